@@ -14,8 +14,47 @@ from .implementations import (
     TrainingStatistics
 )
 
+# Async servis cephesi
+from .async_manager import AsyncTrainingManager
+
 # Repository
 from .repository import TrainingRepository
+from .sqlite_repository import SqliteTrainingRepository
+from .kalici_repository import KaliciTrainingRepository
+from .eszamanli_repository import EszamanliTrainingRepository, OturumAnlikGoruntusu
+
+# Toplu işlem raporu
+from .toplu import TopluIslemRaporu, TopluIslemSonucu
+
+# Birleştirilebilir oturum sorgusu
+from .sorgu import OturumSorgusu
+
+# Vektörel maliyet motoru (numpy gerektirir)
+from .maliyet import MaliyetMotoru
+
+# Akut:kronik yük oranı analizi (numpy gerektirir)
+from .yuk_analizi import AkutKronikYukAnalizi, AkutKronikYukDinleyici
+
+# Performans/ilerleme notu akan analizi
+from .performans_analizi import PerformansAnalizi, PerformansAnaliziDinleyici
+
+# Paralel sporcu raporu üretimi
+from .raporlama import BireyselRaporUretici, sporcu_raporu_olustur
+
+# JSONL/CSV akışlı dışa aktarım
+from .disa_aktarim import kayitlari_yaz, oturumlari_disa_aktar
+
+# JSONL/CSV toplu içe aktarım
+from .ice_aktarim import IceAktarimRaporu, ReddedilenSatir, TopluIceAktarici, satiri_dogrula
+
+# Tekrarlayan program kuralı
+from .tekrar import TekrarKurali
+
+# Olay ve metrik dinleyicileri
+from .olaylar import AntrenmanOlayi, OlayDinleyici, YaziciDinleyici, MetrikToplayici
+
+# Müsaitlik (boş zaman) arama motoru
+from .musaitlik import MusaitlikMotoru
 
 # Önemli Exception'lar
 from .exceptions import (
@@ -31,7 +70,8 @@ from .exceptions import (
     GecersizTarihSaatHatasi,
     GecersizSureHatasi,
     GecersizSahaIdHatasi,
-    SahaDoluHatasi
+    SahaDoluHatasi,
+    SurumCakismasiHatasi
 )
 
 # Modül versiyonu
@@ -49,7 +89,34 @@ __all__ = [
     
     # Service & Repository
     "TrainingManager",
+    "AsyncTrainingManager",
     "TrainingRepository",
+    "SqliteTrainingRepository",
+    "KaliciTrainingRepository",
+    "EszamanliTrainingRepository",
+    "OturumAnlikGoruntusu",
+    "MusaitlikMotoru",
+    "TopluIslemRaporu",
+    "TopluIslemSonucu",
+    "OturumSorgusu",
+    "MaliyetMotoru",
+    "AkutKronikYukAnalizi",
+    "AkutKronikYukDinleyici",
+    "PerformansAnalizi",
+    "PerformansAnaliziDinleyici",
+    "BireyselRaporUretici",
+    "sporcu_raporu_olustur",
+    "kayitlari_yaz",
+    "oturumlari_disa_aktar",
+    "TopluIceAktarici",
+    "IceAktarimRaporu",
+    "ReddedilenSatir",
+    "satiri_dogrula",
+    "TekrarKurali",
+    "AntrenmanOlayi",
+    "OlayDinleyici",
+    "YaziciDinleyici",
+    "MetrikToplayici",
     
     # Entity sınıfları
     "TrainingPlan",
@@ -70,5 +137,6 @@ __all__ = [
     "GecersizSureHatasi",
     "GecersizSahaIdHatasi",
     "SahaDoluHatasi",
+    "SurumCakismasiHatasi",
 ]
 
@@ -0,0 +1,129 @@
+"""
+TrainingManager için asyncio cephesi (facade).
+Eşzamanlı rezervasyon isteklerinde kontrol-sonra-kaydet adımlarını kaynak
+(sporcu, saha) bazında kilitleyerek atomik yapar; farklı kaynaklara yapılan
+rezervasyonlar birbirini beklemez.
+"""
+import asyncio
+from concurrent.futures import Executor
+from contextlib import asynccontextmanager
+from datetime import datetime
+from functools import partial
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, List, Optional, Tuple
+
+from .base import AntrenmanOturumuTemel
+from .implementations import TrainingManager
+from .olaylar import OlayDinleyici
+from .exceptions import OturumBulunamadiHatasi
+
+
+# Kaynak anahtarı -> asyncio.Lock tablosu; kullanılmayan kilitler silinir
+class _KaynakKilitleri:
+
+    # Boş kilit tablosu oluşturur
+    def __init__(self):
+        # anahtar -> [kilit, kilidi tutan veya bekleyen görev sayısı]
+        self._kilitler: Dict[tuple, list] = {}
+
+    # Tablodaki (kullanımda olan) kilit sayısını döndürür
+    def __len__(self) -> int:
+        return len(self._kilitler)
+
+    # Verilen anahtarların kilitlerini sıralı alır (sabit sıra kilitlenmeyi/deadlock önler)
+    @asynccontextmanager
+    async def kilitle(self, anahtarlar: Iterable[tuple]) -> AsyncIterator[None]:
+        kayitlar = []
+        for anahtar in sorted(set(anahtarlar)):
+            kayit = self._kilitler.get(anahtar)
+            if kayit is None:
+                kayit = self._kilitler[anahtar] = [asyncio.Lock(), 0]
+            kayit[1] += 1
+            kayitlar.append((anahtar, kayit))
+
+        alinanlar = []
+        try:
+            for _, kayit in kayitlar:
+                await kayit[0].acquire()
+                alinanlar.append(kayit[0])
+            yield
+        finally:
+            for kilit in reversed(alinanlar):
+                kilit.release()
+            for anahtar, kayit in kayitlar:
+                kayit[1] -= 1
+                if kayit[1] == 0:
+                    del self._kilitler[anahtar]
+
+
+# TrainingManager işlemlerini kaynak bazlı kilitlerle eşzamanlı çağrılabilir hale getiren async cephe
+class AsyncTrainingManager:
+    """
+    Her işlem, ilgili oturumun id'si, sporcusu ve sahası için alınan
+    kilitler altında senkron TrainingManager'a devredilir. Aynı sporcu veya
+    sahaya yönelik istekler sırayla, diğerleri birbirini beklemeden işlenir.
+
+    yurutucu (Executor) verilirse repository işlemleri event loop'u
+    bloklamamak için bu yürütücüde çalışır; bu durumda repository farklı
+    kaynaklara aynı anda yapılan çağrılara karşı thread-safe olmalıdır.
+    Verilmezse işlemler event loop içinde çalışır.
+    """
+
+    # Cepheyi repository, olay dinleyicileri ve isteğe bağlı yürütücü ile başlatır
+    def __init__(self, repository, dinleyiciler: Optional[Iterable[OlayDinleyici]] = None,
+                 yurutucu: Optional[Executor] = None):
+        self.repo = repository
+        self._manager = TrainingManager(repository, dinleyiciler)
+        self._yurutucu = yurutucu
+        self._kilitler = _KaynakKilitleri()
+
+    # İşlem olaylarını alacak bir dinleyici ekler
+    def dinleyici_ekle(self, dinleyici: OlayDinleyici) -> None:
+        self._manager.dinleyici_ekle(dinleyici)
+
+    # Yeni bir oturumu, sporcusu ve sahası kilitliyken çakışma kontrolüyle oluşturur
+    async def oturum_olustur(self, oturum: AntrenmanOturumuTemel) -> None:
+        async with self._kilitler.kilitle(self._kilit_anahtarlari(oturum)):
+            await self._calistir(self._manager.oturum_olustur, oturum)
+
+    # Bir oturumu iptal eder
+    async def oturum_iptal_et(self, oturum_id: int) -> None:
+        oturum = await self._oturum_bul(oturum_id)
+        async with self._kilitler.kilitle(self._kilit_anahtarlari(oturum)):
+            await self._calistir(self._manager.oturum_iptal_et, oturum_id)
+
+    # Bir oturumu tamamlandı olarak işaretler
+    async def oturum_tamamla(self, oturum_id: int) -> None:
+        oturum = await self._oturum_bul(oturum_id)
+        async with self._kilitler.kilitle(self._kilit_anahtarlari(oturum)):
+            await self._calistir(self._manager.oturum_tamamla, oturum_id)
+
+    # Bir oturumu, kaynakları kilitliyken çakışma kontrolüyle yeni tarihe planlar
+    async def oturum_planla(self, oturum_id: int, yeni_tarih_saat: datetime) -> None:
+        oturum = await self._oturum_bul(oturum_id)
+        async with self._kilitler.kilitle(self._kilit_anahtarlari(oturum)):
+            await self._calistir(self._manager.oturum_planla, oturum_id, yeni_tarih_saat)
+
+    # Oturumu bulur, yoksa OturumBulunamadiHatasi fırlatır
+    async def _oturum_bul(self, oturum_id: int) -> AntrenmanOturumuTemel:
+        oturum = await self._calistir(self.repo.id_ile_bul, oturum_id)
+        if not oturum:
+            raise OturumBulunamadiHatasi()
+        return oturum
+
+    # Oturumun kilitlenecek kaynak anahtarlarını döndürür (oturum id'si her zaman dahildir)
+    @staticmethod
+    def _kilit_anahtarlari(oturum: AntrenmanOturumuTemel) -> List[Tuple[str, int]]:
+        anahtarlar = [("oturum_id", oturum.oturum_id)]
+        athlete_id = getattr(oturum, 'athlete_id', None)
+        saha_id = getattr(oturum, 'saha_id', None)
+        if athlete_id is not None:
+            anahtarlar.append(("athlete_id", athlete_id))
+        if saha_id is not None:
+            anahtarlar.append(("saha_id", saha_id))
+        return anahtarlar
+
+    # Senkron işlemi yürütücüde (verildiyse) veya doğrudan çalıştırır
+    async def _calistir(self, fonksiyon: Callable[..., Any], *parametreler: Any) -> Any:
+        if self._yurutucu is None:
+            return fonksiyon(*parametreler)
+        return await asyncio.get_running_loop().run_in_executor(self._yurutucu, partial(fonksiyon, *parametreler))
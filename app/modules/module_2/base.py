@@ -1,6 +1,9 @@
+import inspect
 from abc import ABC, abstractmethod
-from datetime import datetime
-from typing import Optional, Any, Dict
+from datetime import datetime, timedelta
+from itertools import repeat
+from operator import attrgetter
+from typing import Optional, Any, Callable, Dict, Iterable, List, Mapping, Tuple
 
 
 from .exceptions import (
@@ -15,8 +18,116 @@ from .exceptions import (
 )
 
 
+# satir_alanlari'nda kurucu varsayılanı olmayan (zorunlu) alanların değeri; satırda bulunmayan zorunlu alanı işaretler
+EKSIK_ALAN = object()
+
+_GUN_MIKROSANIYE = 86400 * 10 ** 6
+
+
+# Toplu oluşturmada bir sütun hızlı doğrulamadan geçemediğinde fırlatılır (dışarı sızmaz)
+class _SutunGecersiz(Exception):
+    pass
+
+
+# Tarihi tam sayı mikrosaniye damgasına çevirir (süreçlere datetime nesnesi göndermekten çok daha ucuzdur)
+def mikrosaniye_damgasi(tarih: Optional[datetime]) -> Optional[int]:
+    """
+    Damga, saat dilimsiz tarihin 0001-01-01'den beri geçen mikrosaniyesidir;
+    damgadan_tarih ile kayıpsız geri çevrilir. None, None olarak kalır.
+    """
+    if tarih is None:
+        return None
+    saniye = tarih.toordinal() * 86400 + tarih.hour * 3600 + tarih.minute * 60 + tarih.second
+    return saniye * 10 ** 6 + tarih.microsecond
+
+
+# mikrosaniye_damgasi ile üretilmiş damgadan tarihi geri kurar (None, None olarak kalır)
+def damgadan_tarih(damga: Optional[int]) -> Optional[datetime]:
+    if damga is None:
+        return None
+    gun, mikrosaniye = divmod(damga, _GUN_MIKROSANIYE)
+    return datetime.fromordinal(gun) + timedelta(microseconds=mikrosaniye)
+
+
+# Tam sayı sütununu tek geçişte doğrular (bool gibi alt tipler yavaş yola bırakılır)
+def _tam_sayi_sutunu(kolon: list, en_az: int, en_cok: Optional[int] = None, bos_olabilir: bool = False) -> None:
+    degerler = [deger for deger in kolon if deger is not None] if bos_olabilir else kolon
+    if not degerler:
+        return
+    if set(map(type, degerler)) != {int}:
+        raise _SutunGecersiz()
+    if min(degerler) < en_az or (en_cok is not None and max(degerler) > en_cok):
+        raise _SutunGecersiz()
+
+
+# Seçenek sütununu her farklı değer için bir kez doğrular ve normalize edilmiş sütunu döndürür
+def _secenek_sutunu(kolon: list, gecerli: list) -> list:
+    esleme = {}
+    try:
+        farkli_degerler = set(kolon)
+    except TypeError:
+        raise _SutunGecersiz()
+    for deger in farkli_degerler:
+        if not isinstance(deger, str):
+            raise _SutunGecersiz()
+        normal = deger.lower().strip()
+        if normal not in gecerli:
+            raise _SutunGecersiz()
+        esleme[deger] = normal
+    if all(deger == normal for deger, normal in esleme.items()):
+        return kolon
+    return [esleme[deger] for deger in kolon]
+
+
+# Boş olamayan metin sütununu doğrular ve kenar boşlukları kırpılmış sütunu döndürür
+def _metin_sutunu(kolon: list) -> list:
+    try:
+        farkli_degerler = set(kolon)
+    except TypeError:
+        raise _SutunGecersiz()
+    if not all(isinstance(deger, str) and deger.strip() for deger in farkli_degerler):
+        raise _SutunGecersiz()
+    if all(deger == deger.strip() for deger in farkli_degerler):
+        return kolon
+    return [deger.strip() for deger in kolon]
+
+
+# Tarih sütununu doğrular (None veya datetime)
+def _tarih_sutunu(kolon: list) -> None:
+    if not set(map(type, kolon)) <= {datetime, type(None)}:
+        raise _SutunGecersiz()
+
+
+# Not sütununu doğrular ve setter gibi 1 ondalığa yuvarlanmış sütunu döndürür (her farklı değer bir kez)
+def _not_sutunu(kolon: list, en_az: float, en_cok: float) -> list:
+    if not set(map(type, kolon)) <= {int, float, type(None)}:
+        raise _SutunGecersiz()
+    esleme = {None: None}
+    for deger in set(kolon):
+        if deger is None:
+            continue
+        if not en_az <= deger <= en_cok:
+            raise _SutunGecersiz()
+        esleme[deger] = round(float(deger), 1)
+    return list(map(esleme.__getitem__, kolon))
+
+
+# Sınıf -> kurucu parametreleri önbelleği (satirlardan_olustur için)
+_SATIR_ALANLARI: Dict[type, Dict[str, Any]] = {}
+
+# Sınıf -> MRO boyunca tüm __slots__ alanları önbelleği (prototip_kopyala için)
+_SLOT_ALANLARI: Dict[type, tuple] = {}
+
+# (sınıf, alan) -> alan okuyucu önbelleği (alan_okuyucu için; sınıfta olmayan alanlar için None)
+_ALAN_OKUYUCULARI: Dict[Tuple[type, str], Optional[Callable[[Any], Any]]] = {}
+# Öznitelik adı -> okuyucu; aynı özniteliği okuyan sınıflar aynı okuyucu nesnesini paylaşır
+_OZNITELIK_OKUYUCULARI: Dict[str, Callable[[Any], Any]] = {}
+
+
 # Tüm antrenman oturumu tipleri için soyut temel sınıf
 class AntrenmanOturumuTemel(ABC):
+    # Nesne başına __dict__ yerine sabit alan düzeni (bellek tasarrufu)
+    __slots__ = ("_oturum_id", "_sure", "_athlete_id", "_team_id", "_oturum_tipi", "_tarih_saat", "_durum", "_surum")
 
     
     GECERLI_OTURUM_TIPLERI = ["kondisyon", "teknik", "taktik", "rehabilitasyon"]
@@ -44,6 +155,7 @@ class AntrenmanOturumuTemel(ABC):
         self._oturum_tipi = None
         self._tarih_saat = None
         self._durum = None
+        self._surum = 0
         
         # Property setter'ları üzerinden değer ataması
         self.oturum_id = oturum_id
@@ -166,6 +278,11 @@ class AntrenmanOturumuTemel(ABC):
             )
         self._durum = durum_formatted
 
+    # Oturumun sürüm numarasını döndürür (eşzamanlı repository her güncellemede artırır; kaydedilmemiş oturumda 0)
+    @property
+    def surum(self) -> int:
+        return self._surum
+
     # Antrenman oturumunun detaylı bilgilerini döndürür (abstract method)
     @abstractmethod
     def oturum_detaylari_getir(self) -> Dict[str, Any]:
@@ -204,12 +321,153 @@ class AntrenmanOturumuTemel(ABC):
         if self.durum == "iptal_edildi":
             self.durum = "planlandı"
 
+    # Şablonun alanlarını kopyalayıp yalnızca id ve tarihi değiştirilmiş yeni bir oturum döndürür
+    def prototip_kopyala(self, oturum_id: int, tarih_saat: Optional[datetime]) -> 'AntrenmanOturumuTemel':
+        """
+        Şablon zaten doğrulanmış olduğundan diğer alanlar setter'lardan geçmeden
+        olduğu gibi kopyalanır (tüm alanlar değiştirilemez değerlerdir); yalnızca
+        değişen id ve tarih setter'larla doğrulanır. deepcopy'den çok daha ucuzdur.
+        """
+        sinif = type(self)
+        alanlar = _SLOT_ALANLARI.get(sinif)
+        if alanlar is None:
+            alanlar = _SLOT_ALANLARI[sinif] = tuple(
+                alan for taban in reversed(sinif.__mro__) for alan in taban.__dict__.get("__slots__", ())
+            )
+        kopya = object.__new__(sinif)
+        for alan in alanlar:
+            setattr(kopya, alan, getattr(self, alan))
+        kopya.oturum_id = oturum_id
+        kopya.tarih_saat = tarih_saat
+        kopya._surum = 0
+        return kopya
+
     # Antrenman oturumunun geçmiş bir tarihte olup olmadığını kontrol eder
     def oturum_gecmis_mi(self) -> bool:
         if self.tarih_saat is None:
             return False
         return self.tarih_saat < datetime.now()
 
+    # Kurucu parametre adlarıyla verilen satırlardan toplu oturum oluşturur (setter'lar atlanır)
+    @classmethod
+    def satirlardan_olustur(
+        cls,
+        satirlar: Iterable[Mapping[str, Any]],
+        dogrula: bool = True
+    ) -> List['AntrenmanOturumuTemel']:
+        """
+        dogrula=True iken her sütun tek geçişte doğrulanır ve normalize edilir;
+        bir sütun geçemezse satırlar normal kurucuyla oluşturulur, böylece hatalı
+        ilk satır setter'ın fırlattığı hatayla bildirilir. dogrula=False güvenilir
+        kaynaklar (kendi kayıtlarımız) içindir; değerler olduğu gibi atanır.
+        Kurucuda olmayan satır anahtarları yok sayılır.
+        """
+        satirlar = satirlar if isinstance(satirlar, list) else list(satirlar)
+        alanlar = cls.satir_alanlari()
+        try:
+            sutunlar = cls._sutunlara_ayir(satirlar, alanlar)
+            if dogrula:
+                cls._sutunlari_dogrula(sutunlar)
+        except _SutunGecersiz:
+            return [cls(**{alan: satir[alan] for alan in alanlar if alan in satir}) for satir in satirlar]
+        return cls.sutunlardan_kur(sutunlar)
+
+    # Satırları alan başına bir liste olacak şekilde sütunlara ayırır (eksik zorunlu alan varsa _SutunGecersiz)
+    @staticmethod
+    def _sutunlara_ayir(satirlar: List[Mapping[str, Any]], alanlar: Dict[str, Any]) -> Dict[str, list]:
+        sutunlar: Dict[str, list] = {}
+        for alan, varsayilan in alanlar.items():
+            if varsayilan is EKSIK_ALAN:
+                try:
+                    sutunlar[alan] = [satir[alan] for satir in satirlar]
+                except KeyError:
+                    raise _SutunGecersiz()
+            else:
+                sutunlar[alan] = [satir.get(alan, varsayilan) for satir in satirlar]
+        return sutunlar
+
+    # Alanı okuyan fonksiyonu döndürür (sınıfta böyle bir alan yoksa None); toplu sütun çıkarma içindir
+    @classmethod
+    def alan_okuyucu(cls, alan: str) -> Optional[Callable[['AntrenmanOturumuTemel'], Any]]:
+        """
+        Bu paketteki slotlu alanların property'leri (ör. sure -> _sure) slotu
+        olduğu gibi döndürür. Property slotun tanımlandığı sınıftakiyse ve alt
+        sınıfta ezilmemişse okuyucu slotu doğrudan okur (property çağrısından
+        birkaç kat ucuz); aksi halde property'nin kendisini okur. Sonuç her
+        durumda getattr(oturum, alan) ile aynıdır. Aynı özniteliği okuyan
+        sınıflar aynı okuyucu nesnesini alır.
+        """
+        anahtar = (cls, alan)
+        if anahtar in _ALAN_OKUYUCULARI:
+            return _ALAN_OKUYUCULARI[anahtar]
+        ozellik = getattr(cls, alan, None)
+        okuyucu = None
+        if ozellik is not None:
+            slot = "_" + alan
+            sahibi = next((taban for taban in cls.__mro__ if slot in taban.__dict__.get("__slots__", ())), None)
+            ad = slot if sahibi is not None and sahibi.__dict__.get(alan) is ozellik else alan
+            okuyucu = _OZNITELIK_OKUYUCULARI.get(ad) or _OZNITELIK_OKUYUCULARI.setdefault(ad, attrgetter(ad))
+        _ALAN_OKUYUCULARI[anahtar] = okuyucu
+        return okuyucu
+
+    # Kurucu parametrelerini ve varsayılanlarını döndürür (zorunlular için EKSIK_ALAN)
+    @classmethod
+    def satir_alanlari(cls) -> Dict[str, Any]:
+        """
+        Sonuç sınıf başına önbelleklenir ve paylaşılır; değiştirilmemelidir.
+        Satır/sütun tabanlı toplu oluşturma ve içe aktarım alan listesini ve
+        boş hücrelerin alacağı varsayılanları buradan okur.
+        """
+        alanlar = _SATIR_ALANLARI.get(cls)
+        if alanlar is None:
+            parametreler = list(inspect.signature(cls.__init__).parameters.values())[1:]
+            alanlar = {
+                parametre.name: EKSIK_ALAN if parametre.default is inspect.Parameter.empty else parametre.default
+                for parametre in parametreler
+            }
+            _SATIR_ALANLARI[cls] = alanlar
+        return alanlar
+
+    # Hazır sütunlardan setter'ları atlayarak nesneleri kurar ve temel alanları atar (alt sınıflar genişletir)
+    @classmethod
+    def sutunlardan_kur(cls, sutunlar: Dict[str, list]) -> List['AntrenmanOturumuTemel']:
+        """
+        sutunlar satir_alanlari anahtarlarıyla eşit uzunlukta listelerdir
+        (tarih_saat datetime olarak). Değerler doğrulanmadan atanır; yalnızca
+        kendi kayıtlarımızdan veya setter'lardan geçmiş sütunlardan kurarken
+        kullanılmalıdır (doğrulamalı yol satirlardan_olustur'dur).
+        """
+        yeni = object.__new__
+        oturumlar = []
+        for oturum_id, sure, athlete_id, team_id, oturum_tipi, tarih_saat, durum in zip(
+            sutunlar["oturum_id"], sutunlar["sure"],
+            sutunlar.get("athlete_id", repeat(None)), sutunlar.get("team_id", repeat(None)),
+            sutunlar["oturum_tipi"], sutunlar["tarih_saat"], sutunlar["durum"]
+        ):
+            oturum = yeni(cls)
+            oturum._oturum_id = oturum_id
+            oturum._sure = sure
+            oturum._athlete_id = athlete_id
+            oturum._team_id = team_id
+            oturum._oturum_tipi = oturum_tipi
+            oturum._tarih_saat = tarih_saat
+            oturum._durum = durum
+            oturum._surum = 0
+            oturumlar.append(oturum)
+        return oturumlar
+
+    # Temel sınıf alanlarını setter'larla aynı kurallarla sütun bazında doğrular
+    @classmethod
+    def _sutunlari_dogrula(cls, sutunlar: Dict[str, list]) -> None:
+        _tam_sayi_sutunu(sutunlar["oturum_id"], 1)
+        _tam_sayi_sutunu(sutunlar["sure"], cls.MIN_SURE, cls.MAX_SURE)
+        for alan in ("athlete_id", "team_id"):
+            if alan in sutunlar:
+                _tam_sayi_sutunu(sutunlar[alan], 1, bos_olabilir=True)
+        sutunlar["oturum_tipi"] = _secenek_sutunu(sutunlar["oturum_tipi"], cls.GECERLI_OTURUM_TIPLERI)
+        _tarih_sutunu(sutunlar["tarih_saat"])
+        sutunlar["durum"] = _secenek_sutunu(sutunlar["durum"], cls.GECERLI_DURUMLAR)
+
     # Geçerli antrenman oturumu tiplerini döndürür
     @classmethod
     def gecerli_oturum_tipleri_getir(cls) -> list[str]:
@@ -1,6 +1,6 @@
 import sys
 import os
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import List
 
 # Windows konsol encoding sorunu için
@@ -34,6 +34,8 @@ try:
         RehabTrainingSession,
         TrainingManager # Servis katmanı
     )
+    from app.modules.module_2.musaitlik import MusaitlikMotoru
+    from app.modules.module_2.olaylar import YaziciDinleyici
     from app.modules.module_2.exceptions import AntrenmanHatasi, TakvimCakismasiHatasi, DuplicateOturumHatasi
 except ImportError as e:
     print("KRİTİK HATA: Modüller bulunamadı!")
@@ -135,7 +137,9 @@ def tarih_al(mesaj="Tarih girin", gecmis_tarihe_izin_ver=False):
 def main():
     # 1. Repository ve Servis Katmanını Başlat
     repo = TrainingRepository()
-    service = TrainingManager(repo)
+    # Demo'da işlem mesajları ekrana yazdırılır (toplu işlerde manager varsayılan olarak sessizdir)
+    service = TrainingManager(repo, dinleyiciler=[YaziciDinleyici()])
+    musaitlik = MusaitlikMotoru(repo)
     
     # Başlangıç verisi (Demo dolu görünsün diye opsiyonel ekleme)
     try:
@@ -262,6 +266,14 @@ def main():
                             if cakisma_var:
                                 tarih_str = zaman.strftime('%Y-%m-%d %H:%M')
                                 print(f"!!! UYARI: {temp_saha_id} numaralı saha {tarih_str} tarihinde dolu!")
+                                oneriler = musaitlik.bos_zamanlari_bul(
+                                    sure_dk=sure, baslangic=zaman, bitis=zaman + timedelta(days=7),
+                                    saha_id=temp_saha_id, adet=3
+                                )
+                                if oneriler:
+                                    print("Bu saha için en yakın boş zamanlar:")
+                                    for bas, bit in oneriler:
+                                        print(f"   - {bas.strftime('%Y-%m-%d %H:%M')} - {bit.strftime('%H:%M')}")
                                 print(f"Lütfen başka bir saha ID giriniz.")
                                 continue
                         
@@ -0,0 +1,77 @@
+"""
+Antrenman oturumlarını JSONL veya CSV dosyasına akışla dışa aktaran hat.
+Repository tembel sorgu ile gezilir, oturumlar parça parça satır sözlüklerine
+çevrilir ve her parça ortak yazıcıyla (app.ortak.disa_aktarim) tek seferde
+kodlanıp (isteğe bağlı gzip ile) dosyaya yazılır. Bellekte aynı anda yalnızca
+bir parçanın satırları ve metni bulunur; sorgunun kendisi başlarken aday
+oturum id'lerinin listesini (eşzamanlı repository'de sonuç oturumlarının
+referans listesini) bir kez kurar.
+"""
+from itertools import islice
+from operator import attrgetter
+from typing import Callable, Dict, Iterator, List
+
+from ...ortak.disa_aktarim import VARSAYILAN_PARCA_BOYUTU, kayitlari_yaz, parametreleri_dogrula, parcalari_yaz
+from .base import AntrenmanOturumuTemel
+from .serilestirme import OTURUM_ALANLARI, oturum_sozluge_cevir
+
+# CSV başlığı: oturum türü ve tüm türlerin alanları (bir türde olmayan alanlar boş kalır)
+CSV_SUTUNLARI = ("oturum_turu",) + tuple(dict.fromkeys(
+    alan for alanlar in OTURUM_ALANLARI.values() for alan in alanlar
+))
+
+# Oturum sınıfı -> satır sözlüğü üreten fonksiyon (ilk örnekte oturum_detaylari_getir'den türetilir)
+_SATIR_CEVIRICILERI: Dict[type, Callable[[AntrenmanOturumuTemel], dict]] = {}
+
+
+# Repository'deki tüm oturumları (sorgu sırasıyla) dosyaya aktarır; yazılan oturum sayısını döndürür
+def oturumlari_disa_aktar(repository, yol: str, bicim: str = "jsonl", sikistir: bool = False,
+                          parca_boyutu: int = VARSAYILAN_PARCA_BOYUTU) -> int:
+    parametreleri_dogrula(bicim, CSV_SUTUNLARI, parca_boyutu)
+    oturumlar = iter(repository.sorgu())
+    return parcalari_yaz(_oturum_parcalari(oturumlar, parca_boyutu), yol, bicim, CSV_SUTUNLARI, sikistir)
+
+
+# Oturumları parça parça satır sözlüklerine çevirir
+def _oturum_parcalari(oturumlar: Iterator, parca_boyutu: int) -> Iterator[List[dict]]:
+    ceviriciler = _SATIR_CEVIRICILERI
+    while True:
+        parca = []
+        for oturum in islice(oturumlar, parca_boyutu):
+            cevirici = ceviriciler.get(type(oturum)) or _satir_cevirici_olustur(oturum)
+            parca.append(cevirici(oturum))
+        if not parca:
+            return
+        yield parca
+
+
+# Sınıfın satır sözlüğünü slotlardan doğrudan okuyan çeviriciyi kurar ve önbelleğe alır
+def _satir_cevirici_olustur(ornek: AntrenmanOturumuTemel) -> Callable[[AntrenmanOturumuTemel], dict]:
+    """
+    oturum_detaylari_getir her alanı property üzerinden okuyup sözlüğü tek
+    tek kurar; satır başına maliyetin yarısı buradadır. Örneğin satırındaki
+    anahtarlar (oturum_turu dışında) aynı adlı slotlardan attrgetter ile tek
+    çağrıda okunur. Çeviricinin örnekteki sonucu oturum_detaylari_getir ile
+    birebir aynı değilse (ör. alt sınıf satırı değiştirmişse) sınıf için
+    oturum_sozluge_cevir kullanılır.
+    """
+    sinif = type(ornek)
+    beklenen = oturum_sozluge_cevir(ornek)
+    anahtarlar = tuple(anahtar for anahtar in beklenen if anahtar != "oturum_turu")
+    cevirici = oturum_sozluge_cevir
+    if all(hasattr(sinif, "_" + anahtar) for anahtar in anahtarlar):
+        okuyucu = attrgetter(*("_" + anahtar for anahtar in anahtarlar))
+        oturum_turu = beklenen.get("oturum_turu")
+
+        def cevirici(oturum: AntrenmanOturumuTemel) -> dict:
+            satir = dict(zip(anahtarlar, okuyucu(oturum)))
+            tarih_saat = satir.get("tarih_saat")
+            if tarih_saat is not None:
+                satir["tarih_saat"] = tarih_saat.isoformat()
+            satir["oturum_turu"] = oturum_turu
+            return satir
+
+        if cevirici(ornek) != beklenen:
+            cevirici = oturum_sozluge_cevir
+    _SATIR_CEVIRICILERI[sinif] = cevirici
+    return cevirici
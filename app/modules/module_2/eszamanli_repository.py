@@ -0,0 +1,382 @@
+"""
+Thread havuzlarında paylaşılabilen eşzamanlı antrenman repository'si.
+Yazma işlemleri oturum id'si ve kaynak (sporcu, takım, saha) anahtarlarına
+göre şeritlenmiş kilitler altında yapılır; her oturum bir sürüm numarası
+taşır ve eski sürümle yapılan güncelleme reddedilir (iyimser kilitleme).
+Anlık görüntüler kilitsiz alınır ve yazmalar arasında paylaşılır.
+"""
+import threading
+from contextlib import contextmanager
+from datetime import date, datetime
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .base import AntrenmanOturumuTemel
+from .indeks import ZamanAraligiIndeksi
+from .haftalik_yuk import Hafta
+from .repository import TrainingRepository
+from .sorgu import OturumSorgusu
+from .exceptions import (
+    DuplicateOturumHatasi,
+    OturumBulunamadiHatasi,
+    SurumCakismasiHatasi
+)
+
+
+# Repository'nin belirli bir andaki değişmez görüntüsü; okuma yazarları bloklamaz
+class OturumAnlikGoruntusu:
+    """
+    Saklanan oturum nesneleri repository içinde hiç değiştirilmediği (her
+    yazma yeni bir kopya koyduğu) için id -> nesne sözlüğünün kopyası tutarlı
+    bir anlık görüntüdür. Görüntü salt okunurdur ve aynı nesildeki okuyucular
+    arasında paylaşılır. Sorgular görüntü üzerinde tarama ile yapılır.
+    """
+
+    # Görüntüyü id -> oturum sözlüğüyle başlatır
+    def __init__(self, oturumlar: Dict[int, AntrenmanOturumuTemel]):
+        self._oturumlar = oturumlar
+
+    # Görüntüdeki oturum sayısını döndürür
+    def __len__(self) -> int:
+        return len(self._oturumlar)
+
+    # Görüntüdeki oturumları kayıt sırasıyla gezer
+    def __iter__(self) -> Iterator[AntrenmanOturumuTemel]:
+        return iter(self._oturumlar.values())
+
+    # ID'si verilen oturumu bulur
+    def id_ile_bul(self, oturum_id: int) -> Optional[AntrenmanOturumuTemel]:
+        return self._oturumlar.get(oturum_id)
+
+    # Tüm oturumları listeler
+    def tumunu_listele(self) -> List[AntrenmanOturumuTemel]:
+        return list(self._oturumlar.values())
+
+    # Sporcu ID'sine göre oturumları filtreler
+    def sporcuya_gore_filtrele(self, athlete_id: int) -> List[AntrenmanOturumuTemel]:
+        return [oturum for oturum in self._oturumlar.values() if getattr(oturum, 'athlete_id', None) == athlete_id]
+
+    # Takım ID'sine göre oturumları filtreler
+    def takima_gore_filtrele(self, team_id: int) -> List[AntrenmanOturumuTemel]:
+        return [oturum for oturum in self._oturumlar.values() if getattr(oturum, 'team_id', None) == team_id]
+
+    # Tarih aralığındaki oturumları tarih sırasıyla döndürür
+    def tarih_araligina_gore_filtrele(self, baslangic: datetime, bitis: datetime) -> List[AntrenmanOturumuTemel]:
+        oturumlar = [oturum for oturum in self._oturumlar.values()
+                     if oturum.tarih_saat is not None and baslangic <= oturum.tarih_saat <= bitis]
+        oturumlar.sort(key=lambda oturum: (oturum.tarih_saat, oturum.oturum_id))
+        return oturumlar
+
+
+# Şeritli kilitler ve sürüm kontrolüyle thread-safe TrainingRepository
+class EszamanliTrainingRepository(TrainingRepository):
+    """
+    Kilit düzeni:
+    - Her yazma, oturum id'sinin ve oturumun eski/yeni kaynaklarının düştüğü
+      şerit kilitlerini artan sırada alır (sabit sıra kilitlenmeyi önler).
+      Aynı oturuma veya aynı kaynağa yapılan işlemler sıralanır, diğerleri
+      paralel ilerler. Kaynak bazlı indeksler (sporcu/takım/saha kovaları,
+      zaman indeksleri, durum sayaçları, indeks kayıtları) yalnızca şerit
+      altında değiştirilir.
+    - Bütün oturumların paylaştığı indeksler (tip/durum kovaları, tarih
+      indeksi, haftalık yükler) ortak kilitle korunur; kilit yalnızca bu
+      indekslerin tek oturumluk güncellemesi süresince tutulur.
+    - id sözlüğü tek atamalarla değiştirilir (toplu kayıt tek update ile) ve
+      kilitsiz okunur. Oturum indekslere sözlüğe yazıldıktan sonra girer,
+      sözlükten indekslerden çıktıktan sonra silinir.
+    - Anlık görüntü hiçbir kilit almaz: her yazma nesil sayacını artırır;
+      görüntü son yazmadan beri alınmadıysa sözlük tek bir C çağrısıyla
+      (GIL altında yazmalarla araya girmeden) kopyalanır, aksi halde önceki
+      görüntü döndürülür.
+    - Kaynak bazlı okumalar (filtreler, çakışma kontrolü) yalnızca o kaynağın
+      şeridini, ortak indeks okumaları ortak kilidi alır. Birden fazla indeksi
+      birlikte gezen sorgular ve sayaç denetimi tüm şeritleri kısa süre tutar.
+
+    Saklanan oturumlar hiç yerinde değiştirilmez: kaydet/guncelle verilen
+    nesnenin bir kopyasını saklar, id_ile_bul da bir kopya döndürür. Bu yüzden
+    okuyucuların elindeki nesneler yazarlar tarafından değiştirilmez.
+    Listeleme metotlarının döndürdüğü nesneler paylaşılır ve değiştirilmemelidir;
+    güncelleme için oturum id_ile_bul ile okunmalıdır.
+
+    guncelle, verilen oturumun sürümü saklanan sürümle aynı değilse
+    SurumCakismasiHatasi fırlatır; başarılı güncellemede sürüm bir artar ve
+    verilen nesnenin sürümü de yeni değere çekilir.
+    """
+
+    # Varsayılan şerit (kilit) sayısı
+    SERIT_SAYISI = 64
+
+    # Repository'yi verilen sayıda şerit kilidiyle başlatır
+    def __init__(self, serit_sayisi: int = SERIT_SAYISI):
+        if not isinstance(serit_sayisi, int) or serit_sayisi <= 0:
+            raise ValueError(f"Şerit sayısı pozitif tam sayı olmalıdır, alınan: {serit_sayisi}")
+        super().__init__()
+        self._seritler = [threading.Lock() for _ in range(serit_sayisi)]
+        self._ortak_kilit = threading.Lock()
+        # Yazma nesli ve son anlık görüntü (nesil, id -> oturum); görüntü yazmalar arasında yeniden kullanılır
+        self._nesil = 0
+        self._goruntu: Tuple[int, Dict[int, AntrenmanOturumuTemel]] = (-1, {})
+        # (kaynak türü, kaynak id) -> (indeks sürümü, indeks kopyası); değişmeyen indeks için aynı kopya döner
+        self._indeks_kopyalari: Dict[tuple, Tuple[int, ZamanAraligiIndeksi]] = {}
+
+    # Yeni bir oturumun kopyasını 1. sürüm olarak kaydeder
+    def kaydet(self, oturum: AntrenmanOturumuTemel) -> None:
+        kopya = self._kopyala(oturum, 1)
+        with self._seritleri_kilitle(self._kilit_anahtarlari(kopya)):
+            if kopya.oturum_id in self._storage:
+                raise DuplicateOturumHatasi(f"Oturum ID {kopya.oturum_id} zaten mevcut.")
+            self._storage[kopya.oturum_id] = kopya
+            self._nesil += 1
+            self._indekse_ekle(kopya)
+        oturum._surum = 1
+
+    # Birden fazla oturumu tek seferde kaydeder; mükerrer id varsa hiçbiri kaydedilmez
+    def kaydet_toplu(self, oturumlar: Iterable[AntrenmanOturumuTemel]) -> None:
+        oturumlar = list(oturumlar)
+        kopyalar = [self._kopyala(oturum, 1) for oturum in oturumlar]
+        anahtarlar = [anahtar for kopya in kopyalar for anahtar in self._kilit_anahtarlari(kopya)]
+        with self._seritleri_kilitle(anahtarlar):
+            super().kaydet_toplu(kopyalar)
+            self._nesil += 1
+        for oturum in oturumlar:
+            oturum._surum = 1
+
+    # Oturumu, okunduğu sürüm hâlâ güncelse yeni sürüm olarak kaydeder
+    def guncelle(self, oturum: AntrenmanOturumuTemel) -> None:
+        oturum_id = oturum.oturum_id
+        with self._mevcut_oturumu_kilitle(oturum_id, self._kilit_anahtarlari(oturum), "Güncellenecek"):
+            mevcut = self._storage[oturum_id]
+            if oturum.surum != mevcut.surum:
+                raise SurumCakismasiHatasi(
+                    f"Oturum ID {oturum_id} güncel değil: okunan sürüm {oturum.surum}, mevcut sürüm {mevcut.surum}"
+                )
+            kopya = self._kopyala(oturum, mevcut.surum + 1)
+            self._indeksten_cikar(oturum_id)
+            self._storage[oturum_id] = kopya
+            self._nesil += 1
+            self._indekse_ekle(kopya)
+        oturum._surum = kopya.surum
+
+    # ID'si verilen oturumu sistemden siler
+    def sil(self, oturum_id: int) -> None:
+        with self._mevcut_oturumu_kilitle(oturum_id, (), "Silinecek"):
+            self._indeksten_cikar(oturum_id)
+            del self._storage[oturum_id]
+            self._nesil += 1
+
+    # ID'si verilen oturumun (güncellemede kullanılabilecek) bir kopyasını döndürür
+    def id_ile_bul(self, oturum_id: int) -> Optional[AntrenmanOturumuTemel]:
+        oturum = self._storage.get(oturum_id)
+        return None if oturum is None else self._kopyala(oturum, oturum.surum)
+
+    # Tüm oturumları tutarlı bir anlık görüntü olarak kilitsiz döndürür (son yazmadan beri değişmediyse aynı görüntü)
+    def anlik_goruntu(self) -> OturumAnlikGoruntusu:
+        nesil, oturumlar = self._goruntu
+        guncel_nesil = self._nesil
+        if nesil != guncel_nesil:
+            # Nesil kopyadan önce okunur: kopya en az bu nesli içerir, sonraki yazmalar nesli değiştirir
+            oturumlar = self._storage.copy()
+            self._goruntu = (guncel_nesil, oturumlar)
+        return OturumAnlikGoruntusu(oturumlar)
+
+    # Sporcu ID'sine göre oturumları filtreler
+    def sporcuya_gore_filtrele(self, athlete_id: int) -> List[AntrenmanOturumuTemel]:
+        with self._serit(("athlete_id", athlete_id)):
+            return super().sporcuya_gore_filtrele(athlete_id)
+
+    # Oturumu olan sporcuların ID'lerini döndürür (sporcu indeksinin anahtarları tek kopyayla kilitsiz okunur)
+    def sporcu_idleri(self) -> List[int]:
+        return sorted(self._sporcu_indeksi.copy())
+
+    # Takım ID'sine göre oturumları filtreler
+    def takima_gore_filtrele(self, team_id: int) -> List[AntrenmanOturumuTemel]:
+        with self._serit(("team_id", team_id)):
+            return super().takima_gore_filtrele(team_id)
+
+    # Tarih aralığına göre oturumları filtreler (sonuç tarih sırasındadır)
+    def tarih_araligina_gore_filtrele(self, baslangic: datetime, bitis: datetime) -> List[AntrenmanOturumuTemel]:
+        with self._ortak_kilit:
+            return super().tarih_araligina_gore_filtrele(baslangic, bitis)
+
+    # Tarih sırasıyla bir sayfa oturum ve bir sonraki sayfanın imlecini döndürür (son sayfada imleç None)
+    def tarih_sirali_sayfa(
+        self,
+        imlec: Optional[Tuple[datetime, int]] = None,
+        limit: int = 50,
+        baslangic: Optional[datetime] = None,
+        bitis: Optional[datetime] = None
+    ) -> Tuple[List[AntrenmanOturumuTemel], Optional[Tuple[datetime, int]]]:
+        with self._ortak_kilit:
+            return super().tarih_sirali_sayfa(imlec, limit, baslangic, bitis)
+
+    # Sorgu id'lerini tüm indeksler sabitken toplar (sorgu kaynak ve ortak indeksleri birlikte gezer)
+    def _sorgu_idleri(self, sorgu: OturumSorgusu) -> Iterator[int]:
+        with self._tum_indeksleri_kilitle():
+            return iter(list(super()._sorgu_idleri(sorgu)))
+
+    # Sorgu sonuçlarını tüm indeksler sabitken tutarlı bir liste olarak toplar
+    def _sorgu_calistir(self, sorgu: OturumSorgusu) -> Iterator[AntrenmanOturumuTemel]:
+        with self._tum_indeksleri_kilitle():
+            storage = self._storage
+            return iter([storage[oturum_id] for oturum_id in super()._sorgu_idleri(sorgu)])
+
+    # Tarihi henüz ayarlanmamış oturumları listeler
+    def tarihsiz_oturumlar(self) -> List[AntrenmanOturumuTemel]:
+        with self._ortak_kilit:
+            return super().tarihsiz_oturumlar()
+
+    # Durumlara göre oturum sayılarını döndürür (genel sayımlar ortak kilit, sporcu sayımları sporcu şeridi altında)
+    def durum_sayilari(self, athlete_id: Optional[int] = None) -> Dict[str, int]:
+        kilit = self._ortak_kilit if athlete_id is None else self._serit(("athlete_id", athlete_id))
+        with kilit:
+            return super().durum_sayilari(athlete_id)
+
+    # Canlı sayaçları tüm indeksler sabitken yeniden sayımla karşılaştırır
+    def sayac_tutarliligi_kontrol(self) -> Dict[Tuple[Optional[int], str], Tuple[int, int]]:
+        with self._tum_indeksleri_kilitle():
+            return super().sayac_tutarliligi_kontrol()
+
+    # Sporcunun veya takımın haftalık yükünü ortak kilit altında döndürür
+    def haftalik_yuk(self, tarih: date, athlete_id: int = None, team_id: int = None) -> int:
+        with self._ortak_kilit:
+            return super().haftalik_yuk(tarih, athlete_id, team_id)
+
+    # Sporcunun veya takımın tüm haftalık yüklerini ortak kilit altında döndürür
+    def haftalik_yukler(self, athlete_id: int = None, team_id: int = None) -> Dict[Hafta, int]:
+        with self._ortak_kilit:
+            return super().haftalik_yukler(athlete_id, team_id)
+
+    # Haftalık program seviyesini ortak kilit altında atar
+    def haftalik_seviye_ata(self, seviye: str, athlete_id: int = None, team_id: int = None) -> None:
+        with self._ortak_kilit:
+            super().haftalik_seviye_ata(seviye, athlete_id, team_id)
+
+    # Haftalık sınırı aşanları ortak kilit altında döndürür
+    def haftalik_sinir_asanlar(self, tarih: date, alan: str = "athlete_id") -> Dict[int, Tuple[int, int]]:
+        with self._ortak_kilit:
+            return super().haftalik_sinir_asanlar(tarih, alan)
+
+    # Belirtilen tarih ve saatte çakışma olup olmadığını kontrol eder
+    def detayli_cakisma_kontrol(self, tarih: datetime, sure_dk: int, haric_id: int = -1,
+                                athlete_id: int = None, saha_id: int = None) -> bool:
+        with self._seritleri_kilitle(self._kaynak_anahtarlari(athlete_id, None, saha_id)):
+            return super().detayli_cakisma_kontrol(tarih, sure_dk, haric_id, athlete_id, saha_id)
+
+    # Sporcunun ve/veya sahanın [baslangic, bitis) ile çakışan oturum aralıklarını döndürür
+    def kaynak_zaman_araliklari(self, baslangic: datetime, bitis: datetime,
+                                athlete_id: int = None, saha_id: int = None) -> List[Tuple[datetime, datetime, int]]:
+        with self._seritleri_kilitle(self._kaynak_anahtarlari(athlete_id, None, saha_id)):
+            return super().kaynak_zaman_araliklari(baslangic, bitis, athlete_id, saha_id)
+
+    # Sporcunun zaman indeksinin bir kopyasını döndürür (tarihli oturumu yoksa None)
+    def sporcu_zaman_indeksi(self, athlete_id: int) -> Optional[ZamanAraligiIndeksi]:
+        return self._zaman_indeksi_kopyasi("athlete_id", athlete_id, self._sporcu_zaman_indeksi)
+
+    # Sahanın zaman indeksinin bir kopyasını döndürür (tarihli oturumu yoksa None)
+    def saha_zaman_indeksi(self, saha_id: int) -> Optional[ZamanAraligiIndeksi]:
+        return self._zaman_indeksi_kopyasi("saha_id", saha_id, self._saha_zaman_indeksi)
+
+    # Kaynağın zaman indeksini şeridi kilitliyken kopyalar; indeks değişmediyse önceki kopyayı döndürür
+    def _zaman_indeksi_kopyasi(self, alan: str, kaynak_id: int,
+                               indeksler: Dict[int, ZamanAraligiIndeksi]) -> Optional[ZamanAraligiIndeksi]:
+        anahtar = (alan, kaynak_id)
+        with self._serit(anahtar):
+            indeks = indeksler.get(kaynak_id)
+            if indeks is None:
+                self._indeks_kopyalari.pop(anahtar, None)
+                return None
+            kayit = self._indeks_kopyalari.get(anahtar)
+            if kayit is None or kayit[0] != indeks.surum:
+                kayit = self._indeks_kopyalari[anahtar] = (indeks.surum, indeks.kopyala())
+            return kayit[1]
+
+    # Paylaşılan indeks güncellemesini ortak kilit altında yapar
+    def _ortak_indekslere_ekle(self, *parametreler, **adlandirilmis) -> None:
+        with self._ortak_kilit:
+            super()._ortak_indekslere_ekle(*parametreler, **adlandirilmis)
+
+    # Paylaşılan indekslerden çıkarmayı ortak kilit altında yapar
+    def _ortak_indekslerden_cikar(self, *parametreler) -> None:
+        with self._ortak_kilit:
+            super()._ortak_indekslerden_cikar(*parametreler)
+
+    # Toplu kaydın tarih aralıklarını ortak kilit altında tarih indeksine ekler
+    def _tarih_indeksine_toplu_ekle(self, araliklar: List[tuple]) -> None:
+        with self._ortak_kilit:
+            super()._tarih_indeksine_toplu_ekle(araliklar)
+
+    # Tüm şeritleri (artan sırada) ve ortak kilidi alır; birden fazla indeksi birlikte okuyan işlemler içindir
+    @contextmanager
+    def _tum_indeksleri_kilitle(self) -> Iterator[None]:
+        for kilit in self._seritler:
+            kilit.acquire()
+        try:
+            with self._ortak_kilit:
+                yield
+        finally:
+            for kilit in reversed(self._seritler):
+                kilit.release()
+
+    # Var olan bir oturumun id'sini ve eski/yeni kaynaklarını kilitler; oturum yoksa OturumBulunamadiHatasi fırlatır
+    @contextmanager
+    def _mevcut_oturumu_kilitle(self, oturum_id: int, yeni_anahtarlar: Iterable[tuple],
+                                islem: str) -> Iterator[None]:
+        yeni_anahtarlar = list(yeni_anahtarlar)
+        while True:
+            kayit = self._indeks_kayitlari.get(oturum_id)
+            if kayit is None:
+                # Aynı oturumun güncellemesi kaydı kısa süre indeks dışında tutar; yokluk id şeridi altında doğrulanır
+                with self._serit(("oturum_id", oturum_id)):
+                    kayit = self._indeks_kayitlari.get(oturum_id)
+            if kayit is None:
+                raise OturumBulunamadiHatasi(f"{islem} oturum bulunamadı: ID {oturum_id}")
+            athlete_id, team_id, saha_id = kayit[:3]
+            anahtarlar = yeni_anahtarlar + [("oturum_id", oturum_id)]
+            anahtarlar += self._kaynak_anahtarlari(athlete_id, team_id, saha_id)
+            with self._seritleri_kilitle(anahtarlar):
+                # Kilitler alınırken oturumun kaynakları değiştiyse yeni kaynaklarla tekrar denenir
+                if self._indeks_kayitlari.get(oturum_id) is kayit:
+                    yield
+                    return
+
+    # Anahtarın düştüğü şeridin kilidini döndürür (tek anahtarlı okumalar için)
+    def _serit(self, anahtar: tuple) -> threading.Lock:
+        return self._seritler[hash(anahtar) % len(self._seritler)]
+
+    # Verilen anahtarların düştüğü şeritleri artan sırada kilitler
+    @contextmanager
+    def _seritleri_kilitle(self, anahtarlar: Iterable[tuple]) -> Iterator[None]:
+        serit_sayisi = len(self._seritler)
+        kilitler = [self._seritler[serit] for serit in sorted({hash(anahtar) % serit_sayisi for anahtar in anahtarlar})]
+        for kilit in kilitler:
+            kilit.acquire()
+        try:
+            yield
+        finally:
+            for kilit in reversed(kilitler):
+                kilit.release()
+
+    # Oturumun kilitlenecek anahtarlarını döndürür (oturum id'si ve kaynakları)
+    @classmethod
+    def _kilit_anahtarlari(cls, oturum: AntrenmanOturumuTemel) -> List[tuple]:
+        return [("oturum_id", oturum.oturum_id)] + cls._kaynak_anahtarlari(
+            getattr(oturum, 'athlete_id', None), getattr(oturum, 'team_id', None), getattr(oturum, 'saha_id', None)
+        )
+
+    # Verilen kaynakların kilit anahtarlarını döndürür
+    @staticmethod
+    def _kaynak_anahtarlari(athlete_id: Optional[int], team_id: Optional[int], saha_id: Optional[int]) -> List[tuple]:
+        anahtarlar = []
+        if athlete_id is not None:
+            anahtarlar.append(("athlete_id", athlete_id))
+        if team_id is not None:
+            anahtarlar.append(("team_id", team_id))
+        if saha_id is not None:
+            anahtarlar.append(("saha_id", saha_id))
+        return anahtarlar
+
+    # Oturumun, verilen sürüm numarasını taşıyan bağımsız bir kopyasını döndürür
+    @staticmethod
+    def _kopyala(oturum: AntrenmanOturumuTemel, surum: int) -> AntrenmanOturumuTemel:
+        kopya = oturum.prototip_kopyala(oturum.oturum_id, oturum.tarih_saat)
+        kopya._surum = surum
+        return kopya
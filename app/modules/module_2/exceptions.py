@@ -116,3 +116,11 @@ class GecersizSureHatasi(AntrenmanHatasi):
     def __init__(self, mesaj: str = "Antrenman oturumu süresi 1 ile 480 dakika arasında pozitif bir tam sayı olmalıdır"):
         super().__init__(mesaj)
 
+
+
+# Güncellenen oturumun sürümü repository'deki sürümden eskiyse fırlatılan exception
+class SurumCakismasiHatasi(AntrenmanHatasi):
+
+    # Exception örneğini başlatır
+    def __init__(self, mesaj: str = "Oturum, okunduktan sonra başka bir işlem tarafından güncellenmiş"):
+        super().__init__(mesaj)
@@ -0,0 +1,89 @@
+"""
+Sporcu ve takım bazında haftalık antrenman yükü indeksi.
+Oturum süreleri ISO hafta kovalarında dakika toplamı olarak tutulur ve
+kayıt/güncelleme/silme ile artımlı güncellenir; seviyeye göre önerilen
+haftalık sınırı aşan kaynaklar ayrıca hafta kovalarında tutulur.
+"""
+from datetime import date
+from typing import Dict, Optional, Tuple
+
+from .implementations import TrainingSchedule
+
+# ISO hafta anahtarı: (ISO yıl, hafta numarası)
+Hafta = Tuple[int, int]
+
+
+# Tarihin ISO hafta anahtarını döndürür
+def hafta_anahtari(tarih: date) -> Hafta:
+    iso = tarih.isocalendar()
+    return iso[0], iso[1]
+
+
+# Kaynak (sporcu veya takım) bazında ISO hafta kovalı dakika toplamları
+class HaftalikYukIndeksi:
+    """
+    Her kaynak için hafta -> toplam dakika tutulur. Kaynağın seviyesi
+    (düşük/orta/yüksek, atanmamışsa varsayılan) TrainingSchedule.
+    onerilen_maksimum_haftalik_sure ile sınıra çevrilir; sınırı aşan
+    kaynaklar hafta -> kaynak kovasında tutulduğundan "bu hafta sınırı
+    aşanlar" sorgusu oturumları taramadan tek kova okumasıdır.
+    """
+
+    # Boş bir indeks oluşturur
+    def __init__(self, varsayilan_seviye: str = "orta"):
+        self._yukler: Dict[int, Dict[Hafta, int]] = {}
+        self._seviyeler: Dict[int, str] = {}
+        self._varsayilan_seviye = varsayilan_seviye
+        # Hafta -> sınırı aşan kaynak id'leri (dict sıralı küme olarak kullanılır)
+        self._asimlar: Dict[Hafta, Dict[int, None]] = {}
+
+    # Kaynağın o haftaki yüküne dakika ekler (çıkarmak için negatif dakika verilir)
+    def ekle(self, kaynak_id: int, hafta: Hafta, dakika: int) -> None:
+        haftalar = self._yukler.setdefault(kaynak_id, {})
+        yeni_yuk = haftalar.get(hafta, 0) + dakika
+        if yeni_yuk:
+            haftalar[hafta] = yeni_yuk
+        else:
+            del haftalar[hafta]
+            if not haftalar:
+                del self._yukler[kaynak_id]
+        self._asim_guncelle(kaynak_id, hafta, yeni_yuk)
+
+    # Kaynağın o haftaki toplam yükünü (dakika) döndürür
+    def yuk(self, kaynak_id: int, hafta: Hafta) -> int:
+        return self._yukler.get(kaynak_id, {}).get(hafta, 0)
+
+    # Kaynağın tüm haftalarındaki yükleri hafta sırasıyla döndürür
+    def haftalar(self, kaynak_id: int) -> Dict[Hafta, int]:
+        return dict(sorted(self._yukler.get(kaynak_id, {}).items()))
+
+    # Kaynağın haftalık sınırını (dakika) döndürür
+    def sinir(self, kaynak_id: int) -> int:
+        return TrainingSchedule.onerilen_maksimum_haftalik_sure(self._seviyeler.get(kaynak_id, self._varsayilan_seviye))
+
+    # Kaynağın seviyesini atar ve sınır aşımlarını yeni sınıra göre yeniden hesaplar
+    def seviye_ata(self, kaynak_id: int, seviye: str) -> None:
+        if not isinstance(seviye, str) or seviye.lower().strip() not in TrainingSchedule.GECERLI_PROGRAM_SEVIYELERI:
+            raise ValueError(
+                f"Haftalık program {TrainingSchedule.GECERLI_PROGRAM_SEVIYELERI} değerlerinden biri olmalıdır"
+            )
+        self._seviyeler[kaynak_id] = seviye.lower().strip()
+        for hafta, yuk in self._yukler.get(kaynak_id, {}).items():
+            self._asim_guncelle(kaynak_id, hafta, yuk)
+
+    # O hafta sınırını aşan kaynakları (kaynak_id -> (yük, sınır)) döndürür
+    def sinir_asanlar(self, hafta: Hafta) -> Dict[int, Tuple[int, int]]:
+        return {kaynak_id: (self._yukler[kaynak_id][hafta], self.sinir(kaynak_id))
+                for kaynak_id in self._asimlar.get(hafta, {})}
+
+    # Kaynağın o haftaki aşım kovası üyeliğini günceller
+    def _asim_guncelle(self, kaynak_id: int, hafta: Hafta, yuk: int) -> None:
+        kova: Optional[Dict[int, None]] = self._asimlar.get(hafta)
+        if yuk > self.sinir(kaynak_id):
+            if kova is None:
+                kova = self._asimlar[hafta] = {}
+            kova[kaynak_id] = None
+        elif kova is not None and kaynak_id in kova:
+            del kova[kaynak_id]
+            if not kova:
+                del self._asimlar[hafta]
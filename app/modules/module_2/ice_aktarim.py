@@ -0,0 +1,375 @@
+"""
+Geçmiş antrenman oturumlarını JSONL veya CSV dosyasından toplu içe aktaran hat.
+Dosya parça parça okunur, parçalar süreç havuzunda setter kurallarıyla
+doğrulanır ve her satırın tüm hataları toplanır; geçerli satırlar
+TrainingManager.oturum_olustur_toplu ile çakışma kontrolünden geçirilerek
+dosya sırasıyla eklenir. Rapor, hızı ve reddedilen satırları sebepleriyle verir.
+"""
+import csv
+import gzip
+import json
+import os
+from collections import abc, deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from datetime import datetime
+from itertools import islice
+from operator import attrgetter
+from time import perf_counter
+from typing import Any, Deque, Dict, Iterator, List, Mapping, Optional, TextIO, Tuple
+
+from .base import (
+    AntrenmanOturumuTemel, EKSIK_ALAN, damgadan_tarih, mikrosaniye_damgasi
+)
+from .exceptions import AntrenmanHatasi
+from .serilestirme import OTURUM_ALANLARI, OTURUM_SINIFLARI
+from .toplu import CAKISMA, MUKERRER_ID
+
+BICIMLER = ("jsonl", "csv")
+VARSAYILAN_PARCA_BOYUTU = 2_000
+
+# Reddedilen satırın, doğrulamadan geçemediğini belirten durum (eklemede reddedilenler toplu.py durumlarını taşır)
+GECERSIZ = "gecersiz"
+
+# CSV'de metin olarak gelen sayısal alanlar (boş hücre alanın verilmediği anlamına gelir)
+_TAM_SAYI_ALANLARI = frozenset(("oturum_id", "sure", "athlete_id", "team_id", "antrenor_id", "saha_id",
+                                "katilimci_sayisi", "fizyoterapist_id"))
+_ONDALIK_ALANLARI = frozenset(("performans_notu", "ilerleme_notu"))
+
+# Dosyadaki bir satırın reddedilme kaydı
+class ReddedilenSatir:
+    __slots__ = ("satir_no", "oturum_id", "durum", "hatalar")
+
+    # Kaydı başlatır; hatalar (alan, mesaj) çiftleridir
+    def __init__(self, satir_no: int, oturum_id: Any, durum: str, hatalar: List[Tuple[str, str]]):
+        self.satir_no = satir_no
+        self.oturum_id = oturum_id
+        self.durum = durum
+        self.hatalar = hatalar
+
+    # Kaydı sözlük olarak döndürür
+    def sozluge_cevir(self) -> Dict[str, Any]:
+        return {
+            "satir_no": self.satir_no,
+            "oturum_id": self.oturum_id,
+            "durum": self.durum,
+            "hatalar": [{"alan": alan, "mesaj": mesaj} for alan, mesaj in self.hatalar],
+        }
+
+    def __repr__(self) -> str:
+        return f"ReddedilenSatir(satir_no={self.satir_no}, oturum_id={self.oturum_id!r}, durum={self.durum!r})"
+
+
+# İçe aktarımın sayılarını, süresini ve reddedilen satırlarını tutan rapor
+class IceAktarimRaporu:
+
+    # Raporu başlatır
+    def __init__(self, okunan: int, eklenen: int, reddedilenler: List[ReddedilenSatir], sure_sn: float):
+        self.okunan = okunan
+        self.eklenen = eklenen
+        self.reddedilenler = reddedilenler
+        self.sure_sn = sure_sn
+
+    # Saniyede işlenen satır sayısını döndürür
+    @property
+    def satir_hizi(self) -> float:
+        return self.okunan / self.sure_sn if self.sure_sn > 0 else 0.0
+
+    # Sayıları durum bazında özetler
+    def ozet(self) -> Dict[str, Any]:
+        sayilar = {GECERSIZ: 0, CAKISMA: 0, MUKERRER_ID: 0}
+        for reddedilen in self.reddedilenler:
+            sayilar[reddedilen.durum] = sayilar.get(reddedilen.durum, 0) + 1
+        return {
+            "okunan": self.okunan,
+            "eklenen": self.eklenen,
+            "reddedilen": len(self.reddedilenler),
+            **sayilar,
+            "sure_sn": round(self.sure_sn, 3),
+            "satir_hizi": round(self.satir_hizi, 1),
+        }
+
+    def __repr__(self) -> str:
+        return (f"IceAktarimRaporu(okunan={self.okunan}, eklenen={self.eklenen}, "
+                f"reddedilen={len(self.reddedilenler)}, satir_hizi={self.satir_hizi:.0f}/sn)")
+
+
+# Tek satırı setter kurallarıyla doğrular; (oturum veya None, tüm (alan, mesaj) hataları) döndürür
+def satiri_dogrula(satir: Any) -> Tuple[Optional[AntrenmanOturumuTemel], List[Tuple[str, str]]]:
+    oturum_turu, hatalar = _turu_bul(satir)
+    if oturum_turu is None:
+        return None, hatalar
+    _, degerler = _grubu_dogrula(oturum_turu, [0], [satir], False, hatalar)
+    if hatalar:
+        return None, hatalar[0][2]
+    sutunlar = dict(zip(OTURUM_ALANLARI[oturum_turu], degerler))
+    return OTURUM_SINIFLARI[oturum_turu].sutunlardan_kur(sutunlar)[0], []
+
+
+# Dosyadaki oturumları doğrulayıp çakışma kontrolüyle toplu ekleyen içe aktarıcı
+class TopluIceAktarici:
+    """
+    Dosya parca_boyutu'luk parçalar halinde okunur ve süreç havuzuna
+    gönderilir; havuzda en fazla 2 * isci_sayisi parça bekler. Süreçler
+    satırları türlerine göre gruplar ve her alanı (farklı değer başına bir
+    kez) kurucunun kullandığı setter'dan geçirir; ilk hatada durulmaz,
+    satırın tüm hataları toplanır. Geçerli satırlar setter'ların normalize
+    ettiği düz sütunlar olarak geri gelir, ana süreçte doğrulamasız kurulur
+    ve parça parça oturum_olustur_toplu'ya verilir: dosyadaki mükerrer
+    ID'ler ve çakışmalar tek tek eklemeyle aynı sonucu verir (önce gelen
+    kazanır). isci_sayisi=1 iken havuz açılmaz.
+    """
+
+    # İçe aktarıcıyı TrainingManager, işçi süreç sayısı (None: CPU sayısı) ve parça boyutuyla başlatır
+    def __init__(self, manager, isci_sayisi: Optional[int] = None, parca_boyutu: int = VARSAYILAN_PARCA_BOYUTU):
+        if isci_sayisi is not None and (not isinstance(isci_sayisi, int) or isci_sayisi <= 0):
+            raise ValueError(f"İşçi sayısı pozitif tam sayı olmalıdır, alınan: {isci_sayisi}")
+        if not isinstance(parca_boyutu, int) or parca_boyutu <= 0:
+            raise ValueError(f"Parça boyutu pozitif tam sayı olmalıdır, alınan: {parca_boyutu}")
+        self._manager = manager
+        self._isci_sayisi = isci_sayisi or os.cpu_count() or 1
+        self._parca_boyutu = parca_boyutu
+
+    # Dosyayı içe aktarır; biçim verilmezse uzantıdan (.jsonl/.csv, ardından isteğe bağlı .gz) anlaşılır
+    def ice_aktar(self, yol: str, bicim: Optional[str] = None) -> IceAktarimRaporu:
+        bicim = bicim or _bicimi_bul(yol)
+        if bicim not in BICIMLER:
+            raise ValueError(f"İçe aktarım biçimi {BICIMLER} değerlerinden biri olmalıdır, alınan: '{bicim}'")
+
+        baslangic = perf_counter()
+        okunan = eklenen = 0
+        reddedilenler: List[ReddedilenSatir] = []
+        with _dosya_ac(yol) as dosya:
+            for sonuc in self._sonuclar(_is_yukleri(dosya, bicim, self._parca_boyutu, self._isci_sayisi > 1)):
+                okunan += sonuc["adet"]
+                eklenen += self._parcayi_ekle(sonuc, reddedilenler)
+        reddedilenler.sort(key=attrgetter("satir_no"))
+        return IceAktarimRaporu(okunan, eklenen, reddedilenler, perf_counter() - baslangic)
+
+    # Parça doğrulama sonuçlarını dosya sırasıyla üretir
+    def _sonuclar(self, is_yukleri: Iterator[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        if self._isci_sayisi == 1:
+            yield from map(_parca_dogrula, is_yukleri)
+            return
+
+        bekleyenler: Deque[Future] = deque()
+        with ProcessPoolExecutor(max_workers=self._isci_sayisi) as havuz:
+            for is_yuku in is_yukleri:
+                bekleyenler.append(havuz.submit(_parca_dogrula, is_yuku))
+                if len(bekleyenler) >= 2 * self._isci_sayisi:
+                    yield bekleyenler.popleft().result()
+            while bekleyenler:
+                yield bekleyenler.popleft().result()
+
+    # Parçanın geçerli satırlarını kurup toplu ekler, reddedilenleri listeye ekler; eklenen sayısını döndürür
+    def _parcayi_ekle(self, sonuc: Dict[str, Any], reddedilenler: List[ReddedilenSatir]) -> int:
+        ilk_no = sonuc["ilk_no"]
+        for sira, oturum_id, hatalar in sonuc["hatalar"]:
+            reddedilenler.append(ReddedilenSatir(ilk_no + sira, oturum_id, GECERSIZ, hatalar))
+
+        siralar: List[int] = []
+        oturumlar: List[AntrenmanOturumuTemel] = []
+        for oturum_turu, grup_siralari, degerler, damgalar in sonuc["gruplar"]:
+            sutunlar = dict(zip(OTURUM_ALANLARI[oturum_turu], degerler))
+            if damgalar is not None:
+                sutunlar["tarih_saat"] = list(map(damgadan_tarih, damgalar))
+            siralar.extend(grup_siralari)
+            oturumlar.extend(OTURUM_SINIFLARI[oturum_turu].sutunlardan_kur(sutunlar))
+        if not oturumlar:
+            return 0
+
+        # Gruplar türe göre ayrıldığından dosya sırası yeniden kurulur (çakışmada önce gelen kazanır)
+        sirali = sorted(range(len(oturumlar)), key=siralar.__getitem__)
+        oturumlar = [oturumlar[i] for i in sirali]
+        siralar = [siralar[i] for i in sirali]
+
+        rapor = self._manager.oturum_olustur_toplu(oturumlar)
+        for sonuc_maddesi in rapor.reddedilenler:
+            alan = "oturum_id" if sonuc_maddesi.durum == MUKERRER_ID else "tarih_saat"
+            reddedilenler.append(ReddedilenSatir(ilk_no + siralar[sonuc_maddesi.sira], sonuc_maddesi.oturum_id,
+                                                 sonuc_maddesi.durum, [(alan, sonuc_maddesi.sebep)]))
+        return len(oturumlar) - len(rapor.reddedilenler)
+
+
+# Dosyayı parçalara böler; JSONL'de ham satırlar, CSV'de (C ayrıştırıcıyla) hücre listeleri gönderilir
+# (damgala: doğrulanan tarihler süreç sınırını geçeceği için damgaya çevrilsin mi)
+def _is_yukleri(dosya: TextIO, bicim: str, parca_boyutu: int, damgala: bool) -> Iterator[Dict[str, Any]]:
+    if bicim == "csv":
+        okuyucu = csv.reader(dosya)
+        baslik = next(okuyucu, None)
+    else:
+        okuyucu = dosya
+        baslik = None
+    ilk_no = 1
+    while True:
+        satirlar = list(islice(okuyucu, parca_boyutu))
+        if not satirlar:
+            return
+        yield {"bicim": bicim, "baslik": baslik, "satirlar": satirlar, "ilk_no": ilk_no,
+               "damgala": damgala}
+        ilk_no += len(satirlar)
+
+
+# Süreçte bir parçayı doğrular; geçerli satırları tür bazında düz sütunlar, geçersizleri hatalarıyla döndürür
+def _parca_dogrula(is_yuku: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Satır numarası JSONL'de dosya satırı, CSV'de başlıktan sonraki kayıt
+    sırasıdır (1'den başlar). Boş JSONL satırları atlanır ve sayılmaz.
+    """
+    hatalar: List[Tuple[int, Any, List[Tuple[str, str]]]] = []
+    turler: Dict[str, Tuple[List[int], List[Mapping[str, Any]]]] = {}
+    csv_mi = is_yuku["bicim"] == "csv"
+    for sira, satir in _satirlari_coz(is_yuku, hatalar):
+        oturum_turu, tur_hatalari = _turu_bul(satir)
+        if oturum_turu is None:
+            hatalar.append((sira, satir.get("oturum_id") if isinstance(satir, abc.Mapping) else None, tur_hatalari))
+            continue
+        siralar, satirlar = turler.setdefault(oturum_turu, ([], []))
+        siralar.append(sira)
+        satirlar.append(satir)
+    # Okunan: çözülemeyen ve türü bilinmeyen satırlar dahil, boş olmayan tüm satırlar
+    adet = len(hatalar) + sum(len(siralar) for siralar, _ in turler.values())
+
+    gruplar = []
+    for oturum_turu, (siralar, satirlar) in turler.items():
+        gecerli_siralar, degerler = _grubu_dogrula(oturum_turu, siralar, satirlar, csv_mi, hatalar)
+        if not gecerli_siralar:
+            continue
+        damgalar = None
+        if is_yuku["damgala"]:
+            # Süreçlere tarihler datetime yerine damga olarak gönderilir; sütundaki nesneler pickle edilmez
+            tarih_sirasi = OTURUM_ALANLARI[oturum_turu].index("tarih_saat")
+            damgalar = list(map(mikrosaniye_damgasi, degerler[tarih_sirasi]))
+            degerler[tarih_sirasi] = None
+        gruplar.append((oturum_turu, gecerli_siralar, degerler, damgalar))
+    return {"ilk_no": is_yuku["ilk_no"], "adet": adet, "gruplar": gruplar, "hatalar": hatalar}
+
+
+# Parçanın satırlarını (parça içi sıra, çözülmüş değer) olarak üretir; çözülemeyen satırlar hatalara eklenir
+def _satirlari_coz(is_yuku: Dict[str, Any], hatalar: list) -> Iterator[Tuple[int, Any]]:
+    if is_yuku["bicim"] == "csv":
+        baslik = is_yuku["baslik"]
+        for sira, hucreler in enumerate(is_yuku["satirlar"]):
+            if len(hucreler) != len(baslik):
+                hatalar.append((sira, None, [("satir", f"Hücre sayısı başlıkla uyuşmuyor: {len(hucreler)} != {len(baslik)}")]))
+            else:
+                yield sira, dict(zip(baslik, hucreler))
+        return
+
+    for sira, metin in enumerate(is_yuku["satirlar"]):
+        if not metin.strip():
+            continue
+        try:
+            yield sira, json.loads(metin)
+        except ValueError as hata:
+            hatalar.append((sira, None, [("satir", f"Geçersiz JSON: {hata}")]))
+
+
+# Satırın oturum türünü döndürür; satır nesne değilse veya tür bilinmiyorsa (None, hata) döndürür
+def _turu_bul(satir: Any) -> Tuple[Optional[str], List[Tuple[str, str]]]:
+    if not isinstance(satir, abc.Mapping):
+        return None, [("satir", f"Satır bir nesne olmalıdır, alınan: {type(satir).__name__}")]
+    oturum_turu = satir.get("oturum_turu")
+    if oturum_turu not in OTURUM_SINIFLARI:
+        return None, [("oturum_turu", f"Bilinmeyen oturum türü: '{oturum_turu}'")]
+    return oturum_turu, []
+
+
+# Bir türün satırlarını setter kurallarıyla doğrular; (geçerli satır sıraları, alan başına normalize sütunlar) döndürür
+def _grubu_dogrula(oturum_turu: str, siralar: List[int], satirlar: List[Mapping[str, Any]], csv_mi: bool,
+                   hatalar: list) -> Tuple[List[int], List[list]]:
+    """
+    Setter'lar birbirinden bağımsızdır ve sonuçları yalnızca değere
+    bağlıdır; bu yüzden her sütunun her farklı (tip, değer) çifti tek bir
+    örnek nesnenin setter'ından bir kez geçirilir ve sonuç (normalize değer
+    veya hata mesajı) tüm satırlara eşlenir. Satırın her alanı ayrı
+    doğrulandığından ilk hatada durulmaz; hatalar alan sırasıyla toplanır.
+    """
+    sinif = OTURUM_SINIFLARI[oturum_turu]
+    alanlar = OTURUM_ALANLARI[oturum_turu]
+    varsayilanlar = sinif.satir_alanlari()
+    ornek = object.__new__(sinif)
+    satir_hatalari: Dict[int, List[Tuple[str, str]]] = {}
+    sutunlar = [
+        _sutunu_dogrula(ornek, alan, [satir.get(alan) for satir in satirlar], varsayilanlar[alan], csv_mi,
+                        satir_hatalari)
+        for alan in alanlar
+    ]
+    if not satir_hatalari:
+        return siralar, sutunlar
+
+    oturum_idleri = sutunlar[alanlar.index("oturum_id")]
+    for i in sorted(satir_hatalari):
+        oturum_id = oturum_idleri[i] if oturum_idleri[i] is not None else satirlar[i].get("oturum_id")
+        hatalar.append((siralar[i], oturum_id, satir_hatalari[i]))
+    gecerliler = [i for i in range(len(satirlar)) if i not in satir_hatalari]
+    return [siralar[i] for i in gecerliler], [[sutun[i] for i in gecerliler] for sutun in sutunlar]
+
+
+# Sütunu her farklı değer için bir kez setter'dan geçirir; hatalı hücreleri satir_hatalari'na ekler
+def _sutunu_dogrula(ornek: AntrenmanOturumuTemel, alan: str, kolon: list, varsayilan: Any, csv_mi: bool,
+                    satir_hatalari: Dict[int, List[Tuple[str, str]]]) -> list:
+    # Tip de anahtara katılır: 1, 1.0 ve True eşit hash'lenir ama setter'lar onları farklı değerlendirebilir
+    anahtarlar = list(zip(map(type, kolon), kolon))
+    try:
+        farkli_anahtarlar = set(anahtarlar)
+    except TypeError:
+        sonuclar = [_setter_sonucu(ornek, alan, deger, varsayilan, csv_mi) for deger in kolon]
+    else:
+        onbellek = {anahtar: _setter_sonucu(ornek, alan, anahtar[1], varsayilan, csv_mi)
+                    for anahtar in farkli_anahtarlar}
+        if all(mesaj is None for _, mesaj in onbellek.values()):
+            return [onbellek[anahtar][0] for anahtar in anahtarlar]
+        sonuclar = list(map(onbellek.__getitem__, anahtarlar))
+
+    for i, (_, mesaj) in enumerate(sonuclar):
+        if mesaj is not None:
+            satir_hatalari.setdefault(i, []).append((alan, mesaj))
+    return [deger for deger, _ in sonuclar]
+
+
+# Ham değeri (gerekirse çevirip) örnek nesnenin setter'ından geçirir; (normalize değer, hata veya None) döndürür
+def _setter_sonucu(ornek: AntrenmanOturumuTemel, alan: str, deger: Any, varsayilan: Any,
+                   csv_mi: bool) -> Tuple[Any, Optional[str]]:
+    # Verilmemiş alan (CSV'de boş hücre) kurucudaki gibi varsayılanını alır
+    if deger is None or (csv_mi and deger == ""):
+        deger = varsayilan
+    if deger is EKSIK_ALAN:
+        return None, "Zorunlu alan eksik"
+    if deger is None:
+        return None, None
+
+    # CSV'de çevrilemeyen sayılar metin olarak kalır ve setter'ın kendi hatasıyla reddedilir
+    if csv_mi and alan in _TAM_SAYI_ALANLARI:
+        try:
+            deger = int(deger)
+        except ValueError:
+            pass
+    elif csv_mi and alan in _ONDALIK_ALANLARI:
+        try:
+            deger = float(deger)
+        except ValueError:
+            pass
+    elif alan == "tarih_saat" and isinstance(deger, str):
+        try:
+            deger = datetime.fromisoformat(deger)
+        except ValueError:
+            return None, f"Tarih ve saat ISO 8601 biçiminde olmalıdır, alınan: '{deger}'"
+
+    try:
+        setattr(ornek, alan, deger)
+    except (AntrenmanHatasi, ValueError, TypeError) as hata:
+        return None, str(hata)
+    return getattr(ornek, "_" + alan), None
+
+
+# Dosya adından biçimi çıkarır (sondaki .gz yok sayılır)
+def _bicimi_bul(yol: str) -> str:
+    ad = yol[:-3] if yol.endswith(".gz") else yol
+    return os.path.splitext(ad)[1].lstrip(".").lower()
+
+
+# Kaynak dosyayı metin olarak (.gz ise gzip ile) açar; CSV'nin hücre içi satır sonları için newline=""
+def _dosya_ac(yol: str) -> TextIO:
+    if yol.endswith(".gz"):
+        return gzip.open(yol, "rt", encoding="utf-8", newline="")
+    return open(yol, encoding="utf-8", newline="")
@@ -2,10 +2,17 @@
 Antrenman ve Program modülü için implementasyon sınıfları.
 Subclass'lar, entity/model sınıfları ve service katmanı burada yer alır.
 """
-from datetime import datetime
-from typing import Optional, Dict, Any, List
-
-from .base import AntrenmanOturumuTemel
+from datetime import datetime, timedelta
+from time import perf_counter
+from typing import Optional, Dict, Any, Iterable, List, Set
+
+from .base import (
+    AntrenmanOturumuTemel,
+    _metin_sutunu,
+    _not_sutunu,
+    _secenek_sutunu,
+    _tam_sayi_sutunu
+)
 from .exceptions import (
     GecersizSporcuIdHatasi,
     GecersizTakimIdHatasi,
@@ -16,10 +23,32 @@ from .exceptions import (
     TakvimCakismasiHatasi,
     OturumBulunamadiHatasi
 )
+from .olaylar import (
+    CAKISMA_REDDEDILDI,
+    IPTAL_EDILDI,
+    NOT_GUNCELLENDI,
+    OLUSTURULDU,
+    PLANLANDI,
+    TAMAMLANDI,
+    TOPLU_OLUSTURULDU,
+    AntrenmanOlayi,
+    OlayDinleyici
+)
+from .tekrar import TekrarKurali, tekrarlayan_oturumlar
+from .toplu import (
+    CAKISMA,
+    EKLENDI,
+    MUKERRER_ID,
+    TopluIslemRaporu,
+    TopluIslemSonucu,
+    cakisan_ciftleri_bul
+)
 
 
 # Bireysel antrenman oturumu subclass'ı - tek sporcu için özel antrenman seansları
 class IndividualTrainingSession(AntrenmanOturumuTemel):
+    # Alt sınıfa özel alanlar (temel sınıfın __slots__ düzenine eklenir)
+    __slots__ = ("_antrenor_id", "_odak_alani", "_performans_notu")
     
     MIN_PERFORMANS_NOTU = 0
     MAX_PERFORMANS_NOTU = 10
@@ -114,6 +143,28 @@ class IndividualTrainingSession(AntrenmanOturumuTemel):
         else:
             self._performans_notu = None
 
+    # Bireysel oturum alanlarını sütun bazında doğrular (satirlardan_olustur için)
+    @classmethod
+    def _sutunlari_dogrula(cls, sutunlar: Dict[str, list]) -> None:
+        super()._sutunlari_dogrula(sutunlar)
+        _tam_sayi_sutunu(sutunlar["antrenor_id"], 1)
+        sutunlar["odak_alani"] = _secenek_sutunu(sutunlar["odak_alani"], cls.GECERLI_ODAK_ALANLARI)
+        sutunlar["performans_notu"] = _not_sutunu(
+            sutunlar["performans_notu"], cls.MIN_PERFORMANS_NOTU, cls.MAX_PERFORMANS_NOTU
+        )
+
+    # Bireysel oturuma özel alanları hazır sütunlardan atar
+    @classmethod
+    def sutunlardan_kur(cls, sutunlar: Dict[str, list]) -> List[AntrenmanOturumuTemel]:
+        oturumlar = super().sutunlardan_kur(sutunlar)
+        for oturum, antrenor_id, odak_alani, performans_notu in zip(
+            oturumlar, sutunlar["antrenor_id"], sutunlar["odak_alani"], sutunlar["performans_notu"]
+        ):
+            oturum._antrenor_id = antrenor_id
+            oturum._odak_alani = odak_alani
+            oturum._performans_notu = performans_notu
+        return oturumlar
+
     # Bireysel antrenman oturumunun detaylı bilgilerini döndürür
     def oturum_detaylari_getir(self) -> Dict[str, Any]:
         detaylar = {
@@ -145,34 +196,35 @@ class IndividualTrainingSession(AntrenmanOturumuTemel):
 
     # Bireysel antrenman oturumu için detaylı rapor oluşturur
     def bireysel_rapor_olustur(self) -> str:
-        rapor = f"=== BİREYSEL ANTRENMAN RAPORU ===\n"
-        rapor += f"Oturum ID: {self.oturum_id}\n"
-        rapor += f"Sporcu ID: {self.athlete_id}\n"
-        rapor += f"Antrenör ID: {self.antrenor_id}\n"
-        rapor += f"Odak Alanı: {self.odak_alani.upper()}\n"
-        rapor += f"Oturum Tipi: {self.oturum_tipi.upper()}\n"
-        rapor += f"Süre: {self.sure} dakika ({self.sure // 60} saat {self.sure % 60} dakika)\n"
-        
+        # Satırlar listede toplanıp tek join ile birleştirilir (tekrarlı += her adımda metni kopyalar)
+        satirlar = [
+            "=== BİREYSEL ANTRENMAN RAPORU ===",
+            f"Oturum ID: {self.oturum_id}",
+            f"Sporcu ID: {self.athlete_id}",
+            f"Antrenör ID: {self.antrenor_id}",
+            f"Odak Alanı: {self.odak_alani.upper()}",
+            f"Oturum Tipi: {self.oturum_tipi.upper()}",
+            f"Süre: {self.sure} dakika ({self.sure // 60} saat {self.sure % 60} dakika)",
+        ]
         if self.tarih_saat:
-            rapor += f"Tarih/Saat: {self.tarih_saat.strftime('%d.%m.%Y %H:%M')}\n"
-        
-        rapor += f"Durum: {self.durum.upper()}\n"
-        
-        if self.performans_notu is not None:
-            rapor += f"Performans Notu: {self.performans_notu}/10\n"
-            if self.performans_notu >= 8:
-                rapor += "Değerlendirme: Mükemmel performans!\n"
-            elif self.performans_notu >= 6:
-                rapor += "Değerlendirme: İyi performans.\n"
+            satirlar.append(f"Tarih/Saat: {self.tarih_saat.strftime('%d.%m.%Y %H:%M')}")
+        satirlar.append(f"Durum: {self.durum.upper()}")
+
+        performans_notu = self.performans_notu
+        if performans_notu is not None:
+            satirlar.append(f"Performans Notu: {performans_notu}/10")
+            if performans_notu >= 8:
+                satirlar.append("Değerlendirme: Mükemmel performans!")
+            elif performans_notu >= 6:
+                satirlar.append("Değerlendirme: İyi performans.")
             else:
-                rapor += "Değerlendirme: Geliştirilmesi gereken alanlar var.\n"
+                satirlar.append("Değerlendirme: Geliştirilmesi gereken alanlar var.")
         else:
-            rapor += "Performans Notu: Henüz değerlendirilmedi\n"
-        
-        rapor += f"Tahmini Maliyet: {self.oturum_maliyeti_hesapla()} TL\n"
-        rapor += "=" * 35
-        
-        return rapor
+            satirlar.append("Performans Notu: Henüz değerlendirilmedi")
+
+        satirlar.append(f"Tahmini Maliyet: {self.oturum_maliyeti_hesapla()} TL")
+        satirlar.append("=" * 35)
+        return "\n".join(satirlar)
 
     # Yeni bir bireysel antrenman oturumu oluşturur
     @classmethod
@@ -230,6 +282,8 @@ class IndividualTrainingSession(AntrenmanOturumuTemel):
 
 # Takım antrenman oturumu subclass'ı - birden fazla sporcu için antrenman seansları
 class TeamTrainingSession(AntrenmanOturumuTemel):
+    # Alt sınıfa özel alanlar (temel sınıfın __slots__ düzenine eklenir)
+    __slots__ = ("_saha_id", "_katilimci_sayisi", "_antrenman_plani")
     
     MIN_KATILIMCI = 2
     MAX_KATILIMCI = 30
@@ -320,6 +374,26 @@ class TeamTrainingSession(AntrenmanOturumuTemel):
             )
         self._antrenman_plani = plan_formatted
 
+    # Takım oturumu alanlarını sütun bazında doğrular (satirlardan_olustur için)
+    @classmethod
+    def _sutunlari_dogrula(cls, sutunlar: Dict[str, list]) -> None:
+        super()._sutunlari_dogrula(sutunlar)
+        _tam_sayi_sutunu(sutunlar["saha_id"], cls.MIN_SAHA_ID, cls.MAX_SAHA_ID)
+        _tam_sayi_sutunu(sutunlar["katilimci_sayisi"], cls.MIN_KATILIMCI, cls.MAX_KATILIMCI)
+        sutunlar["antrenman_plani"] = _secenek_sutunu(sutunlar["antrenman_plani"], cls.GECERLI_ANTRENMAN_PLANLARI)
+
+    # Takım oturumuna özel alanları hazır sütunlardan atar
+    @classmethod
+    def sutunlardan_kur(cls, sutunlar: Dict[str, list]) -> List[AntrenmanOturumuTemel]:
+        oturumlar = super().sutunlardan_kur(sutunlar)
+        for oturum, saha_id, katilimci_sayisi, antrenman_plani in zip(
+            oturumlar, sutunlar["saha_id"], sutunlar["katilimci_sayisi"], sutunlar["antrenman_plani"]
+        ):
+            oturum._saha_id = saha_id
+            oturum._katilimci_sayisi = katilimci_sayisi
+            oturum._antrenman_plani = antrenman_plani
+        return oturumlar
+
     # Takım antrenman oturumunun detaylı bilgilerini döndürür
     def oturum_detaylari_getir(self) -> Dict[str, Any]:
         detaylar = {
@@ -436,6 +510,8 @@ class TeamTrainingSession(AntrenmanOturumuTemel):
 
 # Rehabilitasyon antrenman oturumu subclass'ı - sakatlık sonrası rehabilitasyon seansları
 class RehabTrainingSession(AntrenmanOturumuTemel):
+    # Alt sınıfa özel alanlar (temel sınıfın __slots__ düzenine eklenir)
+    __slots__ = ("_fizyoterapist_id", "_sakatlik_tipi", "_rehab_programi", "_ilerleme_notu")
     
     GECERLI_SAKATLIK_TIPLERI = ["kas", "eklem", "kırık", "burkulma", "yırtık", "diğer"]
     MIN_ILERLEME_NOTU = 0
@@ -548,6 +624,35 @@ class RehabTrainingSession(AntrenmanOturumuTemel):
         else:
             self._ilerleme_notu = None
 
+    # Rehabilitasyon ilerleme notunu günceller
+    def ilerleme_notu_guncelle(self, yeni_not: float) -> None:
+        self.ilerleme_notu = yeni_not
+
+    # Rehabilitasyon oturumu alanlarını sütun bazında doğrular (satirlardan_olustur için)
+    @classmethod
+    def _sutunlari_dogrula(cls, sutunlar: Dict[str, list]) -> None:
+        super()._sutunlari_dogrula(sutunlar)
+        _tam_sayi_sutunu(sutunlar["fizyoterapist_id"], 1)
+        sutunlar["sakatlik_tipi"] = _secenek_sutunu(sutunlar["sakatlik_tipi"], cls.GECERLI_SAKATLIK_TIPLERI)
+        sutunlar["rehab_programi"] = _metin_sutunu(sutunlar["rehab_programi"])
+        sutunlar["ilerleme_notu"] = _not_sutunu(
+            sutunlar["ilerleme_notu"], cls.MIN_ILERLEME_NOTU, cls.MAX_ILERLEME_NOTU
+        )
+
+    # Rehabilitasyon oturumuna özel alanları hazır sütunlardan atar
+    @classmethod
+    def sutunlardan_kur(cls, sutunlar: Dict[str, list]) -> List[AntrenmanOturumuTemel]:
+        oturumlar = super().sutunlardan_kur(sutunlar)
+        for oturum, fizyoterapist_id, sakatlik_tipi, rehab_programi, ilerleme_notu in zip(
+            oturumlar, sutunlar["fizyoterapist_id"], sutunlar["sakatlik_tipi"],
+            sutunlar["rehab_programi"], sutunlar["ilerleme_notu"]
+        ):
+            oturum._fizyoterapist_id = fizyoterapist_id
+            oturum._sakatlik_tipi = sakatlik_tipi
+            oturum._rehab_programi = rehab_programi
+            oturum._ilerleme_notu = ilerleme_notu
+        return oturumlar
+
     # Rehabilitasyon antrenman oturumunun detaylı bilgilerini döndürür
     def oturum_detaylari_getir(self) -> Dict[str, Any]:
         detaylar = {
@@ -873,6 +978,16 @@ class TrainingStatistics:
             iptal_edilen=iptal_edilen,
         )
 
+    # Durum sayımından (durum -> oturum sayısı) istatistik nesnesi oluşturur; repository sayaçlarıyla tarama gerekmez
+    @classmethod
+    def durum_sayimindan_olustur(cls, sporcu_id: int, sayim: Dict[str, int]) -> "TrainingStatistics":
+        return cls(
+            sporcu_id=sporcu_id,
+            toplam_oturum=sum(sayim.values()),
+            tamamlanan=sayim.get("tamamlandi", 0),
+            iptal_edilen=sayim.get("iptal_edildi", 0),
+        )
+
     # Verilen oturum listesi için durumlara göre sayım yapan yardımcı static metot
     @staticmethod
     def durum_sayim(oturumlar: List[AntrenmanOturumuTemel]) -> Dict[str, int]:
@@ -886,17 +1001,37 @@ class TrainingStatistics:
 # Antrenman modülü için Servis (Service) katmanı - iş mantığı kurallarını uygular ve Repository ile haberleşir
 class TrainingManager:
     
-    # TrainingManager örneğini başlatır
-    def __init__(self, repository):
+    # TrainingManager örneğini başlatır; dinleyici verilmezse işlemler sessizdir
+    def __init__(self, repository, dinleyiciler: Optional[Iterable[OlayDinleyici]] = None):
         self.repo = repository
+        self._dinleyiciler: List[OlayDinleyici] = list(dinleyiciler or ())
     
     # Yeni bir TrainingManager örneği oluşturur (class method)
     @classmethod
     def yeni_manager_olustur(cls, repository) -> 'TrainingManager':
         return cls(repository)
 
+    # İşlem olaylarını alacak bir dinleyici ekler
+    def dinleyici_ekle(self, dinleyici: OlayDinleyici) -> None:
+        self._dinleyiciler.append(dinleyici)
+
+    # Daha önce eklenmiş bir dinleyiciyi çıkarır
+    def dinleyici_cikar(self, dinleyici: OlayDinleyici) -> None:
+        self._dinleyiciler.remove(dinleyici)
+
+    # Olayı tüm dinleyicilere iletir; baslangic verilmişse işlem süresi hesaplanır
+    def _yayinla(self, tur: str, oturum_id: Optional[int], baslangic: Optional[float] = None,
+                 detay: Optional[Dict[str, Any]] = None) -> None:
+        sure_sn = perf_counter() - baslangic if baslangic is not None else None
+        olay = AntrenmanOlayi(tur, oturum_id, sure_sn, detay)
+        for dinleyici in self._dinleyiciler:
+            dinleyici.olay_al(olay)
+
     # Yeni bir oturum oluşturur ve çakışma kontrolü yapar
     def oturum_olustur(self, oturum: AntrenmanOturumuTemel) -> None:
+        # Dinleyici yoksa süre ölçülmez ve olay oluşturulmaz
+        baslangic = perf_counter() if self._dinleyiciler else None
+
         # 1. Çakışma Kontrolü (GÜNCELLENMİŞ KISIM)
         if oturum.tarih_saat:
             # Oturum tipine göre ID'leri güvenli şekilde alıyoruz
@@ -913,31 +1048,168 @@ class TrainingManager:
             )
             
             if cakisma_var:
+                if self._dinleyiciler:
+                    self._yayinla(CAKISMA_REDDEDILDI, oturum.oturum_id, baslangic)
                 raise TakvimCakismasiHatasi(f"Bu tarih ve saatte ({oturum.tarih_saat}) planlanan kaynak (sporcu veya saha) dolu!")
 
         # 2. Kayıt
         self.repo.kaydet(oturum)
-        print(f"Bilgi: {oturum.oturum_id} ID'li oturum başarıyla oluşturuldu.")
+        if self._dinleyiciler:
+            self._yayinla(OLUSTURULDU, oturum.oturum_id, baslangic)
+
+    # Birden fazla oturumu tek sweep-line taramasıyla çakışma kontrolünden geçirip çakışmayanları toplu kaydeder
+    def oturum_olustur_toplu(self, oturumlar: Iterable[AntrenmanOturumuTemel]) -> TopluIslemRaporu:
+        """
+        Sonuç, oturumları girdi sırasıyla tek tek oturum_olustur ile eklemekle aynıdır:
+        mevcut bir oturumla çakışan madde reddedilir, toplu içindeki çakışmalarda
+        önce gelen kazanır, reddedilen madde sonrakileri engellemez. İlk hatada
+        durmak yerine her madde için bir sonuç döndürülür; kabul edilenler
+        repository'ye tek seferde yazılır.
+        """
+        baslangic = perf_counter() if self._dinleyiciler else None
+        oturumlar = list(oturumlar)
+        sonuclar: List[Optional[TopluIslemSonucu]] = [None] * len(oturumlar)
+
+        # 1. Mükerrer ID'ler (repository'de veya toplu içinde önceden görülmüş)
+        gorulen: Set[int] = set()
+        adaylar: List[int] = []
+        id_ile_bul = self.repo.id_ile_bul
+        for sira, oturum in enumerate(oturumlar):
+            oturum_id = oturum.oturum_id
+            if oturum_id in gorulen or id_ile_bul(oturum_id) is not None:
+                sonuclar[sira] = TopluIslemSonucu(sira, oturum_id, MUKERRER_ID,
+                                                  f"Oturum ID {oturum_id} zaten mevcut.")
+            else:
+                adaylar.append(sira)
+            gorulen.add(oturum_id)
+
+        # 2. Tarihli adayların aralıklarını kaynaklarına (sporcu, saha) göre grupla
+        kaynaklar: Dict[tuple, List[tuple]] = {}
+        for sira in adaylar:
+            oturum = oturumlar[sira]
+            tarih_saat = oturum.tarih_saat
+            if tarih_saat is None:
+                continue
+            aralik = (tarih_saat, tarih_saat + timedelta(minutes=oturum.sure), (True, sira))
+            ath_id = getattr(oturum, 'athlete_id', None)
+            saha_id = getattr(oturum, 'saha_id', None)
+            if ath_id is not None:
+                kaynaklar.setdefault(("athlete_id", ath_id), []).append(aralik)
+            if saha_id is not None:
+                kaynaklar.setdefault(("saha_id", saha_id), []).append(aralik)
+
+        # 3. Her kaynakta yeni ve mevcut aralıkları tek taramada kesiştir
+        mevcut_cakismalar: Dict[int, Dict[int, None]] = {}
+        komsular: Dict[int, Set[int]] = {}
+        kaynak_zaman_araliklari = self.repo.kaynak_zaman_araliklari
+        for (alan, kaynak_id), araliklar in kaynaklar.items():
+            if len(araliklar) == 1:
+                en_erken, en_gec = araliklar[0][0], araliklar[0][1]
+            else:
+                en_erken = min(aralik[0] for aralik in araliklar)
+                en_gec = max(aralik[1] for aralik in araliklar)
+            mevcutlar = kaynak_zaman_araliklari(en_erken, en_gec, **{alan: kaynak_id})
+            # Kaynakta tek yeni aralık varsa ve mevcut aralık yoksa çakışacak bir şey yoktur
+            if not mevcutlar and len(araliklar) == 1:
+                continue
+            for baslangic, bitis, oturum_id in mevcutlar:
+                araliklar.append((baslangic, bitis, (False, oturum_id)))
+
+            for (birinci_yeni, birinci), (ikinci_yeni, ikinci) in cakisan_ciftleri_bul(araliklar):
+                if birinci_yeni and ikinci_yeni:
+                    komsular.setdefault(birinci, set()).add(ikinci)
+                    komsular.setdefault(ikinci, set()).add(birinci)
+                elif birinci_yeni:
+                    mevcut_cakismalar.setdefault(birinci, {})[ikinci] = None
+                elif ikinci_yeni:
+                    mevcut_cakismalar.setdefault(ikinci, {})[birinci] = None
+
+        # 4. Girdi sırasıyla karar ver: önce kabul edilen kazanır
+        kabul_edilenler: Set[int] = set()
+        for sira in adaylar:
+            oturum = oturumlar[sira]
+            mevcutlar = mevcut_cakismalar.get(sira)
+            komsu = komsular.get(sira)
+            if mevcutlar is None and (komsu is None or komsu.isdisjoint(kabul_edilenler)):
+                kabul_edilenler.add(sira)
+                sonuclar[sira] = TopluIslemSonucu(sira, oturum.oturum_id, EKLENDI)
+                continue
+
+            cakisan_idler = list(mevcutlar or ())
+            cakisan_idler += sorted(oturumlar[diger].oturum_id for diger in komsu or ()
+                                    if diger in kabul_edilenler)
+            sonuclar[sira] = TopluIslemSonucu(
+                sira, oturum.oturum_id, CAKISMA,
+                f"Bu tarih ve saatte ({oturum.tarih_saat}) planlanan kaynak (sporcu veya saha) dolu!",
+                cakisan_idler
+            )
+
+        # 5. Kabul edilenleri tek seferde kaydet
+        self.repo.kaydet_toplu([oturumlar[sira] for sira in adaylar if sira in kabul_edilenler])
+
+        rapor = TopluIslemRaporu(sonuclar)
+        if self._dinleyiciler:
+            # Madde olayları süresizdir; ölçülen süre toplu işlemin tamamına aittir
+            for sonuc in sonuclar:
+                if sonuc.basarili:
+                    self._yayinla(OLUSTURULDU, sonuc.oturum_id)
+                elif sonuc.durum == CAKISMA:
+                    self._yayinla(CAKISMA_REDDEDILDI, sonuc.oturum_id, detay={"cakisan_idler": sonuc.cakisan_idler})
+            self._yayinla(TOPLU_OLUSTURULDU, None, baslangic, {
+                "eklenen": len(kabul_edilenler),
+                "reddedilen": len(oturumlar) - len(kabul_edilenler),
+            })
+        return rapor
 
     # Bir oturumu iptal eder
     def oturum_iptal_et(self, oturum_id: int) -> None:
+        baslangic = perf_counter() if self._dinleyiciler else None
         oturum = self.repo.id_ile_bul(oturum_id)
         if not oturum:
             raise OturumBulunamadiHatasi()
         
         oturum.oturum_iptal_et()
         self.repo.guncelle(oturum) 
-        print(f"Bilgi: {oturum_id} ID'li oturum iptal edildi.")
+        if self._dinleyiciler:
+            self._yayinla(IPTAL_EDILDI, oturum_id, baslangic)
 
     # Bir oturumu tamamlandı olarak işaretler
     def oturum_tamamla(self, oturum_id: int) -> None:
+        baslangic = perf_counter() if self._dinleyiciler else None
         oturum = self.repo.id_ile_bul(oturum_id)
         if not oturum:
             raise OturumBulunamadiHatasi()
         
         oturum.oturum_tamamla()
         self.repo.guncelle(oturum)
-        print(f"Bilgi: {oturum_id} ID'li oturum tamamlandı olarak işaretlendi.")
+        if self._dinleyiciler:
+            self._yayinla(TAMAMLANDI, oturum_id, baslangic)
+
+    # Bir oturumu çakışma kontrolü yaparak yeni tarihe planlar ve repository indekslerini günceller
+    def oturum_planla(self, oturum_id: int, yeni_tarih_saat: datetime) -> None:
+        baslangic = perf_counter() if self._dinleyiciler else None
+        oturum = self.repo.id_ile_bul(oturum_id)
+        if not oturum:
+            raise OturumBulunamadiHatasi()
+        if not isinstance(yeni_tarih_saat, datetime):
+            raise GecersizTarihSaatHatasi(f"Tarih ve saat datetime objesi olmalıdır, alınan: {type(yeni_tarih_saat).__name__}")
+
+        cakisma_var = self.repo.detayli_cakisma_kontrol(
+            tarih=yeni_tarih_saat,
+            sure_dk=oturum.sure,
+            haric_id=oturum.oturum_id,
+            athlete_id=getattr(oturum, 'athlete_id', None),
+            saha_id=getattr(oturum, 'saha_id', None)
+        )
+        if cakisma_var:
+            if self._dinleyiciler:
+                self._yayinla(CAKISMA_REDDEDILDI, oturum_id, baslangic, {"tarih_saat": yeni_tarih_saat})
+            raise TakvimCakismasiHatasi(f"Bu tarih ve saatte ({yeni_tarih_saat}) planlanan kaynak (sporcu veya saha) dolu!")
+
+        oturum.oturum_planla(yeni_tarih_saat)
+        self.repo.guncelle(oturum)
+        if self._dinleyiciler:
+            self._yayinla(PLANLANDI, oturum_id, baslangic, {"tarih_saat": yeni_tarih_saat})
 
     # Sporcunun antrenman geçmişini ve gelecek programını raporlar
     def sporcu_programi_getir(self, athlete_id: int) -> List[Dict[str, Any]]:
@@ -947,27 +1219,53 @@ class TrainingManager:
             rapor.append(o.oturum_detaylari_getir())
         return rapor
 
+    # Bireysel oturumun performans notunu günceller ve eski/yeni notla olay yayınlar
+    def performans_notu_guncelle(self, oturum_id: int, yeni_not: float) -> None:
+        self._not_guncelle(oturum_id, yeni_not, IndividualTrainingSession, "performans_notu")
+
+    # Rehabilitasyon oturumunun ilerleme notunu günceller ve eski/yeni notla olay yayınlar
+    def ilerleme_notu_guncelle(self, oturum_id: int, yeni_not: float) -> None:
+        self._not_guncelle(oturum_id, yeni_not, RehabTrainingSession, "ilerleme_notu")
+
+    # Oturumun not alanını kendi *_guncelle metoduyla günceller (analiz dinleyicileri eski notu olaydan alır)
+    def _not_guncelle(self, oturum_id: int, yeni_not: float, sinif: type, alan: str) -> None:
+        baslangic = perf_counter() if self._dinleyiciler else None
+        oturum = self.repo.id_ile_bul(oturum_id)
+        if not oturum:
+            raise OturumBulunamadiHatasi()
+        if not isinstance(oturum, sinif):
+            raise AntrenmanHatasi(f"{oturum_id} ID'li oturumun {alan} alanı yok ({type(oturum).__name__})")
+
+        eski_not = getattr(oturum, alan)
+        getattr(oturum, f"{alan}_guncelle")(yeni_not)
+        self.repo.guncelle(oturum)
+        if self._dinleyiciler:
+            self._yayinla(NOT_GUNCELLENDI, oturum_id, baslangic,
+                          {"alan": alan, "eski_not": eski_not, "yeni_not": getattr(oturum, alan)})
+
+    # Sporcunun istatistiklerini repository'nin canlı durum sayaçlarından oluşturur
+    def sporcu_istatistikleri(self, athlete_id: int) -> TrainingStatistics:
+        return TrainingStatistics.durum_sayimindan_olustur(athlete_id, self.repo.durum_sayilari(athlete_id))
+
+    # Şablon oturumları tekrar kuralına göre çoğaltır ve tek toplu çakışma kontrolüyle kaydeder
+    def program_olustur(
+        self,
+        sablonlar: Iterable[AntrenmanOturumuTemel],
+        kural: TekrarKurali,
+        baslangic_id: int
+    ) -> TopluIslemRaporu:
+        """
+        Her şablonun tekrarları ardışık id bloklarıyla (baslangic_id'den itibaren)
+        tembel üretilir ve oturum_olustur_toplu ile eklenir; çakışan veya id'si
+        mevcut tekrarlar atlanır ve raporda sebebiyle listelenir.
+        """
+        return self.oturum_olustur_toplu(tekrarlayan_oturumlar(sablonlar, kural, baslangic_id))
+
     # Belirli aralıklarla tekrar eden antrenmanlar oluşturur
-    def toplu_program_olustur(self, baslangic_id: int, template_oturum: AntrenmanOturumuTemel, tekrar_sayisi: int, aralik_gun: int):
-        from datetime import timedelta
-        import copy
-        
-        mevcut_tarih = template_oturum.tarih_saat
-        mevcut_id = baslangic_id
-        
-        for _ in range(tekrar_sayisi):
-            yeni_oturum = copy.deepcopy(template_oturum)
-            yeni_oturum.oturum_id = mevcut_id
-            yeni_oturum.tarih_saat = mevcut_tarih
-            
-            try:
-                self.oturum_olustur(yeni_oturum)
-            except Exception as e:
-                print(f"Hata: {mevcut_id} ID'li periyodik oturum oluşturulamadı. Sebep: {e}")
-            
-            mevcut_tarih += timedelta(days=aralik_gun)
-            mevcut_id += 1
-    
+    def toplu_program_olustur(self, baslangic_id: int, template_oturum: AntrenmanOturumuTemel,
+                              tekrar_sayisi: int, aralik_gun: int) -> TopluIslemRaporu:
+        return self.program_olustur([template_oturum], TekrarKurali.gunluk(aralik_gun, tekrar_sayisi), baslangic_id)
+
     # Verilen oturum durumunun geçerli olup olmadığını kontrol eden static metot
     @staticmethod
     def oturum_durumu_gecerli_mi(durum: str) -> bool:
@@ -0,0 +1,159 @@
+"""
+Antrenman repository'si için bellek içi indeks yapıları.
+Zaman aralığı indeksi, kaynak (sporcu/saha) bazında çakışma sorgularını hızlandırır.
+"""
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timedelta
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+
+# Başlangıç zamanına göre sıralı tutulan zaman aralığı indeksi
+class ZamanAraligiIndeksi:
+    """
+    Aralıkları (başlangıç zamanı, oturum_id) sırasına göre iki paralel listede tutar.
+
+    Bir oturumun süresi sınırlı olduğundan (en fazla MAX_SURE dakika), bir
+    sorguyla çakışabilecek aralıkların başlangıcı [sorgu - en uzun süre,
+    sorgu bitişi) penceresindedir. Bu pencere bisect ile bulunur, böylece
+    çakışma sorgusu O(log N + k) maliyetindedir.
+    """
+
+    # Boş bir indeks oluşturur
+    def __init__(self):
+        self._baslangiclar: List[datetime] = []
+        self._kayitlar: List[Tuple[int, datetime]] = []  # (oturum_id, bitis)
+        self._en_uzun_sure = 0
+        # Her değişiklikte artar; indeksten türetilen önbellekler geçerliliğini buna göre kontrol eder
+        self.surum = 0
+
+    # İndeksteki aralık sayısını döndürür
+    def __len__(self) -> int:
+        return len(self._baslangiclar)
+
+    # İndeksin, sonraki değişikliklerden etkilenmeyen bağımsız bir kopyasını döndürür
+    def kopyala(self) -> 'ZamanAraligiIndeksi':
+        kopya = ZamanAraligiIndeksi()
+        kopya._baslangiclar = self._baslangiclar[:]
+        kopya._kayitlar = self._kayitlar[:]
+        kopya._en_uzun_sure = self._en_uzun_sure
+        kopya.surum = self.surum
+        return kopya
+
+    # Yeni bir aralık ekler
+    def ekle(self, baslangic: datetime, sure_dk: int, oturum_id: int) -> None:
+        konum = self._konum_bul(baslangic, oturum_id)
+        self._baslangiclar.insert(konum, baslangic)
+        self._kayitlar.insert(konum, (oturum_id, baslangic + timedelta(minutes=sure_dk)))
+        if sure_dk > self._en_uzun_sure:
+            self._en_uzun_sure = sure_dk
+        self.surum += 1
+
+    # Birden fazla aralığı (baslangic, sure_dk, oturum_id) tek birleştirme geçişiyle ekler
+    def toplu_ekle(self, araliklar: Iterable[Tuple[datetime, int, int]]) -> None:
+        """
+        Tek tek ekle her eklemede listenin kuyruğunu kaydırır (k ekleme için
+        O(k·N)). Burada yeni aralıklar sıralanır, eski listelerdeki konumları
+        bisect ile bulunur ve yeni listeler dilim kopyalarıyla tek geçişte
+        kurulur: O(N + k log N).
+        """
+        araliklar = araliklar if isinstance(araliklar, list) else list(araliklar)
+        # Birkaç aralıkta ekle her birini kendi konumuna yerleştirir; sıralamaya gerek yoktur
+        if len(araliklar) <= 4:
+            for baslangic, sure_dk, oturum_id in araliklar:
+                self.ekle(baslangic, sure_dk, oturum_id)
+            return
+        yeniler = sorted(araliklar, key=lambda aralik: (aralik[0], aralik[2]))
+
+        eski_baslangiclar, eski_kayitlar = self._baslangiclar, self._kayitlar
+        baslangiclar: List[datetime] = []
+        kayitlar: List[Tuple[int, datetime]] = []
+        onceki = 0
+        for baslangic, sure_dk, oturum_id in yeniler:
+            # Yeniler sıralı olduğundan eski listedeki konumları azalmaz
+            konum = self._konum_bul(baslangic, oturum_id)
+            baslangiclar += eski_baslangiclar[onceki:konum]
+            kayitlar += eski_kayitlar[onceki:konum]
+            baslangiclar.append(baslangic)
+            kayitlar.append((oturum_id, baslangic + timedelta(minutes=sure_dk)))
+            if sure_dk > self._en_uzun_sure:
+                self._en_uzun_sure = sure_dk
+            onceki = konum
+        baslangiclar += eski_baslangiclar[onceki:]
+        kayitlar += eski_kayitlar[onceki:]
+
+        self._baslangiclar, self._kayitlar = baslangiclar, kayitlar
+        self.surum += 1
+
+    # (baslangic, oturum_id) çiftinden büyük ilk kaydın konumunu döndürür (eşit başlangıçlar id sırasında)
+    def _konum_bul(self, baslangic: datetime, oturum_id: int) -> int:
+        konum = bisect_left(self._baslangiclar, baslangic)
+        son = bisect_right(self._baslangiclar, baslangic, konum)
+        # Aynı anda başlayan çok sayıda oturum olabilir; eşitler arasında id'ye göre ikili arama yapılır
+        kayitlar = self._kayitlar
+        while konum < son:
+            orta = (konum + son) // 2
+            if kayitlar[orta][0] <= oturum_id:
+                konum = orta + 1
+            else:
+                son = orta
+        return konum
+
+    # Verilen başlangıç zamanındaki aralığı oturum id'sine göre çıkarır
+    def cikar(self, baslangic: datetime, oturum_id: int) -> bool:
+        konum = self._konum_bul(baslangic, oturum_id) - 1
+        if konum < 0 or self._baslangiclar[konum] != baslangic or self._kayitlar[konum][0] != oturum_id:
+            return False
+        del self._baslangiclar[konum]
+        del self._kayitlar[konum]
+        self.surum += 1
+        return True
+
+    # Verilen aralıkla çakışan oturumların id'lerini başlangıç sırasıyla üretir
+    def cakisanlar(self, baslangic: datetime, sure_dk: int) -> Iterator[int]:
+        bitis = baslangic + timedelta(minutes=sure_dk)
+        alt_sinir = baslangic - timedelta(minutes=self._en_uzun_sure)
+
+        ilk = bisect_right(self._baslangiclar, alt_sinir)
+        son = bisect_left(self._baslangiclar, bitis)
+        kayitlar = self._kayitlar
+
+        # İki aralık çakışır <=> baslangic1 < bitis2 ve baslangic2 < bitis1
+        for konum in range(ilk, son):
+            oturum_id, kayit_bitis = kayitlar[konum]
+            if kayit_bitis > baslangic:
+                yield oturum_id
+
+    # Verilen aralıkla çakışan kayıtları (baslangic, bitis, oturum_id) olarak başlangıç sırasıyla üretir
+    def cakisan_araliklar(self, baslangic: datetime, sure_dk: int) -> Iterator[Tuple[datetime, datetime, int]]:
+        bitis = baslangic + timedelta(minutes=sure_dk)
+        alt_sinir = baslangic - timedelta(minutes=self._en_uzun_sure)
+
+        ilk = bisect_right(self._baslangiclar, alt_sinir)
+        son = bisect_left(self._baslangiclar, bitis)
+
+        for konum in range(ilk, son):
+            oturum_id, kayit_bitis = self._kayitlar[konum]
+            if kayit_bitis > baslangic:
+                yield self._baslangiclar[konum], kayit_bitis, oturum_id
+
+    # Başlangıcı [baslangic, bitis] içinde kalan kayıtları (baslangic, oturum_id) olarak sıralı üretir
+    def sirali_kayitlar(
+        self,
+        baslangic: Optional[datetime] = None,
+        bitis: Optional[datetime] = None,
+        imlec: Optional[Tuple[datetime, int]] = None
+    ) -> Iterator[Tuple[datetime, int]]:
+        ilk = 0 if baslangic is None else bisect_left(self._baslangiclar, baslangic)
+        if imlec is not None:
+            # İmleç, son okunan (baslangic, oturum_id) çiftidir; okuma ondan sonra devam eder
+            ilk = max(ilk, self._konum_bul(imlec[0], imlec[1]))
+        son = len(self._baslangiclar) if bitis is None else bisect_right(self._baslangiclar, bitis)
+
+        for konum in range(ilk, son):
+            yield self._baslangiclar[konum], self._kayitlar[konum][0]
+
+    # Başlangıcı [baslangic, bitis] içinde kalan kayıt sayısını döndürür (O(log N); sorgu planlaması için)
+    def aralik_sayisi(self, baslangic: Optional[datetime] = None, bitis: Optional[datetime] = None) -> int:
+        ilk = 0 if baslangic is None else bisect_left(self._baslangiclar, baslangic)
+        son = len(self._baslangiclar) if bitis is None else bisect_right(self._baslangiclar, bitis)
+        return max(0, son - ilk)
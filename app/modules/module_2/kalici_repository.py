@@ -0,0 +1,251 @@
+"""
+Append-only kayıt günlüğü (log) ve snapshot ile kalıcı antrenman repository'si.
+Her kaydet/guncelle/sil işlemi günlüğün sonuna tek satırlık bir kayıt olarak
+eklenir; günlük belirli bir uzunluğa ulaşınca tüm durum snapshot'a yazılır ve
+günlük sıfırlanır. Açılışta son snapshot yüklenir, sadece günlüğün kuyruğu
+yeniden oynatılır.
+"""
+import json
+import os
+from typing import Any, Iterable, List, Optional
+
+from .base import AntrenmanOturumuTemel
+from .repository import TrainingRepository
+from .serilestirme import oturum_sozluge_cevir, sozluklerden_oturumlar_olustur
+from .exceptions import AntrenmanHatasi, DuplicateOturumHatasi, OturumBulunamadiHatasi
+
+# Günlük kaydındaki işlem kodları
+KAYDET = "k"
+GUNCELLE = "g"
+SIL = "s"
+TOPLU_KAYDET = "t"
+
+
+# TrainingRepository'nin değişikliklerini diske yazan kalıcı sürümü
+class KaliciTrainingRepository(TrainingRepository):
+    """
+    Günlük satırı biçimi: [sira, islem, veri]. sira her işlemde bir artar;
+    snapshot'ın ilk satırı içerdiği son sira değerini saklar. Snapshot yazıldıktan
+    sonra günlük kesilmeden önce çökülürse, açılışta sira'sı snapshot'tan küçük
+    veya eşit kayıtlar atlanır. Yarım yazılmış son satır (çökme anında) yok
+    sayılır ve günlükten kesilir.
+
+    İşlem önce günlüğe yazılır, sonra belleğe uygulanır: günlüğe yazılamayan
+    işlem repository'nin sözlüğünü ve indekslerini değiştirmez ve yeniden
+    açılışta görünmez. Repository oturum nesnelerini kopyalamaz (id_ile_bul
+    saklanan nesneyi döndürür); çağıranın guncelle'den önce nesne üzerinde
+    yaptığı değişiklik (ör. TrainingManager.oturum_tamamla) günlük yazılamasa
+    da bellekteki nesnede görünür, indeksler ve diskteki durum ise eski
+    değerde kalır.
+    """
+
+    GUNLUK_DOSYASI = "oturumlar.log"
+    SNAPSHOT_DOSYASI = "oturumlar.snapshot"
+    VARSAYILAN_SNAPSHOT_ESIGI = 10_000
+
+    # Repository'yi verilen klasördeki snapshot ve günlükten yükleyerek başlatır
+    def __init__(self, klasor: str, snapshot_esigi: int = VARSAYILAN_SNAPSHOT_ESIGI, fsync: bool = False):
+        if not isinstance(snapshot_esigi, int) or snapshot_esigi <= 0:
+            raise ValueError(f"Snapshot eşiği pozitif tam sayı olmalıdır, alınan: {snapshot_esigi}")
+
+        super().__init__()
+        os.makedirs(klasor, exist_ok=True)
+        self._klasor = klasor
+        self._snapshot_esigi = snapshot_esigi
+        self._fsync = fsync
+        self._sira = 0
+        self._gunluk_kayit_sayisi = 0
+
+        self._snapshot_yukle()
+        self._gunlugu_oynat()
+        self._gunluk = open(self._gunluk_yolu, "ab")
+
+    # Verilen klasörde yeni bir kalıcı repository örneği oluşturur
+    @classmethod
+    def bos_repository_olustur(cls, klasor: str) -> 'KaliciTrainingRepository':
+        return cls(klasor)
+
+    @property
+    def _gunluk_yolu(self) -> str:
+        return os.path.join(self._klasor, self.GUNLUK_DOSYASI)
+
+    @property
+    def _snapshot_yolu(self) -> str:
+        return os.path.join(self._klasor, self.SNAPSHOT_DOSYASI)
+
+    # Yeni bir antrenman oturumunu günlüğe yazar ve kaydeder
+    def kaydet(self, oturum: AntrenmanOturumuTemel) -> None:
+        if oturum.oturum_id in self._storage:
+            raise DuplicateOturumHatasi(f"Oturum ID {oturum.oturum_id} zaten mevcut.")
+        self._gunluge_yaz(KAYDET, self._kayit_verisi(oturum))
+        super().kaydet(oturum)
+        self._snapshot_gerekirse_al()
+
+    # Birden fazla oturumu günlüğe tek bir kayıt olarak yazar ve kaydeder (açılışta ya hepsi ya hiçbiri yüklenir)
+    def kaydet_toplu(self, oturumlar: Iterable[AntrenmanOturumuTemel]) -> None:
+        oturumlar = list(oturumlar)
+        gorulen = set()
+        for oturum in oturumlar:
+            if oturum.oturum_id in self._storage or oturum.oturum_id in gorulen:
+                raise DuplicateOturumHatasi(f"Oturum ID {oturum.oturum_id} zaten mevcut.")
+            gorulen.add(oturum.oturum_id)
+        self._gunluge_yaz(TOPLU_KAYDET, [self._kayit_verisi(oturum) for oturum in oturumlar])
+        super().kaydet_toplu(oturumlar)
+        self._snapshot_gerekirse_al()
+
+    # Mevcut bir antrenman oturumunu günlüğe yazar ve günceller
+    def guncelle(self, oturum: AntrenmanOturumuTemel) -> None:
+        if oturum.oturum_id not in self._storage:
+            raise OturumBulunamadiHatasi(f"Güncellenecek oturum bulunamadı: ID {oturum.oturum_id}")
+        self._gunluge_yaz(GUNCELLE, self._kayit_verisi(oturum))
+        super().guncelle(oturum)
+        self._snapshot_gerekirse_al()
+
+    # ID'si verilen oturumun silinmesini günlüğe yazar ve oturumu siler
+    def sil(self, oturum_id: int) -> None:
+        if oturum_id not in self._storage:
+            raise OturumBulunamadiHatasi(f"Silinecek oturum bulunamadı: ID {oturum_id}")
+        self._gunluge_yaz(SIL, oturum_id)
+        super().sil(oturum_id)
+        self._snapshot_gerekirse_al()
+
+    # Tüm durumu yeni bir snapshot'a yazar ve günlüğü sıfırlar
+    def snapshot_al(self) -> None:
+        gecici_yol = self._snapshot_yolu + ".tmp"
+        with open(gecici_yol, "wb") as dosya:
+            dosya.write(self._satir({"sira": self._sira}))
+            for oturum in self._storage.values():
+                dosya.write(self._satir(self._kayit_verisi(oturum)))
+            dosya.flush()
+            os.fsync(dosya.fileno())
+        # Yeni snapshot tek adımda eskisinin yerine geçer; yarım snapshot hiç görünmez
+        os.replace(gecici_yol, self._snapshot_yolu)
+        # Yer değiştirme klasör girdisi diske işlenmeden günlük kesilirse çökmede eski snapshot ve boş günlük kalır
+        self._klasoru_fsync()
+
+        self._gunluk.close()
+        self._gunluk = open(self._gunluk_yolu, "wb")
+        self._gunluk_kayit_sayisi = 0
+
+    # Günlük dosyasını kapatır
+    def kapat(self) -> None:
+        if not self._gunluk.closed:
+            self._gunluk.close()
+
+    def __enter__(self) -> 'KaliciTrainingRepository':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.kapat()
+
+    # İşlemi günlüğün sonuna ekler; yazma başarısız olursa yarım kalan satırı geri keser
+    def _gunluge_yaz(self, islem: str, veri: Any) -> None:
+        satir = self._satir([self._sira + 1, islem, veri])
+        konum = self._gunluk.tell()
+        try:
+            self._gunluk.write(satir)
+            self._gunluk.flush()
+            if self._fsync:
+                os.fsync(self._gunluk.fileno())
+        except BaseException:
+            try:
+                self._gunluk.seek(konum)
+                self._gunluk.truncate()
+            except (OSError, ValueError):
+                pass
+            raise
+        self._sira += 1
+        self._gunluk_kayit_sayisi += 1
+
+    # Klasörün girdilerini (yeniden adlandırmalar) diske işler; klasör açılamayan platformlarda (Windows) atlanır
+    def _klasoru_fsync(self) -> None:
+        try:
+            tanimlayici = os.open(self._klasor, os.O_RDONLY)
+        except OSError:
+            return
+        try:
+            os.fsync(tanimlayici)
+        finally:
+            os.close(tanimlayici)
+
+    # Günlük eşiğe ulaştıysa snapshot alır
+    def _snapshot_gerekirse_al(self) -> None:
+        if self._gunluk_kayit_sayisi >= self._snapshot_esigi:
+            self.snapshot_al()
+
+    # Oturumun günlük/snapshot kaydını döndürür (team_id her türde saklanır; sadece takım oturumlarının kurucu alanıdır)
+    @staticmethod
+    def _kayit_verisi(oturum: AntrenmanOturumuTemel) -> dict:
+        veri = oturum_sozluge_cevir(oturum)
+        veri["team_id"] = oturum.team_id
+        return veri
+
+    # Kayıtlardan oturumları kurar ve team_id'lerini geri yükler (kendi yazdığımız veri; doğrulama atlanır)
+    @staticmethod
+    def _kayitlardan_oturumlar(veriler: List[dict]) -> List[AntrenmanOturumuTemel]:
+        oturumlar = sozluklerden_oturumlar_olustur(veriler, dogrula=False)
+        for oturum, veri in zip(oturumlar, veriler):
+            oturum._team_id = veri.get("team_id")
+        return oturumlar
+
+    # Varsa son snapshot'ı belleğe yükler (kendi yazdığımız veri olduğu için setter doğrulaması atlanır)
+    def _snapshot_yukle(self) -> None:
+        if not os.path.exists(self._snapshot_yolu):
+            return
+        with open(self._snapshot_yolu, "rb") as dosya:
+            satirlar = iter(dosya)
+            baslik = json.loads(next(satirlar))
+            self._sira = baslik["sira"]
+            oturumlar = self._kayitlardan_oturumlar([json.loads(satir) for satir in satirlar])
+        for oturum in oturumlar:
+            super().kaydet(oturum)
+
+    # Günlükte snapshot'tan sonraki kayıtları yeniden oynatır, yarım kalan son satırı keser
+    def _gunlugu_oynat(self) -> None:
+        if not os.path.exists(self._gunluk_yolu):
+            return
+        gecerli_uzunluk = 0
+        with open(self._gunluk_yolu, "rb") as dosya:
+            for satir in dosya:
+                kayit = self._kayit_coz(satir)
+                if kayit is None:
+                    break
+                gecerli_uzunluk += len(satir)
+                self._gunluk_kayit_sayisi += 1
+
+                sira, islem, veri = kayit
+                if sira <= self._sira:
+                    continue
+                self._kayit_uygula(islem, veri)
+                self._sira = sira
+
+        if gecerli_uzunluk < os.path.getsize(self._gunluk_yolu):
+            os.truncate(self._gunluk_yolu, gecerli_uzunluk)
+
+    # Tek bir günlük kaydını (günlüğe tekrar yazmadan) bellekteki duruma uygular
+    def _kayit_uygula(self, islem: str, veri: Any) -> None:
+        if islem == KAYDET:
+            super().kaydet(self._kayitlardan_oturumlar([veri])[0])
+        elif islem == GUNCELLE:
+            super().guncelle(self._kayitlardan_oturumlar([veri])[0])
+        elif islem == SIL:
+            super().sil(veri)
+        elif islem == TOPLU_KAYDET:
+            super().kaydet_toplu(self._kayitlardan_oturumlar(veri))
+        else:
+            raise AntrenmanHatasi(f"Günlükte bilinmeyen işlem kodu: '{islem}'")
+
+    # Satırı çözer; eksik ya da bozuk (yarım yazılmış) satır için None döndürür
+    @staticmethod
+    def _kayit_coz(satir: bytes) -> Optional[List[Any]]:
+        if not satir.endswith(b"\n"):
+            return None
+        try:
+            return json.loads(satir)
+        except ValueError:
+            return None
+
+    # Veriyi günlük/snapshot için tek satırlık kompakt JSON'a çevirir
+    @staticmethod
+    def _satir(veri: Any) -> bytes:
+        return (json.dumps(veri, ensure_ascii=False, separators=(",", ":")) + "\n").encode("utf-8")
@@ -0,0 +1,195 @@
+"""
+Antrenman oturumları için vektörel maliyet hesaplama motoru (NumPy).
+Oturumlardan gerekli sütunlar bir kez çıkarılır; fiyatlandırma kuralları
+oturum_maliyeti_hesapla ile aynı sırayla dizi işlemleri olarak uygulanır ve
+toplamlar takım, antrenör, fizyoterapist, ay veya tipe göre gruplanır.
+numpy isteğe bağlı bir bağımlılıktır; yalnızca bu motor için gereklidir.
+"""
+from operator import attrgetter
+from itertools import compress
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from .base import AntrenmanOturumuTemel
+from .implementations import IndividualTrainingSession, TeamTrainingSession, RehabTrainingSession
+
+
+# Bireysel oturum maliyetleri; bayrak 1 = koordinasyon odağı
+def _bireysel_maliyetleri(saat: 'np.ndarray') -> List['np.ndarray']:
+    maliyet = IndividualTrainingSession.SAATLIK_ANTRENOR_UCRETI * saat
+    return [maliyet, maliyet * 1.2]
+
+
+# Takım oturumu maliyetleri; bayrak biti 0 = maç hazırlığı planı, bit 1 = 15'ten fazla katılımcı
+def _takim_maliyetleri(saat: 'np.ndarray') -> List['np.ndarray']:
+    saha_maliyeti = TeamTrainingSession.SAHA_KIRASI_SAATLIK * saat
+    antrenor_maliyeti = TeamTrainingSession.ANTRENOR_UCRETI_SAATLIK * saat
+    normal = saha_maliyeti + antrenor_maliyeti
+    mac_hazirligi = saha_maliyeti + antrenor_maliyeti * 1.3
+    return [normal, mac_hazirligi, normal * 1.1, mac_hazirligi * 1.1]
+
+
+# Rehabilitasyon oturumu maliyetleri; bayrak 1 = kırık/yırtık sakatlık
+def _rehab_maliyetleri(saat: 'np.ndarray') -> List['np.ndarray']:
+    fizyoterapist_maliyeti = RehabTrainingSession.FIZYOTERAPIST_UCRETI_SAATLIK * saat
+    ekipman_maliyeti = RehabTrainingSession.EKIPMAN_MALIYETI_SAATLIK * saat
+    return [fizyoterapist_maliyeti + ekipman_maliyeti, fizyoterapist_maliyeti + ekipman_maliyeti * 1.5]
+
+
+# Oturum sınıfı -> (bayrak kodunu veren fonksiyon, süre ekseninde maliyet dizilerini veren fonksiyon)
+# Yalnızca tam bu sınıflar vektörel hesaplanır; alt sınıflar kendi oturum_maliyeti_hesapla'sını kullanır
+_KURALLAR: Dict[type, Tuple[Callable[[AntrenmanOturumuTemel], int], Callable[['np.ndarray'], List['np.ndarray']]]] = {
+    IndividualTrainingSession: (
+        lambda oturum: oturum.odak_alani == "koordinasyon",
+        _bireysel_maliyetleri,
+    ),
+    TeamTrainingSession: (
+        lambda oturum: (oturum.antrenman_plani == "maç_hazırlığı") + 2 * (oturum.katilimci_sayisi > 15),
+        _takim_maliyetleri,
+    ),
+    RehabTrainingSession: (
+        lambda oturum: oturum.sakatlik_tipi in ("kırık", "yırtık"),
+        _rehab_maliyetleri,
+    ),
+}
+
+# Oturum sınıfı -> "tur" grubu adı (serileştirmedeki oturum_turu değerleri)
+_TUR_ADLARI = {
+    IndividualTrainingSession: "bireysel",
+    TeamTrainingSession: "takım",
+    RehabTrainingSession: "rehabilitasyon",
+}
+
+
+# Grup adı -> grup anahtarını veren oturum özelliği (özelliği olmayan sınıfların oturumları None grubuna düşer)
+# "tur" grubu sınıf kodlarından, "ay" grubu tarih sütunundan hesaplanır
+_GRUP_OZELLIKLERI: Dict[str, str] = {
+    "takim": "team_id",
+    "sporcu": "athlete_id",
+    "antrenor": "antrenor_id",
+    "fizyoterapist": "fizyoterapist_id",
+    "ay": "tarih_saat",
+    "tip": "oturum_tipi",
+}
+
+
+# Oturum maliyetlerini dizi işlemleriyle hesaplayıp gruplayan motor
+class MaliyetMotoru:
+    """
+    Bir oturumun maliyeti yalnızca sınıfına, kural bayraklarına (odak alanı,
+    plan, katılımcı eşiği, sakatlık tipi) ve süresine bağlıdır. Motor her
+    sınıf ve bayrak birleşimi için maliyeti tüm süre değerleri üzerinde
+    oturum_maliyeti_hesapla ile aynı işlem sırasıyla (aynı IEEE sonuçları)
+    tek seferde hesaplar, sonra her oturumun maliyetini bu tablodan okur.
+
+    Yuvarlama tablo hücresi başına Python round(x, 2) ile yapılır (np.round
+    yarım değerlerde farklı sonuç verebilir); maliyetler kuruş cinsinden tam
+    sayı tutulduğundan toplamlar kayan nokta toplama hatası içermez.
+    """
+
+    # Gruplanabilecek alanlar
+    GRUP_ALANLARI = tuple(_GRUP_OZELLIKLERI) + ("tur",)
+
+    # Motoru oturumların maliyet sütunlarını bir kez çıkararak başlatır
+    def __init__(self, oturumlar: Iterable[AntrenmanOturumuTemel]):
+        if np is None:
+            raise ImportError("MaliyetMotoru için numpy gereklidir (pip install numpy)")
+        self._oturumlar = oturumlar if isinstance(oturumlar, list) else list(oturumlar)
+        # Sınıflar küçük tam sayı kodlarına çevrilir (nesne dizisi karşılaştırması yavaştır)
+        siniflar = list(map(type, self._oturumlar))
+        self._siniflar = list(dict.fromkeys(siniflar))
+        sinif_kodlari = {sinif: kod for kod, sinif in enumerate(self._siniflar)}
+        self._sinif_kodlari = np.fromiter(map(sinif_kodlari.__getitem__, siniflar), dtype=np.intp, count=len(siniflar))
+        self._kurus = self._kuruslari_hesapla()
+        # Grup adı -> (anahtarlar, oturum başına grup kodu); ilk gruplamada çıkarılır
+        self._grup_kodlari: Dict[str, Tuple[list, 'np.ndarray']] = {}
+
+    # Repository'deki tüm oturumlar için motor oluşturur
+    @classmethod
+    def repositoryden_olustur(cls, repository) -> 'MaliyetMotoru':
+        return cls(repository.tumunu_listele())
+
+    # Motordaki oturum sayısını döndürür
+    def __len__(self) -> int:
+        return len(self._oturumlar)
+
+    # Oturum başına maliyetleri (giriş sırasıyla) döndürür; değerler oturum_maliyeti_hesapla ile aynıdır
+    def maliyetler(self) -> 'np.ndarray':
+        return self._kurus / 100
+
+    # Tüm oturumların toplam maliyetini döndürür
+    def toplam(self) -> float:
+        return int(self._kurus.sum()) / 100
+
+    # Toplam maliyeti verilen alana göre gruplar (alan: takim, sporcu, antrenor, fizyoterapist, ay, tip, tur)
+    def grupla(self, alan: str) -> Dict[Any, float]:
+        if alan not in self.GRUP_ALANLARI:
+            raise ValueError(f"Gruplama alanı {self.GRUP_ALANLARI} değerlerinden biri olmalıdır, alınan: '{alan}'")
+        anahtarlar, kodlar = self._grup_kodlari_al(alan)
+        toplamlar = np.bincount(kodlar, weights=self._kurus, minlength=len(anahtarlar))
+        return {anahtar: int(round(kurus)) / 100 for anahtar, kurus in zip(anahtarlar, toplamlar.tolist())}
+
+    # Alanın grup anahtarlarını ve oturum başına grup kodlarını döndürür (önbellekli)
+    def _grup_kodlari_al(self, alan: str) -> Tuple[list, 'np.ndarray']:
+        kayit = self._grup_kodlari.get(alan)
+        if kayit is not None:
+            return kayit
+        if alan == "tur":
+            anahtarlar = [_TUR_ADLARI.get(sinif, sinif.__name__) for sinif in self._siniflar]
+            kayit = (anahtarlar, self._sinif_kodlari)
+        else:
+            if alan == "ay":
+                yil_ay = attrgetter("year", "month")
+                degerler = [None if tarih is None else yil_ay(tarih) for tarih in self._sutun("tarih_saat")]
+            else:
+                degerler = self._sutun(_GRUP_OZELLIKLERI[alan])
+            anahtarlar = list(dict.fromkeys(degerler))
+            kod = {anahtar: sira for sira, anahtar in enumerate(anahtarlar)}
+            kayit = (anahtarlar, np.fromiter(map(kod.__getitem__, degerler), dtype=np.intp, count=len(degerler)))
+        self._grup_kodlari[alan] = kayit
+        return kayit
+
+    # Özellik değerlerini giriş sırasıyla döndürür; özelliği olmayan sınıfların oturumları için None
+    def _sutun(self, ozellik: str) -> list:
+        okuyucular = [sinif.alan_okuyucu(ozellik) for sinif in self._siniflar]
+        if None not in okuyucular and len(set(okuyucular)) == 1:
+            return list(map(okuyucular[0], self._oturumlar))
+        degerler = np.full(len(self._oturumlar), None, dtype=object)
+        for kod, okuyucu in enumerate(okuyucular):
+            if okuyucu is not None:
+                maske = self._sinif_kodlari == kod
+                degerler[maske] = list(map(okuyucu, compress(self._oturumlar, maske.tolist())))
+        return degerler.tolist()
+
+    # Her oturumun maliyetini kuruş cinsinden (int64) hesaplar
+    def _kuruslari_hesapla(self) -> 'np.ndarray':
+        kurus = np.zeros(len(self._oturumlar), dtype=np.int64)
+        for kod, sinif in enumerate(self._siniflar):
+            maske = self._sinif_kodlari == kod
+            grup = list(compress(self._oturumlar, maske.tolist()))
+            kural = _KURALLAR.get(sinif)
+            if kural is None:
+                # Bilinmeyen (alt) sınıf: kendi maliyet metodu kullanılır
+                kurus[maske] = [round(oturum.oturum_maliyeti_hesapla() * 100) for oturum in grup]
+                continue
+
+            bayrak_fonksiyonu, maliyet_fonksiyonu = kural
+            sureler = np.fromiter(map(sinif.alan_okuyucu("sure"), grup), dtype=np.int64, count=len(grup))
+            bayraklar = np.fromiter(map(bayrak_fonksiyonu, grup), dtype=np.int64, count=len(grup))
+            tablo = self._kurus_tablosu(maliyet_fonksiyonu, int(sureler.max()))
+            kurus[maske] = tablo[bayraklar, sureler]
+        return kurus
+
+    # Her bayrak birleşimi ve 0..en_uzun_sure süreleri için kuruş cinsinden maliyet tablosunu kurar
+    @staticmethod
+    def _kurus_tablosu(maliyet_fonksiyonu: Callable[['np.ndarray'], List['np.ndarray']],
+                       en_uzun_sure: int) -> 'np.ndarray':
+        saat = np.arange(en_uzun_sure + 1, dtype=np.int64) / 60.0
+        return np.array([
+            [round(round(maliyet, 2) * 100) for maliyet in satir.tolist()]
+            for satir in maliyet_fonksiyonu(saat)
+        ], dtype=np.int64)
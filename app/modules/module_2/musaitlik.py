@@ -0,0 +1,171 @@
+"""
+Antrenman modülü için müsaitlik (boş zaman) arama motoru.
+Sporcu ve saha doluluklarını gün başına slot bitmap'i olarak tutar ve
+istenen süreye uyan en erken boş zamanları bit işlemleriyle bulur.
+"""
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+from .base import AntrenmanOturumuTemel
+from .implementations import TeamTrainingSession
+from .indeks import ZamanAraligiIndeksi
+from .exceptions import (
+    AntrenmanHatasi,
+    GecersizSahaIdHatasi,
+    GecersizSureHatasi,
+    GecersizTarihSaatHatasi
+)
+
+GUN_DAKIKA = 24 * 60
+
+
+# Repository'nin zaman indeksleri üzerinden boş zaman arayan servis sınıfı
+class MusaitlikMotoru:
+    """
+    Her kaynak (sporcu veya saha) için gün başına bir tam sayı bitmap'i tutar:
+    i. bit, günün i. slotunun (slot_dk dakikalık) dolu olduğunu gösterir.
+    Bitmap'ler kaynağın zaman indeksinden tembel olarak üretilir ve indeksin
+    sürümü değişince o kaynak için yeniden hesaplanır.
+
+    Slot sınırına oturmayan oturumlar, kısmen kapladıkları slotları da dolu
+    sayar; bu yüzden dönen her boş zaman detayli_cakisma_kontrol'e göre de boştur.
+    """
+
+    VARSAYILAN_SLOT_DK = 15
+
+    # Motoru verilen repository için başlatır
+    def __init__(self, repository, slot_dk: int = VARSAYILAN_SLOT_DK):
+        if not isinstance(slot_dk, int) or slot_dk <= 0 or GUN_DAKIKA % slot_dk != 0:
+            raise ValueError(f"Slot süresi 1440'ı tam bölen pozitif bir tam sayı olmalıdır, alınan: {slot_dk}")
+
+        self.repo = repository
+        self._slot_dk = slot_dk
+        self._gunluk_slot = GUN_DAKIKA // slot_dk
+        self._slot = timedelta(minutes=slot_dk)
+        # (kaynak_turu, kaynak_id) -> (indeks, indeks_surumu, {gun: bitmap})
+        self._onbellek: Dict[Tuple[str, int], Tuple[ZamanAraligiIndeksi, int, Dict[date, int]]] = {}
+
+    # Slot süresini dakika cinsinden döndürür
+    @property
+    def slot_dk(self) -> int:
+        return self._slot_dk
+
+    # Sporcu ve/veya saha için, pencere içindeki en erken boş zamanları (baslangic, bitis) olarak döndürür
+    def bos_zamanlari_bul(
+        self,
+        sure_dk: int,
+        baslangic: datetime,
+        bitis: datetime,
+        athlete_id: Optional[int] = None,
+        saha_id: Optional[int] = None,
+        adet: int = 5
+    ) -> List[Tuple[datetime, datetime]]:
+        self._parametreleri_dogrula(sure_dk, baslangic, bitis, athlete_id, saha_id, adet)
+
+        ilk_gun = baslangic.date()
+        gun_sayisi = (bitis.date() - ilk_gun).days + 1
+        pencere_baslangici = datetime.combine(ilk_gun, datetime.min.time())
+
+        # Pencere boyunca tüm günlerin bitmap'lerini tek bir tam sayıda birleştir
+        dolu = 0
+        kaynaklar = []
+        if athlete_id is not None:
+            kaynaklar.append(("sporcu", athlete_id, self.repo.sporcu_zaman_indeksi(athlete_id)))
+        if saha_id is not None:
+            kaynaklar.append(("saha", saha_id, self.repo.saha_zaman_indeksi(saha_id)))
+
+        for kaynak_turu, kaynak_id, indeks in kaynaklar:
+            if indeks is None:
+                continue
+            gunler = self._gun_bitmapleri(kaynak_turu, kaynak_id, indeks)
+            for gun_no in range(gun_sayisi):
+                gun = ilk_gun + timedelta(days=gun_no)
+                bitmap = gunler.get(gun)
+                if bitmap is None:
+                    bitmap = gunler[gun] = self._gun_bitmap_hesapla(indeks, gun)
+                if bitmap:
+                    dolu |= bitmap << (gun_no * self._gunluk_slot)
+
+        # Aranan slot aralığı: başlangıç yukarı, bitiş aşağı yuvarlanır
+        ilk_slot = -((pencere_baslangici - baslangic) // self._slot)
+        son_slot = (bitis - pencere_baslangici) // self._slot
+        gereken_slot = -(-sure_dk // self._slot_dk)
+        if son_slot - ilk_slot < gereken_slot:
+            return []
+
+        toplam_slot = gun_sayisi * self._gunluk_slot
+        bos = ~dolu & ((1 << toplam_slot) - 1)
+
+        # i. bit, i'den başlayan gereken_slot kadar slotun hepsi boşsa 1 kalır (katlamalı kaydırma)
+        aday = bos
+        kapsanan = 1
+        while kapsanan < gereken_slot:
+            adim = min(kapsanan, gereken_slot - kapsanan)
+            aday &= aday >> adim
+            kapsanan += adim
+
+        gecerli_baslangiclar = ((1 << (son_slot - gereken_slot + 1)) - 1) & ~((1 << ilk_slot) - 1)
+        aday &= gecerli_baslangiclar
+
+        sonuclar = []
+        sure = timedelta(minutes=sure_dk)
+        while aday and len(sonuclar) < adet:
+            en_dusuk = aday & -aday
+            slot_no = en_dusuk.bit_length() - 1
+            aday ^= en_dusuk
+            zaman = pencere_baslangici + slot_no * self._slot
+            sonuclar.append((zaman, zaman + sure))
+        return sonuclar
+
+    # En erken boş zamanı döndürür, yoksa None
+    def ilk_bos_zaman(
+        self,
+        sure_dk: int,
+        baslangic: datetime,
+        bitis: datetime,
+        athlete_id: Optional[int] = None,
+        saha_id: Optional[int] = None
+    ) -> Optional[Tuple[datetime, datetime]]:
+        sonuclar = self.bos_zamanlari_bul(sure_dk, baslangic, bitis, athlete_id, saha_id, adet=1)
+        return sonuclar[0] if sonuclar else None
+
+    # Kaynağın gün bitmap önbelleğini döndürür, indeks değiştiyse sıfırlar
+    def _gun_bitmapleri(self, kaynak_turu: str, kaynak_id: int, indeks: ZamanAraligiIndeksi) -> Dict[date, int]:
+        anahtar = (kaynak_turu, kaynak_id)
+        kayit = self._onbellek.get(anahtar)
+        if kayit is None or kayit[0] is not indeks or kayit[1] != indeks.surum:
+            kayit = (indeks, indeks.surum, {})
+            self._onbellek[anahtar] = kayit
+        return kayit[2]
+
+    # Kaynağın bir gününe ait doluluk bitmap'ini zaman indeksinden hesaplar
+    def _gun_bitmap_hesapla(self, indeks: ZamanAraligiIndeksi, gun: date) -> int:
+        gun_baslangici = datetime.combine(gun, datetime.min.time())
+        bitmap = 0
+        for oturum_baslangic, oturum_bitis, _ in indeks.cakisan_araliklar(gun_baslangici, GUN_DAKIKA):
+            ilk = max(0, (oturum_baslangic - gun_baslangici) // self._slot)
+            son = min(self._gunluk_slot, -((gun_baslangici - oturum_bitis) // self._slot))
+            if son > ilk:
+                bitmap |= ((1 << (son - ilk)) - 1) << ilk
+        return bitmap
+
+    # Sorgu parametrelerini doğrular
+    @staticmethod
+    def _parametreleri_dogrula(sure_dk, baslangic, bitis, athlete_id, saha_id, adet) -> None:
+        if athlete_id is None and saha_id is None:
+            raise AntrenmanHatasi("Müsaitlik araması için sporcu ID'si veya saha ID'si verilmelidir")
+        if saha_id is not None and (not isinstance(saha_id, int) or
+                                    not TeamTrainingSession.MIN_SAHA_ID <= saha_id <= TeamTrainingSession.MAX_SAHA_ID):
+            raise GecersizSahaIdHatasi(
+                f"Saha ID'si {TeamTrainingSession.MIN_SAHA_ID} ile {TeamTrainingSession.MAX_SAHA_ID} arasında olmalıdır, alınan: {saha_id}"
+            )
+        if not isinstance(sure_dk, int) or not AntrenmanOturumuTemel.MIN_SURE <= sure_dk <= AntrenmanOturumuTemel.MAX_SURE:
+            raise GecersizSureHatasi(
+                f"Süre {AntrenmanOturumuTemel.MIN_SURE} ile {AntrenmanOturumuTemel.MAX_SURE} dakika arasında olmalıdır, alınan: {sure_dk}"
+            )
+        if not isinstance(baslangic, datetime) or not isinstance(bitis, datetime):
+            raise GecersizTarihSaatHatasi("Arama penceresinin başlangıç ve bitişi datetime objesi olmalıdır")
+        if bitis <= baslangic:
+            raise GecersizTarihSaatHatasi("Arama penceresinin bitişi başlangıcından sonra olmalıdır")
+        if not isinstance(adet, int) or adet <= 0:
+            raise ValueError(f"İstenen boş zaman adedi pozitif tam sayı olmalıdır, alınan: {adet}")
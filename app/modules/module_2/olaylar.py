@@ -0,0 +1,149 @@
+"""
+TrainingManager işlemleri için olay (event) ve metrik arayüzü.
+Manager her işlemde bir AntrenmanOlayi yayınlar; dinleyiciler bu olayları
+yazdırabilir veya sayaç/histogram olarak toplayabilir. Dinleyici yoksa olay
+nesnesi oluşturulmaz ve süre ölçülmez.
+"""
+import sys
+from bisect import bisect_left
+from typing import Any, Dict, List, Optional, TextIO, Tuple
+
+# Olay türleri
+OLUSTURULDU = "olusturuldu"
+IPTAL_EDILDI = "iptal_edildi"
+TAMAMLANDI = "tamamlandi"
+PLANLANDI = "planlandi"
+CAKISMA_REDDEDILDI = "cakisma_reddedildi"
+TOPLU_OLUSTURULDU = "toplu_olusturuldu"
+NOT_GUNCELLENDI = "not_guncellendi"
+
+
+# Manager'ın yayınladığı tek bir işlem olayı
+class AntrenmanOlayi:
+    __slots__ = ("tur", "oturum_id", "sure_sn", "detay")
+
+    # Olayı başlatır; sure_sn işlemin saniye cinsinden süresidir (toplu işlemin alt olaylarında None)
+    def __init__(self, tur: str, oturum_id: Optional[int], sure_sn: Optional[float] = None,
+                 detay: Optional[Dict[str, Any]] = None):
+        self.tur = tur
+        self.oturum_id = oturum_id
+        self.sure_sn = sure_sn
+        self.detay = detay or {}
+
+    def __repr__(self) -> str:
+        return f"AntrenmanOlayi(tur={self.tur!r}, oturum_id={self.oturum_id}, sure_sn={self.sure_sn})"
+
+
+# Olay dinleyicilerinin temel sınıfı; varsayılan davranış hiçbir şey yapmamaktır
+class OlayDinleyici:
+
+    # Yayınlanan olayı alır (alt sınıflar ezer)
+    def olay_al(self, olay: AntrenmanOlayi) -> None:
+        pass
+
+
+# Olayları eski "Bilgi: ..." biçiminde yazdıran dinleyici (CLI demo için)
+class YaziciDinleyici(OlayDinleyici):
+
+    # Yazıcıyı başlatır; dosya verilmezse sys.stdout kullanılır
+    def __init__(self, dosya: Optional[TextIO] = None):
+        self._dosya = dosya
+
+    # Olayı tek satırlık bir mesaj olarak yazdırır
+    def olay_al(self, olay: AntrenmanOlayi) -> None:
+        mesaj = self.mesaj_olustur(olay)
+        if mesaj is not None:
+            print(mesaj, file=self._dosya or sys.stdout)
+
+    # Olay için yazdırılacak mesajı döndürür (bilinmeyen tür için None)
+    @staticmethod
+    def mesaj_olustur(olay: AntrenmanOlayi) -> Optional[str]:
+        if olay.tur == OLUSTURULDU:
+            return f"Bilgi: {olay.oturum_id} ID'li oturum başarıyla oluşturuldu."
+        if olay.tur == IPTAL_EDILDI:
+            return f"Bilgi: {olay.oturum_id} ID'li oturum iptal edildi."
+        if olay.tur == TAMAMLANDI:
+            return f"Bilgi: {olay.oturum_id} ID'li oturum tamamlandı olarak işaretlendi."
+        if olay.tur == PLANLANDI:
+            return f"Bilgi: {olay.oturum_id} ID'li oturum {olay.detay.get('tarih_saat')} tarihine planlandı."
+        if olay.tur == CAKISMA_REDDEDILDI:
+            return f"Uyarı: {olay.oturum_id} ID'li oturum çakışma nedeniyle reddedildi."
+        if olay.tur == NOT_GUNCELLENDI:
+            return f"Bilgi: {olay.oturum_id} ID'li oturumun notu {olay.detay.get('yeni_not')} olarak güncellendi."
+        if olay.tur == TOPLU_OLUSTURULDU:
+            return (f"Bilgi: Toplu oluşturma tamamlandı: {olay.detay.get('eklenen', 0)} oturum eklendi, "
+                    f"{olay.detay.get('reddedilen', 0)} oturum reddedildi.")
+        return None
+
+
+# Olayları bellekte sayan ve işlem sürelerini histogramda toplayan dinleyici
+class MetrikToplayici(OlayDinleyici):
+    """
+    Süre histogramı logaritmik kovalar kullanır: kova üst sınırları 1 µs'den
+    başlayıp ikiye katlanarak ~16 s'ye kadar gider, daha uzun süreler son
+    kovaya düşer. Bellek kullanımı olay sayısından bağımsızdır; yüzdelikler
+    kova üst sınırıyla (en fazla 2 kat hatayla) tahmin edilir.
+    """
+
+    # Kova üst sınırları (saniye)
+    KOVA_SINIRLARI: Tuple[float, ...] = tuple(1e-6 * 2 ** us for us in range(25))
+
+    # Boş sayaç ve histogramlarla başlatır
+    def __init__(self):
+        self._sayaclar: Dict[str, int] = {}
+        self._histogramlar: Dict[str, List[int]] = {}
+        self._toplam_sureler: Dict[str, float] = {}
+
+    # Olayı sayar, süresi varsa histograma ekler
+    def olay_al(self, olay: AntrenmanOlayi) -> None:
+        tur = olay.tur
+        self._sayaclar[tur] = self._sayaclar.get(tur, 0) + 1
+        if olay.sure_sn is None:
+            return
+        histogram = self._histogramlar.get(tur)
+        if histogram is None:
+            histogram = self._histogramlar[tur] = [0] * (len(self.KOVA_SINIRLARI) + 1)
+        histogram[bisect_left(self.KOVA_SINIRLARI, olay.sure_sn)] += 1
+        self._toplam_sureler[tur] = self._toplam_sureler.get(tur, 0.0) + olay.sure_sn
+
+    # Verilen türdeki olay sayısını döndürür
+    def sayac(self, tur: str) -> int:
+        return self._sayaclar.get(tur, 0)
+
+    # Tüm olay sayılarını döndürür
+    def sayaclar(self) -> Dict[str, int]:
+        return dict(self._sayaclar)
+
+    # Verilen türdeki işlemlerin ortalama süresini saniye olarak döndürür (ölçüm yoksa None)
+    def ortalama_sure(self, tur: str) -> Optional[float]:
+        histogram = self._histogramlar.get(tur)
+        if histogram is None:
+            return None
+        return self._toplam_sureler[tur] / sum(histogram)
+
+    # Dolu histogram kovalarını (üst sınır saniye, adet) olarak döndürür; son kovanın üst sınırı inf'dir
+    def histogram(self, tur: str) -> List[Tuple[float, int]]:
+        histogram = self._histogramlar.get(tur, [])
+        sinirlar = self.KOVA_SINIRLARI + (float("inf"),)
+        return [(sinirlar[kova], adet) for kova, adet in enumerate(histogram) if adet]
+
+    # Verilen yüzdelik için süre tahminini (kova üst sınırı) döndürür (ölçüm yoksa None)
+    def yuzdelik(self, tur: str, oran: float) -> Optional[float]:
+        if not 0 < oran <= 1:
+            raise ValueError(f"Yüzdelik oranı (0, 1] aralığında olmalıdır, alınan: {oran}")
+        histogram = self.histogram(tur)
+        if not histogram:
+            return None
+        hedef = oran * sum(adet for _, adet in histogram)
+        birikim = 0
+        for sinir, adet in histogram:
+            birikim += adet
+            if birikim >= hedef:
+                return sinir
+        return histogram[-1][0]
+
+    # Tüm sayaç ve histogramları sıfırlar
+    def sifirla(self) -> None:
+        self._sayaclar.clear()
+        self._histogramlar.clear()
+        self._toplam_sureler.clear()
@@ -0,0 +1,266 @@
+"""
+Performans ve ilerleme notları için akan (streaming) analiz bileşeni.
+Notlar sporcu, odak alanı ve sakatlık tipi anahtarlarında gün bazlı
+histogramlarda tutulur; ortalama ve yüzdelikler (ör. son 30 günde "hız"
+oturumlarının p90'ı) ham oturumlara erişmeden bu histogramlardan hesaplanır.
+"""
+from datetime import date
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .base import AntrenmanOturumuTemel
+from .implementations import IndividualTrainingSession, RehabTrainingSession
+from .olaylar import AntrenmanOlayi, OlayDinleyici, NOT_GUNCELLENDI
+
+# Notlar 0.1 hassasiyetle yuvarlandığı için her olası değer için bir kova tutulur
+NOT_CARPANI = 10
+KOVA_SAYISI = int(max(IndividualTrainingSession.MAX_PERFORMANS_NOTU,
+                      RehabTrainingSession.MAX_ILERLEME_NOTU) * NOT_CARPANI) + 1
+
+# Oturum sınıfı -> (metrik adı, not alanı, sınıfa özel gruplama alanı)
+_NOT_ALANLARI = {
+    IndividualTrainingSession: ("performans", "_performans_notu", "odak_alani"),
+    RehabTrainingSession: ("ilerleme", "_ilerleme_notu", "sakatlik_tipi"),
+}
+METRIKLER = ("performans", "ilerleme")
+
+
+# Tek bir anahtarın (ör. "hız" oturumlarının performans notları) sınırlı bellekli not histogramı
+class NotHistogrami:
+    """
+    Notlar 0 ile 10 arasında ve 0.1 hassasiyetle saklandığından KOVA_SAYISI
+    kovalı bir sayım histogramı tüm dağılımı kayıpsız özetler; yüzdelikler
+    yaklaşık değil kesindir ve not düzeltmeleri sayım azaltılarak geri
+    alınabilir. Tüm zamanlar için tek histogram, zaman pencereli sorgular
+    için son saklama_gun günün gün bazlı seyrek histogramları tutulur;
+    bellek kullanımı not sayısından bağımsızdır. Pencerenin son günü
+    (en_yeni_gun) çağıran tarafından verilir ve yalnızca ileri kayar;
+    pencereden çıkan günler histogram bir sonraki kullanıldığında atılır.
+    """
+
+    # Boş histogram oluşturur
+    def __init__(self, saklama_gun: int):
+        self._saklama_gun = saklama_gun
+        self._tum: List[int] = [0] * KOVA_SAYISI
+        self._gunler: Dict[int, Dict[int, int]] = {}  # gün (ordinal) -> kova -> adet
+        self._en_yeni_gun: Optional[int] = None
+
+    # Verilen gündeki kovaya adet ekler (geri almak için adet=-1); gün None ise yalnızca tüm zamanlar sayımı değişir
+    def ekle(self, kova: int, gun: Optional[int], en_yeni_gun: int, adet: int = 1) -> None:
+        self._tum[kova] += adet
+        self._pencereyi_kaydir(en_yeni_gun)
+        if gun is None or gun <= self._en_yeni_gun - self._saklama_gun:
+            return
+        gunluk = self._gunler.setdefault(gun, {})
+        yeni_adet = gunluk.get(kova, 0) + adet
+        if yeni_adet > 0:
+            gunluk[kova] = yeni_adet
+        else:
+            gunluk.pop(kova, None)
+            if not gunluk:
+                del self._gunler[gun]
+
+    # [ilk_gun, son_gun] (ordinal, dahil) penceresinin kova sayımlarını döndürür; pencere yoksa tüm zamanlar
+    def kovalar(self, ilk_gun: Optional[int] = None, son_gun: Optional[int] = None,
+                en_yeni_gun: Optional[int] = None) -> List[int]:
+        if ilk_gun is None:
+            return list(self._tum)
+        if en_yeni_gun is not None:
+            self._pencereyi_kaydir(en_yeni_gun)
+        if self._en_yeni_gun is not None and ilk_gun <= self._en_yeni_gun - self._saklama_gun:
+            raise ValueError(f"Zaman penceresi saklama süresini ({self._saklama_gun} gün) aşıyor")
+        sayim = [0] * KOVA_SAYISI
+        if son_gun - ilk_gun + 1 <= len(self._gunler):
+            gunler = (self._gunler.get(gun) for gun in range(ilk_gun, son_gun + 1))
+        else:
+            gunler = (gunluk for gun, gunluk in self._gunler.items() if ilk_gun <= gun <= son_gun)
+        for gunluk in gunler:
+            if gunluk:
+                for kova, adet in gunluk.items():
+                    sayim[kova] += adet
+        return sayim
+
+    # Pencereyi en_yeni_gun'e kaydırır ve saklama süresinden eski gün histogramlarını atar (tüm zamanlar histogramında kalırlar)
+    def _pencereyi_kaydir(self, en_yeni_gun: int) -> None:
+        if self._en_yeni_gun is not None and en_yeni_gun <= self._en_yeni_gun:
+            return
+        self._en_yeni_gun = en_yeni_gun
+        sinir = en_yeni_gun - self._saklama_gun
+        for gun in [gun for gun in self._gunler if gun <= sinir]:
+            del self._gunler[gun]
+
+
+# Sporcu, odak alanı ve sakatlık tipi bazında akan not analizi
+class PerformansAnalizi:
+    """
+    Bireysel oturumların performans notları ("performans" metriği) sporcu ve
+    odak alanına, rehabilitasyon oturumlarının ilerleme notları ("ilerleme")
+    sporcu ve sakatlık tipine göre toplanır. Notun günü oturumun tarihidir
+    (tarihsiz oturumlarda kaydedildiği gün). Sorgular tam olarak bir anahtar
+    alır; son_gun verilirse bugun dahil son son_gun gün, verilmezse tüm
+    zamanlar kullanılır. Saklama penceresi tüm histogramlar için ortaktır ve
+    en yeni not gününe, ancak en fazla bugüne göre kayar; ileri tarihli
+    notlar gerçek günlerin histogramlarını silmez.
+
+    Penceredeki her notun hangi gün ve kovaya yazıldığı saklanır; not
+    yeniden yazıldığında eski not bu kayıttan geri alınır. Günü pencereden
+    çıkan notların kayıtları atılır (bellek oturum sayısıyla büyümez); böyle
+    bir not yeniden yazılırsa eski değeri (eski_not) tüm zamanlar
+    sayımından geri alınır.
+    """
+
+    # Analizi gün bazlı histogramların saklanacağı gün sayısıyla başlatır
+    def __init__(self, saklama_gun: int = 365):
+        if not isinstance(saklama_gun, int) or saklama_gun <= 0:
+            raise ValueError(f"Saklama süresi pozitif tam sayı olmalıdır, alınan: {saklama_gun}")
+        self._saklama_gun = saklama_gun
+        self._histogramlar: Dict[Tuple[str, str, object], NotHistogrami] = {}
+        self._not_kayitlari: Dict[int, tuple] = {}  # oturum_id -> (anahtarlar, kova, gün)
+        self._kayit_gunleri: Dict[int, Dict[int, None]] = {}  # gün -> o güne yazılmış notların oturum id'leri
+        self._en_yeni_gun: Optional[int] = None  # saklama penceresinin son günü (ordinal)
+
+    # Repository'deki notlu oturumlardan analiz oluşturur
+    @classmethod
+    def repositoryden_olustur(cls, repository, saklama_gun: int = 365) -> 'PerformansAnalizi':
+        analiz = cls(saklama_gun)
+        analiz.notlari_ekle(repository.tumunu_listele())
+        return analiz
+
+    # Oturumların mevcut notlarını ekler; eklenen not sayısını döndürür (bugun verilmezse bugünün tarihi)
+    def notlari_ekle(self, oturumlar: Iterable[AntrenmanOturumuTemel], bugun: Optional[date] = None) -> int:
+        bugun = bugun or date.today()
+        return sum(self.not_kaydet(oturum, bugun) for oturum in oturumlar)
+
+    # Oturumun güncel notunu kaydeder; daha önce kaydedilen notu yazıldığı gün ve kovadan geri alınır
+    def not_kaydet(self, oturum: AntrenmanOturumuTemel, bugun: Optional[date] = None,
+                   eski_not: Optional[float] = None) -> bool:
+        alanlar = _NOT_ALANLARI.get(type(oturum))
+        if alanlar is None:
+            return False
+        metrik, not_alani, grup_alani = alanlar
+        anahtarlar = ((metrik, "sporcu", oturum.athlete_id), (metrik, grup_alani, getattr(oturum, grup_alani)))
+        bugun = (bugun or date.today()).toordinal()
+        gun = oturum.tarih_saat.toordinal() if oturum.tarih_saat is not None else bugun
+
+        eski_kayit = self._kayit_cikar(oturum.oturum_id)
+        if eski_kayit is not None:
+            self._yansit(*eski_kayit, -1)
+        elif eski_not is not None and not self._pencerede_mi(gun):
+            # Kaydı pencereden çıkarken atılmış not yalnızca tüm zamanlar sayımından geri alınır
+            self._yansit(anahtarlar, int(round(eski_not * NOT_CARPANI)), None, -1)
+        yeni_not = getattr(oturum, not_alani)
+        if yeni_not is None:
+            return False
+        self._pencereyi_kaydir(min(gun, bugun))
+        kayit = (anahtarlar, int(round(yeni_not * NOT_CARPANI)), gun)
+        self._yansit(*kayit, 1)
+        if oturum.oturum_id is not None and self._pencerede_mi(gun):
+            self._not_kayitlari[oturum.oturum_id] = kayit
+            self._kayit_gunleri.setdefault(gun, {})[oturum.oturum_id] = None
+        return True
+
+    # Anahtarın not ortalamasını döndürür (not yoksa None)
+    def ortalama(self, athlete_id: int = None, odak_alani: str = None, sakatlik_tipi: str = None,
+                 metrik: str = "performans", son_gun: Optional[int] = None,
+                 bugun: Optional[date] = None) -> Optional[float]:
+        sayim = self._kovalar(athlete_id, odak_alani, sakatlik_tipi, metrik, son_gun, bugun)
+        adet = sum(sayim)
+        if not adet:
+            return None
+        return sum(kova * sayi for kova, sayi in enumerate(sayim)) / adet / NOT_CARPANI
+
+    # Anahtarın oran yüzdeliğindeki notunu döndürür (en küçük not: en az oran kadar not ona eşit/küçük; not yoksa None)
+    def yuzdelik(self, oran: float, athlete_id: int = None, odak_alani: str = None, sakatlik_tipi: str = None,
+                 metrik: str = "performans", son_gun: Optional[int] = None,
+                 bugun: Optional[date] = None) -> Optional[float]:
+        if not 0 < oran <= 1:
+            raise ValueError(f"Yüzdelik oranı (0, 1] aralığında olmalıdır, alınan: {oran}")
+        sayim = self._kovalar(athlete_id, odak_alani, sakatlik_tipi, metrik, son_gun, bugun)
+        hedef = oran * sum(sayim)
+        if not hedef:
+            return None
+        birikim = 0
+        for kova, adet in enumerate(sayim):
+            birikim += adet
+            if adet and birikim >= hedef:
+                return kova / NOT_CARPANI
+        return None
+
+    # Anahtardaki not sayısını döndürür
+    def adet(self, athlete_id: int = None, odak_alani: str = None, sakatlik_tipi: str = None,
+             metrik: str = "performans", son_gun: Optional[int] = None, bugun: Optional[date] = None) -> int:
+        return sum(self._kovalar(athlete_id, odak_alani, sakatlik_tipi, metrik, son_gun, bugun))
+
+    # Not kovasını verilen gün için anahtarların histogramlarına işaretiyle ekler (gün None: yalnızca tüm zamanlar)
+    def _yansit(self, anahtarlar: tuple, kova: int, gun: Optional[int], adet: int) -> None:
+        for anahtar in anahtarlar:
+            histogram = self._histogramlar.get(anahtar)
+            if histogram is None:
+                histogram = self._histogramlar[anahtar] = NotHistogrami(self._saklama_gun)
+            histogram.ekle(kova, gun, self._en_yeni_gun, adet)
+
+    # Oturumun not kaydını gün dizininden de silerek çıkarır (kayıt yoksa None)
+    def _kayit_cikar(self, oturum_id: Optional[int]) -> Optional[tuple]:
+        kayit = self._not_kayitlari.pop(oturum_id, None)
+        if kayit is not None:
+            gunun_kayitlari = self._kayit_gunleri[kayit[2]]
+            del gunun_kayitlari[oturum_id]
+            if not gunun_kayitlari:
+                del self._kayit_gunleri[kayit[2]]
+        return kayit
+
+    # Günün saklama penceresinde olup olmadığını döndürür (henüz not yoksa pencere boştur, her gün içindedir)
+    def _pencerede_mi(self, gun: int) -> bool:
+        return self._en_yeni_gun is None or gun > self._en_yeni_gun - self._saklama_gun
+
+    # Ortak pencereyi en_yeni_gun'e kaydırır; günü pencereden çıkan notların kayıtlarını atar
+    def _pencereyi_kaydir(self, en_yeni_gun: int) -> None:
+        if self._en_yeni_gun is not None and en_yeni_gun <= self._en_yeni_gun:
+            return
+        self._en_yeni_gun = en_yeni_gun
+        sinir = en_yeni_gun - self._saklama_gun
+        for gun in [gun for gun in self._kayit_gunleri if gun <= sinir]:
+            for oturum_id in self._kayit_gunleri.pop(gun):
+                del self._not_kayitlari[oturum_id]
+
+    # Sorgu anahtarının (pencereli) kova sayımlarını döndürür
+    def _kovalar(self, athlete_id: Optional[int], odak_alani: Optional[str], sakatlik_tipi: Optional[str],
+                 metrik: str, son_gun: Optional[int], bugun: Optional[date]) -> List[int]:
+        verilenler = [deger for deger in (athlete_id, odak_alani, sakatlik_tipi) if deger is not None]
+        if len(verilenler) != 1:
+            raise ValueError("athlete_id, odak_alani veya sakatlik_tipi parametrelerinden yalnızca biri verilmelidir")
+        if metrik not in METRIKLER:
+            raise ValueError(f"Metrik {METRIKLER} değerlerinden biri olmalıdır, alınan: '{metrik}'")
+
+        if odak_alani is not None:
+            anahtar = ("performans", "odak_alani", odak_alani.lower().strip())
+        elif sakatlik_tipi is not None:
+            anahtar = ("ilerleme", "sakatlik_tipi", sakatlik_tipi.lower().strip())
+        else:
+            anahtar = (metrik, "sporcu", athlete_id)
+
+        histogram = self._histogramlar.get(anahtar)
+        if histogram is None:
+            return [0] * KOVA_SAYISI
+        if son_gun is None:
+            return histogram.kovalar()
+        if not isinstance(son_gun, int) or son_gun <= 0:
+            raise ValueError(f"Gün sayısı pozitif tam sayı olmalıdır, alınan: {son_gun}")
+        bitis = (bugun or date.today()).toordinal()
+        return histogram.kovalar(bitis - son_gun + 1, bitis, self._en_yeni_gun)
+
+
+# Manager'ın not güncelleme olaylarını analize yansıtan dinleyici
+class PerformansAnaliziDinleyici(OlayDinleyici):
+
+    # Dinleyiciyi analiz ve oturumların okunacağı repository ile başlatır
+    def __init__(self, analiz: PerformansAnalizi, repository):
+        self.analiz = analiz
+        self._repo = repository
+
+    # Güncellenen oturumun yeni notunu ekler, eski notunu geri alır
+    def olay_al(self, olay: AntrenmanOlayi) -> None:
+        if olay.tur != NOT_GUNCELLENDI:
+            return
+        oturum = self._repo.id_ile_bul(olay.oturum_id)
+        if oturum is not None:
+            self.analiz.not_kaydet(oturum, eski_not=olay.detay.get("eski_not"))
@@ -0,0 +1,167 @@
+"""
+Sporcu bazında bireysel antrenman raporlarını toplu üreten akış hattı.
+Oturumlar sporcu indeksinden sporcu sporcu gruplanır, sporcu parçaları süreç
+havuzunda raporlanır ve sonuçlar sporcu sırasıyla sporcu başına bir dosyaya
+veya tek bir zip arşivine akıtılır; bellekte aynı anda yalnızca sınırlı
+sayıda parça bulunur.
+"""
+import os
+import zipfile
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from datetime import datetime
+from operator import attrgetter
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .base import AntrenmanOturumuTemel, damgadan_tarih, mikrosaniye_damgasi
+from .implementations import IndividualTrainingSession
+
+# Süreçlere gönderilen sütunlar (tarih_saat ayrıca mikrosaniye damgası olarak gönderilir)
+_SUTUNLAR = ("oturum_id", "sure", "athlete_id", "antrenor_id", "odak_alani",
+             "oturum_tipi", "durum", "performans_notu")
+_SUTUN_OKUYUCU = attrgetter(*_SUTUNLAR)
+
+
+# Sporcunun bireysel oturumlarından (tarih sırasıyla, tarihsizler sonda) tek rapor metni oluşturur
+def sporcu_raporu_olustur(athlete_id: int, oturumlar: Iterable[IndividualTrainingSession]) -> str:
+    sirali = sorted(oturumlar, key=_rapor_sirasi)
+    bolumler = [f"##### SPORCU {athlete_id} - BİREYSEL ANTRENMAN RAPORLARI ({len(sirali)} oturum) #####"]
+    bolumler.extend(oturum.bireysel_rapor_olustur() for oturum in sirali)
+    return "\n\n".join(bolumler) + "\n"
+
+
+# Raporda oturum sırası: tarihliler tarih sırasıyla, tarihsizler sonda; eşitlikte oturum ID'si
+def _rapor_sirasi(oturum: AntrenmanOturumuTemel) -> Tuple[bool, datetime, int]:
+    return oturum.tarih_saat is None, oturum.tarih_saat or datetime.min, oturum.oturum_id
+
+
+# Süreçte bir parçanın sporcu raporlarını oluşturur; (athlete_id, UTF-8 rapor) listesi döndürür
+def _parca_raporla(parca: Dict[str, Any]) -> List[Tuple[int, bytes]]:
+    """
+    Nesneleri pickle ile göndermek rapor üretiminden pahalıdır; bu yüzden
+    parça düz sütunlar olarak gelir ve oturumlar doğrulamasız kurucu yoluyla
+    (satirlardan_olustur ile aynı) yeniden kurulur.
+    """
+    sutunlar = dict(zip(_SUTUNLAR, parca["sutunlar"]))
+    sutunlar["tarih_saat"] = list(map(damgadan_tarih, parca["damgalar"]))
+    oturumlar = IndividualTrainingSession.sutunlardan_kur(sutunlar)
+
+    sonuclar = []
+    bas = 0
+    for athlete_id, adet in parca["sporcular"]:
+        sonuclar.append((athlete_id, sporcu_raporu_olustur(athlete_id, oturumlar[bas:bas + adet]).encode("utf-8")))
+        bas += adet
+    return sonuclar
+
+
+# Repository'deki sporcuların bireysel antrenman raporlarını paralel üretip yazan hat
+class BireyselRaporUretici:
+    """
+    Sporcular parca_boyutu'luk parçalara bölünür. Her parçanın oturumları
+    sporcu indeksinden (sporcuya_gore_filtrele) alınıp sütunlara çevrilir ve
+    süreç havuzuna gönderilir; havuzda en fazla 2 * isci_sayisi parça
+    bekler, sonuçlar geldikçe sporcu sırasıyla yazılır. isci_sayisi=1 iken
+    havuz açılmaz, parçalar aynı süreçte raporlanır.
+
+    Bireysel oturumu olmayan sporcular için rapor üretilmez. Alt sınıf
+    oturumları (bireysel_rapor_olustur'u değiştirmiş olabilir) içeren
+    sporcuların raporu ana süreçte nesnelerin kendisinden üretilir.
+    """
+
+    # Üreticiyi repository, işçi süreç sayısı (None: CPU sayısı) ve parça boyutuyla başlatır
+    def __init__(self, repository, isci_sayisi: Optional[int] = None, parca_boyutu: int = 250):
+        if isci_sayisi is not None and (not isinstance(isci_sayisi, int) or isci_sayisi <= 0):
+            raise ValueError(f"İşçi sayısı pozitif tam sayı olmalıdır, alınan: {isci_sayisi}")
+        if not isinstance(parca_boyutu, int) or parca_boyutu <= 0:
+            raise ValueError(f"Parça boyutu pozitif tam sayı olmalıdır, alınan: {parca_boyutu}")
+        self._repo = repository
+        self._isci_sayisi = isci_sayisi or os.cpu_count() or 1
+        self._parca_boyutu = parca_boyutu
+
+    # Sporcu raporlarını (athlete_id, metin) olarak sporcu sırasıyla üretir
+    def raporlar(self, athlete_idleri: Optional[Iterable[int]] = None) -> Iterator[Tuple[int, str]]:
+        for athlete_id, veri in self._kodlu_raporlar(athlete_idleri):
+            yield athlete_id, veri.decode("utf-8")
+
+    # Her sporcunun raporunu klasördeki sporcu_<id>.txt dosyasına yazar; yazılan rapor sayısını döndürür
+    def klasore_yaz(self, klasor: str, athlete_idleri: Optional[Iterable[int]] = None) -> int:
+        os.makedirs(klasor, exist_ok=True)
+        sayi = 0
+        for athlete_id, veri in self._kodlu_raporlar(athlete_idleri):
+            with open(os.path.join(klasor, self.dosya_adi(athlete_id)), "wb") as dosya:
+                dosya.write(veri)
+            sayi += 1
+        return sayi
+
+    # Tüm raporları tek zip arşivine (sporcu başına bir üye) yazar; yazılan rapor sayısını döndürür
+    def arsive_yaz(self, arsiv_yolu: str, athlete_idleri: Optional[Iterable[int]] = None) -> int:
+        sayi = 0
+        with zipfile.ZipFile(arsiv_yolu, "w", compression=zipfile.ZIP_DEFLATED) as arsiv:
+            for athlete_id, veri in self._kodlu_raporlar(athlete_idleri):
+                arsiv.writestr(self.dosya_adi(athlete_id), veri)
+                sayi += 1
+        return sayi
+
+    # Sporcu raporunun dosya/arşiv üyesi adını döndürür
+    @staticmethod
+    def dosya_adi(athlete_id: int) -> str:
+        return f"sporcu_{athlete_id}.txt"
+
+    # Raporları (athlete_id, UTF-8 metin) olarak sporcu sırasıyla üretir
+    def _kodlu_raporlar(self, athlete_idleri: Optional[Iterable[int]]) -> Iterator[Tuple[int, bytes]]:
+        sporcular = self._repo.sporcu_idleri() if athlete_idleri is None else list(athlete_idleri)
+        parcalar = (self._parca_hazirla(sporcular[bas:bas + self._parca_boyutu])
+                    for bas in range(0, len(sporcular), self._parca_boyutu))
+
+        if self._isci_sayisi == 1:
+            for is_yuku, sira, ana_surecte in parcalar:
+                yield from self._birlestir(_parca_raporla(is_yuku), sira, ana_surecte)
+            return
+
+        bekleyenler: Deque[Tuple[Future, List[int], Dict[int, bytes]]] = deque()
+        with ProcessPoolExecutor(max_workers=self._isci_sayisi) as havuz:
+            for is_yuku, sira, ana_surecte in parcalar:
+                bekleyenler.append((havuz.submit(_parca_raporla, is_yuku), sira, ana_surecte))
+                if len(bekleyenler) >= 2 * self._isci_sayisi:
+                    gelecek, sira, ana_surecte = bekleyenler.popleft()
+                    yield from self._birlestir(gelecek.result(), sira, ana_surecte)
+            while bekleyenler:
+                gelecek, sira, ana_surecte = bekleyenler.popleft()
+                yield from self._birlestir(gelecek.result(), sira, ana_surecte)
+
+    # Sporcuların oturumlarını indeksten alıp (süreç iş yükü, sporcu sırası, ana süreçte üretilen raporlar) döndürür
+    def _parca_hazirla(self, sporcular: List[int]) -> Tuple[Dict[str, Any], List[int], Dict[int, bytes]]:
+        oturumlar: List[IndividualTrainingSession] = []
+        sporcu_adetleri: List[Tuple[int, int]] = []
+        ana_surecte: Dict[int, bytes] = {}
+        for athlete_id in sporcular:
+            bireyseller = [oturum for oturum in self._repo.sporcuya_gore_filtrele(athlete_id)
+                           if isinstance(oturum, IndividualTrainingSession)]
+            if not bireyseller:
+                continue
+            if all(type(oturum) is IndividualTrainingSession for oturum in bireyseller):
+                oturumlar.extend(bireyseller)
+                sporcu_adetleri.append((athlete_id, len(bireyseller)))
+            else:
+                ana_surecte[athlete_id] = sporcu_raporu_olustur(athlete_id, bireyseller).encode("utf-8")
+
+        satirlar = list(map(_SUTUN_OKUYUCU, oturumlar))
+        is_yuku = {
+            "sutunlar": [list(sutun) for sutun in zip(*satirlar)] if satirlar else [[] for _ in _SUTUNLAR],
+            "damgalar": [mikrosaniye_damgasi(oturum.tarih_saat) for oturum in oturumlar],
+            "sporcular": sporcu_adetleri,
+        }
+        return is_yuku, sporcular, ana_surecte
+
+    # Süreçten gelen raporlarla ana süreçte üretilenleri parçanın sporcu sırasıyla birleştirir
+    @staticmethod
+    def _birlestir(sonuclar: List[Tuple[int, bytes]], sira: List[int],
+                   ana_surecte: Dict[int, bytes]) -> Iterator[Tuple[int, bytes]]:
+        if not ana_surecte:
+            yield from sonuclar
+            return
+        raporlar = dict(sonuclar)
+        raporlar.update(ana_surecte)
+        for athlete_id in sira:
+            if athlete_id in raporlar:
+                yield athlete_id, raporlar[athlete_id]
@@ -1,7 +1,11 @@
-from typing import List, Optional, Dict, Any
-from datetime import datetime
+from itertools import islice
+from typing import Iterable, Iterator, List, Optional, Dict, Any, Tuple
+from datetime import date, datetime
 
 from .base import AntrenmanOturumuTemel
+from .indeks import ZamanAraligiIndeksi
+from .haftalik_yuk import Hafta, HaftalikYukIndeksi, hafta_anahtari
+from .sorgu import OturumSorgusu, TARIH_ARALIGI, TUM_OTURUMLAR
 from .exceptions import (
     DuplicateOturumHatasi,
     OturumBulunamadiHatasi
@@ -14,6 +18,40 @@ class TrainingRepository:
     def __init__(self):
         # Veritabanı simülasyonu için dictionary kullanıyoruz (id -> nesne)
         self._storage: Dict[int, AntrenmanOturumuTemel] = {}
+
+        # İkincil indeksler (kaynak id -> oturum id'leri); dict sıralı küme olarak kullanılır
+        self._sporcu_indeksi: Dict[int, Dict[int, None]] = {}
+        self._takim_indeksi: Dict[int, Dict[int, None]] = {}
+        self._saha_indeksi: Dict[int, Dict[int, None]] = {}
+        self._tip_indeksi: Dict[str, Dict[int, None]] = {}
+        self._durum_indeksi: Dict[str, Dict[int, None]] = {}
+
+        # Sorgu koşulu alanı -> hash indeksi
+        self._alan_indeksleri: Dict[str, Dict[Any, Dict[int, None]]] = {
+            "athlete_id": self._sporcu_indeksi,
+            "team_id": self._takim_indeksi,
+            "saha_id": self._saha_indeksi,
+            "oturum_tipi": self._tip_indeksi,
+            "durum": self._durum_indeksi,
+        }
+
+        # Çakışma kontrolü için kaynak bazlı zaman aralığı indeksleri (sadece tarihi olan oturumlar)
+        self._sporcu_zaman_indeksi: Dict[int, ZamanAraligiIndeksi] = {}
+        self._saha_zaman_indeksi: Dict[int, ZamanAraligiIndeksi] = {}
+
+        # Tarih sıralı indeks (tarihli oturumlar) ve tarihi olmayan oturumlar ayrı tutulur
+        self._tarih_indeksi = ZamanAraligiIndeksi()
+        self._tarihsiz: Dict[int, None] = {}
+
+        # Canlı durum sayaçları (sporcu id -> durum -> oturum sayısı); genel sayımlar durum indeksinden okunur
+        self._sporcu_durum_sayaclari: Dict[int, Dict[str, int]] = {}
+
+        # ISO hafta kovalı yük indeksleri (tarihli ve iptal edilmemiş oturumların süreleri)
+        self._sporcu_yuk_indeksi = HaftalikYukIndeksi()
+        self._takim_yuk_indeksi = HaftalikYukIndeksi()
+
+        # Oturumun indekse yazıldığı andaki anahtarları (nesne yerinde değiştirilse bile eski kayıt silinebilsin diye)
+        self._indeks_kayitlari: Dict[int, tuple] = {}
     
     # Yeni bir boş repository örneği oluşturur
     @classmethod
@@ -26,19 +64,48 @@ class TrainingRepository:
             raise DuplicateOturumHatasi(f"Oturum ID {oturum.oturum_id} zaten mevcut.")
         
         self._storage[oturum.oturum_id] = oturum
+        self._indekse_ekle(oturum)
+
+    # Birden fazla oturumu tek seferde kaydeder; mükerrer id varsa hiçbiri kaydedilmez
+    def kaydet_toplu(self, oturumlar: Iterable[AntrenmanOturumuTemel]) -> None:
+        oturumlar = list(oturumlar)
+        gorulen = set()
+        for oturum in oturumlar:
+            if oturum.oturum_id in self._storage or oturum.oturum_id in gorulen:
+                raise DuplicateOturumHatasi(f"Oturum ID {oturum.oturum_id} zaten mevcut.")
+            gorulen.add(oturum.oturum_id)
+
+        # Oturumlar sözlüğe tek güncellemeyle eklenir (aynı anda okuyanlar yarım bir toplu kayıt görmez)
+        self._storage.update({oturum.oturum_id: oturum for oturum in oturumlar})
+
+        # Zaman indekslerine girecek aralıklar biriktirilip her indekse tek birleştirmeyle eklenir
+        tarih_araliklari: List[tuple] = []
+        sporcu_araliklari: Dict[int, List[tuple]] = {}
+        saha_araliklari: Dict[int, List[tuple]] = {}
+        for oturum in oturumlar:
+            self._indekse_ekle(oturum, tarih_araliklari, sporcu_araliklari, saha_araliklari)
+
+        self._tarih_indeksine_toplu_ekle(tarih_araliklari)
+        for athlete_id, araliklar in sporcu_araliklari.items():
+            self._zaman_indeksi_al(self._sporcu_zaman_indeksi, athlete_id).toplu_ekle(araliklar)
+        for saha_id, araliklar in saha_araliklari.items():
+            self._zaman_indeksi_al(self._saha_zaman_indeksi, saha_id).toplu_ekle(araliklar)
 
     # Mevcut bir antrenman oturumunu günceller
     def guncelle(self, oturum: AntrenmanOturumuTemel) -> None:
         if oturum.oturum_id not in self._storage:
             raise OturumBulunamadiHatasi(f"Güncellenecek oturum bulunamadı: ID {oturum.oturum_id}")
         
+        self._indeksten_cikar(oturum.oturum_id)
         self._storage[oturum.oturum_id] = oturum
+        self._indekse_ekle(oturum)
 
     # ID'si verilen oturumu sistemden siler
     def sil(self, oturum_id: int) -> None:
         if oturum_id not in self._storage:
             raise OturumBulunamadiHatasi(f"Silinecek oturum bulunamadı: ID {oturum_id}")
         
+        self._indeksten_cikar(oturum_id)
         del self._storage[oturum_id]
 
     # ID'si verilen oturumu bulur
@@ -51,68 +118,378 @@ class TrainingRepository:
 
     # Sporcu ID'sine göre antrenman oturumlarını filtreler
     def sporcuya_gore_filtrele(self, athlete_id: int) -> List[AntrenmanOturumuTemel]:
-        sonuclar = []
-        for oturum in self._storage.values():
-            if getattr(oturum, 'athlete_id', None) == athlete_id:
-                sonuclar.append(oturum)
-        return sonuclar
+        oturum_idleri = self._sporcu_indeksi.get(athlete_id, {})
+        return [self._storage[oturum_id] for oturum_id in oturum_idleri]
+
+    # Oturumu olan sporcuların ID'lerini artan sırada döndürür
+    def sporcu_idleri(self) -> List[int]:
+        return sorted(self._sporcu_indeksi)
 
     # Takım ID'sine göre antrenman oturumlarını filtreler
     def takima_gore_filtrele(self, team_id: int) -> List[AntrenmanOturumuTemel]:
-        sonuclar = []
-        for oturum in self._storage.values():
-            if getattr(oturum, 'team_id', None) == team_id:
-                sonuclar.append(oturum)
-        return sonuclar
+        oturum_idleri = self._takim_indeksi.get(team_id, {})
+        return [self._storage[oturum_id] for oturum_id in oturum_idleri]
 
-    # Tarih aralığına göre antrenman oturumlarını filtreler
+    # Tarih aralığına göre antrenman oturumlarını filtreler (sonuç tarih sırasındadır)
     def tarih_araligina_gore_filtrele(self, baslangic: datetime, bitis: datetime) -> List[AntrenmanOturumuTemel]:
-        sonuclar = []
+        return [self._storage[oturum_id] for _, oturum_id in self._tarih_indeksi.sirali_kayitlar(baslangic, bitis)]
+
+    # Tarih sırasıyla bir sayfa oturum ve bir sonraki sayfanın imlecini döndürür (son sayfada imleç None)
+    def tarih_sirali_sayfa(
+        self,
+        imlec: Optional[Tuple[datetime, int]] = None,
+        limit: int = 50,
+        baslangic: Optional[datetime] = None,
+        bitis: Optional[datetime] = None
+    ) -> Tuple[List[AntrenmanOturumuTemel], Optional[Tuple[datetime, int]]]:
+        if not isinstance(limit, int) or limit <= 0:
+            raise ValueError(f"Sayfa limiti pozitif tam sayı olmalıdır, alınan: {limit}")
+
+        # Bir fazlasını okuyarak sonraki sayfanın olup olmadığını anla
+        kayitlar = list(islice(self._tarih_indeksi.sirali_kayitlar(baslangic, bitis, imlec), limit + 1))
+        sonraki_imlec = kayitlar[limit - 1] if len(kayitlar) > limit else None
+        return [self._storage[oturum_id] for _, oturum_id in kayitlar[:limit]], sonraki_imlec
+
+    # Tarihi henüz ayarlanmamış oturumları listeler
+    def tarihsiz_oturumlar(self) -> List[AntrenmanOturumuTemel]:
+        return [self._storage[oturum_id] for oturum_id in self._tarihsiz]
+
+    # Durumlara göre oturum sayılarını döndürür (athlete_id verilirse yalnızca o sporcu); sayaçlardan O(1) okunur
+    def durum_sayilari(self, athlete_id: Optional[int] = None) -> Dict[str, int]:
+        if athlete_id is None:
+            return {durum: len(kova) for durum, kova in self._durum_indeksi.items()}
+        return dict(self._sporcu_durum_sayaclari.get(athlete_id, {}))
+
+    # Canlı sayaçları oturumların güncel durumlarıyla yeniden sayımla karşılaştırır
+    # Dönüş: (athlete_id veya genel için None, durum) -> (canlı sayaç, yeniden sayım); boş sözlük tutarlı demektir
+    def sayac_tutarliligi_kontrol(self) -> Dict[Tuple[Optional[int], str], Tuple[int, int]]:
+        genel: Dict[str, int] = {}
+        sporcular: Dict[int, Dict[str, int]] = {}
         for oturum in self._storage.values():
-            if oturum.tarih_saat and baslangic <= oturum.tarih_saat <= bitis:
-                sonuclar.append(oturum)
-        return sonuclar
+            durum = oturum.durum
+            genel[durum] = genel.get(durum, 0) + 1
+            athlete_id = getattr(oturum, 'athlete_id', None)
+            if athlete_id is not None:
+                sayim = sporcular.setdefault(athlete_id, {})
+                sayim[durum] = sayim.get(durum, 0) + 1
+
+        farklar: Dict[Tuple[Optional[int], str], Tuple[int, int]] = {}
+        karsilastirmalar = [(None, {durum: len(kova) for durum, kova in self._durum_indeksi.items()}, genel)]
+        for athlete_id in set(sporcular) | set(self._sporcu_durum_sayaclari):
+            karsilastirmalar.append(
+                (athlete_id, self._sporcu_durum_sayaclari.get(athlete_id, {}), sporcular.get(athlete_id, {})))
+        for athlete_id, canli, yeniden in karsilastirmalar:
+            for durum in set(canli) | set(yeniden):
+                if canli.get(durum, 0) != yeniden.get(durum, 0):
+                    farklar[(athlete_id, durum)] = (canli.get(durum, 0), yeniden.get(durum, 0))
+        return farklar
+
+    # Sporcunun veya takımın verilen tarihin ISO haftasındaki toplam yükünü (dakika) döndürür
+    def haftalik_yuk(self, tarih: date, athlete_id: int = None, team_id: int = None) -> int:
+        indeks, kaynak_id = self._yuk_indeksi_sec(athlete_id, team_id)
+        return indeks.yuk(kaynak_id, hafta_anahtari(tarih))
+
+    # Sporcunun veya takımın tüm haftalık yüklerini (ISO hafta -> dakika) hafta sırasıyla döndürür
+    def haftalik_yukler(self, athlete_id: int = None, team_id: int = None) -> Dict[Hafta, int]:
+        indeks, kaynak_id = self._yuk_indeksi_sec(athlete_id, team_id)
+        return indeks.haftalar(kaynak_id)
+
+    # Sporcunun veya takımın haftalık program seviyesini atar (varsayılan: orta)
+    def haftalik_seviye_ata(self, seviye: str, athlete_id: int = None, team_id: int = None) -> None:
+        indeks, kaynak_id = self._yuk_indeksi_sec(athlete_id, team_id)
+        indeks.seviye_ata(kaynak_id, seviye)
+
+    # Tarihin haftasında önerilen sınırı aşan sporcuları veya takımları (id -> (yük, sınır)) döndürür
+    def haftalik_sinir_asanlar(self, tarih: date, alan: str = "athlete_id") -> Dict[int, Tuple[int, int]]:
+        if alan not in ("athlete_id", "team_id"):
+            raise ValueError(f"Alan 'athlete_id' veya 'team_id' olmalıdır, alınan: '{alan}'")
+        indeks = self._sporcu_yuk_indeksi if alan == "athlete_id" else self._takim_yuk_indeksi
+        return indeks.sinir_asanlar(hafta_anahtari(tarih))
+
+    # athlete_id veya team_id'den (yalnızca biri) ilgili yük indeksini ve kaynak id'sini seçer
+    def _yuk_indeksi_sec(self, athlete_id: Optional[int], team_id: Optional[int]) -> Tuple[HaftalikYukIndeksi, int]:
+        if (athlete_id is None) == (team_id is None):
+            raise ValueError("athlete_id veya team_id parametrelerinden yalnızca biri verilmelidir")
+        if athlete_id is not None:
+            return self._sporcu_yuk_indeksi, athlete_id
+        return self._takim_yuk_indeksi, team_id
 
     # Belirtilen tarih ve saatte çakışma olup olmadığını kontrol eder
     def detayli_cakisma_kontrol(self, tarih: datetime, sure_dk: int, haric_id: int = -1, 
                                 athlete_id: int = None, saha_id: int = None) -> bool:
-        # Circular import riskini önlemek için yerel import
-        from .base import AntrenmanOturumuTemel
-        
-        for oturum in self._storage.values():
-            # 1. Kendisiyle kıyaslamayı atla
-            if oturum.oturum_id == haric_id:
-                continue
-            
-            # 2. Tarihi ayarlanmamış (None olan) oturumları atla
-            if not oturum.tarih_saat:
-                continue
-            
-            # 3. Zaman Çakışması Kontrolü
-            zaman_cakisiyor = AntrenmanOturumuTemel.tarih_cakismasi_kontrol(
-                oturum.tarih_saat, 
-                oturum.sure, 
-                tarih, 
-                sure_dk
-            )
-            
-           # Zaman çakışıyorsa, kaynağın (Sporcu veya Saha) aynı olup olmadığına bak
-            if zaman_cakisiyor:
-                
-                # A) Sporcu Çakışması: Eğer athlete_id verildiyse kontrol et
-                mevcut_sporcu_id = getattr(oturum, 'athlete_id', None)
-                if athlete_id is not None and mevcut_sporcu_id is not None:
-                    if mevcut_sporcu_id == athlete_id:
-                        return True
-                
-                # B) Saha Çakışması: Eğer saha_id verildiyse kontrol et
-                mevcut_saha_id = getattr(oturum, 'saha_id', None)
-                if saha_id is not None and mevcut_saha_id is not None:
-                    if mevcut_saha_id == saha_id:
-                        return True
+        # A) Sporcu Çakışması: Eğer athlete_id verildiyse sporcunun zaman indeksine bak
+        if athlete_id is not None:
+            if self._indekste_cakisma_var(self._sporcu_zaman_indeksi.get(athlete_id), tarih, sure_dk, haric_id):
+                return True
+
+        # B) Saha Çakışması: Eğer saha_id verildiyse sahanın zaman indeksine bak
+        if saha_id is not None:
+            if self._indekste_cakisma_var(self._saha_zaman_indeksi.get(saha_id), tarih, sure_dk, haric_id):
+                return True
 
         return False
-    
+
+    # Oturumlar için zincirlenebilir bir sorgu başlatır
+    def sorgu(self) -> OturumSorgusu:
+        return OturumSorgusu(self)
+
+    # Sorgunun sürücüsünü (en az adaylı indeks) seçer ve (alan, aday_sayisi) olarak döndürür
+    def _sorgu_plani(self, sorgu: OturumSorgusu) -> Tuple[str, int]:
+        alan, aday_sayisi, _ = self._sorgu_kovalari(sorgu)[0]
+        return alan, aday_sayisi
+
+    # Sorgu koşullarını (alan, aday_sayisi, kova) olarak aday sayısına göre artan sırada döndürür
+    # (tarih koşulunun kovası None'dır; aday sayısı tarih indeksinde ikili aramayla bulunur)
+    def _sorgu_kovalari(self, sorgu: OturumSorgusu) -> List[Tuple[str, int, Optional[Dict[int, None]]]]:
+        kovalar = []
+        for alan, deger in sorgu.esitlikler:
+            kova = self._alan_indeksleri[alan].get(deger, {})
+            kovalar.append((alan, len(kova), kova))
+        if sorgu.tarih_kosulu_var:
+            kovalar.append((TARIH_ARALIGI, self._tarih_indeksi.aralik_sayisi(sorgu.baslangic, sorgu.bitis), None))
+        if not kovalar:
+            return [(TUM_OTURUMLAR, len(self._storage), None)]
+        kovalar.sort(key=lambda kova: kova[1])
+        return kovalar
+
+    # Sorguya uyan oturum id'lerini istenen sırada tembel üretir
+    def _sorgu_idleri(self, sorgu: OturumSorgusu) -> Iterator[int]:
+        """
+        En az adaylı koşul sürücü olur ve yalnızca onun adayları gezilir;
+        diğer koşullar hash indekslerinde üyelik (O(1)) ve indeks kaydındaki
+        tarihle kontrol edilir. Maliyet en küçük kovanın boyutuyla orantılıdır.
+        Sıralama sürücü sırasıyla aynıysa sonuçlar sıralanmadan akar.
+        """
+        (surucu, aday_sayisi, surucu_kova), *digerleri = self._sorgu_kovalari(sorgu)
+        if aday_sayisi == 0:
+            return iter(())
+
+        if surucu == TARIH_ARALIGI:
+            adaylar = (oturum_id for _, oturum_id in self._tarih_indeksi.sirali_kayitlar(sorgu.baslangic, sorgu.bitis))
+        elif surucu == TUM_OTURUMLAR:
+            adaylar = iter(list(self._storage))
+        else:
+            adaylar = iter(list(surucu_kova))
+
+        kovalar = [kova for alan, _, kova in digerleri if alan != TARIH_ARALIGI]
+        tarih_kontrolu = sorgu.tarih_kosulu_var and surucu != TARIH_ARALIGI
+        if kovalar or tarih_kontrolu:
+            adaylar = self._sorgu_suz(adaylar, kovalar, sorgu.baslangic if tarih_kontrolu else None,
+                                      sorgu.bitis if tarih_kontrolu else None, tarih_kontrolu)
+
+        tarih_sirasinda = surucu == TARIH_ARALIGI
+        if sorgu.siralama is not None and not (sorgu.siralama == "tarih_saat" and not sorgu.azalan and tarih_sirasinda):
+            adaylar = iter(self._idleri_sirala(list(adaylar), sorgu.siralama, sorgu.azalan))
+        if sorgu.adet is not None:
+            adaylar = islice(adaylar, sorgu.adet)
+        return adaylar
+
+    # Sorgu sonuçlarını oturum nesneleri olarak tembel üretir
+    def _sorgu_calistir(self, sorgu: OturumSorgusu) -> Iterator[AntrenmanOturumuTemel]:
+        storage = self._storage
+        return (storage[oturum_id] for oturum_id in self._sorgu_idleri(sorgu))
+
+    # Aday id'lerden diğer kovaların hepsinde bulunan ve tarih koşulunu sağlayanları üretir
+    def _sorgu_suz(self, adaylar: Iterator[int], kovalar: List[Dict[int, None]], baslangic: Optional[datetime],
+                   bitis: Optional[datetime], tarih_kontrolu: bool) -> Iterator[int]:
+        indeks_kayitlari = self._indeks_kayitlari
+        for oturum_id in adaylar:
+            for kova in kovalar:
+                if oturum_id not in kova:
+                    break
+            else:
+                if tarih_kontrolu:
+                    tarih_saat = indeks_kayitlari[oturum_id][3]
+                    if (tarih_saat is None or (baslangic is not None and tarih_saat < baslangic)
+                            or (bitis is not None and tarih_saat > bitis)):
+                        continue
+                yield oturum_id
+
+    # Id'leri indeks kayıtlarındaki alana göre sıralar (tarihi olmayanlar her iki yönde de sonda)
+    def _idleri_sirala(self, oturum_idleri: List[int], alan: str, azalan: bool) -> List[int]:
+        indeks_kayitlari = self._indeks_kayitlari
+        if alan == "oturum_id":
+            oturum_idleri.sort(reverse=azalan)
+        elif alan == "sure":
+            oturum_idleri.sort(key=lambda oturum_id: (indeks_kayitlari[oturum_id][4], oturum_id), reverse=azalan)
+        else:
+            tarihli = [oturum_id for oturum_id in oturum_idleri if indeks_kayitlari[oturum_id][3] is not None]
+            tarihsiz = [oturum_id for oturum_id in oturum_idleri if indeks_kayitlari[oturum_id][3] is None]
+            tarihli.sort(key=lambda oturum_id: (indeks_kayitlari[oturum_id][3], oturum_id), reverse=azalan)
+            tarihsiz.sort(reverse=azalan)
+            oturum_idleri = tarihli + tarihsiz
+        return oturum_idleri
+
+    # Sporcunun ve/veya sahanın [baslangic, bitis) ile çakışan oturum aralıklarını (baslangic, bitis, oturum_id) olarak döndürür
+    def kaynak_zaman_araliklari(self, baslangic: datetime, bitis: datetime,
+                                athlete_id: int = None, saha_id: int = None) -> List[Tuple[datetime, datetime, int]]:
+        sure_dk = (bitis - baslangic).total_seconds() / 60
+        araliklar: Dict[int, Tuple[datetime, datetime, int]] = {}
+        for indeks in (self._sporcu_zaman_indeksi.get(athlete_id) if athlete_id is not None else None,
+                       self._saha_zaman_indeksi.get(saha_id) if saha_id is not None else None):
+            if indeks is not None:
+                for aralik in indeks.cakisan_araliklar(baslangic, sure_dk):
+                    araliklar[aralik[2]] = aralik
+        return sorted(araliklar.values())
+
+    # Sporcunun zaman aralığı indeksini döndürür (tarihli oturumu yoksa None)
+    def sporcu_zaman_indeksi(self, athlete_id: int) -> Optional[ZamanAraligiIndeksi]:
+        return self._sporcu_zaman_indeksi.get(athlete_id)
+
+    # Sahanın zaman aralığı indeksini döndürür (tarihli oturumu yoksa None)
+    def saha_zaman_indeksi(self, saha_id: int) -> Optional[ZamanAraligiIndeksi]:
+        return self._saha_zaman_indeksi.get(saha_id)
+
+    # Zaman indeksinde, haric_id dışında çakışan bir oturum olup olmadığını kontrol eder
+    @staticmethod
+    def _indekste_cakisma_var(indeks: Optional[ZamanAraligiIndeksi], tarih: datetime,
+                              sure_dk: int, haric_id: int) -> bool:
+        if indeks is None:
+            return False
+        for oturum_id in indeks.cakisanlar(tarih, sure_dk):
+            if oturum_id != haric_id:
+                return True
+        return False
+
+    # Oturumu ikincil indekslere ekler ve indekslenen anahtarları saklar
+    # (biriktirme listeleri verilirse zaman aralıkları indekse yazılmak yerine bunlara eklenir)
+    def _indekse_ekle(self, oturum: AntrenmanOturumuTemel, tarih_araliklari: Optional[List[tuple]] = None,
+                      sporcu_araliklari: Optional[Dict[int, List[tuple]]] = None,
+                      saha_araliklari: Optional[Dict[int, List[tuple]]] = None) -> None:
+        oturum_id = oturum.oturum_id
+        athlete_id = getattr(oturum, 'athlete_id', None)
+        team_id = getattr(oturum, 'team_id', None)
+        saha_id = getattr(oturum, 'saha_id', None)
+        tarih_saat = oturum.tarih_saat
+        sure = oturum.sure
+        oturum_tipi = oturum.oturum_tipi
+        durum = oturum.durum
+
+        if athlete_id is not None:
+            self._sporcu_indeksi.setdefault(athlete_id, {})[oturum_id] = None
+            sayaclar = self._sporcu_durum_sayaclari.setdefault(athlete_id, {})
+            sayaclar[durum] = sayaclar.get(durum, 0) + 1
+        if team_id is not None:
+            self._takim_indeksi.setdefault(team_id, {})[oturum_id] = None
+        if saha_id is not None:
+            self._saha_indeksi.setdefault(saha_id, {})[oturum_id] = None
+
+        toplu = tarih_araliklari is not None
+        if tarih_saat is not None and toplu:
+            aralik = (tarih_saat, sure, oturum_id)
+            tarih_araliklari.append(aralik)
+            if athlete_id is not None:
+                sporcu_araliklari.setdefault(athlete_id, []).append(aralik)
+            if saha_id is not None:
+                saha_araliklari.setdefault(saha_id, []).append(aralik)
+        elif tarih_saat is not None:
+            if athlete_id is not None:
+                self._zaman_indeksi_al(self._sporcu_zaman_indeksi, athlete_id).ekle(tarih_saat, sure, oturum_id)
+            if saha_id is not None:
+                self._zaman_indeksi_al(self._saha_zaman_indeksi, saha_id).ekle(tarih_saat, sure, oturum_id)
+
+        self._ortak_indekslere_ekle(oturum_id, athlete_id, team_id, tarih_saat, sure, oturum_tipi, durum,
+                                    tarih_indeksine=not toplu)
+        self._indeks_kayitlari[oturum_id] = (athlete_id, team_id, saha_id, tarih_saat, sure, oturum_tipi, durum)
+
+    # Oturumu tüm oturumların paylaştığı indekslere (tip, durum, tarih, haftalık yük) ekler
+    # (tarih_indeksine=False ise tarihli oturumun aralığı toplu eklemede ayrıca yazılır)
+    def _ortak_indekslere_ekle(self, oturum_id: int, athlete_id: Optional[int], team_id: Optional[int],
+                               tarih_saat: Optional[datetime], sure: int, oturum_tipi: str, durum: str,
+                               tarih_indeksine: bool = True) -> None:
+        self._tip_indeksi.setdefault(oturum_tipi, {})[oturum_id] = None
+        self._durum_indeksi.setdefault(durum, {})[oturum_id] = None
+        if tarih_saat is None:
+            self._tarihsiz[oturum_id] = None
+        elif tarih_indeksine:
+            self._tarih_indeksi.ekle(tarih_saat, sure, oturum_id)
+        self._haftalik_yuke_yansit(athlete_id, team_id, tarih_saat, sure, durum, 1)
+
+    # Toplu kayıtta biriktirilen aralıkları tarih indeksine tek birleştirmeyle ekler
+    def _tarih_indeksine_toplu_ekle(self, araliklar: List[tuple]) -> None:
+        self._tarih_indeksi.toplu_ekle(araliklar)
+
+    # Oturumu, indekse yazıldığı andaki anahtarlarla ikincil indekslerden çıkarır
+    def _indeksten_cikar(self, oturum_id: int) -> None:
+        athlete_id, team_id, saha_id, tarih_saat, sure, oturum_tipi, durum = self._indeks_kayitlari.pop(oturum_id)
+        self._ortak_indekslerden_cikar(oturum_id, athlete_id, team_id, tarih_saat, sure, oturum_tipi, durum)
+
+        if athlete_id is not None:
+            self._kovadan_cikar(self._sporcu_indeksi, athlete_id, oturum_id)
+            self._sayaci_azalt(athlete_id, durum)
+        if team_id is not None:
+            self._kovadan_cikar(self._takim_indeksi, team_id, oturum_id)
+        if saha_id is not None:
+            self._kovadan_cikar(self._saha_indeksi, saha_id, oturum_id)
+
+        if tarih_saat is not None:
+            if athlete_id is not None:
+                self._zaman_indeksinden_cikar(self._sporcu_zaman_indeksi, athlete_id, tarih_saat, oturum_id)
+            if saha_id is not None:
+                self._zaman_indeksinden_cikar(self._saha_zaman_indeksi, saha_id, tarih_saat, oturum_id)
+
+    # Oturumu tüm oturumların paylaştığı indekslerden (tip, durum, tarih, haftalık yük) çıkarır
+    def _ortak_indekslerden_cikar(self, oturum_id: int, athlete_id: Optional[int], team_id: Optional[int],
+                                  tarih_saat: Optional[datetime], sure: int, oturum_tipi: str, durum: str) -> None:
+        self._haftalik_yuke_yansit(athlete_id, team_id, tarih_saat, sure, durum, -1)
+        self._kovadan_cikar(self._tip_indeksi, oturum_tipi, oturum_id)
+        self._kovadan_cikar(self._durum_indeksi, durum, oturum_id)
+        if tarih_saat is not None:
+            self._tarih_indeksi.cikar(tarih_saat, oturum_id)
+        else:
+            self._tarihsiz.pop(oturum_id, None)
+
+    # Hash indeksindeki kovadan id'yi çıkarır, boşalan kovayı siler
+    @staticmethod
+    def _kovadan_cikar(indeks: Dict[Any, Dict[int, None]], anahtar: Any, oturum_id: int) -> None:
+        kova = indeks.get(anahtar)
+        if kova is None:
+            return
+        kova.pop(oturum_id, None)
+        if not kova:
+            del indeks[anahtar]
+
+    # Oturum süresini sporcu ve takımın haftalık yüküne ekler (isaret=-1 ise çıkarır); tarihsiz ve iptal edilmiş oturumlar sayılmaz
+    def _haftalik_yuke_yansit(self, athlete_id: Optional[int], team_id: Optional[int], tarih_saat: Optional[datetime],
+                              sure: int, durum: str, isaret: int) -> None:
+        if tarih_saat is None or durum == "iptal_edildi":
+            return
+        hafta = hafta_anahtari(tarih_saat)
+        if athlete_id is not None:
+            self._sporcu_yuk_indeksi.ekle(athlete_id, hafta, isaret * sure)
+        if team_id is not None:
+            self._takim_yuk_indeksi.ekle(team_id, hafta, isaret * sure)
+
+    # Sporcunun durum sayacını bir azaltır, sıfırlanan sayaçları siler
+    def _sayaci_azalt(self, athlete_id: int, durum: str) -> None:
+        sayaclar = self._sporcu_durum_sayaclari.get(athlete_id)
+        if sayaclar is None or durum not in sayaclar:
+            return
+        sayaclar[durum] -= 1
+        if not sayaclar[durum]:
+            del sayaclar[durum]
+            if not sayaclar:
+                del self._sporcu_durum_sayaclari[athlete_id]
+
+    # Kaynağın zaman indeksini döndürür, yoksa oluşturur
+    @staticmethod
+    def _zaman_indeksi_al(indeksler: Dict[int, ZamanAraligiIndeksi], kaynak_id: int) -> ZamanAraligiIndeksi:
+        indeks = indeksler.get(kaynak_id)
+        if indeks is None:
+            indeks = indeksler[kaynak_id] = ZamanAraligiIndeksi()
+        return indeks
+
+    # Kaynağın zaman indeksinden aralığı çıkarır, boşalan indeksi siler
+    @staticmethod
+    def _zaman_indeksinden_cikar(indeksler: Dict[int, ZamanAraligiIndeksi], kaynak_id: int,
+                                 tarih_saat: datetime, oturum_id: int) -> None:
+        indeks = indeksler.get(kaynak_id)
+        if indeks is None:
+            return
+        indeks.cikar(tarih_saat, oturum_id)
+        if not indeks:
+            del indeksler[kaynak_id]
+
     # Oturum ID'sinin geçerli formatda olup olmadığını kontrol eder
     @staticmethod
     def gecerli_oturum_id_mi(oturum_id: int) -> bool:
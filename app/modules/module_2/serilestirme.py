@@ -0,0 +1,67 @@
+"""
+Antrenman oturumlarını düz sözlüklere çeviren ve geri oluşturan yardımcılar.
+Kalıcı repository'ler ve dışa/içe aktarım bu ortak satır biçimini kullanır.
+"""
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Mapping
+
+from .base import AntrenmanOturumuTemel
+from .implementations import IndividualTrainingSession, TeamTrainingSession, RehabTrainingSession
+from .exceptions import AntrenmanHatasi
+
+# oturum_detaylari_getir içindeki "oturum_turu" değerinden sınıfa eşleme
+OTURUM_SINIFLARI = {
+    "bireysel": IndividualTrainingSession,
+    "takım": TeamTrainingSession,
+    "rehabilitasyon": RehabTrainingSession,
+}
+
+# Her oturum türünün kurucu parametreleri (oturum_detaylari_getir anahtarlarıyla aynı adlar)
+OTURUM_ALANLARI = {
+    "bireysel": ("oturum_id", "sure", "athlete_id", "antrenor_id", "odak_alani",
+                 "oturum_tipi", "tarih_saat", "durum", "performans_notu"),
+    "takım": ("oturum_id", "sure", "team_id", "saha_id", "katilimci_sayisi",
+              "antrenman_plani", "oturum_tipi", "tarih_saat", "durum"),
+    "rehabilitasyon": ("oturum_id", "sure", "athlete_id", "fizyoterapist_id", "sakatlik_tipi",
+                       "rehab_programi", "oturum_tipi", "tarih_saat", "durum", "ilerleme_notu"),
+}
+
+
+# Oturumu, tarih ISO metni olan düz bir sözlüğe çevirir
+def oturum_sozluge_cevir(oturum: AntrenmanOturumuTemel) -> Dict[str, Any]:
+    return oturum.oturum_detaylari_getir()
+
+
+# oturum_detaylari_getir biçimindeki sözlükten oturum nesnesini (setter doğrulamasıyla) oluşturur
+def sozlukten_oturum_olustur(satir: Mapping[str, Any]) -> AntrenmanOturumuTemel:
+    oturum_turu = satir.get("oturum_turu")
+    if oturum_turu not in OTURUM_SINIFLARI:
+        raise AntrenmanHatasi(f"Bilinmeyen oturum türü: '{oturum_turu}'")
+
+    parametreler = {alan: satir.get(alan) for alan in OTURUM_ALANLARI[oturum_turu] if satir.get(alan) is not None}
+    tarih_saat = parametreler.get("tarih_saat")
+    if isinstance(tarih_saat, str):
+        parametreler["tarih_saat"] = datetime.fromisoformat(tarih_saat)
+    return OTURUM_SINIFLARI[oturum_turu](**parametreler)
+
+
+# Sözlüklerden toplu oturum oluşturur; türlere göre gruplayıp satirlardan_olustur'u kullanır (sıra korunur)
+def sozluklerden_oturumlar_olustur(satirlar: Iterable[Mapping[str, Any]], dogrula: bool = True) -> List[AntrenmanOturumuTemel]:
+    gruplar: Dict[str, List[int]] = {}
+    hazir: List[Dict[str, Any]] = []
+    for sira, satir in enumerate(satirlar):
+        oturum_turu = satir.get("oturum_turu")
+        if oturum_turu not in OTURUM_SINIFLARI:
+            raise AntrenmanHatasi(f"Bilinmeyen oturum türü: '{oturum_turu}'")
+        tarih_saat = satir.get("tarih_saat")
+        if isinstance(tarih_saat, str):
+            satir = dict(satir, tarih_saat=datetime.fromisoformat(tarih_saat))
+        gruplar.setdefault(oturum_turu, []).append(sira)
+        hazir.append(satir)
+
+    oturumlar: List[Any] = [None] * len(hazir)
+    for oturum_turu, siralar in gruplar.items():
+        olusanlar = OTURUM_SINIFLARI[oturum_turu].satirlardan_olustur([hazir[sira] for sira in siralar], dogrula)
+        for sira, oturum in zip(siralar, olusanlar):
+            oturumlar[sira] = oturum
+    return oturumlar
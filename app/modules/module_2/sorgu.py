@@ -0,0 +1,123 @@
+"""
+Antrenman oturumları için birleştirilebilir sorgu nesnesi.
+Koşullar (sporcu, takım, saha, tip, durum, tarih aralığı) zincirlenerek
+eklenir; repository sorguyu en seçici indeksten başlayıp diğer indekslerle
+üyelik kontrolü yaparak çalıştırır ve sonuçları tembel (lazy) üretir.
+"""
+from datetime import datetime
+from typing import Any, Iterator, List, Optional, Tuple
+
+from .base import AntrenmanOturumuTemel
+from .exceptions import GecersizTarihSaatHatasi
+
+# Planda hiçbir indeks kullanılamadığında (koşulsuz sorgu) sürücü adı
+TUM_OTURUMLAR = "tumu"
+# Tarih aralığı koşulunun plandaki adı
+TARIH_ARALIGI = "tarih_saat"
+
+
+# Zincirlenebilir oturum sorgusu; repository.sorgu() ile oluşturulur
+class OturumSorgusu:
+    """
+    Örnek: repo.sorgu().sporcu(42).tip("kondisyon").durum("planlandı")
+               .tarih_araligi(mart_basi, mart_sonu).sirala("tarih_saat")
+
+    Tüm koşullar VE ile birleşir. Tarih aralığı iki uçta da dahildir; tarihi
+    olmayan oturumlar tarih koşulunu sağlamaz. Sıralama verilmezse sonuçlar
+    sürücü indeksin sırasıyla (tarih indeksi için tarih, diğerleri için kayıt
+    sırası) gelir. Sonuçlar gezildikçe üretilir; gezinme sırasında
+    repository'nin değiştirilmesi sonucu etkileyebilir.
+    """
+
+    # Sıralamada kullanılabilecek alanlar
+    SIRALAMA_ALANLARI = ("tarih_saat", "oturum_id", "sure")
+
+    # Repository'ye bağlı boş bir sorgu oluşturur
+    def __init__(self, repository):
+        self._repo = repository
+        self.esitlikler: List[Tuple[str, Any]] = []
+        self.tarih_kosulu_var = False
+        self.baslangic: Optional[datetime] = None
+        self.bitis: Optional[datetime] = None
+        self.siralama: Optional[str] = None
+        self.azalan = False
+        self.adet: Optional[int] = None
+
+    # Sporcu koşulu ekler
+    def sporcu(self, athlete_id: int) -> 'OturumSorgusu':
+        return self._esitlik_ekle("athlete_id", athlete_id)
+
+    # Takım koşulu ekler
+    def takim(self, team_id: int) -> 'OturumSorgusu':
+        return self._esitlik_ekle("team_id", team_id)
+
+    # Saha koşulu ekler
+    def saha(self, saha_id: int) -> 'OturumSorgusu':
+        return self._esitlik_ekle("saha_id", saha_id)
+
+    # Oturum tipi koşulu ekler (setter ile aynı şekilde küçük harfe çevrilir)
+    def tip(self, oturum_tipi: str) -> 'OturumSorgusu':
+        return self._esitlik_ekle("oturum_tipi", self._normalize(oturum_tipi))
+
+    # Durum koşulu ekler (setter ile aynı şekilde küçük harfe çevrilir)
+    def durum(self, durum: str) -> 'OturumSorgusu':
+        return self._esitlik_ekle("durum", self._normalize(durum))
+
+    # Tarih aralığı koşulu ekler; uçlardan biri None ise o yönde sınır yoktur
+    def tarih_araligi(self, baslangic: Optional[datetime] = None,
+                      bitis: Optional[datetime] = None) -> 'OturumSorgusu':
+        for tarih in (baslangic, bitis):
+            if tarih is not None and not isinstance(tarih, datetime):
+                raise GecersizTarihSaatHatasi(f"Tarih datetime objesi olmalıdır, alınan: {type(tarih).__name__}")
+        # Birden fazla tarih koşulu kesişim olarak birleşir
+        if baslangic is not None and (self.baslangic is None or baslangic > self.baslangic):
+            self.baslangic = baslangic
+        if bitis is not None and (self.bitis is None or bitis < self.bitis):
+            self.bitis = bitis
+        self.tarih_kosulu_var = True
+        return self
+
+    # Sonuçların sıralamasını belirler
+    def sirala(self, alan: str = "tarih_saat", azalan: bool = False) -> 'OturumSorgusu':
+        if alan not in self.SIRALAMA_ALANLARI:
+            raise ValueError(f"Sıralama alanı {self.SIRALAMA_ALANLARI} değerlerinden biri olmalıdır, alınan: '{alan}'")
+        self.siralama = alan
+        self.azalan = azalan
+        return self
+
+    # Döndürülecek en fazla sonuç sayısını belirler
+    def limit(self, adet: int) -> 'OturumSorgusu':
+        if not isinstance(adet, int) or adet <= 0:
+            raise ValueError(f"Sorgu limiti pozitif tam sayı olmalıdır, alınan: {adet}")
+        self.adet = adet
+        return self
+
+    # Sorgu sonuçlarını tembel olarak gezer
+    def __iter__(self) -> Iterator[AntrenmanOturumuTemel]:
+        return self._repo._sorgu_calistir(self)
+
+    # Sorgu sonuçlarını liste olarak döndürür
+    def listele(self) -> List[AntrenmanOturumuTemel]:
+        return list(self)
+
+    # Sorguya uyan oturum sayısını nesnelere erişmeden döndürür
+    def say(self) -> int:
+        return sum(1 for _ in self._repo._sorgu_idleri(self))
+
+    # Sorgunun ilk sonucunu döndürür (sonuç yoksa None)
+    def ilk(self) -> Optional[AntrenmanOturumuTemel]:
+        return next(iter(self), None)
+
+    # Sorgunun sürücü indeksini ve aday sayısını (alan, aday_sayisi) olarak döndürür
+    def plan(self) -> Tuple[str, int]:
+        return self._repo._sorgu_plani(self)
+
+    # Eşitlik koşulunu ekler
+    def _esitlik_ekle(self, alan: str, deger: Any) -> 'OturumSorgusu':
+        self.esitlikler.append((alan, deger))
+        return self
+
+    # Metin değerleri setter'larla aynı biçime getirir
+    @staticmethod
+    def _normalize(deger: Any) -> Any:
+        return deger.lower().strip() if isinstance(deger, str) else deger
@@ -0,0 +1,337 @@
+"""
+SQLite tabanlı antrenman oturumu repository'si.
+TrainingRepository ile aynı metotları sunar; veriler bir dosyada veya
+':memory:' veritabanında tutulur, çakışma koşulu SQL'e taşınır.
+"""
+import sqlite3
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .base import AntrenmanOturumuTemel
+from .sorgu import OturumSorgusu
+from .serilestirme import OTURUM_ALANLARI, oturum_sozluge_cevir, sozluklerden_oturumlar_olustur
+from .exceptions import DuplicateOturumHatasi, OturumBulunamadiHatasi
+
+# Sabit genişlikli tarih biçimi: metin karşılaştırması kronolojik sırayla aynı olur
+TARIH_FORMATI = "%Y-%m-%d %H:%M:%S.%f"
+
+# Tablo sütunları (tarih_saat, baslangic/bitis olarak iki sütunda saklanır)
+SUTUNLAR = (
+    "oturum_id", "oturum_turu", "sure", "athlete_id", "team_id", "saha_id", "oturum_tipi", "durum",
+    "baslangic", "bitis", "antrenor_id", "odak_alani", "performans_notu", "katilimci_sayisi",
+    "antrenman_plani", "fizyoterapist_id", "sakatlik_tipi", "rehab_programi", "ilerleme_notu",
+)
+
+SEMA = """
+CREATE TABLE IF NOT EXISTS oturumlar (
+    oturum_id INTEGER PRIMARY KEY,
+    oturum_turu TEXT NOT NULL,
+    sure INTEGER NOT NULL,
+    athlete_id INTEGER,
+    team_id INTEGER,
+    saha_id INTEGER,
+    oturum_tipi TEXT NOT NULL,
+    durum TEXT NOT NULL,
+    baslangic TEXT,
+    bitis TEXT,
+    antrenor_id INTEGER,
+    odak_alani TEXT,
+    performans_notu REAL,
+    katilimci_sayisi INTEGER,
+    antrenman_plani TEXT,
+    fizyoterapist_id INTEGER,
+    sakatlik_tipi TEXT,
+    rehab_programi TEXT,
+    ilerleme_notu REAL
+);
+CREATE INDEX IF NOT EXISTS ix_oturumlar_sporcu ON oturumlar (athlete_id, baslangic);
+CREATE INDEX IF NOT EXISTS ix_oturumlar_saha ON oturumlar (saha_id, baslangic);
+CREATE INDEX IF NOT EXISTS ix_oturumlar_takim ON oturumlar (team_id);
+CREATE INDEX IF NOT EXISTS ix_oturumlar_baslangic ON oturumlar (baslangic);
+"""
+
+
+# Sorgu sıralama alanı -> ORDER BY ifadesi (artan, azalan); tarihi olmayanlar her iki yönde sonda
+SIRALAMA_SQL = {
+    "tarih_saat": ("baslangic IS NULL, baslangic, oturum_id", "baslangic IS NULL, baslangic DESC, oturum_id DESC"),
+    "oturum_id": ("oturum_id", "oturum_id DESC"),
+    "sure": ("sure, oturum_id", "sure DESC, oturum_id DESC"),
+}
+
+# Sorgu sonuçları veritabanından bu büyüklükte parçalarla okunur
+SORGU_PARCA_BOYUTU = 500
+
+
+# Antrenman oturumlarının SQLite veri erişim katmanı
+class SqliteTrainingRepository:
+
+    # Repository'yi verilen veritabanı dosyası (veya ':memory:') ile başlatır
+    def __init__(self, veritabani: str = ":memory:"):
+        self._baglanti = sqlite3.connect(veritabani)
+        self._baglanti.row_factory = sqlite3.Row
+        self._baglanti.executescript(SEMA)
+
+        # Çakışma sorgusunda baslangic indeksini aralıkla kullanabilmek için en uzun süre
+        en_uzun = self._baglanti.execute("SELECT MAX(sure) FROM oturumlar").fetchone()[0]
+        self._en_uzun_sure = en_uzun or 0
+
+    # Yeni bir boş (bellek içi) repository örneği oluşturur
+    @classmethod
+    def bos_repository_olustur(cls) -> 'SqliteTrainingRepository':
+        return cls(":memory:")
+
+    # Veritabanı bağlantısını kapatır
+    def kapat(self) -> None:
+        self._baglanti.close()
+
+    def __enter__(self) -> 'SqliteTrainingRepository':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.kapat()
+
+    # Yeni bir antrenman oturumunu sisteme kaydeder
+    def kaydet(self, oturum: AntrenmanOturumuTemel) -> None:
+        self.kaydet_toplu([oturum])
+
+    # Birden fazla oturumu tek bir transaction içinde kaydeder; biri hatalıysa hiçbiri kaydedilmez
+    def kaydet_toplu(self, oturumlar: Iterable[AntrenmanOturumuTemel]) -> None:
+        satirlar = [self._satira_cevir(oturum) for oturum in oturumlar]
+        yer_tutucular = ", ".join("?" for _ in SUTUNLAR)
+        try:
+            with self._baglanti:
+                self._baglanti.executemany(
+                    f"INSERT INTO oturumlar ({', '.join(SUTUNLAR)}) VALUES ({yer_tutucular})", satirlar
+                )
+        except sqlite3.IntegrityError as e:
+            raise DuplicateOturumHatasi(f"Kaydedilecek oturumlardan biri zaten mevcut: {e}")
+        self._en_uzun_sure_guncelle(satirlar)
+
+    # Mevcut bir antrenman oturumunu günceller
+    def guncelle(self, oturum: AntrenmanOturumuTemel) -> None:
+        satir = self._satira_cevir(oturum)
+        atamalar = ", ".join(f"{sutun} = ?" for sutun in SUTUNLAR[1:])
+        with self._baglanti:
+            imlec = self._baglanti.execute(
+                f"UPDATE oturumlar SET {atamalar} WHERE oturum_id = ?", satir[1:] + (satir[0],)
+            )
+        if imlec.rowcount == 0:
+            raise OturumBulunamadiHatasi(f"Güncellenecek oturum bulunamadı: ID {oturum.oturum_id}")
+        self._en_uzun_sure_guncelle([satir])
+
+    # ID'si verilen oturumu sistemden siler
+    def sil(self, oturum_id: int) -> None:
+        with self._baglanti:
+            imlec = self._baglanti.execute("DELETE FROM oturumlar WHERE oturum_id = ?", (oturum_id,))
+        if imlec.rowcount == 0:
+            raise OturumBulunamadiHatasi(f"Silinecek oturum bulunamadı: ID {oturum_id}")
+
+    # ID'si verilen oturumu bulur
+    def id_ile_bul(self, oturum_id: int) -> Optional[AntrenmanOturumuTemel]:
+        oturumlar = self._sorgula("SELECT * FROM oturumlar WHERE oturum_id = ?", (oturum_id,))
+        return oturumlar[0] if oturumlar else None
+
+    # Tüm antrenman oturumlarını listeler
+    def tumunu_listele(self) -> List[AntrenmanOturumuTemel]:
+        return self._sorgula("SELECT * FROM oturumlar ORDER BY oturum_id")
+
+    # Sporcu ID'sine göre antrenman oturumlarını filtreler
+    def sporcuya_gore_filtrele(self, athlete_id: int) -> List[AntrenmanOturumuTemel]:
+        return self._sorgula("SELECT * FROM oturumlar WHERE athlete_id = ? ORDER BY oturum_id", (athlete_id,))
+
+    # Oturumu olan sporcuların ID'lerini artan sırada döndürür
+    def sporcu_idleri(self) -> List[int]:
+        imlec = self._baglanti.execute(
+            "SELECT DISTINCT athlete_id FROM oturumlar WHERE athlete_id IS NOT NULL ORDER BY athlete_id")
+        return [satir[0] for satir in imlec.fetchall()]
+
+    # Takım ID'sine göre antrenman oturumlarını filtreler
+    def takima_gore_filtrele(self, team_id: int) -> List[AntrenmanOturumuTemel]:
+        return self._sorgula("SELECT * FROM oturumlar WHERE team_id = ? ORDER BY oturum_id", (team_id,))
+
+    # Tarih aralığına göre antrenman oturumlarını filtreler (sonuç tarih sırasındadır)
+    def tarih_araligina_gore_filtrele(self, baslangic: datetime, bitis: datetime) -> List[AntrenmanOturumuTemel]:
+        return self._sorgula(
+            "SELECT * FROM oturumlar WHERE baslangic >= ? AND baslangic <= ? ORDER BY baslangic, oturum_id",
+            (baslangic.strftime(TARIH_FORMATI), bitis.strftime(TARIH_FORMATI))
+        )
+
+    # Tarih sırasıyla bir sayfa oturum ve bir sonraki sayfanın imlecini döndürür (son sayfada imleç None)
+    def tarih_sirali_sayfa(
+        self,
+        imlec: Optional[Tuple[datetime, int]] = None,
+        limit: int = 50,
+        baslangic: Optional[datetime] = None,
+        bitis: Optional[datetime] = None
+    ) -> Tuple[List[AntrenmanOturumuTemel], Optional[Tuple[datetime, int]]]:
+        if not isinstance(limit, int) or limit <= 0:
+            raise ValueError(f"Sayfa limiti pozitif tam sayı olmalıdır, alınan: {limit}")
+
+        kosullar = ["baslangic IS NOT NULL"]
+        parametreler: List[Any] = []
+        if baslangic is not None:
+            kosullar.append("baslangic >= ?")
+            parametreler.append(baslangic.strftime(TARIH_FORMATI))
+        if bitis is not None:
+            kosullar.append("baslangic <= ?")
+            parametreler.append(bitis.strftime(TARIH_FORMATI))
+        if imlec is not None:
+            kosullar.append("(baslangic, oturum_id) > (?, ?)")
+            parametreler.extend([imlec[0].strftime(TARIH_FORMATI), imlec[1]])
+
+        oturumlar = self._sorgula(
+            f"SELECT * FROM oturumlar WHERE {' AND '.join(kosullar)} ORDER BY baslangic, oturum_id LIMIT ?",
+            tuple(parametreler) + (limit + 1,)
+        )
+        sonraki_imlec = None
+        if len(oturumlar) > limit:
+            son = oturumlar[limit - 1]
+            sonraki_imlec = (son.tarih_saat, son.oturum_id)
+        return oturumlar[:limit], sonraki_imlec
+
+    # Tarihi henüz ayarlanmamış oturumları listeler
+    def tarihsiz_oturumlar(self) -> List[AntrenmanOturumuTemel]:
+        return self._sorgula("SELECT * FROM oturumlar WHERE baslangic IS NULL ORDER BY oturum_id")
+
+    # Durumlara göre oturum sayılarını döndürür (athlete_id verilirse yalnızca o sporcu; sayım SQL'de yapılır)
+    def durum_sayilari(self, athlete_id: Optional[int] = None) -> Dict[str, int]:
+        if athlete_id is None:
+            imlec = self._baglanti.execute("SELECT durum, COUNT(*) FROM oturumlar GROUP BY durum")
+        else:
+            imlec = self._baglanti.execute(
+                "SELECT durum, COUNT(*) FROM oturumlar WHERE athlete_id = ? GROUP BY durum", (athlete_id,))
+        return dict(imlec.fetchall())
+
+    # Belirtilen tarih ve saatte çakışma olup olmadığını kontrol eder (çakışma koşulu SQL'de değerlendirilir)
+    def detayli_cakisma_kontrol(self, tarih: datetime, sure_dk: int, haric_id: int = -1,
+                                athlete_id: int = None, saha_id: int = None) -> bool:
+        bitis = tarih + timedelta(minutes=sure_dk)
+        # Çakışan bir oturum en geç (tarih - en uzun süre) anından sonra başlamış olmalıdır
+        alt_sinir = tarih - timedelta(minutes=self._en_uzun_sure)
+        zaman = (alt_sinir.strftime(TARIH_FORMATI), bitis.strftime(TARIH_FORMATI),
+                 tarih.strftime(TARIH_FORMATI), haric_id)
+
+        for sutun, kaynak_id in (("athlete_id", athlete_id), ("saha_id", saha_id)):
+            if kaynak_id is None:
+                continue
+            satir = self._baglanti.execute(
+                f"SELECT 1 FROM oturumlar WHERE {sutun} = ? AND baslangic > ? AND baslangic < ? "
+                f"AND bitis > ? AND oturum_id != ? LIMIT 1",
+                (kaynak_id,) + zaman
+            ).fetchone()
+            if satir:
+                return True
+        return False
+
+    # Sporcunun ve/veya sahanın [baslangic, bitis) ile çakışan oturum aralıklarını (baslangic, bitis, oturum_id) olarak döndürür
+    def kaynak_zaman_araliklari(self, baslangic: datetime, bitis: datetime,
+                                athlete_id: int = None, saha_id: int = None) -> List[Tuple[datetime, datetime, int]]:
+        alt_sinir = baslangic - timedelta(minutes=self._en_uzun_sure)
+        zaman = (alt_sinir.strftime(TARIH_FORMATI), bitis.strftime(TARIH_FORMATI), baslangic.strftime(TARIH_FORMATI))
+
+        araliklar: Dict[int, Tuple[datetime, datetime, int]] = {}
+        for sutun, kaynak_id in (("athlete_id", athlete_id), ("saha_id", saha_id)):
+            if kaynak_id is None:
+                continue
+            satirlar = self._baglanti.execute(
+                f"SELECT baslangic, bitis, oturum_id FROM oturumlar WHERE {sutun} = ? AND baslangic > ? "
+                f"AND baslangic < ? AND bitis > ?",
+                (kaynak_id,) + zaman
+            )
+            for kayit_baslangic, kayit_bitis, oturum_id in satirlar:
+                araliklar[oturum_id] = (datetime.strptime(kayit_baslangic, TARIH_FORMATI),
+                                        datetime.strptime(kayit_bitis, TARIH_FORMATI), oturum_id)
+        return sorted(araliklar.values())
+
+    # Oturumlar için zincirlenebilir bir sorgu başlatır (koşullar SQL'e derlenir)
+    def sorgu(self) -> OturumSorgusu:
+        return OturumSorgusu(self)
+
+    # Sorgunun SQLite plan özetini ve sonuç sayısını döndürür
+    def _sorgu_plani(self, sorgu: OturumSorgusu) -> Tuple[str, int]:
+        kosul, parametreler = self._sorgu_kosulu(sorgu)
+        plan = self._baglanti.execute(f"EXPLAIN QUERY PLAN SELECT oturum_id FROM oturumlar{kosul}", parametreler).fetchone()
+        return plan["detail"], self._baglanti.execute(f"SELECT COUNT(*) FROM oturumlar{kosul}", parametreler).fetchone()[0]
+
+    # Sorguya uyan oturum id'lerini istenen sırada üretir
+    def _sorgu_idleri(self, sorgu: OturumSorgusu) -> Iterator[int]:
+        kosul, parametreler = self._sorgu_kosulu(sorgu)
+        imlec = self._baglanti.execute(f"SELECT oturum_id FROM oturumlar{kosul}{self._sorgu_sonu(sorgu)}", parametreler)
+        return (satir[0] for satir in imlec)
+
+    # Sorgu sonuçlarını veritabanından parça parça okuyarak tembel üretir
+    def _sorgu_calistir(self, sorgu: OturumSorgusu) -> Iterator[AntrenmanOturumuTemel]:
+        kosul, parametreler = self._sorgu_kosulu(sorgu)
+        imlec = self._baglanti.execute(f"SELECT * FROM oturumlar{kosul}{self._sorgu_sonu(sorgu)}", parametreler)
+        while True:
+            satirlar = imlec.fetchmany(SORGU_PARCA_BOYUTU)
+            if not satirlar:
+                return
+            yield from self._satirlardan_oturumlar(satirlar)
+
+    # Sorgu koşullarını WHERE ifadesine ve parametrelerine çevirir
+    @staticmethod
+    def _sorgu_kosulu(sorgu: OturumSorgusu) -> Tuple[str, tuple]:
+        kosullar = []
+        parametreler: List[Any] = []
+        for alan, deger in sorgu.esitlikler:
+            # Alan adları OturumSorgusu'nun sabit alanlarıdır; değerler parametre olarak verilir
+            kosullar.append(f"{alan} = ?")
+            parametreler.append(deger)
+        if sorgu.tarih_kosulu_var:
+            kosullar.append("baslangic IS NOT NULL")
+            if sorgu.baslangic is not None:
+                kosullar.append("baslangic >= ?")
+                parametreler.append(sorgu.baslangic.strftime(TARIH_FORMATI))
+            if sorgu.bitis is not None:
+                kosullar.append("baslangic <= ?")
+                parametreler.append(sorgu.bitis.strftime(TARIH_FORMATI))
+        return (f" WHERE {' AND '.join(kosullar)}" if kosullar else ""), tuple(parametreler)
+
+    # Sorgunun ORDER BY ve LIMIT kısmını döndürür (sıralama verilmezse id sırası)
+    @staticmethod
+    def _sorgu_sonu(sorgu: OturumSorgusu) -> str:
+        siralama = SIRALAMA_SQL[sorgu.siralama or "oturum_id"][1 if sorgu.azalan else 0]
+        return f" ORDER BY {siralama}" + (f" LIMIT {sorgu.adet}" if sorgu.adet is not None else "")
+
+    # Oturum ID'sinin geçerli formatda olup olmadığını kontrol eder
+    @staticmethod
+    def gecerli_oturum_id_mi(oturum_id: int) -> bool:
+        return isinstance(oturum_id, int) and oturum_id > 0
+
+    # Sorguyu çalıştırıp satırları oturum nesnelerine çevirir
+    def _sorgula(self, sql: str, parametreler: tuple = ()) -> List[AntrenmanOturumuTemel]:
+        return self._satirlardan_oturumlar(self._baglanti.execute(sql, parametreler).fetchall())
+
+    # Tablo satırlarını oturum nesnelerine çevirir (tabloya sadece doğrulanmış oturumlar yazılır)
+    def _satirlardan_oturumlar(self, satirlar: List[sqlite3.Row]) -> List[AntrenmanOturumuTemel]:
+        oturumlar = sozluklerden_oturumlar_olustur([self._satirdan_detay(satir) for satir in satirlar], dogrula=False)
+        # team_id yalnızca takım oturumlarının kurucu alanıdır; diğer türlerde sütundan geri yüklenir
+        for oturum, satir in zip(oturumlar, satirlar):
+            oturum._team_id = satir["team_id"]
+        return oturumlar
+
+    # Yazılan satırlardaki en uzun süreyi çakışma sorgusu için saklar
+    def _en_uzun_sure_guncelle(self, satirlar: List[tuple]) -> None:
+        for satir in satirlar:
+            if satir[2] > self._en_uzun_sure:
+                self._en_uzun_sure = satir[2]
+
+    # Oturumu SUTUNLAR sırasında bir tabloya yazılacak demete çevirir
+    @staticmethod
+    def _satira_cevir(oturum: AntrenmanOturumuTemel) -> tuple:
+        detay: Dict[str, Any] = oturum_sozluge_cevir(oturum)
+        if oturum.tarih_saat is not None:
+            detay["baslangic"] = oturum.tarih_saat.strftime(TARIH_FORMATI)
+            detay["bitis"] = (oturum.tarih_saat + timedelta(minutes=oturum.sure)).strftime(TARIH_FORMATI)
+        detay["team_id"] = oturum.team_id
+        return tuple(detay.get(sutun) for sutun in SUTUNLAR)
+
+    # Tablo satırını oturum_detaylari_getir biçiminde bir sözlüğe çevirir
+    @staticmethod
+    def _satirdan_detay(satir: sqlite3.Row) -> Dict[str, Any]:
+        detay = {alan: satir[alan] for alan in OTURUM_ALANLARI[satir["oturum_turu"]] if alan != "tarih_saat"}
+        detay["oturum_turu"] = satir["oturum_turu"]
+        if satir["baslangic"] is not None:
+            detay["tarih_saat"] = datetime.strptime(satir["baslangic"], TARIH_FORMATI)
+        return detay
@@ -0,0 +1,105 @@
+"""
+Tekrarlayan antrenman programları için tekrar kuralı ve oturum üreteci.
+Kural (gün aralığı veya haftanın günleri, son tarih ve/veya adet) tarihleri
+tembel (lazy) olarak üretir; oturumlar şablonun prototip kopyasıyla oluşturulur.
+"""
+from datetime import datetime, timedelta
+from itertools import count
+from typing import Iterable, Iterator, Optional
+
+from .base import AntrenmanOturumuTemel
+from .exceptions import GecersizOturumIdHatasi, GecersizTarihSaatHatasi
+
+
+# Tekrarlayan oturumların tarihlerini tanımlayan kural
+class TekrarKurali:
+    """
+    haftanin_gunleri verilmezse tarihler her `aralik` günde bir üretilir.
+    Verilirse (0=Pazartesi ... 6=Pazar) başlangıç haftasından itibaren her
+    `aralik` haftada bir, listedeki günlerde aynı saatte üretilir; başlangıçtan
+    önceki günler atlanır. Üretim son_tarih'te (dahil) veya adet kadar tarihte durur.
+    """
+
+    # Kuralı doğrulayarak başlatır; son_tarih ve adet'ten en az biri zorunludur
+    def __init__(
+        self,
+        aralik: int = 1,
+        haftanin_gunleri: Optional[Iterable[int]] = None,
+        son_tarih: Optional[datetime] = None,
+        adet: Optional[int] = None
+    ):
+        if not isinstance(aralik, int) or aralik <= 0:
+            raise ValueError(f"Tekrar aralığı pozitif tam sayı olmalıdır, alınan: {aralik}")
+        if son_tarih is None and adet is None:
+            raise ValueError("Tekrar kuralı için son tarih veya adet belirtilmelidir")
+        if son_tarih is not None and not isinstance(son_tarih, datetime):
+            raise GecersizTarihSaatHatasi(f"Son tarih datetime objesi olmalıdır, alınan: {type(son_tarih).__name__}")
+        if adet is not None and (not isinstance(adet, int) or adet < 0):
+            raise ValueError(f"Tekrar adedi negatif olmayan tam sayı olmalıdır, alınan: {adet}")
+
+        gunler = None
+        if haftanin_gunleri is not None:
+            gunler = tuple(sorted(set(haftanin_gunleri)))
+            if not gunler or not all(isinstance(gun, int) and 0 <= gun <= 6 for gun in gunler):
+                raise ValueError(f"Haftanın günleri 0-6 arasında tam sayılar olmalıdır, alınan: {haftanin_gunleri}")
+
+        self.aralik = aralik
+        self.haftanin_gunleri = gunler
+        self.son_tarih = son_tarih
+        self.adet = adet
+
+    # Gün aralıklı basit bir kural oluşturur (eski toplu_program_olustur parametreleri)
+    @classmethod
+    def gunluk(cls, aralik_gun: int, adet: int) -> 'TekrarKurali':
+        return cls(aralik=aralik_gun, adet=adet)
+
+    # Başlangıç tarihinden itibaren kurala uyan tarihleri sırayla üretir
+    def tarihler(self, baslangic: datetime) -> Iterator[datetime]:
+        if not isinstance(baslangic, datetime):
+            raise GecersizTarihSaatHatasi(f"Başlangıç datetime objesi olmalıdır, alınan: {type(baslangic).__name__}")
+
+        uretilen = 0
+        for tarih in self._aday_tarihler(baslangic):
+            if self.adet is not None and uretilen >= self.adet:
+                return
+            if self.son_tarih is not None and tarih > self.son_tarih:
+                return
+            yield tarih
+            uretilen += 1
+
+    # Sınırsız aday tarih dizisini üretir (sınırlar tarihler() içinde uygulanır)
+    def _aday_tarihler(self, baslangic: datetime) -> Iterator[datetime]:
+        if self.haftanin_gunleri is None:
+            adim = timedelta(days=self.aralik)
+            tarih = baslangic
+            while True:
+                yield tarih
+                tarih += adim
+
+        hafta_basi = baslangic - timedelta(days=baslangic.weekday())
+        gun_farklari = [timedelta(days=gun) for gun in self.haftanin_gunleri]
+        adim = timedelta(weeks=self.aralik)
+        while True:
+            for fark in gun_farklari:
+                tarih = hafta_basi + fark
+                if tarih >= baslangic:
+                    yield tarih
+            hafta_basi += adim
+
+
+# Şablonların kurala göre tekrarlarını tembel üretir; id'ler baslangic_id'den itibaren ardışık verilir
+def tekrarlayan_oturumlar(
+    sablonlar: Iterable[AntrenmanOturumuTemel],
+    kural: TekrarKurali,
+    baslangic_id: int
+) -> Iterator[AntrenmanOturumuTemel]:
+    if not isinstance(baslangic_id, int) or baslangic_id <= 0:
+        raise GecersizOturumIdHatasi(f"Başlangıç ID'si pozitif tam sayı olmalıdır, alınan: {baslangic_id}")
+
+    oturum_idleri = count(baslangic_id)
+    for sablon in sablonlar:
+        if sablon.tarih_saat is None:
+            raise GecersizTarihSaatHatasi(f"Şablon oturumun ({sablon.oturum_id}) tarihi olmalıdır")
+        # Tarihler önce çekilir; şablonun tarihleri bitince sayaçtan id harcanmaz
+        for tarih, oturum_id in zip(kural.tarihler(sablon.tarih_saat), oturum_idleri):
+            yield sablon.prototip_kopyala(oturum_id, tarih)
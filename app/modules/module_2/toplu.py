@@ -0,0 +1,106 @@
+"""
+Antrenman modülü için toplu işlem yardımcıları.
+Toplu oturum oluşturmanın madde bazlı sonuç raporu ve aralık kümelerindeki
+tüm çakışan çiftleri tek taramada bulan sweep-line algoritması burada yer alır.
+"""
+import heapq
+from datetime import datetime
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Tuple
+
+# Toplu işlemde bir maddenin sonuç durumları
+EKLENDI = "eklendi"
+CAKISMA = "cakisma"
+MUKERRER_ID = "mukerrer_id"
+
+
+# Toplu işlemdeki tek bir maddenin sonucu
+class TopluIslemSonucu:
+    __slots__ = ("sira", "oturum_id", "durum", "sebep", "cakisan_idler")
+
+    # Sonucu başlatır; sira maddenin girdi listesindeki konumudur
+    def __init__(self, sira: int, oturum_id: int, durum: str, sebep: str = "",
+                 cakisan_idler: Optional[List[int]] = None):
+        self.sira = sira
+        self.oturum_id = oturum_id
+        self.durum = durum
+        self.sebep = sebep
+        self.cakisan_idler = cakisan_idler or []
+
+    # Madde başarıyla eklendiyse True döndürür
+    @property
+    def basarili(self) -> bool:
+        return self.durum == EKLENDI
+
+    # Sonucu sözlük olarak döndürür
+    def sozluge_cevir(self) -> Dict[str, Any]:
+        return {
+            "sira": self.sira,
+            "oturum_id": self.oturum_id,
+            "durum": self.durum,
+            "sebep": self.sebep,
+            "cakisan_idler": list(self.cakisan_idler),
+        }
+
+    def __repr__(self) -> str:
+        return f"TopluIslemSonucu(sira={self.sira}, oturum_id={self.oturum_id}, durum={self.durum!r})"
+
+
+# Toplu işlemin, girdi sırasıyla madde bazlı sonuçlarını tutan rapor
+class TopluIslemRaporu:
+
+    # Raporu sonuç listesiyle başlatır
+    def __init__(self, sonuclar: List[TopluIslemSonucu]):
+        self.sonuclar = sonuclar
+
+    # Eklenen maddelerin sonuçlarını döndürür
+    @property
+    def eklenenler(self) -> List[TopluIslemSonucu]:
+        return [sonuc for sonuc in self.sonuclar if sonuc.basarili]
+
+    # Eklenemeyen maddelerin sonuçlarını döndürür
+    @property
+    def reddedilenler(self) -> List[TopluIslemSonucu]:
+        return [sonuc for sonuc in self.sonuclar if not sonuc.basarili]
+
+    # Tüm maddeler eklendiyse True döndürür
+    @property
+    def tamami_basarili(self) -> bool:
+        return all(sonuc.basarili for sonuc in self.sonuclar)
+
+    # Durum bazında madde sayılarını döndürür
+    def ozet(self) -> Dict[str, int]:
+        sayilar = {EKLENDI: 0, CAKISMA: 0, MUKERRER_ID: 0}
+        for sonuc in self.sonuclar:
+            sayilar[sonuc.durum] = sayilar.get(sonuc.durum, 0) + 1
+        return sayilar
+
+    def __len__(self) -> int:
+        return len(self.sonuclar)
+
+    def __iter__(self):
+        return iter(self.sonuclar)
+
+
+# Aralıklar arasındaki tüm çakışan etiket çiftlerini tek sweep-line taramasıyla bulur
+def cakisan_ciftleri_bul(
+    araliklar: Iterable[Tuple[datetime, datetime, Hashable]]
+) -> List[Tuple[Hashable, Hashable]]:
+    """
+    Aralıklar başlangıca göre sıralanır; tarama sırasında aktif aralıklar
+    bitişe göre bir min-heap'te tutulur. Yeni aralık geldiğinde bitişi bu
+    başlangıçtan önce/eşit olanlar atılır, kalan her aktif aralık yeni
+    aralıkla çakışır. Maliyet O((n + k) log n), k çakışan çift sayısıdır.
+    Çiftler (önce başlayan, sonra başlayan) sırasındadır; [a, b) yarı açık
+    aralıklar kullanıldığından uç uca değen aralıklar çakışmaz.
+    """
+    sirali = sorted(araliklar, key=lambda aralik: aralik[0])
+    aktif: List[Tuple[datetime, int, Hashable]] = []
+    ciftler = []
+    for sira, (baslangic, bitis, etiket) in enumerate(sirali):
+        while aktif and aktif[0][0] <= baslangic:
+            heapq.heappop(aktif)
+        for _, _, aktif_etiket in aktif:
+            ciftler.append((aktif_etiket, etiket))
+        # sira, eşit bitişlerde etiketlerin karşılaştırılmasını önler
+        heapq.heappush(aktif, (bitis, sira, etiket))
+    return ciftler
@@ -0,0 +1,258 @@
+"""
+Sporcu bazında akut:kronik antrenman yükü oranı (ACWR) analizi (NumPy).
+Tamamlanan oturumların yükü (süre x oturum tipi ağırlığı) sporcu x gün
+yoğun matrisinde toplanır; 7 günlük akut ve 28 günlük kronik ortalamalar
+satır bazında kümülatif toplam farklarıyla tek geçişte hesaplanır.
+numpy isteğe bağlı bir bağımlılıktır; yalnızca bu analiz için gereklidir.
+"""
+from datetime import date, datetime
+from itertools import compress, repeat
+from operator import and_, attrgetter, is_not
+from typing import Dict, Iterable, List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from .base import AntrenmanOturumuTemel
+from .olaylar import AntrenmanOlayi, IPTAL_EDILDI, OlayDinleyici, PLANLANDI, TAMAMLANDI
+
+# Oturum tipi -> yük ağırlığı (dakika başına); ağırlığı tanımlanmamış tipler 1.0 sayılır
+VARSAYILAN_TIP_AGIRLIKLARI: Dict[str, float] = {
+    "kondisyon": 1.0,
+    "teknik": 0.8,
+    "taktik": 0.7,
+    "rehabilitasyon": 0.5,
+}
+
+
+# Sporcu x gün yük matrisi üzerinde akut/kronik yük ve oranlarını hesaplayan analiz
+class AkutKronikYukAnalizi:
+    """
+    Günlük yük: sporcunun o gün başlayan tamamlanmış oturumlarının
+    sure x tip ağırlığı toplamı. Akut yük son AKUT_GUN günün (o gün dahil),
+    kronik yük son KRONIK_GUN günün günlük ortalamasıdır; ilk veriden önceki
+    günler sıfır yük sayılır. Oran akut / kronik'tir, kronik yük sıfırsa NaN.
+
+    Yeni tamamlanan oturumlar oturum_ekle ile O(1) eklenir; yalnızca
+    değişen sporcuların kümülatif toplamları bir sonraki sorguda yeniden
+    hesaplanır. Gün ekseni veriye göre her iki yöne genişler.
+    """
+
+    AKUT_GUN = 7
+    KRONIK_GUN = 28
+
+    # Boş analiz oluşturur; tip_agirliklari varsayılan ağırlıkların üzerine yazılır
+    def __init__(self, tip_agirliklari: Optional[Dict[str, float]] = None):
+        if np is None:
+            raise ImportError("AkutKronikYukAnalizi için numpy gereklidir (pip install numpy)")
+        self._agirliklar = dict(VARSAYILAN_TIP_AGIRLIKLARI)
+        if tip_agirliklari:
+            self._agirliklar.update(tip_agirliklari)
+
+        self._satirlar: Dict[int, int] = {}          # athlete_id -> matris satırı
+        self._ilk_gun: Optional[int] = None          # gün ekseninin ilk günü (date ordinal)
+        self._gun_sayisi = 0                         # kullanılan gün sayısı (kapasite daha büyük olabilir)
+        self._gunluk = np.zeros((0, 0))              # sporcu x gün günlük yük (kapasiteli)
+        # Akut/kronik önbellekleri ve kümülatif toplamları yeniden hesaplanacak satırlar
+        self._akut = np.zeros((0, 0))
+        self._kronik = np.zeros((0, 0))
+        self._kirli: Dict[int, None] = {}
+
+    # Repository'deki tamamlanmış oturumlardan analiz oluşturur
+    @classmethod
+    def repositoryden_olustur(cls, repository,
+                              tip_agirliklari: Optional[Dict[str, float]] = None) -> 'AkutKronikYukAnalizi':
+        analiz = cls(tip_agirliklari)
+        analiz.oturumlari_ekle(repository.tumunu_listele())
+        return analiz
+
+    # Tamamlanmış, tarihli ve sporcusu olan oturumları toplu ekler; eklenen oturum sayısını döndürür
+    def oturumlari_ekle(self, oturumlar: Iterable[AntrenmanOturumuTemel]) -> int:
+        oturumlar = oturumlar if isinstance(oturumlar, list) else list(oturumlar)
+        # Sütunlar tek tek çıkarılır ve C düzeyindeki map/compress ile süzülür (satır başına tuple kurulmaz)
+        athlete_idleri = list(map(attrgetter("_athlete_id"), oturumlar))
+        tarihler = list(map(attrgetter("_tarih_saat"), oturumlar))
+        maske = list(map(and_,
+                         map("tamamlandi".__eq__, map(attrgetter("_durum"), oturumlar)),
+                         map(and_, map(is_not, tarihler, repeat(None)), map(is_not, athlete_idleri, repeat(None)))))
+        secilenler = list(compress(oturumlar, maske))
+        if not secilenler:
+            return 0
+        athlete_idleri = list(compress(athlete_idleri, maske))
+        tarihler = list(compress(tarihler, maske))
+        tipler = list(map(attrgetter("_oturum_tipi"), secilenler))
+        adet = len(secilenler)
+
+        gunler = np.fromiter(map(datetime.toordinal, tarihler), dtype=np.int64, count=adet)
+        self._gun_eksenini_genislet(int(gunler.min()), int(gunler.max()))
+        for athlete_id in dict.fromkeys(athlete_idleri):
+            self._satir_al(athlete_id)
+        satirlar = np.fromiter(map(self._satirlar.__getitem__, athlete_idleri), dtype=np.int64, count=adet)
+        tip_agirliklari = {tip: self._agirliklar.get(tip, 1.0) for tip in set(tipler)}
+        yukler = np.fromiter(map(attrgetter("_sure"), secilenler), dtype=np.float64, count=adet) * np.fromiter(
+            map(tip_agirliklari.__getitem__, tipler), dtype=np.float64, count=adet)
+
+        # Aynı hücreye düşen yükler bincount ile düz indeks üzerinde toplanır
+        satir_kapasitesi, gun_kapasitesi = self._gunluk.shape
+        duz = satirlar * gun_kapasitesi + (gunler - self._ilk_gun)
+        self._gunluk += np.bincount(duz, weights=yukler, minlength=satir_kapasitesi * gun_kapasitesi).reshape(
+            satir_kapasitesi, gun_kapasitesi)
+        self._kirli.update(dict.fromkeys(np.unique(satirlar).tolist()))
+        return adet
+
+    # Tek bir oturumu ekler (tamamlanmamış, tarihsiz veya sporcusuz ise False döndürür)
+    def oturum_ekle(self, oturum: AntrenmanOturumuTemel) -> bool:
+        return self._tek_oturum_yansit(oturum, 1.0)
+
+    # Daha önce eklenmiş bir oturumun yükünü geri alır (ör. durum düzeltmesi)
+    def oturum_cikar(self, oturum: AntrenmanOturumuTemel) -> bool:
+        return self._tek_oturum_yansit(oturum, -1.0)
+
+    # Analizdeki sporcu id'lerini matris satır sırasıyla döndürür
+    def sporcular(self) -> List[int]:
+        return list(self._satirlar)
+
+    # Gün eksenini (datetime64[D]) döndürür
+    def gunler(self) -> 'np.ndarray':
+        if self._ilk_gun is None:
+            return np.array([], dtype="datetime64[D]")
+        ilk = np.datetime64(date.fromordinal(self._ilk_gun), "D")
+        return ilk + np.arange(self._gun_sayisi)
+
+    # Sporcunun gün bazında yük, akut, kronik ve oran serilerini döndürür (sporcu yoksa None)
+    def sporcu_serisi(self, athlete_id: int) -> Optional[Dict[str, 'np.ndarray']]:
+        satir = self._satirlar.get(athlete_id)
+        if satir is None:
+            return None
+        self._yeniden_hesapla()
+        akut = self._akut[satir, :self._gun_sayisi]
+        kronik = self._kronik[satir, :self._gun_sayisi]
+        return {
+            "gun": self.gunler(),
+            "yuk": self._gunluk[satir, :self._gun_sayisi].copy(),
+            "akut": akut.copy(),
+            "kronik": kronik.copy(),
+            "oran": self._oran(akut, kronik),
+        }
+
+    # Verilen gün için tüm sporcuların (akut, kronik, oran) değerlerini döndürür (oran tanımsızsa None)
+    def gun_degerleri(self, gun: date) -> Dict[int, Tuple[float, float, Optional[float]]]:
+        if self._ilk_gun is None:
+            return {}
+        sutun = gun.toordinal() - self._ilk_gun
+        if not 0 <= sutun < self._gun_sayisi:
+            return {}
+        self._yeniden_hesapla()
+        akut = self._akut[:len(self._satirlar), sutun].tolist()
+        kronik = self._kronik[:len(self._satirlar), sutun].tolist()
+        return {
+            athlete_id: (akut[satir], kronik[satir], akut[satir] / kronik[satir] if kronik[satir] else None)
+            for athlete_id, satir in self._satirlar.items()
+        }
+
+    # Tüm sporcular için (akut, kronik, oran) matrislerini (sporcu x gün) döndürür; satırlar sporcular() sırasındadır
+    def matrisler(self) -> Tuple['np.ndarray', 'np.ndarray', 'np.ndarray']:
+        self._yeniden_hesapla()
+        akut = self._akut[:len(self._satirlar), :self._gun_sayisi].copy()
+        kronik = self._kronik[:len(self._satirlar), :self._gun_sayisi].copy()
+        return akut, kronik, self._oran(akut, kronik)
+
+    # Tek oturumun yükünü işaretiyle matrise yansıtır
+    def _tek_oturum_yansit(self, oturum: AntrenmanOturumuTemel, isaret: float) -> bool:
+        athlete_id = getattr(oturum, "athlete_id", None)
+        if oturum.durum != "tamamlandi" or oturum.tarih_saat is None or athlete_id is None:
+            return False
+        gun = oturum.tarih_saat.toordinal()
+        self._gun_eksenini_genislet(gun, gun)
+        satir = self._satir_al(athlete_id)
+        self._gunluk[satir, gun - self._ilk_gun] += isaret * oturum.sure * self._agirliklar.get(oturum.oturum_tipi, 1.0)
+        self._kirli[satir] = None
+        return True
+
+    # Sporcunun matris satırını döndürür; yeni sporcu için satır açar (kapasite ikiye katlanarak büyür)
+    def _satir_al(self, athlete_id: int) -> int:
+        satir = self._satirlar.get(athlete_id)
+        if satir is None:
+            satir = self._satirlar[athlete_id] = len(self._satirlar)
+            if satir >= self._gunluk.shape[0]:
+                self._kapasite_ayarla(max(2 * satir, 16), self._gunluk.shape[1], 0)
+        return satir
+
+    # Gün eksenini [ilk_gun, son_gun] aralığını kapsayacak şekilde genişletir
+    def _gun_eksenini_genislet(self, ilk_gun: int, son_gun: int) -> None:
+        if self._ilk_gun is None:
+            self._ilk_gun = ilk_gun
+        sola = max(0, self._ilk_gun - ilk_gun)
+        gun_sayisi = max(self._gun_sayisi + sola, son_gun - self._ilk_gun + sola + 1)
+        if sola or gun_sayisi > self._gunluk.shape[1]:
+            # Sağa doğru büyüme (yeni günler) sık olduğundan kapasite ikiye katlanır
+            kapasite = gun_sayisi if sola else max(gun_sayisi, 2 * self._gunluk.shape[1])
+            self._kapasite_ayarla(self._gunluk.shape[0], kapasite, sola)
+            self._ilk_gun -= sola
+        self._gun_sayisi = gun_sayisi
+
+    # Matrisleri yeni kapasiteye taşır; sola kadar yeni gün başa eklenir
+    def _kapasite_ayarla(self, satir_kapasitesi: int, gun_kapasitesi: int, sola: int) -> None:
+        eski = self._gunluk
+        self._gunluk = np.zeros((satir_kapasitesi, gun_kapasitesi))
+        self._gunluk[:eski.shape[0], sola:sola + eski.shape[1]] = eski[:, :gun_kapasitesi - sola]
+        self._akut = np.zeros_like(self._gunluk)
+        self._kronik = np.zeros_like(self._gunluk)
+        # Önbellek matrisleri yeniden kurulduğu için tüm satırlar yeniden hesaplanır
+        self._kirli.update(dict.fromkeys(self._satirlar.values()))
+
+    # Değişen satırların akut/kronik ortalamalarını kümülatif toplam farklarıyla yeniden hesaplar
+    def _yeniden_hesapla(self) -> None:
+        if not self._kirli:
+            return
+        satirlar = np.fromiter(self._kirli, dtype=np.int64, count=len(self._kirli))
+        self._kirli = {}
+        gun_sayisi = self._gun_sayisi
+        toplam = np.zeros((len(satirlar), gun_sayisi + 1))
+        np.cumsum(self._gunluk[satirlar, :gun_sayisi], axis=1, out=toplam[:, 1:])
+        sonlar = np.arange(1, gun_sayisi + 1)
+        for hedef, pencere in ((self._akut, self.AKUT_GUN), (self._kronik, self.KRONIK_GUN)):
+            baslar = np.maximum(sonlar - pencere, 0)
+            hedef[satirlar, :gun_sayisi] = (toplam[:, sonlar] - toplam[:, baslar]) / pencere
+
+    # Akut/kronik oranını hesaplar; kronik yük sıfırsa NaN
+    @staticmethod
+    def _oran(akut: 'np.ndarray', kronik: 'np.ndarray') -> 'np.ndarray':
+        oran = np.full(akut.shape, np.nan)
+        np.divide(akut, kronik, out=oran, where=kronik > 0)
+        return oran
+
+
+# Manager'ın "tamamlandi" olaylarında oturumu analize ekleyen dinleyici
+class AkutKronikYukDinleyici(OlayDinleyici):
+    """
+    Sayılan her oturumun analize eklendiği andaki kopyası tutulur: aynı oturum
+    tekrar tamamlandı işaretlenirse yükü ikinci kez eklenmez; iptal edilirse
+    yükü geri alınır, yeniden planlanırsa eski günden çıkarılıp yeni güne
+    eklenir.
+    """
+
+    # Dinleyiciyi analiz ve oturumların okunacağı repository ile başlatır
+    def __init__(self, analiz: AkutKronikYukAnalizi, repository):
+        self.analiz = analiz
+        self._repo = repository
+        self._sayilanlar: Dict[int, AntrenmanOturumuTemel] = {}   # oturum_id -> analize eklendiği haliyle kopya
+
+    # Tamamlama, iptal ve yeniden planlama olaylarını analize yansıtır
+    def olay_al(self, olay: AntrenmanOlayi) -> None:
+        if olay.tur == TAMAMLANDI:
+            if olay.oturum_id not in self._sayilanlar:
+                self._ekle(olay.oturum_id)
+        elif olay.tur in (IPTAL_EDILDI, PLANLANDI):
+            sayilan = self._sayilanlar.pop(olay.oturum_id, None)
+            if sayilan is not None:
+                self.analiz.oturum_cikar(sayilan)
+                self._ekle(olay.oturum_id)
+
+    # Oturumu repository'den okuyup analize ekler ve eklendiği haliyle kaydeder
+    def _ekle(self, oturum_id: int) -> None:
+        oturum = self._repo.id_ile_bul(oturum_id)
+        if oturum is not None and self.analiz.oturum_ekle(oturum):
+            self._sayilanlar[oturum_id] = oturum.prototip_kopyala(oturum_id, oturum.tarih_saat)
@@ -23,6 +23,14 @@ from .repository import (
     MacRepository
 )
 
+# JSONL/CSV dışa aktarım
+from .disa_aktarim import (
+    mac_sozluge_cevir,
+    maclari_disa_aktar,
+    ligleri_disa_aktar,
+    lig_maclarini_disa_aktar
+)
+
 __all__ = [
     # Base
     'MacBase',
@@ -40,4 +48,9 @@ __all__ = [
     'PuanTablosu',
     'LigRepository',
     'MacRepository',
+    # Dışa aktarım
+    'mac_sozluge_cevir',
+    'maclari_disa_aktar',
+    'ligleri_disa_aktar',
+    'lig_maclarini_disa_aktar',
 ]
\ No newline at end of file
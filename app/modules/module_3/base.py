@@ -111,6 +111,8 @@ class PuanKurallari:
 
 # Maç ve Turnuva yönetimi için soyut temel sınıf - tüm maç tiplerinin ortak özelliklerini tanımlar
 class MacBase(ABC):
+    # Nesne başına __dict__ yerine sabit alan düzeni (bellek tasarrufu)
+    __slots__ = ("_mac_id", "_ev_sahibi", "_deplasman", "_tarih_saat", "_gecerli_durumlar", "_durum", "_skor_ev", "_skor_dep", "_skor_girildi_mi", "_konum", "_hakem", "_mac_tipi")
 
     # Maç objesi oluşturur - tüm maç tipleri için ortak başlatma
     def __init__(self, mac_id, ev_sahibi, deplasman, tarih_saat, mac_tipi=None, gecerli_durumlar=None, konum=None, hakem=None):
@@ -201,11 +201,12 @@ def main():
             try:
                 print("\n--- Maç Sonuçları Gir ---")
                 
-                # Fikstür yoksa oluştur
-                try:
-                    fikstur = mevcut_lig.fikstur_olustur()
-                except:
-                    pass
+                # Fikstür yoksa oluştur (varsa girilmiş skorlar korunur)
+                if not mevcut_lig.fikstur_var_mi():
+                    try:
+                        fikstur = mevcut_lig.fikstur_olustur()
+                    except:
+                        pass
                 
                 hafta_no = int(input("Hafta numarası: "))
                 maclar = mevcut_lig.haftalik_maclar_getir(hafta_no)
@@ -413,7 +414,7 @@ def main():
                 print("\nÖnce bir lig oluşturmalısınız!")
                 continue
             
-            if not mevcut_lig._fikstur:
+            if not mevcut_lig.fikstur_var_mi():
                 print("\nÖnce fikstür oluşturmalısınız!")
                 continue
             
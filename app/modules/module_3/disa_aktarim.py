@@ -0,0 +1,145 @@
+import json
+from datetime import datetime
+from enum import Enum
+from operator import attrgetter
+from typing import Dict, Tuple
+
+from ...ortak.disa_aktarim import VARSAYILAN_PARCA_BOYUTU, kayitlari_yaz
+from .base import MacBase
+from .implementations import LigMaci, HazirlikMaci, ElemeMaci
+
+# ============================================================================
+# DIŞA AKTARIM (JSONL / CSV)
+# ============================================================================
+
+# Tüm maç tiplerinde ortak alanlar: (satır anahtarı, slot adı)
+_ORTAK_ALANLAR = (
+    ("mac_id", "_mac_id"), ("ev_sahibi", "_ev_sahibi"), ("deplasman", "_deplasman"),
+    ("tarih_saat", "_tarih_saat"), ("durum", "_durum"), ("skor_ev", "_skor_ev"),
+    ("skor_deplasman", "_skor_dep"), ("skor_girildi_mi", "_skor_girildi_mi"),
+    ("konum", "_konum"), ("hakem", "_hakem"), ("mac_tipi", "_mac_tipi"),
+)
+
+# Maç sınıfı -> (mac_turu değeri, sınıfa özel alanlar)
+_MAC_TURLERI = {
+    LigMaci: ("lig", (("lig_adi", "_lig_adi"), ("hafta_no", "_hafta_no"), ("spor_tipi", "_spor_tipi"), ("sezon", "_sezon"))),
+    HazirlikMaci: ("hazirlik", (("organizasyon_adi", "_organizasyon_adi"), ("min_bilet_fiyati", "_min_bilet_fiyati"),
+                                ("bilet_fiyati", "_bilet_fiyati"), ("seyirci_sayisi", "_seyirci_sayisi"),
+                                ("yardim_maci_mi", "_yardim_maci_mi"))),
+    ElemeMaci: ("eleme", (("tur_adi", "_tur_adi"),)),
+}
+
+# Maç CSV başlığı: maç türü, ortak alanlar ve tüm türlerin alanları (bir türde olmayan alanlar boş kalır)
+MAC_SUTUNLARI = ("mac_turu",) + tuple(anahtar for anahtar, _ in _ORTAK_ALANLAR) + tuple(
+    anahtar for _, alanlar in _MAC_TURLERI.values() for anahtar, _ in alanlar
+)
+
+# Lig CSV başlığı (lig_bilgisi_getir anahtarları; takım listesi CSV'de JSON metni olarak yazılır)
+LIG_SUTUNLARI = ("lig_adi", "spor_tipi", "sezon_baslangic", "takim_sayisi", "takimlar")
+
+# Maç sınıfı -> (mac_turu, satır anahtarları, slot okuyucu); alt sınıflar ilk bilinen atalarıyla eşlenir
+_SATIR_KALIPLARI: Dict[type, Tuple[str, Tuple[str, ...], attrgetter]] = {}
+
+
+# Maçı düz (JSON/CSV'ye yazılabilir) bir sözlüğe çeviren fonksiyon
+def mac_sozluge_cevir(mac: MacBase) -> Dict:
+    """
+    Maçı tarih ISO metni, enum'ları değerleri olan düz bir sözlüğe çevirir.
+
+    Args:
+        mac: LigMaci, HazirlikMaci veya ElemeMaci (ya da alt sınıfları)
+
+    Returns:
+        Dict: mac_turu, ortak alanlar ve maç tipine özel alanlar
+    """
+    mac_turu, anahtarlar, okuyucu = _satir_kalibi(type(mac))
+    satir = {"mac_turu": mac_turu}
+    for anahtar, deger in zip(anahtarlar, okuyucu(mac)):
+        if isinstance(deger, datetime):
+            deger = deger.isoformat()
+        elif isinstance(deger, Enum):
+            deger = deger.value
+        satir[anahtar] = deger
+    return satir
+
+
+# Maç repository'sindeki tüm maçları dosyaya aktaran fonksiyon
+def maclari_disa_aktar(mac_repository, yol: str, bicim: str = "jsonl", sikistir: bool = False,
+                       parca_boyutu: int = VARSAYILAN_PARCA_BOYUTU) -> int:
+    """
+    Maçları kayıt sırasıyla parça parça JSONL veya CSV dosyasına yazar.
+
+    Args:
+        mac_repository: MacRepository objesi
+        yol: Hedef dosya yolu
+        bicim: "jsonl" veya "csv" (varsayılan: "jsonl")
+        sikistir: True ise dosya gzip ile sıkıştırılır
+        parca_boyutu: Bir parçada kodlanıp yazılan en fazla maç sayısı
+
+    Returns:
+        int: Yazılan maç sayısı
+    """
+    satirlar = map(mac_sozluge_cevir, mac_repository.maclari_gez())
+    return kayitlari_yaz(satirlar, yol, bicim, MAC_SUTUNLARI, sikistir, parca_boyutu)
+
+
+# Lig repository'sindeki ligleri dosyaya aktaran fonksiyon
+def ligleri_disa_aktar(lig_repository, yol: str, bicim: str = "jsonl", sikistir: bool = False,
+                       parca_boyutu: int = VARSAYILAN_PARCA_BOYUTU) -> int:
+    """
+    Ligleri (lig_bilgisi_getir satırları) parça parça JSONL veya CSV dosyasına yazar.
+
+    Args:
+        lig_repository: LigRepository objesi
+        yol: Hedef dosya yolu
+        bicim: "jsonl" veya "csv" (varsayılan: "jsonl")
+        sikistir: True ise dosya gzip ile sıkıştırılır
+        parca_boyutu: Bir parçada kodlanıp yazılan en fazla lig sayısı
+
+    Returns:
+        int: Yazılan lig sayısı
+    """
+    satirlar = (_lig_satiri(lig, bicim == "csv") for lig in lig_repository.ligleri_gez())
+    return kayitlari_yaz(satirlar, yol, bicim, LIG_SUTUNLARI, sikistir, parca_boyutu)
+
+
+# Lig repository'sindeki tüm liglerin fikstür maçlarını dosyaya aktaran fonksiyon
+def lig_maclarini_disa_aktar(lig_repository, yol: str, bicim: str = "jsonl", sikistir: bool = False,
+                             parca_boyutu: int = VARSAYILAN_PARCA_BOYUTU) -> int:
+    """
+    Her ligin fikstür maçlarını lig ve hafta sırasıyla dosyaya yazar (fikstürü olmayan ligler atlanır).
+
+    Args:
+        lig_repository: LigRepository objesi
+        yol: Hedef dosya yolu
+        bicim: "jsonl" veya "csv" (varsayılan: "jsonl")
+        sikistir: True ise dosya gzip ile sıkıştırılır
+        parca_boyutu: Bir parçada kodlanıp yazılan en fazla maç sayısı
+
+    Returns:
+        int: Yazılan maç sayısı
+    """
+    satirlar = (mac_sozluge_cevir(mac) for lig in lig_repository.ligleri_gez() for mac in lig.maclari_gez())
+    return kayitlari_yaz(satirlar, yol, bicim, MAC_SUTUNLARI, sikistir, parca_boyutu)
+
+
+# Yardımcı fonksiyon - maç sınıfının satır kalıbını (önbellekli) döndürür
+def _satir_kalibi(sinif: type) -> Tuple[str, Tuple[str, ...], attrgetter]:
+    kalip = _SATIR_KALIPLARI.get(sinif)
+    if kalip is None:
+        ata = next((ata for ata in sinif.__mro__ if ata in _MAC_TURLERI), None)
+        if ata is None:
+            raise TypeError(f"Dışa aktarılamayan maç tipi: {sinif.__name__}")
+        mac_turu, ozel_alanlar = _MAC_TURLERI[ata]
+        alanlar = _ORTAK_ALANLAR + ozel_alanlar
+        kalip = (mac_turu, tuple(anahtar for anahtar, _ in alanlar), attrgetter(*(slot for _, slot in alanlar)))
+        _SATIR_KALIPLARI[sinif] = kalip
+    return kalip
+
+
+# Yardımcı fonksiyon - ligi satır sözlüğüne çevirir (CSV için takım listesi JSON metni olarak yazılır)
+def _lig_satiri(lig, takimlar_json: bool) -> Dict:
+    satir = lig.lig_bilgisi_getir()
+    if takimlar_json:
+        satir["takimlar"] = json.dumps(satir["takimlar"], ensure_ascii=False)
+    return satir
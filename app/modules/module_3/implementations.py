@@ -3,6 +3,8 @@ from .base import MacBase, TurnuvaHatasi, SporTipi, PuanKurallari, MacTipi
 
 # Hazırlık maçı sınıfı - hazırlık ve dostluk maçları için özel özellikler
 class HazirlikMaci(MacBase):
+    # Alt sınıfa özel alanlar (temel sınıfın __slots__ düzenine eklenir)
+    __slots__ = ("_organizasyon_adi", "_min_bilet_fiyati", "_bilet_fiyati", "_seyirci_sayisi", "_yardim_maci_mi")
 
     # Hazırlık maçı objesi oluşturur - organizasyon ve bilet bilgileri ile
     def __init__(self, mac_id, ev_sahibi, deplasman, tarih_saat, organizasyon_adi, min_bilet_fiyati=50.0, bilet_fiyati=None):
@@ -132,6 +134,8 @@ class HazirlikMaci(MacBase):
 
 # Lig maçı sınıfı - lig organizasyonları için maç yönetimi
 class LigMaci(MacBase):
+    # Alt sınıfa özel alanlar (temel sınıfın __slots__ düzenine eklenir)
+    __slots__ = ("_lig_adi", "_hafta_no", "_spor_tipi", "_sezon")
 
     # Lig maçı objesi oluşturur - lig, hafta ve spor tipi bilgileri ile
     def __init__(self, mac_id, ev_sahibi, deplasman, tarih_saat, lig_adi, hafta_no, spor_tipi: SporTipi = SporTipi.FUTBOL):
@@ -141,7 +145,7 @@ class LigMaci(MacBase):
         self.lig_adi = lig_adi
         self.hafta_no = hafta_no
         self._spor_tipi = spor_tipi
-        self._sezon = f"{tarih_saat.year}-{tarih_saat.year+1} Sezonu"
+        self._sezon = self._sezon_adi(tarih_saat.year)
 
     
     @property
@@ -253,6 +257,101 @@ class LigMaci(MacBase):
         """
         return cls(mac_id, ev_sahibi, deplasman, tarih_saat, lig_adi, hafta_no, spor_tipi)
 
+    # Class metot - satırlardan setter'ları atlayarak toplu lig maçı oluşturur
+    @classmethod
+    def satirlardan_olustur(cls, satirlar, dogrula=True):
+        """
+        Kurucu parametre adlarıyla verilen satırlardan toplu lig maçı oluşturur.
+
+        dogrula=True iken her sütun tek geçişte kontrol edilir; bir sütun geçemezse
+        satırlar normal kurucuyla oluşturulur, böylece hatalı ilk satır setter'ın
+        fırlattığı hatayla bildirilir. dogrula=False güvenilir kaynaklar içindir.
+
+        Args:
+            satirlar: mac_id, ev_sahibi, deplasman, tarih_saat, lig_adi, hafta_no
+                ve isteğe bağlı spor_tipi anahtarlı sözlükler
+            dogrula: Sütun doğrulaması yapılsın mı (varsayılan: True)
+
+        Returns:
+            list: Satır sırasıyla oluşturulmuş lig maçları
+        """
+        satirlar = satirlar if isinstance(satirlar, list) else list(satirlar)
+        try:
+            mac_idleri = [satir["mac_id"] for satir in satirlar]
+            ev_sahipleri = [satir["ev_sahibi"] for satir in satirlar]
+            deplasmanlar = [satir["deplasman"] for satir in satirlar]
+            tarihler = [satir["tarih_saat"] for satir in satirlar]
+            lig_adlari = [satir["lig_adi"] for satir in satirlar]
+            hafta_nolari = [satir["hafta_no"] for satir in satirlar]
+        except KeyError:
+            return [cls(**satir) for satir in satirlar]
+        spor_tipleri = [satir.get("spor_tipi", SporTipi.FUTBOL) for satir in satirlar]
+
+        if dogrula:
+            try:
+                gecerli = cls._sutunlar_gecerli_mi(mac_idleri, ev_sahipleri, deplasmanlar, tarihler, lig_adlari, hafta_nolari)
+            except TypeError:
+                gecerli = False
+            if not gecerli:
+                return [cls(**satir) for satir in satirlar]
+
+        # Satırlardan gelmeyen alanlar gerçek kurucuyla bir kez kurulan örnekten kopyalanır
+        ornek = cls._ornek_mac()
+        gecerli_durumlar = ornek._gecerli_durumlar
+        durum, konum, hakem, mac_tipi = ornek._durum, ornek._konum, ornek._hakem, ornek._mac_tipi
+        skor_ev, skor_dep, skor_girildi_mi = ornek._skor_ev, ornek._skor_dep, ornek._skor_girildi_mi
+        sezonlar = {}
+        yeni = object.__new__
+        maclar = []
+        for mac_id, ev_sahibi, deplasman, tarih_saat, lig_adi, hafta_no, spor_tipi in zip(
+            mac_idleri, ev_sahipleri, deplasmanlar, tarihler, lig_adlari, hafta_nolari, spor_tipleri
+        ):
+            mac = yeni(cls)
+            mac._mac_id = mac_id
+            mac._ev_sahibi = ev_sahibi
+            mac._deplasman = deplasman
+            mac._tarih_saat = tarih_saat
+            mac._gecerli_durumlar = list(gecerli_durumlar)
+            mac._durum = durum
+            mac._skor_ev = skor_ev
+            mac._skor_dep = skor_dep
+            mac._skor_girildi_mi = skor_girildi_mi
+            mac._konum = konum
+            mac._hakem = hakem
+            mac._mac_tipi = mac_tipi
+            mac._lig_adi = lig_adi
+            mac._hafta_no = hafta_no
+            mac._spor_tipi = spor_tipi
+            sezon = sezonlar.get(tarih_saat.year)
+            if sezon is None:
+                sezon = sezonlar[tarih_saat.year] = cls._sezon_adi(tarih_saat.year)
+            mac._sezon = sezon
+            maclar.append(mac)
+        return maclar
+
+    # Yardımcı metot - kurucu varsayılanlarının okunacağı örnek maçı kurucuyla oluşturur
+    @classmethod
+    def _ornek_mac(cls):
+        return cls(1, "Ev Sahibi", "Deplasman", datetime(2000, 1, 1), "Örnek Lig", 1)
+
+    # Yardımcı metot - başlangıç yılından sezon adını üretir
+    @staticmethod
+    def _sezon_adi(yil):
+        return f"{yil}-{yil + 1} Sezonu"
+
+    # Yardımcı metot - sütunların kurucu kurallarına uyup uymadığını tek geçişte kontrol eder
+    @classmethod
+    def _sutunlar_gecerli_mi(cls, mac_idleri, ev_sahipleri, deplasmanlar, tarihler, lig_adlari, hafta_nolari):
+        for kolon in (mac_idleri, hafta_nolari):
+            if kolon and (set(map(type, kolon)) != {int} or min(kolon) <= 0):
+                return False
+        if not set(map(type, tarihler)) <= {datetime}:
+            return False
+        if not all(cls.lig_adi_gecerli_mi(lig_adi) for lig_adi in set(lig_adlari)):
+            return False
+        # Farklı takım çiftleri azdır; her çift bir kez kontrol edilir
+        return all(isinstance(ev, str) and len(ev) >= 3 and ev != dep for ev, dep in set(zip(ev_sahipleri, deplasmanlar)))
+
 
 
 # ELEME MAÇI SINIFI 
@@ -261,6 +360,9 @@ import random
 
 # Eleme maçı sınıfı - turnuva eleme maçları için özel özellikler
 class ElemeMaci(MacBase):
+    # Alt sınıfa özel alanlar (temel sınıfın __slots__ düzenine eklenir)
+    __slots__ = ("_tur_adi",)
+
     # Eleme maçı objesi oluşturur - tur bilgisi ile
     def __init__(self, mac_id, ev_sahibi, deplasman, tarih_saat, tur_adi):
         super().__init__(mac_id, ev_sahibi, deplasman, tarih_saat, MacTipi.TOURNAMENT)
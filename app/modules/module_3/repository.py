@@ -1,5 +1,5 @@
 from datetime import datetime, timedelta, date
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, Iterator, Optional, Tuple
 from .base import TurnuvaHatasi, SporTipi, PuanKurallari, MacBase
 from .implementations import LigMaci, HazirlikMaci, ElemeMaci
 
@@ -33,7 +33,6 @@ class LigYonetimi:
         self._sezon_baslangic = sezon_baslangic
         self._takimlar = []
         self._fikstur = None
-        self._maclar = []  # LigMaci objelerini saklar
     
     @property
     def lig_adi(self):
@@ -77,7 +76,6 @@ class LigYonetimi:
         # Fikstür varsa sıfırla
         if self._fikstur:
             self._fikstur = None
-            self._maclar = []
     
     # Takım listesini döndüren metot - kopya döndürür
     def takim_listesi_getir(self) -> List[str]:
@@ -109,6 +107,16 @@ class LigYonetimi:
         self._fikstur = FiksturOlusturucu(self._takimlar, self._sezon_baslangic, self._spor_tipi)
         return self._fikstur
     
+    # Fikstür durumunu döndüren metot - takım çıkarılınca fikstür sıfırlanır
+    def fikstur_var_mi(self) -> bool:
+        """
+        Ligin güncel bir fikstürü olup olmadığını döndürür.
+        
+        Returns:
+            bool: True ise fikstür oluşturulmuş
+        """
+        return self._fikstur is not None
+    
     # Belirli haftanın maçlarını getiren metot
     def haftalik_maclar_getir(self, hafta_no: int) -> List[LigMaci]:
         """
@@ -125,6 +133,22 @@ class LigYonetimi:
         
         return self._fikstur.hafta_maclarini_getir(hafta_no, self._lig_adi)
     
+    # Maç ID'si ile fikstürdeki maçı getiren metot
+    def mac_getir(self, mac_id: int) -> Optional[LigMaci]:
+        """
+        Fikstürdeki maçı ID'si ile getirir.
+        
+        Args:
+            mac_id: Maç ID'si
+        
+        Returns:
+            Optional[LigMaci]: Bulunan maç veya None
+        """
+        if not self._fikstur:
+            raise TurnuvaHatasi("Önce fikstür oluşturulmalıdır.")
+        
+        return self._fikstur.mac_getir(mac_id, self._lig_adi)
+    
     # Takımın tüm maç geçmişini getiren metot - tarih sıralı
     def takim_mac_gecmisi_getir(self, takim_adi: str) -> List[LigMaci]:
         """
@@ -142,22 +166,22 @@ class LigYonetimi:
         if takim_adi not in self._takimlar:
             raise TurnuvaHatasi(f"'{takim_adi}' takımı ligde bulunamadı.")
         
-        takim_maclari = []
-        toplam_hafta = self._fikstur.toplam_hafta_sayisi()
-        
-        # Tüm haftalardaki maçları kontrol et
-        for hafta_no in range(1, toplam_hafta + 1):
-            hafta_maclari = self._fikstur.hafta_maclarini_getir(hafta_no, self._lig_adi)
-            
-            # Takımın oynadığı maçları bul
-            for mac in hafta_maclari:
-                if mac.ev_sahibi == takim_adi or mac.deplasman == takim_adi:
-                    takim_maclari.append(mac)
+        # Fikstürün takım indeksi tarih sıralıdır; haftalar taranmaz
+        return self._fikstur.takim_maclarini_getir(takim_adi, self._lig_adi)
+    
+    # Ligin tüm maçlarını hafta hafta üreten metot - fikstür yoksa maç üretmez
+    def maclari_gez(self) -> Iterator[LigMaci]:
+        """
+        Ligin maçlarını hafta sırasıyla tembel (lazy) üretir.
         
-        # Tarih sırasına göre sırala
-        takim_maclari.sort(key=lambda m: m.tarih_saat)
+        Returns:
+            Iterator[LigMaci]: Henüz oluşturulmamış haftalar sırası gelince oluşturulup fikstürde saklanır
+        """
+        if not self._fikstur:
+            return
         
-        return takim_maclari
+        for hafta_no in range(1, self._fikstur.toplam_hafta_sayisi() + 1):
+            yield from self._fikstur.hafta_maclarini_getir(hafta_no, self._lig_adi)
     
     @staticmethod
     def takim_adi_gecerli_mi(takim_adi: str):
@@ -214,30 +238,52 @@ class FiksturOlusturucu:
         self._spor_tipi = spor_tipi
         self._mac_gunleri_offset = mac_gunleri_offset if mac_gunleri_offset is not None else [-2, -1, 0]
         self._mac_saatleri = mac_saatleri if mac_saatleri is not None else [13, 15, 17, 19, 21]
+        # Haftalar kapalı formla yalnızca istendiğinde hesaplanıp saklanır
         self._haftalar = {}  # hafta_no -> [(ev_sahibi, deplasman, tarih_saat), ...]
+        # Haftaların LigMaci objeleri ilk erişimde bir kez oluşturulup saklanır (skorlar çağrılar arasında korunur)
+        self._hafta_maclari = {}  # hafta_no -> [LigMaci, ...]
+        self._mac_haritasi = {}  # mac_id -> LigMaci
+        self._lig_adi = None  # Oluşturulan maçların ait olduğu lig
+        self._takim_indeksi = {}  # takim_adi -> [(hafta_no, haftadaki sıra), ...] tarih sırasıyla (ilk sorguda)
+        self._takim_maclari = {}  # takim_adi -> [LigMaci, ...] (ilk sorguda indeksten kurulur)
         
         self._fikstur_olustur()
     
-    # Private metot - double round-robin algoritması ile fikstür oluşturur
+    # Private metot - double round-robin fikstürünün parametrelerini hazırlar
     def _fikstur_olustur(self):
-        """Double round-robin algoritması ile fikstür oluşturur (Süper Lig mantığı)."""
+        """
+        Double round-robin fikstürünü hazırlar (Süper Lig mantığı).
+        
+        Çember yönteminde ilk takım sabit kalır, diğerleri her hafta bir adım
+        döner; bu yüzden ilk yarının r. haftasında (r = 0'dan) j. yuvadaki takım
+        takimlar[1 + (j - 1 - r) mod (n - 1)] olur ve yuva i, n - 1 - i ile
+        eşleşir. İkinci yarı, ilk yarının ev sahibi/deplasman rolleri değişmiş
+        halidir. Hafta listeleri üretilmez; herhangi bir hafta O(takım sayısı)
+        maliyetle doğrudan hesaplanır.
+        """
         takim_sayisi = len(self._takim_listesi)
         
         if takim_sayisi < 2:
+            self._takimlar = []
+            self._ilk_yari_hafta_sayisi = 0
+            self._takim_yuvalari = {}
+            self._bye_yuvalari = []
             return
         
         # Tek sayıda takım varsa, "BYE" ekle (maç yapmayan takım)
         if takim_sayisi % 2 == 1:
-            takimler = self._takim_listesi + ["BYE"]
+            self._takimlar = self._takim_listesi + ["BYE"]
         else:
-            takimler = self._takim_listesi.copy()
-        
-        # Her hafta kaç maç olacak (Süper Lig mantığı)
-        mac_sayisi_her_hafta = len(takimler) // 2
+            self._takimlar = self._takim_listesi.copy()
         
         # İlk yarı hafta sayısı (her takım bir kez ev sahibi)
-        ilk_yarı_hafta_sayisi = len(takimler) - 1
-        hafta_sayisi = 2 * ilk_yarı_hafta_sayisi
+        self._ilk_yari_hafta_sayisi = len(self._takimlar) - 1
+        
+        # Takım adı -> çember yuvaları ve BYE yuvaları (BYE ile eşleşen maç oynanmaz)
+        self._takim_yuvalari = {}
+        for yuva, takim in enumerate(self._takimlar):
+            self._takim_yuvalari.setdefault(takim, []).append(yuva)
+        self._bye_yuvalari = self._takim_yuvalari.get("BYE", [])
         
         # Sezon başlangıç tarihini en yakın Pazar gününe çevir (offset hesaplaması için)
         # weekday() 0=Pazartesi, 6=Pazar döner
@@ -245,47 +291,122 @@ class FiksturOlusturucu:
         # Eğer bugün Pazar değilse, bir sonraki Pazar'a git
         bugun_gun = self._baslangic_tarihi.weekday()  # 0=Pazartesi, 6=Pazar
         if bugun_gun == 6:  # Bugün Pazar
-            hafta_baslangic_tarihi = self._baslangic_tarihi
+            self._ilk_hafta_baslangic = self._baslangic_tarihi
         else:  # Bir sonraki Pazar'a git
             gun_farki = (6 - bugun_gun) % 7
             if gun_farki == 0:
                 gun_farki = 7
-            hafta_baslangic_tarihi = self._baslangic_tarihi + timedelta(days=gun_farki)
-        
-        # İlk yarı (her takım bir kez ev sahibi, bir kez deplasman)
-        for hafta in range(1, ilk_yarı_hafta_sayisi + 1):
-            maclar = []
-            # Her hafta eşit sayıda maç oluştur (Süper Lig mantığı)
-            for i in range(mac_sayisi_her_hafta):
-                ev_sahibi = takimler[i]
-                deplasman = takimler[len(takimler) - 1 - i]
-                
-                # BYE takımı maç yapmaz - bu maçı atla
-                if ev_sahibi != "BYE" and deplasman != "BYE":
-                    maclar.append((ev_sahibi, deplasman))
-            
-            # Maçları günlere ve saatlere dağıt
-            maclar_tarihli = self._maclari_gunlere_dagit(maclar, hafta_baslangic_tarihi)
-            self._haftalar[hafta] = maclar_tarihli
-            hafta_baslangic_tarihi += timedelta(days=7)
-            
-            # Takımları döndür (round-robin) - ilk takım sabit, diğerleri döner
-            takimler = [takimler[0]] + [takimler[-1]] + takimler[1:-1]
+            self._ilk_hafta_baslangic = self._baslangic_tarihi + timedelta(days=gun_farki)
+    
+    # Haftanın eşleşmelerini tarihleriyle döndüren metot - sezonu üretmeden, O(takım sayısı)
+    def hafta_eslesmeleri_getir(self, hafta_no: int) -> List[Tuple[str, str, datetime]]:
+        """
+        Haftanın eşleşmelerini LigMaci oluşturmadan döndürür.
         
-        # İkinci yarı (ev sahibi/deplasman rollerini değiştir)
-        for hafta in range(ilk_yarı_hafta_sayisi + 1, hafta_sayisi + 1):
-            ilk_yarı_hafta = hafta - ilk_yarı_hafta_sayisi
-            maclar = []
-            
-            # İlk yarıdaki maçların rollerini değiştir
-            for ev_sahibi, deplasman, _ in self._haftalar[ilk_yarı_hafta]:
-                # Rolleri değiştir (ev sahibi <-> deplasman)
-                maclar.append((deplasman, ev_sahibi))
+        Args:
+            hafta_no: Hafta numarası
+        
+        Returns:
+            List[Tuple[str, str, datetime]]: (ev_sahibi, deplasman, tarih_saat) listesi
+        """
+        maclar = self._haftalar.get(hafta_no)
+        if maclar is not None:
+            return maclar
+        if not self._hafta_var_mi(hafta_no):
+            raise TurnuvaHatasi(f"Hafta {hafta_no} bulunamadı.")
+        
+        k = self._ilk_yari_hafta_sayisi
+        ikinci_yari = hafta_no > k
+        r = (hafta_no - k if ikinci_yari else hafta_no) - 1
+        
+        # Çemberin bu haftaki hali: ilk takım sabit, kalanlar r adım sağa dönmüş
+        donen = self._takimlar[1:]
+        kayma = -r % k
+        cember = self._takimlar[:1] + donen[kayma:] + donen[:kayma]
+        yari = len(cember) // 2
+        
+        maclar = []
+        for ev_sahibi, deplasman in zip(cember[:yari], reversed(cember[yari:])):
+            # BYE takımı maç yapmaz - bu maçı atla
+            if ev_sahibi != "BYE" and deplasman != "BYE":
+                # İkinci yarıda rolleri değiştir (ev sahibi <-> deplasman)
+                maclar.append((deplasman, ev_sahibi) if ikinci_yari else (ev_sahibi, deplasman))
+        
+        # Maçları günlere ve saatlere dağıt
+        maclar = self._maclari_gunlere_dagit(maclar, self._hafta_baslangici(hafta_no))
+        self._haftalar[hafta_no] = maclar
+        return maclar
+    
+    # Private metot - hafta numarasının fikstürde olup olmadığını kontrol eder
+    def _hafta_var_mi(self, hafta_no) -> bool:
+        return isinstance(hafta_no, int) and 1 <= hafta_no <= 2 * self._ilk_yari_hafta_sayisi
+    
+    # Private metot - haftanın başlangıç gününü (Pazar) döndürür
+    def _hafta_baslangici(self, hafta_no: int) -> datetime:
+        return self._ilk_hafta_baslangic + timedelta(days=7 * (hafta_no - 1))
+    
+    # Private metot - takımın maç konumlarını (hafta_no, sıra) tarih sırasıyla hesaplar
+    def _takim_konumlari(self, takim_adi: str) -> List[Tuple[int, int]]:
+        """
+        Takımın maç konumlarını haftaları üretmeden hesaplar (eşit tarihlerde hafta sırası korunur).
+        
+        Args:
+            takim_adi: Takım adı
+        
+        Returns:
+            List[Tuple[int, int]]: (hafta_no, haftadaki sıra) listesi
+        """
+        konumlar = self._takim_indeksi.get(takim_adi)
+        if konumlar is not None:
+            return konumlar
+        
+        takimlar = self._takimlar
+        n = len(takimlar)
+        k = self._ilk_yari_hafta_sayisi
+        # BYE ile eşleşen maç oynanmaz; gerçek bir "BYE" takımının da maçı yoktur
+        yuvalar = [] if takim_adi == "BYE" else self._takim_yuvalari.get(takim_adi, [])
+        adaylar = []
+        for r in range(k if yuvalar else 0):
+            # Bu haftada BYE'li maçların sıraları; sonraki maçların haftadaki sırası bunlar kadar kayar
+            atlananlar = set()
+            for bye_yuvasi in self._bye_yuvalari:
+                bye_j = 0 if bye_yuvasi == 0 else 1 + (bye_yuvasi - 1 + r) % k
+                atlananlar.add(min(bye_j, n - 1 - bye_j))
             
-            # Maçları günlere ve saatlere dağıt
-            maclar_tarihli = self._maclari_gunlere_dagit(maclar, hafta_baslangic_tarihi)
-            self._haftalar[hafta] = maclar_tarihli
-            hafta_baslangic_tarihi += timedelta(days=7)
+            for yuva in yuvalar:
+                # Takımın bu haftaki yuvası j; rakibi n - 1 - j yuvasında, maç min(j, n - 1 - j). sırada
+                j = 0 if yuva == 0 else 1 + (yuva - 1 + r) % k
+                rakip_yuvasi = n - 1 - j
+                rakip = takimlar[0] if rakip_yuvasi == 0 else takimlar[1 + (rakip_yuvasi - 1 - r) % k]
+                if rakip == "BYE":
+                    continue
+                mac_sirasi = min(j, rakip_yuvasi)
+                sira = mac_sirasi - sum(1 for atlanan in atlananlar if atlanan < mac_sirasi)
+                for hafta_no in (r + 1, r + 1 + k):
+                    adaylar.append((self._mac_tarihi(self._hafta_baslangici(hafta_no), sira), hafta_no, sira))
+        
+        adaylar.sort()
+        konumlar = self._takim_indeksi[takim_adi] = [(hafta_no, sira) for _, hafta_no, sira in adaylar]
+        return konumlar
+    
+    # Private metot - haftadaki sırasına göre maçın gün ve saatini hesaplar
+    def _mac_tarihi(self, hafta_baslangic: datetime, mac_index: int) -> datetime:
+        """
+        Maçın tarihini hesaplar; saatler bitince bir sonraki maç gününe geçilir.
+        
+        Args:
+            hafta_baslangic: Hafta başlangıç tarihi (Pazar)
+            mac_index: Maçın haftadaki sırası
+        
+        Returns:
+            datetime: Maç tarihi ve saati
+        """
+        saat_sayisi = len(self._mac_saatleri)
+        # Gün offset'i hesapla (Cuma: -2, Cumartesi: -1, Pazar: 0)
+        gun_offset = self._mac_gunleri_offset[(mac_index // saat_sayisi) % len(self._mac_gunleri_offset)]
+        mac_gunu = hafta_baslangic + timedelta(days=gun_offset)
+        saat = self._mac_saatleri[mac_index % saat_sayisi]
+        return mac_gunu.replace(hour=saat, minute=0, second=0, microsecond=0)
     
     # Private metot - maçları günlere ve saatlere dağıtır
     def _maclari_gunlere_dagit(self, maclar: List[Tuple[str, str]], hafta_baslangic: datetime) -> List[Tuple[str, str, datetime]]:
@@ -299,73 +420,122 @@ class FiksturOlusturucu:
         Returns:
             (ev_sahibi, deplasman, tarih_saat) tuple listesi
         """
-        if not maclar:
-            return []
-        
-        maclar_tarihli = []
-        mac_index = 0
-        gun_index = 0
-        saat_index = 0
-        
-        while mac_index < len(maclar):
-            ev_sahibi, deplasman = maclar[mac_index]
-            
-            # Gün offset'i hesapla (Cuma: -2, Cumartesi: -1, Pazar: 0)
-            gun_offset = self._mac_gunleri_offset[gun_index % len(self._mac_gunleri_offset)]
-            mac_gunu = hafta_baslangic + timedelta(days=gun_offset)
-            
-            # Saat bilgisini al
-            saat = self._mac_saatleri[saat_index % len(self._mac_saatleri)]
-            mac_saati = mac_gunu.replace(hour=saat, minute=0, second=0, microsecond=0)
-            
-            maclar_tarihli.append((ev_sahibi, deplasman, mac_saati))
-            
-            mac_index += 1
-            saat_index += 1
-            
-            # Eğer saatler bitti, bir sonraki güne geç
-            if saat_index % len(self._mac_saatleri) == 0:
-                gun_index += 1
-        
-        return maclar_tarihli
+        return [(ev_sahibi, deplasman, self._mac_tarihi(hafta_baslangic, mac_index))
+                for mac_index, (ev_sahibi, deplasman) in enumerate(maclar)]
     
-    # Belirli haftanın maçlarını LigMaci objeleri olarak döndüren metot
+    # Belirli haftanın maçlarını LigMaci objeleri olarak döndüren metot - ilk erişimde oluşturulup saklanır
     def hafta_maclarini_getir(self, hafta_no: int, lig_adi: str) -> List[LigMaci]:
         """
         Belirli haftanın maçlarını LigMaci objeleri olarak döndürür.
         
+        Hafta ilk istendiğinde maçları bir kez oluşturulur; sonraki çağrılar aynı
+        objeleri içeren aynı listeyi döndürür, böylece skor ve durum değişiklikleri
+        korunur. Dönen liste fikstürün kendi deposudur, değiştirilmemelidir.
+        
         Args:
             hafta_no: Hafta numarası
-            lig_adi: Lig adı
+            lig_adi: Lig adı (fikstürün maçları tek bir lige aittir)
         
         Returns:
             List[LigMaci]: O haftanın maçları
         """
-        if hafta_no not in self._haftalar:
+        maclar = self._hafta_maclari.get(hafta_no)
+        if maclar is not None and lig_adi == self._lig_adi:
+            return maclar
+        
+        if not self._hafta_var_mi(hafta_no):
             raise TurnuvaHatasi(f"Hafta {hafta_no} bulunamadı.")
+        if self._lig_adi is not None and lig_adi != self._lig_adi:
+            raise TurnuvaHatasi(f"Fikstürün maçları '{self._lig_adi}' ligi için oluşturulmuştur.")
         
-        maclar = []
-        mac_id = hafta_no * 100 + 1  # Her hafta için benzersiz ID (1001, 1002, 2001, 2002...)
+        maclar = self._hafta_maclarini_olustur(hafta_no, lig_adi)
+        self._lig_adi = lig_adi
+        self._hafta_maclari[hafta_no] = maclar
+        for mac in maclar:
+            self._mac_haritasi.setdefault(mac.mac_id, mac)
+        return maclar
+    
+    # Maç ID'si ile maçı getiren metot - maçın haftası henüz oluşturulmadıysa oluşturur
+    def mac_getir(self, mac_id: int, lig_adi: str) -> Optional[LigMaci]:
+        """
+        Maçı ID'si ile getirir.
         
-        for ev_sahibi, deplasman, tarih in self._haftalar[hafta_no]:
-            mac = LigMaci(
-                mac_id=mac_id,
-                ev_sahibi=ev_sahibi,
-                deplasman=deplasman,
-                tarih_saat=tarih,
-                lig_adi=lig_adi,
-                hafta_no=hafta_no,
-                spor_tipi=self._spor_tipi
-            )
-            maclar.append(mac)
-            mac_id += 1
+        Maç ID'leri hafta_no * 100 + sıra biçimindedir; haftası henüz
+        oluşturulmamış bir maç için yalnızca o hafta oluşturulur. Bir haftada
+        99'dan fazla maç varsa ID'ler çakışır ve haritada ilk oluşturulan kalır.
+        
+        Args:
+            mac_id: Maç ID'si
+            lig_adi: Lig adı
+        
+        Returns:
+            Optional[LigMaci]: Bulunan maç veya None
+        """
+        mac = self._mac_haritasi.get(mac_id)
+        if mac is not None or not isinstance(mac_id, int) or mac_id <= 0:
+            return mac
         
+        hafta_no = (mac_id - 1) // 100
+        if self._hafta_var_mi(hafta_no) and hafta_no not in self._hafta_maclari:
+            self.hafta_maclarini_getir(hafta_no, lig_adi)
+        return self._mac_haritasi.get(mac_id)
+    
+    # Takımın maçlarını tarih sırasıyla döndüren metot - indeksten, ilk sorguda bir kez kurulur
+    def takim_maclarini_getir(self, takim_adi: str, lig_adi: str) -> List[LigMaci]:
+        """
+        Takımın fikstürdeki tüm maçlarını tarih sırasıyla döndürür.
+        
+        Takımın maç konumları ve liste ilk sorguda bir kez hesaplanıp saklanır;
+        sonraki sorgular aynı listeyi döndürür. Liste fikstürün kendi deposudur,
+        değiştirilmemelidir.
+        
+        Args:
+            takim_adi: Takım adı
+            lig_adi: Lig adı
+        
+        Returns:
+            List[LigMaci]: Takımın maçları (fikstürde olmayan takım için boş liste)
+        """
+        maclar = self._takim_maclari.get(takim_adi)
+        if maclar is not None and lig_adi == self._lig_adi:
+            return maclar
+        
+        maclar = [self.hafta_maclarini_getir(hafta_no, lig_adi)[sira]
+                  for hafta_no, sira in self._takim_konumlari(takim_adi)]
+        self._takim_maclari[takim_adi] = maclar
         return maclar
     
+    # Private metot - haftanın maçlarını toplu (sütun doğrulamalı) kurucuyla oluşturur
+    def _hafta_maclarini_olustur(self, hafta_no: int, lig_adi: str) -> List[LigMaci]:
+        """
+        Haftanın maçlarını LigMaci objeleri olarak oluşturur.
+        
+        Args:
+            hafta_no: Hafta numarası
+            lig_adi: Lig adı
+        
+        Returns:
+            List[LigMaci]: Sıralı ID'lerle oluşturulmuş maçlar
+        """
+        mac_id = hafta_no * 100 + 1  # Her hafta için benzersiz ID (1001, 1002, 2001, 2002...)
+        satirlar = [
+            {
+                "mac_id": mac_id + sira,
+                "ev_sahibi": ev_sahibi,
+                "deplasman": deplasman,
+                "tarih_saat": tarih,
+                "lig_adi": lig_adi,
+                "hafta_no": hafta_no,
+                "spor_tipi": self._spor_tipi
+            }
+            for sira, (ev_sahibi, deplasman, tarih) in enumerate(self.hafta_eslesmeleri_getir(hafta_no))
+        ]
+        return LigMaci.satirlardan_olustur(satirlar)
+    
     # Toplam hafta sayısını döndüren metot
     def toplam_hafta_sayisi(self) -> int:
         """Toplam hafta sayısını döndürür."""
-        return len(self._haftalar)
+        return 2 * self._ilk_yari_hafta_sayisi
     
     @staticmethod
     def takim_sayisi_yeterli_mi(takim_listesi: List[str]):
@@ -610,6 +780,14 @@ class LigRepository:
         """Tüm ligleri listeler."""
         return list(self._ligler.values())
     
+    # Ligleri kayıt sırasıyla tek tek üreten metot - liste oluşturmaz
+    def ligleri_gez(self) -> Iterator[LigYonetimi]:
+        """Ligleri kayıt sırasıyla tembel (lazy) üretir."""
+        for lig_adi in list(self._ligler):
+            lig = self._ligler.get(lig_adi)
+            if lig is not None:
+                yield lig
+    
     # Ligi silme metodu - dictionary'den çıkarır
     def lig_sil(self, lig_adi: str):
         """
@@ -763,6 +941,19 @@ class MacRepository:
         maclar.sort(key=lambda m: m.tarih_saat)
         return maclar
     
+    # Maçları kayıt sırasıyla tek tek üreten metot - sıralama yapmaz
+    def maclari_gez(self) -> Iterator[MacBase]:
+        """
+        Maçları kayıt sırasıyla tembel (lazy) üretir.
+        
+        Returns:
+            Iterator[MacBase]: Maçlar (gezinme sırasında eklenen/silinen maçlar etkilemez)
+        """
+        for mac_id in list(self._maclar):
+            mac = self._maclar.get(mac_id)
+            if mac is not None:
+                yield mac
+    
     # Maçı silme metodu - dictionary'den çıkarır
     def mac_sil(self, mac_id: int):
         """
@@ -0,0 +1,16 @@
+# Modüllerden bağımsız, modüllerin paylaştığı JSONL/CSV parça yazıcısı
+from .disa_aktarim import (
+    BICIMLER,
+    VARSAYILAN_PARCA_BOYUTU,
+    kayitlari_yaz,
+    parametreleri_dogrula,
+    parcalari_yaz,
+)
+
+__all__ = [
+    "BICIMLER",
+    "VARSAYILAN_PARCA_BOYUTU",
+    "kayitlari_yaz",
+    "parametreleri_dogrula",
+    "parcalari_yaz",
+]
@@ -0,0 +1,78 @@
+"""
+Satır sözlüklerini JSONL veya CSV dosyasına parça parça yazan ortak yazıcı.
+Modüllerden bağımsızdır (yalnızca standart kütüphane kullanır); her modül
+kendi kayıtlarını satır sözlüklerine çevirip buraya verir. Her parça tek
+seferde kodlanıp (isteğe bağlı gzip ile) tek write çağrısıyla yazılır;
+yazıcı bellekte aynı anda bir parçanın satırlarını ve kodlanmış metnini
+tutar.
+"""
+import csv
+import gzip
+import io
+import json
+from itertools import islice
+from typing import Any, BinaryIO, Iterable, List, Mapping, Optional, Sequence
+
+BICIMLER = ("jsonl", "csv")
+VARSAYILAN_PARCA_BOYUTU = 5_000
+# gzip.open varsayılanı (9) yazma hızını birkaç kat düşürür; 6 zlib'in varsayılan dengesidir
+GZIP_SEVIYESI = 6
+
+_JSON_KODLA = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+
+
+# Satır sözlüklerini parça parça JSONL veya CSV olarak yazar; yazılan satır sayısını döndürür
+def kayitlari_yaz(kayitlar: Iterable[Mapping[str, Any]], yol: str, bicim: str = "jsonl",
+                  sutunlar: Optional[Sequence[str]] = None, sikistir: bool = False,
+                  parca_boyutu: int = VARSAYILAN_PARCA_BOYUTU) -> int:
+    parametreleri_dogrula(bicim, sutunlar, parca_boyutu)
+    kayitlar = iter(kayitlar)
+    parcalar = iter(lambda: list(islice(kayitlar, parca_boyutu)), [])
+    return parcalari_yaz(parcalar, yol, bicim, sutunlar, sikistir)
+
+
+# Hazır satır parçalarını dosyaya yazar; her parça tek seferde kodlanıp tek write ile yazılır
+def parcalari_yaz(parcalar: Iterable[List[Mapping[str, Any]]], yol: str, bicim: str,
+                  sutunlar: Optional[Sequence[str]], sikistir: bool = False) -> int:
+    """
+    Parçaları kendisi üreten çağıranlar içindir (parametreler önceden
+    parametreleri_dogrula ile doğrulanmalıdır). JSONL'de her satır ayrı
+    kodlanır ve parçanın satırları tek metinde birleştirilir. CSV'de
+    sutunlar başlığı ve sırayı belirler, satırda olmayan alanlar boş yazılır.
+    """
+    sayi = 0
+    with _dosya_ac(yol, sikistir) as dosya:
+        if bicim == "csv":
+            dosya.write(_csv_metni([sutunlar]).encode("utf-8"))
+        for parca in parcalar:
+            if bicim == "jsonl":
+                metin = "\n".join(map(_JSON_KODLA, parca)) + "\n"
+            else:
+                metin = _csv_metni([list(map(satir.get, sutunlar)) for satir in parca])
+            dosya.write(metin.encode("utf-8"))
+            sayi += len(parca)
+    return sayi
+
+
+# Biçim, CSV sütunları ve parça boyutunu doğrular
+def parametreleri_dogrula(bicim: str, sutunlar: Optional[Sequence[str]], parca_boyutu: int) -> None:
+    if bicim not in BICIMLER:
+        raise ValueError(f"Dışa aktarım biçimi {BICIMLER} değerlerinden biri olmalıdır, alınan: '{bicim}'")
+    if bicim == "csv" and not sutunlar:
+        raise ValueError("CSV dışa aktarımı için sütunlar verilmelidir")
+    if not isinstance(parca_boyutu, int) or parca_boyutu <= 0:
+        raise ValueError(f"Parça boyutu pozitif tam sayı olmalıdır, alınan: {parca_boyutu}")
+
+
+# Satırları CSV metnine çevirir
+def _csv_metni(satirlar: Iterable[Sequence[Any]]) -> str:
+    tampon = io.StringIO()
+    csv.writer(tampon, lineterminator="\n").writerows(satirlar)
+    return tampon.getvalue()
+
+
+# Hedef dosyayı ikili yazma için (gerekirse gzip ile) açar
+def _dosya_ac(yol: str, sikistir: bool) -> BinaryIO:
+    if sikistir:
+        return gzip.open(yol, "wb", compresslevel=GZIP_SEVIYESI)
+    return open(yol, "wb")
@@ -0,0 +1,118 @@
+"""
+AsyncTrainingManager eşzamanlı rezervasyon benchmark'ı.
+Binlerce eşzamanlı coroutine'in oturum_olustur çağrılarını, her repository
+çağrısının bir veritabanı gidiş-dönüşü kadar (time.sleep ile) sürdüğü bir
+repository üzerinde (a) tek global kilitle, (b) kaynak bazlı kilitlerle ve
+(c) kilitsiz çalıştırır. Kilitsiz çalıştırma çift rezervasyonların oluştuğunu,
+kaynak bazlı kilitler ise bunun önlendiğini gösterir.
+
+Çalıştırma: python benchmarks/async_rezervasyon_benchmark.py [istek_sayisi] [gecikme_ms]
+"""
+import sys
+import os
+import asyncio
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+root_dir = os.path.dirname(current_dir)
+sys.path.insert(0, root_dir)
+
+from app.modules.module_2.async_manager import AsyncTrainingManager
+from app.modules.module_2.implementations import IndividualTrainingSession
+from app.modules.module_2.repository import TrainingRepository
+from app.modules.module_2.exceptions import AntrenmanHatasi
+
+BASLANGIC = datetime(2025, 6, 2, 8, 0)
+
+
+# Her çağrıda ağ gecikmesini taklit eden, çağrı bazında thread-safe repository
+class GecikmeliRepository(TrainingRepository):
+
+    def __init__(self, gecikme_sn: float):
+        super().__init__()
+        self._gecikme_sn = gecikme_sn
+        self._kilit = threading.Lock()
+
+    def detayli_cakisma_kontrol(self, *parametreler, **adlandirilmis):
+        time.sleep(self._gecikme_sn)
+        with self._kilit:
+            return super().detayli_cakisma_kontrol(*parametreler, **adlandirilmis)
+
+    def kaydet(self, oturum):
+        time.sleep(self._gecikme_sn)
+        with self._kilit:
+            super().kaydet(oturum)
+
+
+# Tüm istekleri tek bir kilit altında sıralayan (eski yöntem) cephe
+class TekKilitliManager(AsyncTrainingManager):
+
+    @staticmethod
+    def _kilit_anahtarlari(oturum):
+        return [("tumu", 0)]
+
+
+# Hiç kilit almayan (yanlış) cephe; çift rezervasyonu göstermek için
+class KilitsizManager(AsyncTrainingManager):
+
+    @staticmethod
+    def _kilit_anahtarlari(oturum):
+        return []
+
+
+def _istekler(istek_sayisi: int) -> list:
+    # Sporcu başına ortalama 4 istek, gün içinde 16 olası yarım saatlik başlangıç: çakışmalar bol
+    rastgele = random.Random(42)
+    sporcu_sayisi = max(1, istek_sayisi // 4)
+    return [
+        IndividualTrainingSession(oturum_id, 60, rastgele.randint(1, sporcu_sayisi), 5,
+                                  tarih_saat=BASLANGIC + timedelta(minutes=30 * rastgele.randrange(16)))
+        for oturum_id in range(1, istek_sayisi + 1)
+    ]
+
+
+def _cift_rezervasyon_sayisi(repo: TrainingRepository) -> int:
+    cift = 0
+    for athlete_id in {oturum.athlete_id for oturum in repo.tumunu_listele()}:
+        indeks = repo.sporcu_zaman_indeksi(athlete_id)
+        araliklar = list(indeks.cakisan_araliklar(BASLANGIC - timedelta(days=1), 3 * 24 * 60))
+        for (_, bitis, _), (sonraki_baslangic, _, _) in zip(araliklar, araliklar[1:]):
+            if sonraki_baslangic < bitis:
+                cift += 1
+    return cift
+
+
+async def _calistir(manager_sinifi, istek_sayisi: int, gecikme_sn: float):
+    repo = GecikmeliRepository(gecikme_sn)
+    with ThreadPoolExecutor(max_workers=64) as yurutucu:
+        manager = manager_sinifi(repo, yurutucu=yurutucu)
+
+        async def rezervasyon(oturum):
+            try:
+                await manager.oturum_olustur(oturum)
+            except AntrenmanHatasi:
+                pass
+
+        t0 = time.perf_counter()
+        await asyncio.gather(*(rezervasyon(oturum) for oturum in _istekler(istek_sayisi)))
+        sure = time.perf_counter() - t0
+    return sure, len(repo.tumunu_listele()), _cift_rezervasyon_sayisi(repo)
+
+
+def main(istek_sayisi: int = 2_000, gecikme_ms: float = 0.5) -> None:
+    gecikme_sn = gecikme_ms / 1000
+    print(f"İstek sayısı: {istek_sayisi}, repository çağrı gecikmesi: {gecikme_ms} ms, 64 iş parçacığı")
+    print(f"{'Cephe':<22}{'Süre':>9}{'İstek/sn':>11}{'Kayıt':>8}{'Çift rez.':>11}")
+    for ad, sinif in (("Tek global kilit", TekKilitliManager),
+                      ("Kaynak bazlı kilit", AsyncTrainingManager),
+                      ("Kilitsiz (hatalı)", KilitsizManager)):
+        sure, kayit, cift = asyncio.run(_calistir(sinif, istek_sayisi, gecikme_sn))
+        print(f"{ad:<22}{sure:>8.2f}s{istek_sayisi / sure:>11.0f}{kayit:>8}{cift:>11}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2_000, float(sys.argv[2]) if len(sys.argv) > 2 else 0.5)
@@ -0,0 +1,91 @@
+"""
+Varlık başına bellek benchmark'ı (tracemalloc).
+Oturum ve maç sınıflarının __slots__ düzenindeki nesne başına bayt değerini,
+aynı alanları aynı sırayla __init__ içinde atayan düz (__dict__'li) bir sınıfla,
+yani __slots__ öncesi düzenle karşılaştırır. CPython 3.11+ paylaşılan anahtarlı
+dict'i nesne içinde tutabildiği için, __dict__'in gerçek bir dict'e açıldığı
+durum (deepcopy, pickle, vars() sonrası) ayrı bir sütunda ölçülür.
+
+Çalıştırma: python benchmarks/bellek_benchmark.py [nesne_sayisi]
+"""
+import sys
+import os
+import tracemalloc
+from datetime import datetime, timedelta
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+root_dir = os.path.dirname(current_dir)
+sys.path.insert(0, root_dir)
+
+from app.modules.module_2.implementations import (
+    IndividualTrainingSession,
+    TeamTrainingSession,
+    RehabTrainingSession
+)
+from app.modules.module_3.implementations import LigMaci, HazirlikMaci, ElemeMaci
+
+BASLANGIC = datetime(2025, 1, 1)
+
+
+# __slots__ öncesi düzen: alanlar nesnenin __dict__'inde tutulur
+class _DictDuzeni:
+    def __init__(self, alanlar, dict_ac=False):
+        for ad, deger in alanlar:
+            setattr(self, ad, deger)
+        if dict_ac:
+            self.__dict__
+
+
+def _slot_adlari(sinif) -> list:
+    adlar = []
+    for taban in reversed(sinif.__mro__):
+        adlar.extend(taban.__dict__.get("__slots__", ()))
+    return adlar
+
+
+def _olc(uretici, nesne_sayisi: int) -> float:
+    tracemalloc.start()
+    once = tracemalloc.take_snapshot()
+    nesneler = [uretici(i) for i in range(1, nesne_sayisi + 1)]
+    sonra = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    toplam = sum(fark.size_diff for fark in sonra.compare_to(once, "filename"))
+    del nesneler
+    return toplam / nesne_sayisi
+
+
+def main(nesne_sayisi: int = 100_000) -> None:
+    ureticiler = {
+        "IndividualTrainingSession": lambda i: IndividualTrainingSession(
+            i, 60, i % 1000 + 1, 1, tarih_saat=BASLANGIC + timedelta(minutes=i)),
+        "TeamTrainingSession": lambda i: TeamTrainingSession(
+            i, 90, i % 50 + 1, i % 5 + 1, 15, tarih_saat=BASLANGIC + timedelta(minutes=i)),
+        "RehabTrainingSession": lambda i: RehabTrainingSession(
+            i, 45, i % 1000 + 1, 1, "kas", tarih_saat=BASLANGIC + timedelta(minutes=i)),
+        "LigMaci": lambda i: LigMaci(i, "Galatasaray", "Fenerbahçe", BASLANGIC + timedelta(minutes=i), "Süper Lig", 1),
+        "HazirlikMaci": lambda i: HazirlikMaci(i, "Galatasaray", "Fenerbahçe", BASLANGIC + timedelta(minutes=i), "Yaz Kupası"),
+        "ElemeMaci": lambda i: ElemeMaci(i, "Galatasaray", "Fenerbahçe", BASLANGIC + timedelta(minutes=i), "Final"),
+    }
+
+    print(f"Nesne sayısı: {nesne_sayisi} (değerler dahil, bayt/nesne)")
+    print(f"{'Sınıf':<28}{'__dict__':>10}{'__dict__ açık':>14}{'__slots__':>11}{'Kazanç':>9}{'(açık)':>9}")
+    for ad, uretici in ureticiler.items():
+        ornek = uretici(1)
+        adlar = _slot_adlari(type(ornek))
+        # Her varlık için ayrı sınıf: CPython'un sınıf başına paylaşılan anahtar tablosu karışmasın
+        dict_sinifi = type(f"{ad}Dict", (_DictDuzeni,), {})
+
+        def dict_uretici(i, dict_ac=False, uretici=uretici, adlar=adlar, dict_sinifi=dict_sinifi):
+            nesne = uretici(i)
+            return dict_sinifi([(alan, getattr(nesne, alan)) for alan in adlar], dict_ac)
+
+        # Geçici slot nesnesi hemen serbest kaldığı için farka sadece dict düzenindeki nesne girer
+        dict_boyut = _olc(dict_uretici, nesne_sayisi)
+        acik_boyut = _olc(lambda i: dict_uretici(i, dict_ac=True), nesne_sayisi)
+        slot_boyut = _olc(uretici, nesne_sayisi)
+        print(f"{ad:<28}{dict_boyut:>10.0f}{acik_boyut:>14.0f}{slot_boyut:>11.0f}"
+              f"{1 - slot_boyut / dict_boyut:>9.0%}{1 - slot_boyut / acik_boyut:>9.0%}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,92 @@
+"""
+Çakışma kontrolü ölçeklenme benchmark'ı.
+detayli_cakisma_kontrol'ün zaman aralığı indeksli sürümünü, tüm oturumları
+tarayan eski sürümle farklı repository boyutlarında karşılaştırır.
+
+Çalıştırma: python benchmarks/cakisma_benchmark.py [boyut1 boyut2 ...]
+"""
+import sys
+import os
+import random
+import time
+from datetime import datetime, timedelta
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+root_dir = os.path.dirname(current_dir)
+sys.path.insert(0, root_dir)
+
+from app.modules.module_2.base import AntrenmanOturumuTemel
+from app.modules.module_2.implementations import IndividualTrainingSession, TeamTrainingSession
+from app.modules.module_2.repository import TrainingRepository
+
+BASLANGIC = datetime(2020, 1, 1, 8, 0)
+
+# Eski tarama sürümü bu boyutun üzerinde çok yavaş kaldığı için ölçülmez
+TARAMA_UST_SINIRI = 100_000
+
+
+# Eski davranış: tüm oturumları tarayarak çakışma arar (karşılaştırma için)
+def tarama_ile_cakisma(repo: TrainingRepository, tarih, sure_dk, athlete_id=None, saha_id=None) -> bool:
+    for oturum in repo._storage.values():
+        if not oturum.tarih_saat:
+            continue
+        if AntrenmanOturumuTemel.tarih_cakismasi_kontrol(oturum.tarih_saat, oturum.sure, tarih, sure_dk):
+            if athlete_id is not None and getattr(oturum, 'athlete_id', None) == athlete_id:
+                return True
+            if saha_id is not None and getattr(oturum, 'saha_id', None) == saha_id:
+                return True
+    return False
+
+
+# Verilen boyutta rastgele oturumlarla dolu repository oluşturur
+def repository_olustur(boyut: int, rastgele: random.Random) -> TrainingRepository:
+    repo = TrainingRepository()
+    sporcu_sayisi = max(1, boyut // 100)
+    gun_sayisi = max(1, boyut // 50)
+    for oturum_id in range(1, boyut + 1):
+        tarih = BASLANGIC + timedelta(days=rastgele.randrange(gun_sayisi), minutes=15 * rastgele.randrange(48))
+        if oturum_id % 5 == 0:
+            oturum = TeamTrainingSession(oturum_id, 90, 1, rastgele.randint(1, 5), 15, tarih_saat=tarih)
+        else:
+            oturum = IndividualTrainingSession(oturum_id, 60, rastgele.randint(1, sporcu_sayisi), 1, tarih_saat=tarih)
+        repo.kaydet(oturum)
+    return repo
+
+
+def main(boyutlar, sorgu_sayisi: int = 1000) -> None:
+    rastgele = random.Random(42)
+    print(f"{'Oturum':>10} {'Yükleme (s)':>12} {'İndeks (µs)':>12} {'Tarama (µs)':>12}")
+    print("-" * 50)
+
+    for boyut in boyutlar:
+        t0 = time.perf_counter()
+        repo = repository_olustur(boyut, rastgele)
+        yukleme = time.perf_counter() - t0
+
+        sporcu_sayisi = max(1, boyut // 100)
+        gun_sayisi = max(1, boyut // 50)
+        sorgular = [
+            (BASLANGIC + timedelta(days=rastgele.randrange(gun_sayisi), minutes=5 * rastgele.randrange(150)),
+             rastgele.randint(30, 120), rastgele.randint(1, sporcu_sayisi), rastgele.randint(1, 5))
+            for _ in range(sorgu_sayisi)
+        ]
+
+        t0 = time.perf_counter()
+        for tarih, sure, athlete_id, saha_id in sorgular:
+            repo.detayli_cakisma_kontrol(tarih, sure, athlete_id=athlete_id, saha_id=saha_id)
+        indeks = (time.perf_counter() - t0) / sorgu_sayisi * 1e6
+
+        if boyut <= TARAMA_UST_SINIRI:
+            ornek = sorgular[:20]
+            t0 = time.perf_counter()
+            for tarih, sure, athlete_id, saha_id in ornek:
+                tarama_ile_cakisma(repo, tarih, sure, athlete_id, saha_id)
+            tarama = f"{(time.perf_counter() - t0) / len(ornek) * 1e6:12.1f}"
+        else:
+            tarama = f"{'-':>12}"
+
+        print(f"{boyut:>10} {yukleme:>12.2f} {indeks:>12.2f} {tarama}")
+
+
+if __name__ == "__main__":
+    main([int(x) for x in sys.argv[1:]] or [10_000, 100_000, 1_000_000])
@@ -0,0 +1,101 @@
+"""
+Akışlı dışa aktarım benchmark'ı.
+Repository'deki tüm oturumları (a) eski yöntemle (tüm oturum_detaylari_getir
+sözlüklerini listeye alıp her satırı ayrı json.dumps ile yazarak) ve
+(b) oturumlari_disa_aktar ile JSONL, CSV ve gzip'li JSONL olarak yazar.
+Aynı büyüklükteki hazır baytların diske yazılma süresi üst sınır olarak
+verilir. JSONL çıktısının satırları eski yöntemle aynı sözlüklerdir.
+
+Çalıştırma: python benchmarks/disa_aktarim_benchmark.py [oturum_sayisi]
+"""
+import sys
+import os
+import json
+import random
+import tempfile
+import timeit
+from datetime import datetime, timedelta
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+root_dir = os.path.dirname(current_dir)
+sys.path.insert(0, root_dir)
+
+from app.modules.module_2.implementations import (
+    IndividualTrainingSession, TeamTrainingSession, RehabTrainingSession
+)
+from app.modules.module_2.repository import TrainingRepository
+from app.modules.module_2.disa_aktarim import oturumlari_disa_aktar
+
+BASLANGIC = datetime(2024, 1, 1, 8, 0)
+
+
+def _repository(oturum_sayisi: int) -> TrainingRepository:
+    rastgele = random.Random(42)
+    satirlar = {IndividualTrainingSession: [], TeamTrainingSession: [], RehabTrainingSession: []}
+    for oturum_id in range(1, oturum_sayisi + 1):
+        ortak = {"oturum_id": oturum_id, "sure": rastgele.randint(30, 180),
+                 "tarih_saat": BASLANGIC + timedelta(minutes=10 * oturum_id)}
+        secim = rastgele.random()
+        if secim < 0.5:
+            satirlar[IndividualTrainingSession].append(dict(
+                ortak, athlete_id=rastgele.randint(1, 5000), antrenor_id=rastgele.randint(1, 50),
+                performans_notu=round(rastgele.uniform(0, 10), 1)))
+        elif secim < 0.8:
+            satirlar[TeamTrainingSession].append(dict(
+                ortak, team_id=rastgele.randint(1, 100), saha_id=rastgele.randint(1, 5),
+                katilimci_sayisi=rastgele.randint(2, 30), antrenman_plani="taktik"))
+        else:
+            satirlar[RehabTrainingSession].append(dict(
+                ortak, athlete_id=rastgele.randint(1, 5000), fizyoterapist_id=rastgele.randint(1, 20),
+                sakatlik_tipi="kas"))
+    repo = TrainingRepository()
+    for sinif, sinif_satirlari in satirlar.items():
+        repo.kaydet_toplu(sinif.satirlardan_olustur(sinif_satirlari, dogrula=False))
+    return repo
+
+
+# Eski yöntem: tüm satırlar belleğe alınır, her satır ayrı kodlanıp yazılır
+def _eski_yontem(repo: TrainingRepository, yol: str) -> None:
+    satirlar = [oturum.oturum_detaylari_getir() for oturum in repo.tumunu_listele()]
+    with open(yol, "w", encoding="utf-8") as dosya:
+        for satir in satirlar:
+            dosya.write(json.dumps(satir, ensure_ascii=False) + "\n")
+
+
+def _en_iyi(fonksiyon, tekrar: int = 3) -> float:
+    return min(timeit.repeat(fonksiyon, number=1, repeat=tekrar))
+
+
+def main(oturum_sayisi: int = 1_000_000) -> None:
+    repo = _repository(oturum_sayisi)
+    with tempfile.TemporaryDirectory() as klasor:
+        yol = lambda ad: os.path.join(klasor, ad)
+        sure_eski = _en_iyi(lambda: _eski_yontem(repo, yol("eski.jsonl")))
+        sure_jsonl = _en_iyi(lambda: oturumlari_disa_aktar(repo, yol("yeni.jsonl")))
+        sure_csv = _en_iyi(lambda: oturumlari_disa_aktar(repo, yol("yeni.csv"), "csv"))
+        sure_gzip = _en_iyi(lambda: oturumlari_disa_aktar(repo, yol("yeni.jsonl.gz"), sikistir=True))
+
+        with open(yol("eski.jsonl"), encoding="utf-8") as eski, open(yol("yeni.jsonl"), encoding="utf-8") as yeni:
+            assert all(json.loads(a) == json.loads(b) for a, b in zip(eski, yeni))
+        with open(yol("yeni.jsonl"), "rb") as dosya:
+            veri = dosya.read()
+
+        def _ham_yazma():
+            with open(yol("ham.bin"), "wb") as dosya:
+                dosya.write(veri)
+                dosya.flush()
+                os.fsync(dosya.fileno())
+        sure_disk = _en_iyi(_ham_yazma)
+        boyut_mb = len(veri) / 1e6
+        gzip_mb = os.path.getsize(yol("yeni.jsonl.gz")) / 1e6
+
+    print(f"Oturum sayısı: {oturum_sayisi}, JSONL boyutu: {boyut_mb:.1f} MB (gzip: {gzip_mb:.1f} MB)")
+    print(f"{'Liste + satır başına dumps':<30}{sure_eski:>8.2f} s  {boyut_mb / sure_eski:>7.1f} MB/s")
+    print(f"{'Akışlı JSONL':<30}{sure_jsonl:>8.2f} s  {boyut_mb / sure_jsonl:>7.1f} MB/s  ({sure_eski / sure_jsonl:.1f}x)")
+    print(f"{'Akışlı CSV':<30}{sure_csv:>8.2f} s")
+    print(f"{'Akışlı JSONL + gzip':<30}{sure_gzip:>8.2f} s")
+    print(f"{'Ham disk yazma (fsync)':<30}{sure_disk:>8.2f} s  {boyut_mb / sure_disk:>7.1f} MB/s")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
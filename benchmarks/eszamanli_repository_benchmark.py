@@ -0,0 +1,152 @@
+"""
+EszamanliTrainingRepository verim (throughput) benchmark'ı.
+API iş parçacıkları oku-değiştir-yaz güncellemeleri, sporcu filtreleri ve
+çakışma kontrolleri yaparken bir rapor iş parçacığı belirli aralıklarla tüm
+oturumlar üzerinde tutarlı bir toplam hesaplar. (a) Her işlemi ve rapor
+taramasını tek bir global kilit altında yapan repository ile (b) şeritli
+kilit + sürüm kontrolü + anlık görüntü kullanan repository karşılaştırılır.
+
+Güncellemede okuma ile yazma arasında isteğin işlenme süresi (doğrulama,
+dış servis çağrısı) time.sleep ile taklit edilir. Global kilitli düzende
+oturum yerinde değiştirildiği için kilit bu süre boyunca tutulmak zorundadır;
+sürüm kontrolünde okuma ile yazma arasında kilit tutulmaz. İşlenme süresi 0
+iken iki düzen yalnızca saf CPU işiyle (GIL altında) karşılaştırılır.
+
+Çalıştırma: python benchmarks/eszamanli_repository_benchmark.py [oturum_sayisi] [is_parcacigi] [isleme_ms]
+"""
+import sys
+import os
+import random
+import threading
+import time
+from datetime import datetime, timedelta
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+root_dir = os.path.dirname(current_dir)
+sys.path.insert(0, root_dir)
+
+from app.modules.module_2.eszamanli_repository import EszamanliTrainingRepository
+from app.modules.module_2.implementations import IndividualTrainingSession
+from app.modules.module_2.repository import TrainingRepository
+from app.modules.module_2.exceptions import SurumCakismasiHatasi
+
+BASLANGIC = datetime(2025, 6, 2, 8, 0)
+SPORCU_SAYISI = 500
+RAPOR_ARALIGI_SN = 0.02
+
+
+# Tüm işlemleri ve taramaları tek kilitle sıralayan (eski yöntem) repository
+class KuresellKilitliRepository(TrainingRepository):
+
+    def __init__(self):
+        super().__init__()
+        self.kilit = threading.RLock()
+
+    # Oturum yerinde değiştirildiği için oku-değiştir-yaz kilit altında yapılır
+    def sure_degistir(self, oturum_id: int, isleme_sn: float) -> None:
+        with self.kilit:
+            oturum = self.id_ile_bul(oturum_id)
+            if isleme_sn:
+                time.sleep(isleme_sn)
+            oturum.sure = oturum.sure % 120 + 1
+            self.guncelle(oturum)
+
+    def sporcuya_gore_filtrele(self, athlete_id):
+        with self.kilit:
+            return super().sporcuya_gore_filtrele(athlete_id)
+
+    def detayli_cakisma_kontrol(self, *parametreler, **adlandirilmis):
+        with self.kilit:
+            return super().detayli_cakisma_kontrol(*parametreler, **adlandirilmis)
+
+    # Tutarlı tarama için kilit tüm gezinme boyunca tutulur
+    def toplam_sure(self) -> int:
+        with self.kilit:
+            return sum(oturum.sure for oturum in self._storage.values())
+
+
+# Şeritli repository için aynı işlemler (sürüm çakışmasında yeniden dener)
+class SeritliRepository(EszamanliTrainingRepository):
+
+    def sure_degistir(self, oturum_id: int, isleme_sn: float) -> None:
+        while True:
+            oturum = self.id_ile_bul(oturum_id)
+            if isleme_sn:
+                time.sleep(isleme_sn)
+            oturum.sure = oturum.sure % 120 + 1
+            try:
+                self.guncelle(oturum)
+                return
+            except SurumCakismasiHatasi:
+                continue
+
+    # Tarama anlık görüntü üzerinde kilitsiz yapılır
+    def toplam_sure(self) -> int:
+        return sum(oturum.sure for oturum in self.anlik_goruntu())
+
+
+def _doldur(repo, oturum_sayisi: int) -> None:
+    rastgele = random.Random(42)
+    for oturum_id in range(1, oturum_sayisi + 1):
+        repo.kaydet(IndividualTrainingSession(
+            oturum_id, 60, rastgele.randint(1, SPORCU_SAYISI), 5,
+            tarih_saat=BASLANGIC + timedelta(hours=oturum_id)))
+
+
+def _calistir(repo_sinifi, oturum_sayisi: int, is_parcacigi: int, isleme_sn: float, sure_sn: float):
+    repo = repo_sinifi()
+    _doldur(repo, oturum_sayisi)
+    dur = threading.Event()
+    sureler = [[] for _ in range(is_parcacigi)]
+    rapor_sayisi = [0]
+
+    def api_isci(sira: int) -> None:
+        rastgele = random.Random(sira)
+        while not dur.is_set():
+            t0 = time.perf_counter()
+            secim = rastgele.random()
+            if secim < 0.5:
+                repo.sure_degistir(rastgele.randint(1, oturum_sayisi), isleme_sn)
+            elif secim < 0.8:
+                repo.sporcuya_gore_filtrele(rastgele.randint(1, SPORCU_SAYISI))
+            else:
+                repo.detayli_cakisma_kontrol(BASLANGIC + timedelta(hours=rastgele.randrange(oturum_sayisi)), 60,
+                                             athlete_id=rastgele.randint(1, SPORCU_SAYISI))
+            sureler[sira].append(time.perf_counter() - t0)
+
+    def raporlayici() -> None:
+        while not dur.wait(RAPOR_ARALIGI_SN):
+            repo.toplam_sure()
+            rapor_sayisi[0] += 1
+
+    threadler = [threading.Thread(target=api_isci, args=(sira,)) for sira in range(is_parcacigi)]
+    threadler.append(threading.Thread(target=raporlayici))
+    for thread in threadler:
+        thread.start()
+    time.sleep(sure_sn)
+    dur.set()
+    for thread in threadler:
+        thread.join()
+    tumu = sorted(sure for liste in sureler for sure in liste)
+    return len(tumu) / sure_sn, rapor_sayisi[0] / sure_sn, tumu[len(tumu) // 2], tumu[int(len(tumu) * 0.99)], tumu[-1]
+
+
+def main(oturum_sayisi: int = 20_000, is_parcacigi: int = 8, isleme_ms: float = 0.2,
+         sure_sn: float = 2.0, tekrar: int = 3) -> None:
+    print(f"Oturum: {oturum_sayisi}, API iş parçacığı: {is_parcacigi} + 1 rapor, "
+          f"her ölçüm {sure_sn} s, en iyi {tekrar} deneme")
+    for isleme in sorted({0.0, isleme_ms}):
+        print(f"\nGüncellemede işlenme süresi: {isleme} ms")
+        print(f"{'Repository':<24}{'İşlem/sn':>10}{'Rapor/sn':>10}{'p50':>10}{'p99':>10}{'En uzun':>10}")
+        for ad, sinif in (("Tek global kilit", KuresellKilitliRepository),
+                          ("Şeritli kilit + sürüm", SeritliRepository)):
+            # Gürültülü makinede en iyi deneme (en yüksek işlem/sn) raporlanır
+            islem, rapor, p50, p99, en_uzun = max(
+                _calistir(sinif, oturum_sayisi, is_parcacigi, isleme / 1000, sure_sn) for _ in range(tekrar))
+            print(f"{ad:<24}{islem:>10.0f}{rapor:>10.1f}{p50 * 1e6:>8.0f}µs{p99 * 1e3:>8.1f}ms{en_uzun * 1e3:>8.0f}ms")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20_000,
+         int(sys.argv[2]) if len(sys.argv) > 2 else 8,
+         float(sys.argv[3]) if len(sys.argv) > 3 else 0.2)
@@ -0,0 +1,76 @@
+"""
+Kapalı form fikstür benchmark'ı.
+Büyük bir lig için (a) eski yöntemle (takım listesini her hafta döndürüp tüm
+sezonu tarihli demetlerle baştan üreterek) ve (b) FiksturOlusturucu'nun kapalı
+formuyla tek bir haftanın eşleşmelerini ve bir takımın maç konumlarını hesaplar.
+Tüm sezonun kapalı formla hafta hafta üretimi de verilir; eski yöntemle hafta
+hafta aynı olduğu doğrulanır.
+
+Çalıştırma: python benchmarks/fikstur_benchmark.py [takim_sayisi]
+"""
+import sys
+import os
+import timeit
+from datetime import datetime, timedelta
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+root_dir = os.path.dirname(current_dir)
+sys.path.insert(0, root_dir)
+
+from app.modules.module_3.base import SporTipi
+from app.modules.module_3.repository import FiksturOlusturucu
+
+BASLANGIC = datetime(2024, 8, 30)
+
+
+# Eski yöntem: çember her hafta döndürülür, ikinci yarı ilk yarıdan aynalanır
+def _eski_sezon(fikstur: FiksturOlusturucu, takimlar: list) -> dict:
+    takimlar = takimlar + ["BYE"] if len(takimlar) % 2 else list(takimlar)
+    ilk_yari = len(takimlar) - 1
+    hafta_baslangic = fikstur._ilk_hafta_baslangic
+    haftalar = {}
+    for hafta in range(1, ilk_yari + 1):
+        maclar = [(takimlar[i], takimlar[-1 - i]) for i in range(len(takimlar) // 2)
+                  if takimlar[i] != "BYE" and takimlar[-1 - i] != "BYE"]
+        haftalar[hafta] = fikstur._maclari_gunlere_dagit(maclar, hafta_baslangic)
+        hafta_baslangic += timedelta(days=7)
+        takimlar = [takimlar[0]] + [takimlar[-1]] + takimlar[1:-1]
+    for hafta in range(ilk_yari + 1, 2 * ilk_yari + 1):
+        maclar = [(deplasman, ev_sahibi) for ev_sahibi, deplasman, _ in haftalar[hafta - ilk_yari]]
+        haftalar[hafta] = fikstur._maclari_gunlere_dagit(maclar, hafta_baslangic)
+        hafta_baslangic += timedelta(days=7)
+    return haftalar
+
+
+def _yeni_sezon(takimlar: list) -> dict:
+    fikstur = FiksturOlusturucu(takimlar, BASLANGIC, SporTipi.FUTBOL)
+    return {hafta: fikstur.hafta_eslesmeleri_getir(hafta) for hafta in range(1, fikstur.toplam_hafta_sayisi() + 1)}
+
+
+def _en_iyi(fonksiyon, tekrar: int = 3) -> float:
+    return min(timeit.repeat(fonksiyon, number=1, repeat=tekrar))
+
+
+def main(takim_sayisi: int = 1_001) -> None:
+    takimlar = [f"Takım {i}" for i in range(takim_sayisi)]
+    ornek = FiksturOlusturucu(takimlar, BASLANGIC, SporTipi.FUTBOL)
+    orta_hafta = ornek.toplam_hafta_sayisi() // 2 + 1
+    assert _eski_sezon(ornek, takimlar) == _yeni_sezon(takimlar)
+
+    sure_eski = _en_iyi(lambda: _eski_sezon(ornek, takimlar))
+    sure_hafta = _en_iyi(lambda: FiksturOlusturucu(takimlar, BASLANGIC, SporTipi.FUTBOL)
+                         .hafta_eslesmeleri_getir(orta_hafta), tekrar=10)
+    sure_takim = _en_iyi(lambda: FiksturOlusturucu(takimlar, BASLANGIC, SporTipi.FUTBOL)
+                         ._takim_konumlari(takimlar[-1]), tekrar=10)
+    sure_sezon = _en_iyi(lambda: _yeni_sezon(takimlar))
+
+    print(f"Takım sayısı: {takim_sayisi}, hafta sayısı: {ornek.toplam_hafta_sayisi()}, "
+          f"haftalık maç: {len(ornek.hafta_eslesmeleri_getir(1))}")
+    print(f"{'Eski: tüm sezonu üret':<38}{sure_eski * 1000:>10.1f} ms")
+    print(f"{'Kapalı form: tek hafta':<38}{sure_hafta * 1000:>10.3f} ms  ({sure_eski / sure_hafta:,.0f}x)")
+    print(f"{'Kapalı form: bir takımın maçları':<38}{sure_takim * 1000:>10.3f} ms  ({sure_eski / sure_takim:,.0f}x)")
+    print(f"{'Kapalı form: tüm sezon':<38}{sure_sezon * 1000:>10.1f} ms")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_001)
@@ -0,0 +1,118 @@
+"""
+Toplu içe aktarım benchmark'ı.
+Dışa aktarılmış bir oturum dosyasını (satırların %1'i hatalı) (a) eski
+yöntemle (satır başına sozlukten_oturum_olustur + oturum_olustur, hatalar
+yakalanarak) ve (b) TopluIceAktarici ile (tek süreç ve süreç havuzu) boş bir
+repository'ye aktarır. Sonuç repository'lerinin aynı olduğu doğrulanır.
+Havuzun kazancı makinedeki çekirdek sayısına bağlıdır.
+
+Çalıştırma: python benchmarks/ice_aktarim_benchmark.py [oturum_sayisi] [bicim]
+"""
+import sys
+import os
+import random
+import tempfile
+import timeit
+import json
+import csv
+from datetime import datetime, timedelta
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+root_dir = os.path.dirname(current_dir)
+sys.path.insert(0, root_dir)
+
+from app.modules.module_2.implementations import (
+    IndividualTrainingSession, TeamTrainingSession, RehabTrainingSession, TrainingManager
+)
+from app.modules.module_2.repository import TrainingRepository
+from app.modules.module_2.exceptions import AntrenmanHatasi
+from app.modules.module_2.serilestirme import sozlukten_oturum_olustur
+from app.modules.module_2.disa_aktarim import CSV_SUTUNLARI, kayitlari_yaz
+from app.modules.module_2.ice_aktarim import TopluIceAktarici
+
+BASLANGIC = datetime(2024, 1, 1, 8, 0)
+# CSV'de metin gelen sayısal alanlar (eski yöntemin çevirmesi gerekir)
+SAYISAL = {"oturum_id": int, "sure": int, "athlete_id": int, "team_id": int, "antrenor_id": int, "saha_id": int,
+           "katilimci_sayisi": int, "fizyoterapist_id": int, "performans_notu": float, "ilerleme_notu": float}
+
+
+def _satirlar(oturum_sayisi: int) -> list:
+    rastgele = random.Random(42)
+    satirlar = []
+    for oturum_id in range(1, oturum_sayisi + 1):
+        tarih = BASLANGIC + timedelta(minutes=10 * oturum_id)
+        secim = rastgele.random()
+        if secim < 0.5:
+            oturum = IndividualTrainingSession(oturum_id, rastgele.randint(30, 180), rastgele.randint(1, 5000),
+                                               rastgele.randint(1, 50), tarih_saat=tarih,
+                                               performans_notu=round(rastgele.uniform(0, 10), 1))
+        elif secim < 0.8:
+            oturum = TeamTrainingSession(oturum_id, rastgele.randint(30, 180), rastgele.randint(1, 100),
+                                         rastgele.randint(1, 5), rastgele.randint(2, 30), tarih_saat=tarih)
+        else:
+            oturum = RehabTrainingSession(oturum_id, rastgele.randint(30, 180), rastgele.randint(1, 5000),
+                                          rastgele.randint(1, 20), "kas", tarih_saat=tarih)
+        satir = oturum.oturum_detaylari_getir()
+        if rastgele.random() < 0.01:
+            satir.update(sure=0, durum="bilinmiyor")
+        satirlar.append(satir)
+    return satirlar
+
+
+# Eski yöntem: her satır kurucuyla oluşturulup tek tek eklenir (durmamak için hatalar yakalanır)
+def _eski_yontem(yol: str, bicim: str) -> TrainingRepository:
+    repo = TrainingRepository()
+    manager = TrainingManager(repo)
+    with open(yol, encoding="utf-8", newline="") as dosya:
+        if bicim == "jsonl":
+            satirlar = map(json.loads, dosya)
+        else:
+            satirlar = ({alan: SAYISAL[alan](deger) if alan in SAYISAL else deger
+                         for alan, deger in satir.items() if deger != ""} for satir in csv.DictReader(dosya))
+        for satir in satirlar:
+            try:
+                manager.oturum_olustur(sozlukten_oturum_olustur(satir))
+            except (AntrenmanHatasi, ValueError):
+                pass
+    return repo
+
+
+def _yeni_yontem(yol: str, isci_sayisi: int) -> TrainingRepository:
+    repo = TrainingRepository()
+    TopluIceAktarici(TrainingManager(repo), isci_sayisi=isci_sayisi).ice_aktar(yol)
+    return repo
+
+
+def _icerik(repo: TrainingRepository) -> list:
+    return sorted((oturum.oturum_detaylari_getir() for oturum in repo.tumunu_listele()),
+                  key=lambda satir: satir["oturum_id"])
+
+
+def _en_iyi(fonksiyon, tekrar: int = 3) -> float:
+    return min(timeit.repeat(fonksiyon, number=1, repeat=tekrar))
+
+
+def main(oturum_sayisi: int = 100_000, bicim: str = "jsonl") -> None:
+    isci_sayisi = os.cpu_count() or 1
+    with tempfile.TemporaryDirectory() as klasor:
+        yol = os.path.join(klasor, f"oturumlar.{bicim}")
+        kayitlari_yaz(_satirlar(oturum_sayisi), yol, bicim, sutunlar=CSV_SUTUNLARI)
+
+        sure_eski = _en_iyi(lambda: _eski_yontem(yol, bicim), tekrar=1)
+        sure_tek = _en_iyi(lambda: _yeni_yontem(yol, 1))
+        sure_havuz = _en_iyi(lambda: _yeni_yontem(yol, isci_sayisi))
+        assert _icerik(_eski_yontem(yol, bicim)) == _icerik(_yeni_yontem(yol, 1)) == _icerik(_yeni_yontem(yol, 2))
+        rapor = TopluIceAktarici(TrainingManager(TrainingRepository()), isci_sayisi=1).ice_aktar(yol)
+
+    print(f"Oturum sayısı: {oturum_sayisi}, biçim: {bicim}, CPU: {isci_sayisi}")
+    print(f"Rapor: {rapor.ozet()}")
+    print(f"{'Satır başına kurucu + ekleme':<34}{sure_eski:>8.2f} s  {oturum_sayisi / sure_eski:>9.0f} satır/s")
+    print(f"{'TopluIceAktarici (1 süreç)':<34}{sure_tek:>8.2f} s  {oturum_sayisi / sure_tek:>9.0f} satır/s  "
+          f"({sure_eski / sure_tek:.1f}x)")
+    print(f"{f'TopluIceAktarici ({isci_sayisi} işçi)':<34}{sure_havuz:>8.2f} s  "
+          f"{oturum_sayisi / sure_havuz:>9.0f} satır/s  ({sure_eski / sure_havuz:.1f}x)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000,
+         sys.argv[2] if len(sys.argv) > 2 else "jsonl")
@@ -0,0 +1,63 @@
+"""
+TrainingRepository ikincil indeks benchmark'ı.
+Sporcu ve takım filtrelerinin tam tarama ile indeksli sürümünü yan yana ölçer.
+
+Çalıştırma: python benchmarks/indeks_benchmark.py [oturum_sayisi]
+"""
+import sys
+import os
+import random
+import time
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+root_dir = os.path.dirname(current_dir)
+sys.path.insert(0, root_dir)
+
+from app.modules.module_2.implementations import IndividualTrainingSession, TeamTrainingSession
+from app.modules.module_2.repository import TrainingRepository
+
+
+# Eski tam tarama davranışı (karşılaştırma için)
+def tarama_ile_filtrele(repo: TrainingRepository, alan: str, deger: int) -> list:
+    return [o for o in repo._storage.values() if getattr(o, alan, None) == deger]
+
+
+# Verilen fonksiyonu sorgu listesi üzerinde çalıştırıp sorgu başına süreyi döndürür
+def olc(fonksiyon, sorgular) -> float:
+    baslangic = time.perf_counter()
+    for sorgu in sorgular:
+        fonksiyon(sorgu)
+    return (time.perf_counter() - baslangic) / len(sorgular)
+
+
+def main(oturum_sayisi: int = 200_000, sorgu_sayisi: int = 200) -> None:
+    rastgele = random.Random(42)
+    sporcu_sayisi = max(1, oturum_sayisi // 50)
+    takim_sayisi = max(1, oturum_sayisi // 500)
+
+    repo = TrainingRepository()
+    for oturum_id in range(1, oturum_sayisi + 1):
+        if oturum_id % 4 == 0:
+            oturum = TeamTrainingSession(oturum_id, 90, rastgele.randint(1, takim_sayisi), rastgele.randint(1, 5), 15)
+        else:
+            oturum = IndividualTrainingSession(oturum_id, 60, rastgele.randint(1, sporcu_sayisi), 1)
+        repo.kaydet(oturum)
+
+    sporcu_sorgulari = [rastgele.randint(1, sporcu_sayisi) for _ in range(sorgu_sayisi)]
+    takim_sorgulari = [rastgele.randint(1, takim_sayisi) for _ in range(sorgu_sayisi)]
+
+    print(f"Oturum sayısı: {oturum_sayisi}, sorgu sayısı: {sorgu_sayisi}")
+    print(f"{'Filtre':<24} {'Tarama (ms)':>12} {'İndeks (ms)':>12} {'Hızlanma':>10}")
+    print("-" * 60)
+
+    for ad, alan, metot, sorgular in [
+        ("sporcuya_gore_filtrele", "athlete_id", repo.sporcuya_gore_filtrele, sporcu_sorgulari),
+        ("takima_gore_filtrele", "team_id", repo.takima_gore_filtrele, takim_sorgulari),
+    ]:
+        tarama = olc(lambda d: tarama_ile_filtrele(repo, alan, d), sorgular)
+        indeks = olc(metot, sorgular)
+        print(f"{ad:<24} {tarama * 1000:>12.3f} {indeks * 1000:>12.4f} {tarama / indeks:>9.0f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
@@ -0,0 +1,72 @@
+"""
+Kalıcı repository açılış süresi benchmark'ı.
+Her oturumun birkaç kez yeniden planlandığı (guncelle) aynı geçmiş için
+(a) tüm günlüğün oynatılması ile (b) snapshot + kısa günlük kuyruğunun
+yüklenmesini karşılaştırır; ayrıca işlem başına yazma süresini ölçer.
+
+Çalıştırma: python benchmarks/kalicilik_benchmark.py [oturum_sayisi] [kuyruk_uzunlugu] [oturum_basina_guncelleme]
+"""
+import sys
+import os
+import random
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+root_dir = os.path.dirname(current_dir)
+sys.path.insert(0, root_dir)
+
+from app.modules.module_2.implementations import IndividualTrainingSession, TeamTrainingSession
+from app.modules.module_2.kalici_repository import KaliciTrainingRepository
+
+BASLANGIC = datetime(2025, 1, 1)
+SINIRSIZ = 10 ** 12
+
+
+def _oturum(rastgele: random.Random, oturum_id: int):
+    tarih = BASLANGIC + timedelta(days=rastgele.randrange(365), minutes=15 * rastgele.randrange(96))
+    if oturum_id % 5 == 0:
+        return TeamTrainingSession(oturum_id, 90, 1, rastgele.randint(1, 5), 15, tarih_saat=tarih)
+    return IndividualTrainingSession(oturum_id, 60, rastgele.randint(1, 1000), 1, tarih_saat=tarih)
+
+
+def _doldur(klasor: str, oturum_sayisi: int, kuyruk: int, guncelleme: int, snapshot: bool) -> float:
+    rastgele = random.Random(42)
+    islem_sayisi = oturum_sayisi * (1 + guncelleme)
+    t0 = time.perf_counter()
+    with KaliciTrainingRepository(klasor, snapshot_esigi=SINIRSIZ) as repo:
+        for islem_no in range(islem_sayisi):
+            if snapshot and islem_no == islem_sayisi - kuyruk:
+                repo.snapshot_al()
+            if islem_no < oturum_sayisi:
+                repo.kaydet(_oturum(rastgele, islem_no + 1))
+            else:
+                oturum = repo.id_ile_bul(rastgele.randint(1, oturum_sayisi))
+                oturum.oturum_planla(BASLANGIC + timedelta(days=rastgele.randrange(365), hours=8))
+                repo.guncelle(oturum)
+    return (time.perf_counter() - t0) / islem_sayisi
+
+
+def _acilis_suresi(klasor: str) -> float:
+    t0 = time.perf_counter()
+    with KaliciTrainingRepository(klasor, snapshot_esigi=SINIRSIZ):
+        pass
+    return time.perf_counter() - t0
+
+
+def main(oturum_sayisi: int = 50_000, kuyruk: int = 1_000, guncelleme: int = 4) -> None:
+    with tempfile.TemporaryDirectory() as sadece_gunluk, tempfile.TemporaryDirectory() as snapshotli:
+        yazma = _doldur(sadece_gunluk, oturum_sayisi, kuyruk, guncelleme, snapshot=False)
+        _doldur(snapshotli, oturum_sayisi, kuyruk, guncelleme, snapshot=True)
+
+        print(f"Oturum sayısı: {oturum_sayisi}, toplam işlem: {oturum_sayisi * (1 + guncelleme)}, günlük kuyruğu: {kuyruk}")
+        print(f"Yazma (işlem başına, fsync yok): {yazma * 1e6:.1f} µs")
+        print(f"Açılış - tüm günlük:            {_acilis_suresi(sadece_gunluk):.3f} s")
+        print(f"Açılış - snapshot + kuyruk:     {_acilis_suresi(snapshotli):.3f} s")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50_000,
+         int(sys.argv[2]) if len(sys.argv) > 2 else 1_000,
+         int(sys.argv[3]) if len(sys.argv) > 3 else 4)
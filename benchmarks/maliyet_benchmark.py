@@ -0,0 +1,99 @@
+"""
+Vektörel maliyet motoru benchmark'ı.
+Tüm oturumların toplam maliyetini ve takım, antrenör, fizyoterapist, ay ve
+tip gruplarını (a) her oturumda oturum_maliyeti_hesapla çağırıp sözlüklerde
+toplayarak ve (b) MaliyetMotoru ile (sütun çıkarma dahil) hesaplayıp
+süreleri karşılaştırır. Sonuçların birebir aynı olduğu doğrulanır.
+
+Çalıştırma: python benchmarks/maliyet_benchmark.py [oturum_sayisi]
+"""
+import sys
+import os
+import random
+import timeit
+from datetime import datetime, timedelta
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+root_dir = os.path.dirname(current_dir)
+sys.path.insert(0, root_dir)
+
+from app.modules.module_2.implementations import (
+    IndividualTrainingSession, TeamTrainingSession, RehabTrainingSession
+)
+from app.modules.module_2.maliyet import MaliyetMotoru
+
+BASLANGIC = datetime(2024, 1, 1, 8, 0)
+GRUPLAR = ("takim", "antrenor", "fizyoterapist", "ay", "tip")
+
+
+def _oturumlar(oturum_sayisi: int) -> list:
+    rastgele = random.Random(42)
+    oturumlar = []
+    for oturum_id in range(1, oturum_sayisi + 1):
+        sure = rastgele.randint(30, 180)
+        tarih = BASLANGIC + timedelta(hours=rastgele.randrange(2 * 365 * 24))
+        secim = rastgele.random()
+        if secim < 0.5:
+            oturumlar.append(IndividualTrainingSession(
+                oturum_id, sure, rastgele.randint(1, 2000), rastgele.randint(1, 50),
+                odak_alani=rastgele.choice(["koordinasyon", "hız", "güç"]), tarih_saat=tarih))
+        elif secim < 0.8:
+            oturumlar.append(TeamTrainingSession(
+                oturum_id, sure, rastgele.randint(1, 100), rastgele.randint(1, 5), rastgele.randint(2, 30),
+                antrenman_plani=rastgele.choice(["maç_hazırlığı", "taktik", "teknik"]), tarih_saat=tarih))
+        else:
+            oturumlar.append(RehabTrainingSession(
+                oturum_id, sure, rastgele.randint(1, 2000), rastgele.randint(1, 20),
+                sakatlik_tipi=rastgele.choice(["kırık", "yırtık", "burkulma"]), tarih_saat=tarih))
+    return oturumlar
+
+
+# Eski yöntem: her oturum için maliyet metodu, her grup için sözlükte kuruş toplamı
+def _nesne_tabanli(oturumlar: list) -> dict:
+    anahtarlar = {
+        "takim": lambda o: o.team_id,
+        "antrenor": lambda o: getattr(o, "antrenor_id", None),
+        "fizyoterapist": lambda o: getattr(o, "fizyoterapist_id", None),
+        "ay": lambda o: (o.tarih_saat.year, o.tarih_saat.month),
+        "tip": lambda o: o.oturum_tipi,
+    }
+    kuruslar = [round(oturum.oturum_maliyeti_hesapla() * 100) for oturum in oturumlar]
+    sonuc = {}
+    for grup, anahtar_fonksiyonu in anahtarlar.items():
+        toplamlar = {}
+        for oturum, kurus in zip(oturumlar, kuruslar):
+            anahtar = anahtar_fonksiyonu(oturum)
+            toplamlar[anahtar] = toplamlar.get(anahtar, 0) + kurus
+        sonuc[grup] = {anahtar: kurus / 100 for anahtar, kurus in toplamlar.items()}
+    return sonuc
+
+
+def _motor(oturumlar: list) -> dict:
+    motor = MaliyetMotoru(oturumlar)
+    return {grup: motor.grupla(grup) for grup in GRUPLAR}
+
+
+def _en_iyi(fonksiyon, tekrar: int = 5) -> float:
+    return min(timeit.repeat(fonksiyon, number=1, repeat=tekrar))
+
+
+def main(oturum_sayisi: int = 300_000) -> None:
+    oturumlar = _oturumlar(oturum_sayisi)
+    motor = MaliyetMotoru(oturumlar)
+    assert motor.maliyetler().tolist() == [oturum.oturum_maliyeti_hesapla() for oturum in oturumlar]
+    assert _motor(oturumlar) == _nesne_tabanli(oturumlar)
+
+    sure_nesne = _en_iyi(lambda: _nesne_tabanli(oturumlar))
+    sure_motor = _en_iyi(lambda: _motor(oturumlar))
+    sure_yalniz_maliyet = _en_iyi(lambda: MaliyetMotoru(oturumlar).toplam())
+    # Sütunlar ve grup kodları çıkarıldıktan sonra yeniden gruplama yalnızca bincount'tur
+    sure_hazir = _en_iyi(lambda: {grup: motor.grupla(grup) for grup in GRUPLAR})
+    print(f"Oturum sayısı: {oturum_sayisi}, gruplar: {', '.join(GRUPLAR)}")
+    print(f"{'Nesne metotları + sözlük':<32}{sure_nesne * 1e3:>10.1f} ms")
+    print(f"{'MaliyetMotoru (5 gruplama)':<32}{sure_motor * 1e3:>10.1f} ms  ({sure_nesne / sure_motor:.1f}x)")
+    print(f"{'MaliyetMotoru (yalnız toplam)':<32}{sure_yalniz_maliyet * 1e3:>10.1f} ms")
+    print(f"{'Hazır motorda 5 gruplama':<32}{sure_hazir * 1e3:>10.1f} ms")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 300_000)
@@ -0,0 +1,67 @@
+"""
+Müsaitlik motoru benchmark'ı.
+Dolu bir repository üzerinde, araya yeni kayıtlar girerek (önbellek
+geçersizleşmesi dahil) boş zaman sorgusu başına süreyi ölçer.
+
+Çalıştırma: python benchmarks/musaitlik_benchmark.py [oturum_sayisi]
+"""
+import sys
+import os
+import random
+import time
+from datetime import datetime, timedelta
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+root_dir = os.path.dirname(current_dir)
+sys.path.insert(0, root_dir)
+
+from app.modules.module_2.implementations import IndividualTrainingSession, TeamTrainingSession
+from app.modules.module_2.repository import TrainingRepository
+from app.modules.module_2.musaitlik import MusaitlikMotoru
+
+BASLANGIC = datetime(2025, 1, 1)
+
+
+def main(oturum_sayisi: int = 100_000, sorgu_sayisi: int = 5000) -> None:
+    rastgele = random.Random(42)
+    sporcu_sayisi = max(1, oturum_sayisi // 100)
+    gun_sayisi = 365
+
+    repo = TrainingRepository()
+    for oturum_id in range(1, oturum_sayisi + 1):
+        tarih = BASLANGIC + timedelta(days=rastgele.randrange(gun_sayisi), minutes=15 * rastgele.randrange(96))
+        if oturum_id % 5 == 0:
+            oturum = TeamTrainingSession(oturum_id, 90, 1, rastgele.randint(1, 5), 15, tarih_saat=tarih)
+        else:
+            oturum = IndividualTrainingSession(oturum_id, 60, rastgele.randint(1, sporcu_sayisi), 1, tarih_saat=tarih)
+        repo.kaydet(oturum)
+
+    motor = MusaitlikMotoru(repo)
+    sonraki_id = oturum_sayisi + 1
+    sureler = []
+
+    for sorgu_no in range(sorgu_sayisi):
+        baslangic = BASLANGIC + timedelta(days=rastgele.randrange(gun_sayisi - 7), hours=8)
+        athlete_id = rastgele.randint(1, sporcu_sayisi)
+        saha_id = rastgele.randint(1, 5)
+
+        t0 = time.perf_counter()
+        slotlar = motor.bos_zamanlari_bul(90, baslangic, baslangic + timedelta(days=7),
+                                          athlete_id=athlete_id, saha_id=saha_id, adet=5)
+        sureler.append(time.perf_counter() - t0)
+
+        # Planlama akışını taklit et: her 10 sorguda bir bulunan ilk zamana kayıt yap
+        if slotlar and sorgu_no % 10 == 0:
+            repo.kaydet(IndividualTrainingSession(sonraki_id, 90, athlete_id, 1, tarih_saat=slotlar[0][0]))
+            sonraki_id += 1
+
+    sureler.sort()
+    print(f"Oturum sayısı: {oturum_sayisi}, sorgu sayısı: {sorgu_sayisi} (7 günlük pencere, sporcu + saha)")
+    print(f"Ortalama: {sum(sureler) / len(sureler) * 1e6:.1f} µs")
+    print(f"p50:      {sureler[len(sureler) // 2] * 1e6:.1f} µs")
+    print(f"p99:      {sureler[int(len(sureler) * 0.99)] * 1e6:.1f} µs")
+    print(f"En kötü:  {sureler[-1] * 1e6:.1f} µs")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
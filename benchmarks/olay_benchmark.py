@@ -0,0 +1,64 @@
+"""
+TrainingManager olay dinleyicileri benchmark'ı.
+Aynı oturumları oturum_olustur ile (a) yazıcı dinleyiciyle (eski print
+davranışı; çıktı bir dosyaya gider), (b) dinleyicisiz (varsayılan, sessiz) ve
+(c) metrik toplayıcıyla oluşturma sürelerini karşılaştırır.
+
+Çalıştırma: python benchmarks/olay_benchmark.py [oturum_sayisi]
+"""
+import sys
+import os
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+root_dir = os.path.dirname(current_dir)
+sys.path.insert(0, root_dir)
+
+from app.modules.module_2.implementations import IndividualTrainingSession, TrainingManager
+from app.modules.module_2.repository import TrainingRepository
+from app.modules.module_2.olaylar import MetrikToplayici, YaziciDinleyici
+
+BASLANGIC = datetime(2025, 1, 1)
+
+
+def _oturumlar(oturum_sayisi: int) -> list:
+    return [
+        IndividualTrainingSession(oturum_id, 60, oturum_id % 1000 + 1, 5,
+                                  tarih_saat=BASLANGIC + timedelta(hours=2 * (oturum_id // 1000)))
+        for oturum_id in range(1, oturum_sayisi + 1)
+    ]
+
+
+def _olustur(dinleyiciler: list, oturum_sayisi: int) -> float:
+    oturumlar = _oturumlar(oturum_sayisi)
+    manager = TrainingManager(TrainingRepository(), dinleyiciler=dinleyiciler)
+    t0 = time.perf_counter()
+    for oturum in oturumlar:
+        manager.oturum_olustur(oturum)
+    return time.perf_counter() - t0
+
+
+def _sure(dinleyiciler: list, oturum_sayisi: int, tekrar: int = 3) -> float:
+    # Gürültüyü azaltmak için en iyi tekrar alınır
+    return min(_olustur(dinleyiciler, oturum_sayisi) for _ in range(tekrar))
+
+
+def main(oturum_sayisi: int = 100_000) -> None:
+    with tempfile.TemporaryFile("w") as dosya:
+        yazici = _sure([YaziciDinleyici(dosya)], oturum_sayisi)
+    sessiz = _sure([], oturum_sayisi)
+    metrik_toplayici = MetrikToplayici()
+    metrik = _sure([metrik_toplayici], oturum_sayisi)
+
+    print(f"Oturum sayısı: {oturum_sayisi}")
+    print(f"{'Yazıcı (eski print)':<24}{yazici:>8.3f}s")
+    print(f"{'Sessiz (varsayılan)':<24}{sessiz:>8.3f}s{yazici / sessiz:>7.2f}x")
+    print(f"{'Metrik toplayıcı':<24}{metrik:>8.3f}s{yazici / metrik:>7.2f}x")
+    print(f"oturum_olustur p50 ≤ {metrik_toplayici.yuzdelik('olusturuldu', 0.5) * 1e6:.0f} µs, "
+          f"p99 ≤ {metrik_toplayici.yuzdelik('olusturuldu', 0.99) * 1e6:.0f} µs")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
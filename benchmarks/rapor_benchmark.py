@@ -0,0 +1,118 @@
+"""
+Toplu sporcu raporu benchmark'ı.
+Her sporcunun bireysel antrenman raporlarını (a) eski yöntemle (sporcu başına
+tüm oturumları tarayıp += ile birleştirme) ve (b) BireyselRaporUretici ile
+(indeksten gruplama, list-join, tek süreç ve süreç havuzu) bir zip arşivine
+yazar ve süreleri karşılaştırır. Arşiv içerikleri karşılaştırılarak
+doğrulanır. Havuzun kazancı makinedeki çekirdek sayısına bağlıdır.
+
+Çalıştırma: python benchmarks/rapor_benchmark.py [oturum_sayisi] [sporcu_sayisi]
+"""
+import sys
+import os
+import random
+import tempfile
+import timeit
+import zipfile
+from datetime import datetime, timedelta
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+root_dir = os.path.dirname(current_dir)
+sys.path.insert(0, root_dir)
+
+from app.modules.module_2.implementations import IndividualTrainingSession
+from app.modules.module_2.repository import TrainingRepository
+from app.modules.module_2.raporlama import BireyselRaporUretici
+
+BASLANGIC = datetime(2024, 1, 1, 8, 0)
+
+
+def _repository(oturum_sayisi: int, sporcu_sayisi: int) -> TrainingRepository:
+    rastgele = random.Random(42)
+    oturumlar = []
+    for oturum_id in range(1, oturum_sayisi + 1):
+        oturum = IndividualTrainingSession(
+            oturum_id, rastgele.randint(30, 180), rastgele.randint(1, sporcu_sayisi), rastgele.randint(1, 50),
+            odak_alani=rastgele.choice(["koordinasyon", "hız", "güç"]),
+            tarih_saat=BASLANGIC + timedelta(hours=rastgele.randrange(2 * 365 * 24)))
+        if rastgele.random() < 0.7:
+            oturum.performans_notu_guncelle(round(rastgele.uniform(0, 10), 1))
+        oturumlar.append(oturum)
+    repo = TrainingRepository()
+    repo.kaydet_toplu(oturumlar)
+    return repo
+
+
+# Eski bireysel_rapor_olustur: metin her satırda += ile yeniden kopyalanır
+def _eski_rapor(oturum: IndividualTrainingSession) -> str:
+    rapor = f"=== BİREYSEL ANTRENMAN RAPORU ===\n"
+    rapor += f"Oturum ID: {oturum.oturum_id}\n"
+    rapor += f"Sporcu ID: {oturum.athlete_id}\n"
+    rapor += f"Antrenör ID: {oturum.antrenor_id}\n"
+    rapor += f"Odak Alanı: {oturum.odak_alani.upper()}\n"
+    rapor += f"Oturum Tipi: {oturum.oturum_tipi.upper()}\n"
+    rapor += f"Süre: {oturum.sure} dakika ({oturum.sure // 60} saat {oturum.sure % 60} dakika)\n"
+    if oturum.tarih_saat:
+        rapor += f"Tarih/Saat: {oturum.tarih_saat.strftime('%d.%m.%Y %H:%M')}\n"
+    rapor += f"Durum: {oturum.durum.upper()}\n"
+    if oturum.performans_notu is not None:
+        rapor += f"Performans Notu: {oturum.performans_notu}/10\n"
+        if oturum.performans_notu >= 8:
+            rapor += "Değerlendirme: Mükemmel performans!\n"
+        elif oturum.performans_notu >= 6:
+            rapor += "Değerlendirme: İyi performans.\n"
+        else:
+            rapor += "Değerlendirme: Geliştirilmesi gereken alanlar var.\n"
+    else:
+        rapor += "Performans Notu: Henüz değerlendirilmedi\n"
+    rapor += f"Tahmini Maliyet: {oturum.oturum_maliyeti_hesapla()} TL\n"
+    rapor += "=" * 35
+    return rapor
+
+
+# Eski yöntem: her sporcu için tüm oturumlar taranır, raporlar += ile birleştirilir
+def _eski_yontem(repo: TrainingRepository, arsiv_yolu: str) -> None:
+    oturumlar = repo.tumunu_listele()
+    sporcular = sorted({oturum.athlete_id for oturum in oturumlar})
+    with zipfile.ZipFile(arsiv_yolu, "w", compression=zipfile.ZIP_DEFLATED) as arsiv:
+        for athlete_id in sporcular:
+            sporcunun = [oturum for oturum in oturumlar if oturum.athlete_id == athlete_id]
+            sporcunun.sort(key=lambda o: (o.tarih_saat is None, o.tarih_saat or datetime.min, o.oturum_id))
+            metin = f"##### SPORCU {athlete_id} - BİREYSEL ANTRENMAN RAPORLARI ({len(sporcunun)} oturum) #####"
+            for oturum in sporcunun:
+                metin += "\n\n" + _eski_rapor(oturum)
+            arsiv.writestr(BireyselRaporUretici.dosya_adi(athlete_id), (metin + "\n").encode("utf-8"))
+
+
+def _arsiv_icerigi(arsiv_yolu: str) -> dict:
+    with zipfile.ZipFile(arsiv_yolu) as arsiv:
+        return {ad: arsiv.read(ad) for ad in arsiv.namelist()}
+
+
+def _en_iyi(fonksiyon, tekrar: int = 3) -> float:
+    return min(timeit.repeat(fonksiyon, number=1, repeat=tekrar))
+
+
+def main(oturum_sayisi: int = 200_000, sporcu_sayisi: int = 2_000) -> None:
+    repo = _repository(oturum_sayisi, sporcu_sayisi)
+    isci_sayisi = os.cpu_count() or 1
+    with tempfile.TemporaryDirectory() as klasor:
+        eski_yol = os.path.join(klasor, "eski.zip")
+        yeni_yol = os.path.join(klasor, "yeni.zip")
+        havuz_yol = os.path.join(klasor, "havuz.zip")
+
+        sure_eski = _en_iyi(lambda: _eski_yontem(repo, eski_yol), tekrar=1)
+        sure_tek = _en_iyi(lambda: BireyselRaporUretici(repo, isci_sayisi=1).arsive_yaz(yeni_yol))
+        sure_havuz = _en_iyi(lambda: BireyselRaporUretici(repo, isci_sayisi=isci_sayisi).arsive_yaz(havuz_yol))
+        assert _arsiv_icerigi(eski_yol) == _arsiv_icerigi(yeni_yol) == _arsiv_icerigi(havuz_yol)
+
+    print(f"Oturum sayısı: {oturum_sayisi}, sporcu sayısı: {sporcu_sayisi}, CPU: {isci_sayisi}")
+    print(f"{'Tarama + += birleştirme':<34}{sure_eski * 1e3:>10.1f} ms")
+    print(f"{'BireyselRaporUretici (1 süreç)':<34}{sure_tek * 1e3:>10.1f} ms  ({sure_eski / sure_tek:.1f}x)")
+    print(f"{f'BireyselRaporUretici ({isci_sayisi} işçi)':<34}{sure_havuz * 1e3:>10.1f} ms  "
+          f"({sure_eski / sure_havuz:.1f}x)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000,
+         int(sys.argv[2]) if len(sys.argv) > 2 else 2_000)
@@ -0,0 +1,85 @@
+"""
+Birleştirilebilir sorgu API'si benchmark'ı.
+Çok koşullu sorguları (a) tüm oturumları tarayarak, (b) eski filtre
+metotlarını zincirleyip liste üreteçleriyle süzerek ve (c) en seçici
+indeksten başlayan repository.sorgu() ile çalıştırıp süreleri karşılaştırır.
+
+Çalıştırma: python benchmarks/sorgu_benchmark.py [oturum_sayisi]
+Hızlanma sütunu eski zincire göredir.
+"""
+import sys
+import os
+import random
+import timeit
+from datetime import datetime, timedelta
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+root_dir = os.path.dirname(current_dir)
+sys.path.insert(0, root_dir)
+
+from app.modules.module_2.implementations import IndividualTrainingSession
+from app.modules.module_2.repository import TrainingRepository
+
+BASLANGIC = datetime(2024, 1, 1, 8, 0)
+SPORCU_SAYISI = 2_000
+
+
+def _repository(oturum_sayisi: int) -> TrainingRepository:
+    rastgele = random.Random(42)
+    repo = TrainingRepository()
+    repo.kaydet_toplu(
+        IndividualTrainingSession(
+            oturum_id, 60, rastgele.randint(1, SPORCU_SAYISI), 5,
+            oturum_tipi=rastgele.choice(["kondisyon", "teknik", "taktik"]),
+            tarih_saat=BASLANGIC + timedelta(hours=rastgele.randrange(2 * 365 * 24)),
+            durum=rastgele.choice(["planlandı", "tamamlandi", "iptal_edildi"]),
+        )
+        for oturum_id in range(1, oturum_sayisi + 1)
+    )
+    return repo
+
+
+def _en_iyi(fonksiyon, tekrar: int = 5) -> float:
+    sayi = 20
+    return min(timeit.repeat(fonksiyon, number=sayi, repeat=tekrar)) / sayi
+
+
+def _eski_zincir(repo, athlete_id, baslangic, bitis):
+    # Eski yöntem: iki filtrenin kesişimi, sonra tip/durum için liste üreteci
+    sporcunun = {o.oturum_id for o in repo.sporcuya_gore_filtrele(athlete_id)}
+    return [o for o in repo.tarih_araligina_gore_filtrele(baslangic, bitis)
+            if o.oturum_id in sporcunun and o.oturum_tipi == "kondisyon" and o.durum == "planlandı"]
+
+
+def main(oturum_sayisi: int = 200_000) -> None:
+    repo = _repository(oturum_sayisi)
+    mart_basi, mart_sonu = datetime(2025, 3, 1), datetime(2025, 3, 31, 23, 59)
+    gun_basi, gun_sonu = datetime(2025, 3, 10), datetime(2025, 3, 10, 23, 59)
+
+    senaryolar = [
+        ("Sporcu 42, planlı kondisyon, Mart",
+         lambda: [o for o in repo.tumunu_listele() if o.athlete_id == 42 and o.oturum_tipi == "kondisyon"
+                  and o.durum == "planlandı" and mart_basi <= o.tarih_saat <= mart_sonu],
+         lambda: _eski_zincir(repo, 42, mart_basi, mart_sonu),
+         lambda: repo.sorgu().sporcu(42).tip("kondisyon").durum("planlandı")
+                     .tarih_araligi(mart_basi, mart_sonu).sirala("tarih_saat")),
+        ("Tüm planlı teknik, tek gün",
+         lambda: [o for o in repo.tumunu_listele() if o.oturum_tipi == "teknik" and o.durum == "planlandı"
+                  and gun_basi <= o.tarih_saat <= gun_sonu],
+         lambda: [o for o in repo.tarih_araligina_gore_filtrele(gun_basi, gun_sonu)
+                  if o.oturum_tipi == "teknik" and o.durum == "planlandı"],
+         lambda: repo.sorgu().tip("teknik").durum("planlandı").tarih_araligi(gun_basi, gun_sonu)),
+    ]
+
+    print(f"Oturum sayısı: {oturum_sayisi}, sporcu sayısı: {SPORCU_SAYISI}")
+    print(f"{'Sorgu':<36}{'Tarama':>11}{'Eski zincir':>13}{'sorgu()':>11}{'Hızlanma':>10}  Plan (sürücü, aday)")
+    for ad, tarama, zincir, sorgu in senaryolar:
+        assert sorted(o.oturum_id for o in tarama()) == sorted(o.oturum_id for o in sorgu())
+        sure_tarama, sure_zincir = _en_iyi(tarama, 3), _en_iyi(zincir)
+        sure_sorgu = _en_iyi(lambda: sorgu().listele())
+        print(f"{ad:<36}{sure_tarama * 1e3:>9.2f}ms{sure_zincir * 1e3:>11.3f}ms{sure_sorgu * 1e3:>9.3f}ms"
+              f"{sure_zincir / sure_sorgu:>9.1f}x  {sorgu().plan()}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
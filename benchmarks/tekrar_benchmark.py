@@ -0,0 +1,86 @@
+"""
+Tekrarlayan program (program_olustur) benchmark'ı.
+N sporcu için haftalık bir şablonun 52 haftalık programını (a) eski yöntemle
+(her tekrar için deepcopy + tek tek oturum_olustur) ve (b) TekrarKurali ile
+prototip kopyalayıp tek toplu çakışma kontrolüyle oluşturma sürelerini karşılaştırır.
+
+Çalıştırma: python benchmarks/tekrar_benchmark.py [sporcu_sayisi] [hafta_sayisi]
+"""
+import sys
+import os
+import copy
+import time
+from contextlib import redirect_stdout
+from datetime import datetime, timedelta
+from io import StringIO
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+root_dir = os.path.dirname(current_dir)
+sys.path.insert(0, root_dir)
+
+from app.modules.module_2.implementations import IndividualTrainingSession, TrainingManager
+from app.modules.module_2.repository import TrainingRepository
+from app.modules.module_2.tekrar import TekrarKurali
+from app.modules.module_2.exceptions import AntrenmanHatasi
+
+BASLANGIC = datetime(2025, 1, 6, 9, 0)
+
+
+def _sablonlar(sporcu_sayisi: int) -> list:
+    # Sporcular gün içinde 8 saate yayılır; her birinin haftalık tek bir oturumu vardır
+    return [
+        IndividualTrainingSession(athlete_id, 60, athlete_id, 5,
+                                  tarih_saat=BASLANGIC + timedelta(hours=athlete_id % 8))
+        for athlete_id in range(1, sporcu_sayisi + 1)
+    ]
+
+
+def _eski_yontem(sablonlar: list, hafta_sayisi: int) -> int:
+    repo = TrainingRepository()
+    manager = TrainingManager(repo)
+    oturum_id = 1
+    with redirect_stdout(StringIO()):
+        for sablon in sablonlar:
+            tarih = sablon.tarih_saat
+            for _ in range(hafta_sayisi):
+                yeni = copy.deepcopy(sablon)
+                yeni.oturum_id = oturum_id
+                yeni.tarih_saat = tarih
+                try:
+                    manager.oturum_olustur(yeni)
+                except AntrenmanHatasi as e:
+                    print(f"Hata: {oturum_id} ID'li periyodik oturum oluşturulamadı. Sebep: {e}")
+                tarih += timedelta(days=7)
+                oturum_id += 1
+    return len(repo.tumunu_listele())
+
+
+def _yeni_yontem(sablonlar: list, hafta_sayisi: int) -> int:
+    repo = TrainingRepository()
+    rapor = TrainingManager(repo).program_olustur(sablonlar, TekrarKurali(aralik=7, adet=hafta_sayisi), 1)
+    return len(rapor.eklenenler)
+
+
+def _sure(islem, *parametreler, tekrar: int = 3):
+    # Gürültüyü azaltmak için en iyi tekrar alınır
+    en_iyi, sonuc = float("inf"), None
+    for _ in range(tekrar):
+        t0 = time.perf_counter()
+        sonuc = islem(*parametreler)
+        en_iyi = min(en_iyi, time.perf_counter() - t0)
+    return en_iyi, sonuc
+
+
+def main(sporcu_sayisi: int = 500, hafta_sayisi: int = 52) -> None:
+    sablonlar = _sablonlar(sporcu_sayisi)
+    eski_sure, eski_adet = _sure(_eski_yontem, sablonlar, hafta_sayisi)
+    yeni_sure, yeni_adet = _sure(_yeni_yontem, sablonlar, hafta_sayisi)
+    assert eski_adet == yeni_adet, "İki yöntem farklı sayıda oturum oluşturdu"
+
+    print(f"Sporcu: {sporcu_sayisi}, hafta: {hafta_sayisi}, oluşturulan oturum: {yeni_adet}")
+    print(f"{'deepcopy + oturum_olustur':<28}{eski_sure:>9.3f}s")
+    print(f"{'program_olustur':<28}{yeni_sure:>9.3f}s{eski_sure / yeni_sure:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
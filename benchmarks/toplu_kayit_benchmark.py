@@ -0,0 +1,90 @@
+"""
+Toplu oturum kaydı (oturum_olustur_toplu) benchmark'ı.
+Dolu bir repository'ye aynı oturum listesini (a) tek tek oturum_olustur ile
+ve (b) tek sweep-line taramalı oturum_olustur_toplu ile ekleme sürelerini
+karşılaştırır; iki yolun aynı oturumları kabul ettiği de doğrulanır.
+
+Çalıştırma: python benchmarks/toplu_kayit_benchmark.py [mevcut_oturum] [toplu_boyutu]
+"""
+import sys
+import os
+import copy
+import random
+import time
+from datetime import datetime, timedelta
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+root_dir = os.path.dirname(current_dir)
+sys.path.insert(0, root_dir)
+
+from app.modules.module_2.implementations import IndividualTrainingSession, TeamTrainingSession, TrainingManager
+from app.modules.module_2.repository import TrainingRepository
+from app.modules.module_2.exceptions import AntrenmanHatasi
+
+BASLANGIC = datetime(2025, 1, 1)
+
+
+def _oturumlar(adet: int, ilk_id: int, tohum: int) -> list:
+    rastgele = random.Random(tohum)
+    oturumlar = []
+    for oturum_id in range(ilk_id, ilk_id + adet):
+        tarih = BASLANGIC + timedelta(minutes=30 * rastgele.randrange(17_000))
+        if rastgele.random() < 0.7:
+            oturumlar.append(IndividualTrainingSession(oturum_id, rastgele.choice([30, 60, 90]),
+                                                       rastgele.randint(1, 2_000), 5, tarih_saat=tarih))
+        else:
+            oturumlar.append(TeamTrainingSession(oturum_id, rastgele.choice([60, 120]), rastgele.randint(1, 50),
+                                                 rastgele.randint(1, 5), 15, tarih_saat=tarih))
+    return oturumlar
+
+
+def _dolu_repo(mevcut: list) -> TrainingRepository:
+    repo = TrainingRepository()
+    manager = TrainingManager(repo)
+    manager.oturum_olustur_toplu(copy.copy(o) for o in mevcut)
+    return repo
+
+
+def _tek_tek(repo: TrainingRepository, yeni: list) -> list:
+    manager = TrainingManager(repo)
+    for oturum in yeni:
+        try:
+            manager.oturum_olustur(oturum)
+        except AntrenmanHatasi:
+            pass
+    return sorted(o.oturum_id for o in repo.tumunu_listele())
+
+
+def _toplu(repo: TrainingRepository, yeni: list) -> list:
+    TrainingManager(repo).oturum_olustur_toplu(yeni)
+    return sorted(o.oturum_id for o in repo.tumunu_listele())
+
+
+def _sure(islem, mevcut: list, yeni: list, tekrar: int = 3):
+    # Gürültüyü azaltmak için en iyi tekrar alınır; repository kurulumu ölçüme dahil değildir
+    en_iyi, sonuc = float("inf"), None
+    for _ in range(tekrar):
+        repo = _dolu_repo(mevcut)
+        kopyalar = [copy.copy(o) for o in yeni]
+        t0 = time.perf_counter()
+        sonuc = islem(repo, kopyalar)
+        en_iyi = min(en_iyi, time.perf_counter() - t0)
+    return en_iyi, sonuc
+
+
+def main(mevcut_oturum: int = 100_000, toplu_boyutu: int = 20_000) -> None:
+    mevcut = _oturumlar(mevcut_oturum, 1, tohum=1)
+    yeni = _oturumlar(toplu_boyutu, mevcut_oturum + 1, tohum=2)
+
+    tek_tek_sure, tek_tek_sonuc = _sure(_tek_tek, mevcut, yeni)
+    toplu_sure, toplu_sonuc = _sure(_toplu, mevcut, yeni)
+    assert tek_tek_sonuc == toplu_sonuc, "Toplu ve tek tek ekleme farklı oturumları kabul etti"
+
+    print(f"Mevcut oturum: {mevcut_oturum}, toplu boyutu: {toplu_boyutu}, "
+          f"kabul edilen: {len(toplu_sonuc) - len(_dolu_repo(mevcut).tumunu_listele())}")
+    print(f"{'Tek tek oturum_olustur':<28}{tek_tek_sure:>9.3f}s")
+    print(f"{'oturum_olustur_toplu':<28}{toplu_sure:>9.3f}s{tek_tek_sure / toplu_sure:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
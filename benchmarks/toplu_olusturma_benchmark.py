@@ -0,0 +1,80 @@
+"""
+Toplu oluşturma (satirlardan_olustur) benchmark'ı.
+Aynı satırlardan oturum ve lig maçı nesnelerini (a) normal kurucularla,
+(b) sütun bazlı doğrulamalı toplu yolla ve (c) güvenilir kaynak yoluyla
+(doğrulamasız) oluşturma sürelerini karşılaştırır.
+
+Çalıştırma: python benchmarks/toplu_olusturma_benchmark.py [satir_sayisi]
+"""
+import sys
+import os
+import random
+import time
+from datetime import datetime, timedelta
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+root_dir = os.path.dirname(current_dir)
+sys.path.insert(0, root_dir)
+
+from app.modules.module_2.implementations import (
+    IndividualTrainingSession,
+    TeamTrainingSession,
+    RehabTrainingSession
+)
+from app.modules.module_3.implementations import LigMaci
+
+BASLANGIC = datetime(2025, 1, 1)
+
+
+def _satirlar(sinif, satir_sayisi: int) -> list:
+    rastgele = random.Random(42)
+    satirlar = []
+    for oturum_id in range(1, satir_sayisi + 1):
+        satir = {
+            "oturum_id": oturum_id,
+            "sure": rastgele.randint(30, 120),
+            "tarih_saat": BASLANGIC + timedelta(minutes=15 * rastgele.randrange(35_000)),
+            "durum": rastgele.choice(["planlandı", "tamamlandi"]),
+        }
+        if sinif is IndividualTrainingSession:
+            satir.update(athlete_id=rastgele.randint(1, 1000), antrenor_id=rastgele.randint(1, 20),
+                         odak_alani=rastgele.choice(["hız", "güç"]), performans_notu=rastgele.choice([None, 7.5]))
+        elif sinif is TeamTrainingSession:
+            satir.update(team_id=rastgele.randint(1, 50), saha_id=rastgele.randint(1, 5),
+                         katilimci_sayisi=rastgele.randint(10, 25))
+        elif sinif is RehabTrainingSession:
+            satir.update(athlete_id=rastgele.randint(1, 1000), fizyoterapist_id=rastgele.randint(1, 10),
+                         sakatlik_tipi=rastgele.choice(["kas", "eklem"]), ilerleme_notu=rastgele.choice([None, 4.0]))
+        else:
+            satir = {
+                "mac_id": oturum_id, "ev_sahibi": f"Takım {rastgele.randint(1, 20)}", "deplasman": "Deplasman FK",
+                "tarih_saat": satir["tarih_saat"], "lig_adi": "Süper Lig", "hafta_no": rastgele.randint(1, 38),
+            }
+        satirlar.append(satir)
+    return satirlar
+
+
+def _sure(islem, tekrar: int = 3) -> float:
+    # Gürültüyü azaltmak için en iyi tekrar alınır
+    en_iyi = float("inf")
+    for _ in range(tekrar):
+        t0 = time.perf_counter()
+        islem()
+        en_iyi = min(en_iyi, time.perf_counter() - t0)
+    return en_iyi
+
+
+def main(satir_sayisi: int = 1_000_000) -> None:
+    print(f"Satır sayısı: {satir_sayisi} (sınıf başına)")
+    print(f"{'Sınıf':<28}{'Kurucu':>10}{'Doğrulamalı':>13}{'Güvenilir':>11}{'Hızlanma':>10}")
+    for sinif in (IndividualTrainingSession, TeamTrainingSession, RehabTrainingSession, LigMaci):
+        satirlar = _satirlar(sinif, satir_sayisi)
+        kurucu = _sure(lambda: [sinif(**satir) for satir in satirlar])
+        dogrulamali = _sure(lambda: sinif.satirlardan_olustur(satirlar))
+        guvenilir = _sure(lambda: sinif.satirlardan_olustur(satirlar, dogrula=False))
+        print(f"{sinif.__name__:<28}{kurucu:>9.2f}s{dogrulamali:>12.2f}s{guvenilir:>10.2f}s"
+              f"{kurucu / dogrulamali:>5.1f}x /{kurucu / guvenilir:>4.1f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,111 @@
+"""
+Akut:kronik yük oranı (ACWR) benchmark'ı.
+Tamamlanmış oturumlar için her sporcu ve her gün akut (7 gün) ve kronik
+(28 gün) yükü (a) gün başına sporcunun oturumlarını tarayan saf yöntemle
+ve (b) AkutKronikYukAnalizi'nin gün matrisli kümülatif toplamlarıyla
+hesaplar. Saf yöntem örnek sporcularda ölçülüp tüm sporculara oranlanır.
+Son olarak tek bir yeni oturumun eklenip değerlerin yeniden okunma süresi
+ölçülür.
+
+Çalıştırma: python benchmarks/yuk_analizi_benchmark.py [sporcu_sayisi] [yil] [haftalik_oturum]
+"""
+import sys
+import os
+import random
+import time
+from datetime import datetime, timedelta
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+root_dir = os.path.dirname(current_dir)
+sys.path.insert(0, root_dir)
+
+from app.modules.module_2.implementations import IndividualTrainingSession
+from app.modules.module_2.yuk_analizi import AkutKronikYukAnalizi, VARSAYILAN_TIP_AGIRLIKLARI
+
+BASLANGIC = datetime(2020, 1, 1, 8, 0)
+ORNEK_SPORCU = 5
+
+
+def _oturumlar(sporcu_sayisi: int, yil: int, haftalik_oturum: int) -> list:
+    rastgele = random.Random(42)
+    saat_sayisi = yil * 365 * 24
+    adet = sporcu_sayisi * yil * 52 * haftalik_oturum
+    return IndividualTrainingSession.satirlardan_olustur(
+        ({
+            "oturum_id": oturum_id,
+            "sure": rastgele.randint(30, 120),
+            "athlete_id": rastgele.randint(1, sporcu_sayisi),
+            "antrenor_id": 1,
+            "oturum_tipi": rastgele.choice(("kondisyon", "teknik", "taktik")),
+            "tarih_saat": BASLANGIC + timedelta(hours=rastgele.randrange(saat_sayisi)),
+            "durum": "tamamlandi" if rastgele.random() < 0.85 else "planlandı",
+        } for oturum_id in range(1, adet + 1)),
+        dogrula=False,
+    )
+
+
+# Saf yöntem: her gün için sporcunun tüm tamamlanmış oturumları taranır (O(gün x oturum))
+def _saf(oturumlar: list, gunler: list) -> list:
+    sonuc = []
+    for gun in gunler:
+        akut = kronik = 0.0
+        for oturum in oturumlar:
+            fark = (gun - oturum.tarih_saat.date()).days
+            if 0 <= fark < 28:
+                yuk = oturum.sure * VARSAYILAN_TIP_AGIRLIKLARI[oturum.oturum_tipi]
+                kronik += yuk
+                if fark < 7:
+                    akut += yuk
+        sonuc.append((akut / 7, kronik / 28))
+    return sonuc
+
+
+def main(sporcu_sayisi: int = 2_000, yil: int = 5, haftalik_oturum: int = 3) -> None:
+    t0 = time.perf_counter()
+    oturumlar = _oturumlar(sporcu_sayisi, yil, haftalik_oturum)
+    print(f"{len(oturumlar)} oturum, {sporcu_sayisi} sporcu, {yil} yıl "
+          f"(veri üretimi {time.perf_counter() - t0:.1f} s)")
+
+    t0 = time.perf_counter()
+    analiz = AkutKronikYukAnalizi()
+    analiz.oturumlari_ekle(oturumlar)
+    sure_ekleme = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    akut, kronik, _ = analiz.matrisler()
+    sure_hesap = time.perf_counter() - t0
+    gunler = analiz.gunler().astype(object).tolist()
+
+    # Saf yöntem birkaç sporcuda ölçülür ve sonuçları doğrulanır
+    sporcular = analiz.sporcular()
+    sporcu_oturumlari = {athlete_id: [] for athlete_id in sporcular[:ORNEK_SPORCU]}
+    for oturum in oturumlar:
+        if oturum.athlete_id in sporcu_oturumlari and oturum.durum == "tamamlandi":
+            sporcu_oturumlari[oturum.athlete_id].append(oturum)
+    t0 = time.perf_counter()
+    for satir, athlete_id in enumerate(sporcular[:ORNEK_SPORCU]):
+        beklenen = _saf(sporcu_oturumlari[athlete_id], gunler)
+        assert all(abs(a - akut[satir, gun]) < 1e-6 and abs(k - kronik[satir, gun]) < 1e-6
+                   for gun, (a, k) in enumerate(beklenen))
+    sure_saf = (time.perf_counter() - t0) / ORNEK_SPORCU * len(sporcular)
+
+    # Artımlı güncelleme: yeni tamamlanan tek oturum eklenir ve o günün değerleri okunur (en iyi 5 deneme)
+    son_gun = datetime.combine(gunler[-1], datetime.min.time())
+    sure_artimli = float("inf")
+    for sira in range(5):
+        yeni = IndividualTrainingSession(len(oturumlar) + 1 + sira, 60, sporcular[sira], 1,
+                                         tarih_saat=son_gun, durum="tamamlandi")
+        t0 = time.perf_counter()
+        analiz.oturum_ekle(yeni)
+        analiz.gun_degerleri(gunler[-1])
+        sure_artimli = min(sure_artimli, time.perf_counter() - t0)
+
+    print(f"{'Saf tarama (tahmini, tüm sporcular)':<40}{sure_saf:>10.1f} s")
+    print(f"{'Analiz: oturumları ekleme':<40}{sure_ekleme:>10.2f} s")
+    print(f"{'Analiz: akut/kronik/oran matrisleri':<40}{sure_hesap:>10.2f} s")
+    print(f"{'Tek oturum ekleme + gün değerleri':<40}{sure_artimli * 1e3:>10.2f} ms")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2_000,
+         int(sys.argv[2]) if len(sys.argv) > 2 else 5,
+         int(sys.argv[3]) if len(sys.argv) > 3 else 3)
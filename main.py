@@ -147,21 +147,20 @@ def entegre_gorunum():
     print("-" * 70)
     try:
         repo_2 = TrainingRepository()
-        antrenmanlar = repo_2.tumunu_listele()
-        if not antrenmanlar:
+        # Sayımlar repository'nin canlı durum sayaçlarından okunur (oturumlar taranmaz)
+        durum_sayilari = repo_2.durum_sayilari()
+        toplam = sum(durum_sayilari.values())
+        if not toplam:
             print("   Henüz antrenman kaydı bulunmuyor.")
         else:
-            print(f"   Toplam Antrenman: {len(antrenmanlar)}")
-            tamamlanan = sum(1 for a in antrenmanlar if a.durum == "tamamlandi")
-            planlanan = sum(1 for a in antrenmanlar if a.durum == "planlandı")
-            iptal = sum(1 for a in antrenmanlar if a.durum == "iptal_edildi")
-            print(f"   - Tamamlanan: {tamamlanan}")
-            print(f"   - Planlanan: {planlanan}")
-            print(f"   - İptal Edilen: {iptal}")
+            print(f"   Toplam Antrenman: {toplam}")
+            print(f"   - Tamamlanan: {durum_sayilari.get('tamamlandi', 0)}")
+            print(f"   - Planlanan: {durum_sayilari.get('planlandı', 0)}")
+            print(f"   - İptal Edilen: {durum_sayilari.get('iptal_edildi', 0)}")
             
             # Son 5 antrenmanı göster
             print("\n   Son Antrenmanlar:")
-            for i, ant in enumerate(antrenmanlar[-5:], 1):
+            for i, ant in enumerate(repo_2.tumunu_listele()[-5:], 1):
                 tarih_str = ant.tarih_saat.strftime('%Y-%m-%d %H:%M') if ant.tarih_saat else "Planlanmadı"
                 print(f"   {i}. ID:{ant.oturum_id} | {tarih_str} | {ant.oturum_tipi} | {ant.durum}")
     except Exception as e:
@@ -6,7 +6,20 @@ Kod değişikliklerinden sonra hızlıca doğrulama sağlar.
 import unittest
 import sys
 import os
-from datetime import datetime
+import asyncio
+import threading
+import time
+import copy
+import random
+import tempfile
+import zipfile
+import gzip
+import csv
+import json
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import redirect_stdout
+from io import StringIO
+from datetime import datetime, timedelta
 from typing import List
 
 # --- IMPORT AYARI ---
@@ -26,6 +39,20 @@ try:
         TrainingStatistics
     )
     from app.modules.module_2.repository import TrainingRepository
+    from app.modules.module_2.musaitlik import MusaitlikMotoru
+    from app.modules.module_2.sqlite_repository import SqliteTrainingRepository
+    from app.modules.module_2.kalici_repository import KaliciTrainingRepository
+    from app.modules.module_2.serilestirme import sozluklerden_oturumlar_olustur
+    from app.modules.module_2.tekrar import TekrarKurali, tekrarlayan_oturumlar
+    from app.modules.module_2.olaylar import MetrikToplayici, YaziciDinleyici
+    from app.modules.module_2.async_manager import AsyncTrainingManager
+    from app.modules.module_2.eszamanli_repository import EszamanliTrainingRepository
+    from app.modules.module_2.maliyet import MaliyetMotoru, np
+    from app.modules.module_2.yuk_analizi import AkutKronikYukAnalizi, AkutKronikYukDinleyici
+    from app.modules.module_2.performans_analizi import PerformansAnalizi, PerformansAnaliziDinleyici
+    from app.modules.module_2.raporlama import BireyselRaporUretici, sporcu_raporu_olustur
+    from app.modules.module_2.disa_aktarim import CSV_SUTUNLARI, kayitlari_yaz, oturumlari_disa_aktar
+    from app.modules.module_2.ice_aktarim import TopluIceAktarici, satiri_dogrula
     from app.modules.module_2.exceptions import (
         TakvimCakismasiHatasi,
         OturumBulunamadiHatasi,
@@ -35,7 +62,10 @@ try:
         GecersizSureHatasi,
         GecersizOturumTipiHatasi,
         GecersizOturumDurumuHatasi,
-        GecersizSahaIdHatasi
+        GecersizSahaIdHatasi,
+        GecersizTarihSaatHatasi,
+        SurumCakismasiHatasi,
+        AntrenmanHatasi
     )
 except ImportError as e:
     print(f"HATA: Modüller bulunamadı. Python Path: {sys.path}")
@@ -91,6 +121,25 @@ class TestBaseClass(unittest.TestCase):
         # Çakışma yok (10:00-11:00 ile 12:00-13:00)
         self.assertFalse(AntrenmanOturumuTemel.tarih_cakismasi_kontrol(tarih1, 60, tarih3, 60))
 
+    def test_slots_ve_deepcopy(self):
+        """Oturumlar __dict__ taşımaz, deepcopy tüm alanları bağımsız kopyalar."""
+        oturumlar = [
+            IndividualTrainingSession(1, 60, 101, 5, odak_alani="hız", performans_notu=7.5,
+                                      tarih_saat=datetime(2025, 6, 1, 10, 0)),
+            TeamTrainingSession(2, 90, 10, 3, 12, tarih_saat=datetime(2025, 6, 1, 10, 0)),
+            RehabTrainingSession(3, 45, 101, 7, "kas", ilerleme_notu=4.5),
+        ]
+        for oturum in oturumlar:
+            self.assertFalse(hasattr(oturum, "__dict__"))
+            with self.assertRaises(AttributeError):
+                oturum.tanimsiz_alan = 1
+
+            kopya = copy.deepcopy(oturum)
+            self.assertIsNot(kopya, oturum)
+            self.assertEqual(kopya.oturum_detaylari_getir(), oturum.oturum_detaylari_getir())
+            kopya.oturum_id = 99
+            self.assertNotEqual(oturum.oturum_id, 99)
+
 
 class TestIndividualTrainingSession(unittest.TestCase):
     """IndividualTrainingSession sınıfını test eder."""
@@ -387,7 +436,33 @@ class TestTrainingRepository(unittest.TestCase):
         sonuclar = self.repo.takima_gore_filtrele(10)
         self.assertEqual(len(sonuclar), 2)
         self.assertTrue(all(s.team_id == 10 for s in sonuclar))
-    
+
+    def test_sporcu_indeksi_guncelle_ve_sil(self):
+        """Sporcu indeksi guncelle ve sil ile güncel tutulur."""
+        session1 = IndividualTrainingSession(1, 60, 101, 5)
+        session2 = IndividualTrainingSession(2, 60, 101, 5)
+        self.repo.kaydet(session1)
+        self.repo.kaydet(session2)
+
+        # Nesne yerinde değiştirilip guncelle çağrılırsa eski kova temizlenmeli
+        session1.athlete_id = 102
+        self.repo.guncelle(session1)
+        self.assertEqual([s.oturum_id for s in self.repo.sporcuya_gore_filtrele(101)], [2])
+        self.assertEqual([s.oturum_id for s in self.repo.sporcuya_gore_filtrele(102)], [1])
+
+        self.repo.sil(2)
+        self.assertEqual(self.repo.sporcuya_gore_filtrele(101), [])
+        self.assertEqual(self.repo.sporcuya_gore_filtrele(999), [])
+
+    def test_takim_indeksi_sil(self):
+        """Takım indeksi silinen oturumu döndürmez."""
+        self.repo.kaydet(TeamTrainingSession(1, 60, 10, 1, 10))
+        self.repo.kaydet(TeamTrainingSession(2, 60, 10, 2, 10))
+
+        self.repo.sil(1)
+        sonuclar = self.repo.takima_gore_filtrele(10)
+        self.assertEqual([s.oturum_id for s in sonuclar], [2])
+
     def test_tarih_araligina_gore_filtrele(self):
         """Tarih aralığına göre filtreler."""
         tarih1 = datetime(2025, 6, 1, 10, 0)
@@ -408,6 +483,52 @@ class TestTrainingRepository(unittest.TestCase):
         sonuclar = self.repo.tarih_araligina_gore_filtrele(baslangic, bitis)
         self.assertEqual(len(sonuclar), 2)
     
+    def test_tarih_araligi_sirali_doner(self):
+        """Tarih aralığı sonucu tarih sırasındadır ve tarihsiz oturumlar ayrı tutulur."""
+        self.repo.kaydet(IndividualTrainingSession(1, 60, 101, 5, tarih_saat=datetime(2025, 6, 5, 10, 0)))
+        self.repo.kaydet(IndividualTrainingSession(2, 60, 102, 5, tarih_saat=datetime(2025, 6, 1, 10, 0)))
+        self.repo.kaydet(IndividualTrainingSession(3, 60, 103, 5))
+        self.repo.kaydet(IndividualTrainingSession(4, 60, 104, 5, tarih_saat=datetime(2025, 6, 3, 10, 0)))
+
+        sonuclar = self.repo.tarih_araligina_gore_filtrele(datetime(2025, 6, 1, 10, 0), datetime(2025, 6, 5, 10, 0))
+        self.assertEqual([s.oturum_id for s in sonuclar], [2, 4, 1])
+        self.assertEqual([s.oturum_id for s in self.repo.tarihsiz_oturumlar()], [3])
+
+        # Tarih atanınca oturum tarihsizlerden tarih indeksine geçer
+        oturum3 = self.repo.id_ile_bul(3)
+        oturum3.oturum_planla(datetime(2025, 6, 2, 9, 0))
+        self.repo.guncelle(oturum3)
+        self.assertEqual(self.repo.tarihsiz_oturumlar(), [])
+        sonuclar = self.repo.tarih_araligina_gore_filtrele(datetime(2025, 6, 1), datetime(2025, 6, 30))
+        self.assertEqual([s.oturum_id for s in sonuclar], [2, 3, 4, 1])
+
+    def test_tarih_sirali_sayfa(self):
+        """İmleç ile sayfalama tüm oturumları tarih sırasıyla bir kez döndürür."""
+        ayni_tarih = datetime(2025, 6, 2, 10, 0)
+        for oturum_id in range(1, 24):
+            tarih = ayni_tarih if oturum_id % 4 == 0 else datetime(2025, 6, 1) + timedelta(hours=oturum_id * 7 % 23)
+            self.repo.kaydet(IndividualTrainingSession(oturum_id, 30, oturum_id, 5, tarih_saat=tarih))
+
+        okunan = []
+        imlec = None
+        while True:
+            sayfa, imlec = self.repo.tarih_sirali_sayfa(imlec=imlec, limit=5)
+            okunan.extend(sayfa)
+            if imlec is None:
+                break
+            # Sayfalar arasında eklenen geçmiş tarihli kayıt imlecin gerisinde kalır
+            if len(okunan) == 10:
+                self.repo.kaydet(IndividualTrainingSession(100, 30, 100, 5, tarih_saat=datetime(2025, 5, 1)))
+
+        beklenen = sorted(
+            (s for s in self.repo.tumunu_listele() if s.oturum_id != 100),
+            key=lambda s: (s.tarih_saat, s.oturum_id)
+        )
+        self.assertEqual([s.oturum_id for s in okunan], [s.oturum_id for s in beklenen])
+
+        with self.assertRaises(ValueError):
+            self.repo.tarih_sirali_sayfa(limit=0)
+
     def test_detayli_cakisma_kontrol_sporcu(self):
         """Sporcu çakışması kontrolü yapar."""
         tarih = datetime(2025, 6, 1, 10, 0)
@@ -456,6 +577,67 @@ class TestTrainingRepository(unittest.TestCase):
         )
         self.assertFalse(cakisma)
 
+    def test_detayli_cakisma_kontrol_tarama_ile_ayni(self):
+        """Zaman indeksi, tüm oturumları tarayan eski kontrol ile aynı sonucu verir."""
+        rastgele = random.Random(7)
+        baslangic = datetime(2025, 6, 1, 8, 0)
+        for oturum_id in range(1, 301):
+            tarih = baslangic + timedelta(minutes=15 * rastgele.randint(0, 400))
+            if oturum_id % 3 == 0:
+                oturum = TeamTrainingSession(oturum_id, rastgele.randint(30, 180), 10, rastgele.randint(1, 5), 12, tarih_saat=tarih)
+            else:
+                oturum = IndividualTrainingSession(oturum_id, rastgele.randint(30, 180), rastgele.randint(1, 10), 5, tarih_saat=tarih)
+            self.repo.kaydet(oturum)
+
+        def tarama(tarih, sure, haric_id, athlete_id, saha_id):
+            for o in self.repo.tumunu_listele():
+                if o.oturum_id == haric_id or not o.tarih_saat:
+                    continue
+                if AntrenmanOturumuTemel.tarih_cakismasi_kontrol(o.tarih_saat, o.sure, tarih, sure):
+                    if athlete_id is not None and getattr(o, 'athlete_id', None) == athlete_id:
+                        return True
+                    if saha_id is not None and getattr(o, 'saha_id', None) == saha_id:
+                        return True
+            return False
+
+        for _ in range(500):
+            tarih = baslangic + timedelta(minutes=5 * rastgele.randint(0, 1300))
+            sure = rastgele.randint(1, 240)
+            haric_id = rastgele.randint(-1, 300)
+            athlete_id = rastgele.choice([None, rastgele.randint(1, 10)])
+            saha_id = rastgele.choice([None, rastgele.randint(1, 5)])
+            self.assertEqual(
+                self.repo.detayli_cakisma_kontrol(tarih, sure, haric_id, athlete_id, saha_id),
+                tarama(tarih, sure, haric_id, athlete_id, saha_id)
+            )
+
+    def test_zaman_indeksi_guncelle_ve_sil(self):
+        """Tarih değişikliği ve silme sonrası çakışma kontrolü güncel kalır."""
+        session = IndividualTrainingSession(1, 60, 101, 5, tarih_saat=datetime(2025, 6, 1, 10, 0))
+        self.repo.kaydet(session)
+
+        session.oturum_planla(datetime(2025, 6, 1, 15, 0))
+        self.repo.guncelle(session)
+        self.assertFalse(self.repo.detayli_cakisma_kontrol(datetime(2025, 6, 1, 10, 0), 60, athlete_id=101))
+        self.assertTrue(self.repo.detayli_cakisma_kontrol(datetime(2025, 6, 1, 15, 30), 60, athlete_id=101))
+
+        self.repo.sil(1)
+        self.assertFalse(self.repo.detayli_cakisma_kontrol(datetime(2025, 6, 1, 15, 30), 60, athlete_id=101))
+
+    def test_ayni_anda_baslayan_oturumlar(self):
+        """Aynı başlangıçlı oturumlar id sırasında tutulur, karışık sırada eklenip silinebilir."""
+        tarih = datetime(2025, 6, 1, 10, 0)
+        idler = list(range(1, 41))
+        random.Random(3).shuffle(idler)
+        for oturum_id in idler:
+            self.repo.kaydet(IndividualTrainingSession(oturum_id, 60, oturum_id, 5, tarih_saat=tarih))
+        for oturum_id in idler[:20]:
+            self.repo.sil(oturum_id)
+
+        kalanlar = [o.oturum_id for o in self.repo.tarih_araligina_gore_filtrele(tarih, tarih)]
+        self.assertEqual(kalanlar, sorted(idler[20:]))
+        self.assertFalse(self.repo._tarih_indeksi.cikar(tarih, idler[0]))
+
 
 class TestTrainingManager(unittest.TestCase):
     """TrainingManager servis katmanını test eder."""
@@ -571,6 +753,18 @@ class TestTrainingManager(unittest.TestCase):
         self.assertIsNotNone(oturum11)
         self.assertIsNotNone(oturum12)
     
+    def test_oturum_planla(self):
+        """Oturum yeni tarihe planlanır, dolu kaynağa planlama reddedilir."""
+        self.service.oturum_olustur(IndividualTrainingSession(1, 60, 101, 5, tarih_saat=datetime(2025, 6, 1, 10, 0)))
+        self.service.oturum_olustur(IndividualTrainingSession(2, 60, 101, 5, tarih_saat=datetime(2025, 6, 1, 12, 0)))
+
+        with self.assertRaises(TakvimCakismasiHatasi):
+            self.service.oturum_planla(2, datetime(2025, 6, 1, 10, 30))
+
+        self.service.oturum_planla(2, datetime(2025, 6, 1, 14, 0))
+        self.assertEqual(self.repo.id_ile_bul(2).tarih_saat, datetime(2025, 6, 1, 14, 0))
+        self.assertFalse(self.repo.detayli_cakisma_kontrol(datetime(2025, 6, 1, 12, 0), 60, athlete_id=101))
+
     def test_iptal_bulunamayan_oturum(self):
         """Bulunamayan oturumu iptal etmeye çalışır."""
         with self.assertRaises(OturumBulunamadiHatasi):
@@ -582,6 +776,1634 @@ class TestTrainingManager(unittest.TestCase):
             self.service.oturum_tamamla(999)
 
 
+class TestMusaitlikMotoru(unittest.TestCase):
+    """MusaitlikMotoru boş zaman aramasını test eder."""
+
+    def setUp(self):
+        """Her testten önce çalışır, temiz bir ortam kurar."""
+        self.repo = TrainingRepository()
+        self.motor = MusaitlikMotoru(self.repo)
+
+    def test_sporcu_ve_saha_birlikte(self):
+        """Sporcu ve sahanın ikisinin de boş olduğu en erken zamanları bulur."""
+        self.repo.kaydet(IndividualTrainingSession(1, 60, 101, 5, tarih_saat=datetime(2025, 6, 1, 10, 0)))
+        self.repo.kaydet(TeamTrainingSession(2, 90, 10, 3, 12, tarih_saat=datetime(2025, 6, 1, 11, 10)))
+
+        sonuclar = self.motor.bos_zamanlari_bul(
+            60, datetime(2025, 6, 1, 9, 5), datetime(2025, 6, 1, 14, 0), athlete_id=101, saha_id=3, adet=10
+        )
+        # 11:10-12:40 arası saha dolu, 12:45 bir sonraki slot sınırı
+        self.assertEqual(sonuclar, [
+            (datetime(2025, 6, 1, 12, 45), datetime(2025, 6, 1, 13, 45)),
+            (datetime(2025, 6, 1, 13, 0), datetime(2025, 6, 1, 14, 0)),
+        ])
+
+    def test_sonuclar_cakisma_kontrolu_ile_tutarli(self):
+        """Dönen her boş zaman detayli_cakisma_kontrol'e göre de boştur."""
+        rastgele = random.Random(3)
+        for oturum_id in range(1, 400):
+            tarih = datetime(2025, 6, 1) + timedelta(minutes=rastgele.randrange(0, 60 * 24 * 10))
+            if oturum_id % 2:
+                oturum = IndividualTrainingSession(oturum_id, rastgele.randint(10, 200), rastgele.randint(1, 5), 5, tarih_saat=tarih)
+            else:
+                oturum = TeamTrainingSession(oturum_id, rastgele.randint(10, 200), 1, rastgele.randint(1, 5), 12, tarih_saat=tarih)
+            self.repo.kaydet(oturum)
+
+        for _ in range(100):
+            baslangic = datetime(2025, 6, 1) + timedelta(minutes=rastgele.randrange(0, 60 * 24 * 8))
+            bitis = baslangic + timedelta(days=2)
+            athlete_id, saha_id, sure = rastgele.randint(1, 5), rastgele.randint(1, 5), rastgele.randint(15, 180)
+            for bas, bit in self.motor.bos_zamanlari_bul(sure, baslangic, bitis, athlete_id=athlete_id, saha_id=saha_id):
+                self.assertTrue(baslangic <= bas and bit <= bitis)
+                self.assertFalse(self.repo.detayli_cakisma_kontrol(bas, sure, athlete_id=athlete_id, saha_id=saha_id))
+
+    def test_kayit_sonrasi_onbellek_yenilenir(self):
+        """Yeni kayıt sonrası ilgili kaynağın bitmap'i yeniden hesaplanır."""
+        pencere = (datetime(2025, 6, 1, 10, 0), datetime(2025, 6, 1, 12, 0))
+        self.assertEqual(self.motor.ilk_bos_zaman(60, *pencere, athlete_id=101)[0], datetime(2025, 6, 1, 10, 0))
+
+        self.repo.kaydet(IndividualTrainingSession(1, 60, 101, 5, tarih_saat=datetime(2025, 6, 1, 10, 0)))
+        self.assertEqual(self.motor.ilk_bos_zaman(60, *pencere, athlete_id=101)[0], datetime(2025, 6, 1, 11, 0))
+
+        self.repo.sil(1)
+        self.assertEqual(self.motor.ilk_bos_zaman(60, *pencere, athlete_id=101)[0], datetime(2025, 6, 1, 10, 0))
+
+    def test_gece_yarisini_asan_oturum(self):
+        """Önceki günden taşan oturum ertesi günün slotlarını doldurur."""
+        self.repo.kaydet(TeamTrainingSession(1, 120, 10, 2, 12, tarih_saat=datetime(2025, 6, 1, 23, 0)))
+        ilk = self.motor.ilk_bos_zaman(30, datetime(2025, 6, 2, 0, 0), datetime(2025, 6, 2, 6, 0), saha_id=2)
+        self.assertEqual(ilk[0], datetime(2025, 6, 2, 1, 0))
+
+    def test_gecersiz_parametreler(self):
+        """Geçersiz saha ve eksik kaynak hatası fırlatır."""
+        pencere = (datetime(2025, 6, 1, 10, 0), datetime(2025, 6, 1, 12, 0))
+        with self.assertRaises(GecersizSahaIdHatasi):
+            self.motor.bos_zamanlari_bul(60, *pencere, saha_id=6)
+        with self.assertRaises(AntrenmanHatasi):
+            self.motor.bos_zamanlari_bul(60, *pencere)
+
+class TestSqliteTrainingRepository(unittest.TestCase):
+    """SqliteTrainingRepository sınıfını test eder."""
+
+    def setUp(self):
+        """Her testten önce çalışır, bellek içi bir veritabanı açar."""
+        self.repo = SqliteTrainingRepository()
+        self.tarih = datetime(2025, 6, 1, 10, 0)
+
+    def tearDown(self):
+        self.repo.kapat()
+
+    def test_kaydet_bul_guncelle_sil(self):
+        """Temel CRUD işlemleri bellek içi repository ile aynı davranır."""
+        self.repo.kaydet(IndividualTrainingSession(1, 60, 101, 5, odak_alani="hız", tarih_saat=self.tarih))
+        self.repo.kaydet(TeamTrainingSession(2, 90, 10, 3, 12, tarih_saat=self.tarih))
+        self.repo.kaydet(RehabTrainingSession(3, 45, 101, 7, "kas", ilerleme_notu=4.5))
+
+        bulunan = self.repo.id_ile_bul(1)
+        self.assertIsInstance(bulunan, IndividualTrainingSession)
+        self.assertEqual(bulunan.odak_alani, "hız")
+        self.assertEqual(bulunan.tarih_saat, self.tarih)
+        self.assertEqual(self.repo.id_ile_bul(3).ilerleme_notu, 4.5)
+        self.assertIsNone(self.repo.id_ile_bul(99))
+
+        with self.assertRaises(DuplicateOturumHatasi):
+            self.repo.kaydet(IndividualTrainingSession(1, 60, 102, 5))
+
+        bulunan.athlete_id = 102
+        self.repo.guncelle(bulunan)
+        self.assertEqual([o.oturum_id for o in self.repo.sporcuya_gore_filtrele(101)], [3])
+        self.assertEqual([o.oturum_id for o in self.repo.sporcuya_gore_filtrele(102)], [1])
+        self.assertEqual([o.oturum_id for o in self.repo.takima_gore_filtrele(10)], [2])
+        self.assertEqual([o.oturum_id for o in self.repo.tarihsiz_oturumlar()], [3])
+
+        self.repo.sil(2)
+        self.assertEqual(len(self.repo.tumunu_listele()), 2)
+        with self.assertRaises(OturumBulunamadiHatasi):
+            self.repo.sil(2)
+        with self.assertRaises(OturumBulunamadiHatasi):
+            self.repo.guncelle(TeamTrainingSession(2, 90, 10, 3, 12))
+
+    def test_dosyada_kalicilik(self):
+        """Dosya veritabanına yazılan oturumlar yeniden açıldığında okunur."""
+        with tempfile.TemporaryDirectory() as klasor:
+            yol = os.path.join(klasor, "oturumlar.db")
+            with SqliteTrainingRepository(yol) as repo:
+                repo.kaydet(TeamTrainingSession(1, 300, 10, 2, 12, tarih_saat=self.tarih))
+            with SqliteTrainingRepository(yol) as repo:
+                self.assertEqual(repo.id_ile_bul(1).saha_id, 2)
+                # En uzun süre de veritabanından okunmalı: 300 dakikalık oturum 14:00'te hâlâ sürer
+                self.assertTrue(repo.detayli_cakisma_kontrol(self.tarih + timedelta(hours=4), 30, saha_id=2))
+
+    def test_kaydet_toplu_atomik(self):
+        """Toplu kayıtta tekrarlanan ID varsa hiçbir oturum kaydedilmez."""
+        self.repo.kaydet_toplu([IndividualTrainingSession(i, 60, 101, 5) for i in range(1, 6)])
+        self.assertEqual(len(self.repo.tumunu_listele()), 5)
+
+        with self.assertRaises(DuplicateOturumHatasi):
+            self.repo.kaydet_toplu([IndividualTrainingSession(6, 60, 101, 5), IndividualTrainingSession(3, 60, 101, 5)])
+        self.assertIsNone(self.repo.id_ile_bul(6))
+
+    def test_cakisma_ve_sayfalama_bellek_ici_ile_ayni(self):
+        """Rastgele veride çakışma, tarih aralığı ve sayfalama sonuçları TrainingRepository ile aynıdır."""
+        rastgele = random.Random(5)
+        bellek = TrainingRepository()
+        oturumlar = []
+        for oturum_id in range(1, 300):
+            tarih = datetime(2025, 6, 1) + timedelta(minutes=rastgele.randrange(0, 60 * 24 * 5))
+            if oturum_id % 2:
+                oturum = IndividualTrainingSession(oturum_id, rastgele.randint(10, 200), rastgele.randint(1, 5), 5, tarih_saat=tarih)
+            else:
+                oturum = TeamTrainingSession(oturum_id, rastgele.randint(10, 200), 1, rastgele.randint(1, 5), 12, tarih_saat=tarih)
+            oturumlar.append(oturum)
+            bellek.kaydet(oturum)
+        self.repo.kaydet_toplu(oturumlar)
+
+        for _ in range(300):
+            tarih = datetime(2025, 6, 1) + timedelta(minutes=rastgele.randrange(0, 60 * 24 * 5))
+            sure = rastgele.randint(10, 200)
+            haric = rastgele.choice([-1, rastgele.randint(1, 299)])
+            kaynak = {"athlete_id": rastgele.randint(1, 5)} if rastgele.random() < 0.5 else {"saha_id": rastgele.randint(1, 5)}
+            self.assertEqual(
+                self.repo.detayli_cakisma_kontrol(tarih, sure, haric, **kaynak),
+                bellek.detayli_cakisma_kontrol(tarih, sure, haric, **kaynak)
+            )
+
+        aralik = (datetime(2025, 6, 2), datetime(2025, 6, 3))
+        self.assertEqual([o.oturum_id for o in self.repo.tarih_araligina_gore_filtrele(*aralik)],
+                         [o.oturum_id for o in bellek.tarih_araligina_gore_filtrele(*aralik)])
+
+        imlec, sayfalar = None, []
+        while True:
+            sayfa, imlec = self.repo.tarih_sirali_sayfa(imlec, limit=40)
+            sayfalar.extend(o.oturum_id for o in sayfa)
+            if imlec is None:
+                break
+        self.assertEqual(sayfalar, [o.oturum_id for o in sorted(oturumlar, key=lambda o: (o.tarih_saat, o.oturum_id))])
+
+    def test_training_manager_ile_kullanim(self):
+        """TrainingManager SQLite repository üzerinde de çakışmayı engeller."""
+        manager = TrainingManager(self.repo)
+        manager.oturum_olustur(TeamTrainingSession(1, 90, 10, 3, 12, tarih_saat=self.tarih))
+        with self.assertRaises(TakvimCakismasiHatasi):
+            manager.oturum_olustur(TeamTrainingSession(2, 60, 11, 3, 12, tarih_saat=self.tarih + timedelta(minutes=30)))
+        self.assertEqual(len(self.repo.tumunu_listele()), 1)
+
+    def test_team_id_tum_turlerde_geri_yuklenir(self):
+        """Bireysel ve rehabilitasyon oturumlarının team_id'si de okunurken geri yüklenir."""
+        bireysel = IndividualTrainingSession(1, 60, 101, 5, tarih_saat=self.tarih)
+        bireysel.team_id = 3
+        rehab = RehabTrainingSession(2, 45, 102, 7, "kas")
+        rehab.team_id = 3
+        self.repo.kaydet_toplu([bireysel, rehab, TeamTrainingSession(4, 90, 3, 2, 12)])
+        self.repo.kaydet(IndividualTrainingSession(5, 60, 103, 5))
+
+        self.assertEqual([(type(o), o.team_id) for o in self.repo.takima_gore_filtrele(3)],
+                         [(IndividualTrainingSession, 3), (RehabTrainingSession, 3), (TeamTrainingSession, 3)])
+        self.assertEqual(self.repo.id_ile_bul(2).team_id, 3)
+        self.assertIsNone(self.repo.id_ile_bul(5).team_id)
+        self.assertEqual([o.team_id for o in self.repo.sorgu().takim(3)], [3, 3, 3])
+
+
+class TestKaliciTrainingRepository(unittest.TestCase):
+    """KaliciTrainingRepository günlük ve snapshot kalıcılığını test eder."""
+
+    def setUp(self):
+        """Her testten önce çalışır, geçici bir klasör açar."""
+        self._gecici = tempfile.TemporaryDirectory()
+        self.klasor = self._gecici.name
+        self.tarih = datetime(2025, 6, 1, 10, 0)
+
+    def tearDown(self):
+        self._gecici.cleanup()
+
+    def _islemleri_yap(self, repo):
+        repo.kaydet(IndividualTrainingSession(1, 60, 101, 5, tarih_saat=self.tarih))
+        repo.kaydet(TeamTrainingSession(2, 90, 10, 3, 12, tarih_saat=self.tarih))
+        repo.kaydet(RehabTrainingSession(3, 45, 101, 7, "kas"))
+        oturum = repo.id_ile_bul(1)
+        oturum.oturum_planla(self.tarih + timedelta(days=1))
+        repo.guncelle(oturum)
+        repo.sil(2)
+
+    def _durum(self, repo):
+        return {o.oturum_id: o.oturum_detaylari_getir() for o in repo.tumunu_listele()}
+
+    def test_yeniden_acilista_gunluk_oynatilir(self):
+        """Kapatılıp açılan repository aynı durumu ve indeksleri geri yükler."""
+        with KaliciTrainingRepository(self.klasor) as repo:
+            self._islemleri_yap(repo)
+            beklenen = self._durum(repo)
+
+        with KaliciTrainingRepository(self.klasor) as repo:
+            self.assertEqual(self._durum(repo), beklenen)
+            self.assertEqual(sorted(o.oturum_id for o in repo.sporcuya_gore_filtrele(101)), [1, 3])
+            self.assertTrue(repo.detayli_cakisma_kontrol(self.tarih + timedelta(days=1), 30, athlete_id=101))
+            self.assertFalse(repo.detayli_cakisma_kontrol(self.tarih, 30, saha_id=3))
+
+    def test_cokme_sonrasi_kurtarma(self):
+        """Yarım yazılmış son satır yok sayılır ve sonraki yazmalar sağlam kalır."""
+        repo = KaliciTrainingRepository(self.klasor)
+        self._islemleri_yap(repo)
+        beklenen = self._durum(repo)
+        repo._gunluk.write(b'[6,"k",{"oturum_id":9,"su')  # çökme: kapat() çağrılmadan yarım satır
+        repo._gunluk.flush()
+
+        repo = KaliciTrainingRepository(self.klasor)
+        self.assertEqual(self._durum(repo), beklenen)
+        repo.kaydet(IndividualTrainingSession(4, 30, 102, 5))
+        repo.kapat()
+
+        with KaliciTrainingRepository(self.klasor) as repo:
+            self.assertEqual(sorted(self._durum(repo)), [1, 3, 4])
+
+    def test_snapshot_ve_gunluk_kuyrugu(self):
+        """Eşik aşılınca snapshot alınır; günlük kesilmeden çökülse bile kayıtlar iki kez uygulanmaz."""
+        with KaliciTrainingRepository(self.klasor, snapshot_esigi=4) as repo:
+            self._islemleri_yap(repo)  # 5 işlem: 4'te snapshot, 1 kayıt günlükte
+            beklenen = self._durum(repo)
+        gunluk_yolu = os.path.join(self.klasor, KaliciTrainingRepository.GUNLUK_DOSYASI)
+        with open(gunluk_yolu, "rb") as dosya:
+            self.assertEqual(len(dosya.readlines()), 1)
+
+        with KaliciTrainingRepository(self.klasor) as repo:
+            self.assertEqual(self._durum(repo), beklenen)
+            eski_gunluk = open(gunluk_yolu, "rb").read()
+            repo.kaydet(IndividualTrainingSession(4, 30, 102, 5))
+            repo.snapshot_al()
+            beklenen = self._durum(repo)
+
+        # Snapshot yazıldı ama günlük kesilmeden çökülmüş gibi eski kayıtları geri koy
+        with open(gunluk_yolu, "wb") as dosya:
+            dosya.write(eski_gunluk)
+        with KaliciTrainingRepository(self.klasor) as repo:
+            self.assertEqual(self._durum(repo), beklenen)
+
+    def test_team_id_gunluk_ve_snapshottan_geri_yuklenir(self):
+        """Bireysel ve rehabilitasyon oturumlarının team_id'si yeniden açılışta takım indekslerine döner."""
+        def _takim_durumu(repo):
+            return ([(o.oturum_id, o.team_id) for o in repo.takima_gore_filtrele(3)],
+                    repo.haftalik_yukler(team_id=3))
+
+        for snapshot_esigi in (KaliciTrainingRepository.VARSAYILAN_SNAPSHOT_ESIGI, 2):
+            with self.subTest(snapshot_esigi=snapshot_esigi), tempfile.TemporaryDirectory() as klasor:
+                with KaliciTrainingRepository(klasor, snapshot_esigi=snapshot_esigi) as repo:
+                    bireysel = IndividualTrainingSession(1, 60, 101, 5, tarih_saat=self.tarih)
+                    bireysel.team_id = 3
+                    repo.kaydet(bireysel)
+                    rehab = RehabTrainingSession(2, 45, 102, 7, "kas", tarih_saat=self.tarih + timedelta(hours=2))
+                    rehab.team_id = 3
+                    repo.kaydet_toplu([rehab, IndividualTrainingSession(3, 30, 103, 5)])
+                    beklenen = _takim_durumu(repo)
+                self.assertEqual([oturum_id for oturum_id, _ in beklenen[0]], [1, 2])
+                with KaliciTrainingRepository(klasor) as repo:
+                    self.assertEqual(_takim_durumu(repo), beklenen)
+                    self.assertIsNone(repo.id_ile_bul(3).team_id)
+
+    def test_gunluge_yazilamayan_islem_bellegi_degistirmez(self):
+        """Günlük yazması hata verirse işlem belleğe uygulanmaz ve günlükte yarım satır kalmaz."""
+        class _BozukDosya:
+            def __init__(self, dosya):
+                self._dosya = dosya
+
+            def __getattr__(self, ad):
+                return getattr(self._dosya, ad)
+
+            def flush(self):
+                raise OSError("disk dolu")
+
+        with KaliciTrainingRepository(self.klasor) as repo:
+            repo.kaydet(IndividualTrainingSession(1, 60, 101, 5, tarih_saat=self.tarih))
+            beklenen = self._durum(repo)
+            saglam = repo._gunluk
+            repo._gunluk = _BozukDosya(saglam)
+            with self.assertRaises(OSError):
+                repo.kaydet(IndividualTrainingSession(2, 60, 102, 5))
+            with self.assertRaises(OSError):
+                repo.sil(1)
+            self.assertEqual(self._durum(repo), beklenen)
+            self.assertEqual(sorted(o.oturum_id for o in repo.sporcuya_gore_filtrele(101)), [1])
+            repo._gunluk = saglam
+            repo.kaydet(IndividualTrainingSession(3, 30, 103, 5))
+            beklenen = self._durum(repo)
+
+        with KaliciTrainingRepository(self.klasor) as repo:
+            self.assertEqual(self._durum(repo), beklenen)
+
+    def test_gunluge_yazilamayan_guncellemede_indeksler_ve_disk_eski_kalir(self):
+        """Manager'ın nesneyi değiştirip günlüğe yazamadığı güncellemede indeksler ve diskteki durum eski kalır."""
+        class _BozukDosya:
+            def __init__(self, dosya):
+                self._dosya = dosya
+
+            def __getattr__(self, ad):
+                return getattr(self._dosya, ad)
+
+            def flush(self):
+                raise OSError("disk dolu")
+
+        with KaliciTrainingRepository(self.klasor) as repo:
+            manager = TrainingManager(repo)
+            repo.kaydet(IndividualTrainingSession(1, 60, 101, 5, tarih_saat=self.tarih))
+            saglam = repo._gunluk
+            repo._gunluk = _BozukDosya(saglam)
+            with self.assertRaises(OSError):
+                manager.oturum_tamamla(1)
+            repo._gunluk = saglam
+            self.assertEqual(repo.id_ile_bul(1).durum, "tamamlandi")
+            self.assertEqual(repo.durum_sayilari(101), {"planlandı": 1})
+
+        with KaliciTrainingRepository(self.klasor) as repo:
+            self.assertEqual(repo.id_ile_bul(1).durum, "planlandı")
+
+    def test_snapshot_yerine_konunca_gunluk_kesilmeden_klasor_fsync_edilir(self):
+        """Snapshot yerine konduktan sonra, günlük kesilmeden önce klasör fsync edilir."""
+        with KaliciTrainingRepository(self.klasor) as repo:
+            repo.kaydet(IndividualTrainingSession(1, 60, 101, 5))
+            cagrilar = []
+            klasoru_fsync = repo._klasoru_fsync
+
+            def izleyen():
+                cagrilar.append((os.path.exists(repo._snapshot_yolu), os.path.getsize(repo._gunluk_yolu) > 0))
+                klasoru_fsync()
+
+            repo._klasoru_fsync = izleyen
+            repo.snapshot_al()
+            self.assertEqual(cagrilar, [(True, True)])
+            self.assertEqual(os.path.getsize(repo._gunluk_yolu), 0)
+
+
+class TestTopluOlusturma(unittest.TestCase):
+    """satirlardan_olustur toplu oluşturma yolunu test eder."""
+
+    def setUp(self):
+        """Her testten önce çalışır, üç oturum türü için örnek satırlar hazırlar."""
+        tarih = datetime(2025, 6, 1, 10, 0)
+        self.satirlar = {
+            IndividualTrainingSession: [
+                {"oturum_id": 1, "sure": 60, "athlete_id": 101, "antrenor_id": 5, "odak_alani": " Güç ",
+                 "tarih_saat": tarih, "performans_notu": 7.25},
+                {"oturum_id": 2, "sure": 45, "athlete_id": 102, "antrenor_id": 5, "oturum_tipi": "TEKNIK"},
+            ],
+            TeamTrainingSession: [
+                {"oturum_id": 3, "sure": 90, "team_id": 10, "saha_id": 3, "katilimci_sayisi": 12,
+                 "antrenman_plani": "Kondisyon", "durum": "Tamamlandi", "tarih_saat": tarih},
+            ],
+            RehabTrainingSession: [
+                {"oturum_id": 4, "sure": 30, "athlete_id": 101, "fizyoterapist_id": 7, "sakatlik_tipi": "kas",
+                 "rehab_programi": "  ileri ", "ilerleme_notu": 4},
+            ],
+        }
+
+    def test_kurucu_ile_ayni_sonuc(self):
+        """Doğrulamalı toplu yol normal kurucu ile aynı (normalize edilmiş) nesneleri üretir."""
+        for sinif, satirlar in self.satirlar.items():
+            beklenen = [sinif(**satir).oturum_detaylari_getir() for satir in satirlar]
+            for dogrula in (True, False):
+                oturumlar = sinif.satirlardan_olustur(satirlar, dogrula=dogrula)
+                self.assertTrue(all(type(oturum) is sinif for oturum in oturumlar))
+                if dogrula:
+                    self.assertEqual([o.oturum_detaylari_getir() for o in oturumlar], beklenen)
+        self.assertIsNone(IndividualTrainingSession.satirlardan_olustur(self.satirlar[IndividualTrainingSession])[0].team_id)
+
+    def test_gecersiz_satir_setter_hatasini_firlatir(self):
+        """Hatalı satır, normal kurucunun fırlatacağı hatayla bildirilir."""
+        satirlar = self.satirlar[TeamTrainingSession] + [
+            {"oturum_id": 5, "sure": 90, "team_id": 10, "saha_id": 9, "katilimci_sayisi": 12}
+        ]
+        with self.assertRaises(GecersizSahaIdHatasi):
+            TeamTrainingSession.satirlardan_olustur(satirlar)
+        with self.assertRaises(GecersizSureHatasi):
+            IndividualTrainingSession.satirlardan_olustur([{"oturum_id": 1, "sure": 0, "athlete_id": 1, "antrenor_id": 1}])
+        with self.assertRaises(TypeError):
+            IndividualTrainingSession.satirlardan_olustur([{"oturum_id": 1, "sure": 60, "athlete_id": 1}])
+
+    def test_sozluklerden_karisik_turler_sira_korunur(self):
+        """oturum_detaylari_getir çıktılarından karışık türler sırası korunarak geri oluşturulur."""
+        oturumlar = [sinif(**satir) for sinif, satirlar in self.satirlar.items() for satir in satirlar]
+        detaylar = [o.oturum_detaylari_getir() for o in reversed(oturumlar)]
+        for dogrula in (True, False):
+            geri = sozluklerden_oturumlar_olustur(detaylar, dogrula=dogrula)
+            self.assertEqual([o.oturum_detaylari_getir() for o in geri], detaylar)
+        with self.assertRaises(AntrenmanHatasi):
+            sozluklerden_oturumlar_olustur([{"oturum_turu": "bilinmeyen"}])
+
+
+class TestTopluOturumOlusturma(unittest.TestCase):
+    """oturum_olustur_toplu sweep-line çakışma kontrolünü ve toplu kaydı test eder."""
+
+    def setUp(self):
+        """Her testten önce çalışır, temiz bir ortam kurar."""
+        self.tarih = datetime(2025, 6, 1, 10, 0)
+
+    def _rastgele_oturumlar(self, rng, adet, ilk_id=1):
+        oturumlar = []
+        for oturum_id in range(ilk_id, ilk_id + adet):
+            tarih = self.tarih + timedelta(minutes=15 * rng.randrange(200)) if rng.random() > 0.05 else None
+            if rng.random() < 0.5:
+                oturumlar.append(IndividualTrainingSession(oturum_id, rng.choice([30, 60, 90]), rng.randint(1, 8),
+                                                           5, tarih_saat=tarih))
+            else:
+                oturumlar.append(TeamTrainingSession(oturum_id, rng.choice([45, 120]), rng.randint(1, 4),
+                                                     rng.randint(1, 5), 12, tarih_saat=tarih))
+        return oturumlar
+
+    def test_sirali_oturum_olustur_ile_ayni_sonuc(self):
+        """Toplu sonuç, oturumları sırayla oturum_olustur ile eklemekle aynıdır (bellek ve SQLite)."""
+        rng = random.Random(7)
+        mevcut = self._rastgele_oturumlar(rng, 150)
+        yeni = self._rastgele_oturumlar(rng, 300, ilk_id=140)  # 140-150 arası kaydedilmiş olanlar mükerrer
+
+        for repo_sinifi in (TrainingRepository, SqliteTrainingRepository):
+            sirali_repo, toplu_repo = repo_sinifi(), repo_sinifi()
+            sirali, toplu = TrainingManager(sirali_repo), TrainingManager(toplu_repo)
+            for manager in (sirali, toplu):
+                for oturum in mevcut:
+                    try:
+                        manager.oturum_olustur(copy.copy(oturum))
+                    except (TakvimCakismasiHatasi, DuplicateOturumHatasi):
+                        pass
+            for oturum in yeni:
+                try:
+                    sirali.oturum_olustur(copy.copy(oturum))
+                except (TakvimCakismasiHatasi, DuplicateOturumHatasi):
+                    pass
+            mukerrer = sum(1 for o in yeni if toplu_repo.id_ile_bul(o.oturum_id) is not None)
+            rapor = toplu.oturum_olustur_toplu([copy.copy(o) for o in yeni])
+
+            beklenen = sorted(o.oturum_id for o in sirali_repo.tumunu_listele())
+            self.assertEqual(sorted(o.oturum_id for o in toplu_repo.tumunu_listele()), beklenen)
+            self.assertEqual(len(rapor), len(yeni))
+            self.assertEqual(rapor.ozet()["mukerrer_id"], mukerrer)
+            self.assertTrue(0 < len(rapor.eklenenler) < len(yeni))
+
+    def test_girdi_sirasi_ve_rapor(self):
+        """Toplu içindeki çakışmada önce gelen kazanır, reddedilen madde sonrakileri engellemez."""
+        repo = TrainingRepository()
+        manager = TrainingManager(repo)
+        repo.kaydet(TeamTrainingSession(1, 60, 10, 3, 12, tarih_saat=self.tarih))
+        oturumlar = [
+            TeamTrainingSession(2, 60, 11, 3, 12, tarih_saat=self.tarih + timedelta(minutes=30)),    # mevcut 1 ile
+            IndividualTrainingSession(3, 60, 101, 5, tarih_saat=self.tarih + timedelta(hours=2)),
+            IndividualTrainingSession(4, 60, 101, 5, tarih_saat=self.tarih + timedelta(hours=2, minutes=30)),
+            TeamTrainingSession(5, 60, 11, 3, 12, tarih_saat=self.tarih + timedelta(hours=1)),       # 2 reddedildi
+            IndividualTrainingSession(3, 30, 102, 5),
+        ]
+        rapor = manager.oturum_olustur_toplu(oturumlar)
+
+        self.assertEqual([s.durum for s in rapor], ["cakisma", "eklendi", "cakisma", "eklendi", "mukerrer_id"])
+        self.assertEqual(rapor.sonuclar[0].cakisan_idler, [1])
+        self.assertEqual(rapor.sonuclar[2].cakisan_idler, [3])
+        self.assertFalse(rapor.tamami_basarili)
+        self.assertEqual(sorted(o.oturum_id for o in repo.tumunu_listele()), [1, 3, 5])
+        self.assertTrue(repo.detayli_cakisma_kontrol(self.tarih + timedelta(hours=1), 10, saha_id=3))
+
+    def test_kaydet_toplu_atomik(self):
+        """Mükerrer id içeren toplu kayıtta hiçbir oturum eklenmez; kalıcı repository tek kayıt yazar."""
+        repo = TrainingRepository()
+        with self.assertRaises(DuplicateOturumHatasi):
+            repo.kaydet_toplu([IndividualTrainingSession(1, 60, 101, 5, tarih_saat=self.tarih),
+                               IndividualTrainingSession(1, 30, 102, 5)])
+        self.assertEqual(repo.tumunu_listele(), [])
+        self.assertIsNone(repo.sporcu_zaman_indeksi(101))
+
+        with tempfile.TemporaryDirectory() as klasor:
+            with KaliciTrainingRepository(klasor) as kalici:
+                kalici.kaydet_toplu([IndividualTrainingSession(1, 60, 101, 5, tarih_saat=self.tarih),
+                                     TeamTrainingSession(2, 90, 10, 3, 12, tarih_saat=self.tarih)])
+            with open(os.path.join(klasor, KaliciTrainingRepository.GUNLUK_DOSYASI), "rb") as dosya:
+                self.assertEqual(len(dosya.readlines()), 1)
+            with KaliciTrainingRepository(klasor) as kalici:
+                self.assertEqual(sorted(o.oturum_id for o in kalici.tumunu_listele()), [1, 2])
+                self.assertTrue(kalici.detayli_cakisma_kontrol(self.tarih, 30, saha_id=3))
+
+
+class TestTekrarKurali(unittest.TestCase):
+    """TekrarKurali tarih üretimini ve program_olustur tekrar motorunu test eder."""
+
+    def setUp(self):
+        """Her testten önce çalışır, temiz bir ortam kurar."""
+        self.repo = TrainingRepository()
+        self.service = TrainingManager(self.repo)
+        self.sali = datetime(2025, 6, 3, 18, 0)  # Salı
+
+    def test_tarih_uretimi(self):
+        """Gün aralıklı ve haftanın günleri kuralları doğru tarihleri tembel üretir."""
+        gunluk = list(TekrarKurali(aralik=2, adet=3).tarihler(self.sali))
+        self.assertEqual(gunluk, [self.sali + timedelta(days=gun) for gun in (0, 2, 4)])
+
+        # Pazartesi/Salı/Perşembe, iki haftada bir; başlangıç haftasının Pazartesi'si atlanır
+        kural = TekrarKurali(aralik=2, haftanin_gunleri=[3, 0, 1], son_tarih=datetime(2025, 6, 17, 18, 0))
+        self.assertEqual(list(kural.tarihler(self.sali)), [
+            datetime(2025, 6, 3, 18, 0), datetime(2025, 6, 5, 18, 0),
+            datetime(2025, 6, 16, 18, 0), datetime(2025, 6, 17, 18, 0),
+        ])
+
+        with self.assertRaises(ValueError):
+            TekrarKurali(aralik=1)
+        with self.assertRaises(ValueError):
+            TekrarKurali(haftanin_gunleri=[7], adet=1)
+
+    def test_prototip_kopya_bagimsiz(self):
+        """Prototip kopyası şablonun alanlarını taşır, şablondan bağımsızdır ve id'leri ardışıktır."""
+        sablonlar = [
+            RehabTrainingSession(1, 45, 101, 7, "kas", tarih_saat=self.sali, ilerleme_notu=4),
+            TeamTrainingSession(2, 90, 10, 3, 12, tarih_saat=self.sali),
+        ]
+        kopyalar = list(tekrarlayan_oturumlar(sablonlar, TekrarKurali(aralik=7, adet=2), 50))
+        self.assertEqual([k.oturum_id for k in kopyalar], [50, 51, 52, 53])
+
+        kopya = kopyalar[1]
+        beklenen = dict(sablonlar[0].oturum_detaylari_getir(), oturum_id=51,
+                        tarih_saat=(self.sali + timedelta(days=7)).isoformat())
+        self.assertEqual(kopya.oturum_detaylari_getir(), beklenen)
+        kopya.oturum_iptal_et()
+        self.assertEqual(sablonlar[0].durum, "planlandı")
+
+        with self.assertRaises(GecersizOturumIdHatasi):
+            kopyalar[0].prototip_kopyala(0, self.sali)
+
+    def test_program_olustur_rapor(self):
+        """Çakışan ve id'si mevcut tekrarlar atlanır, raporda sebebiyle listelenir."""
+        self.service.oturum_olustur(IndividualTrainingSession(
+            1, 60, 101, 5, tarih_saat=self.sali + timedelta(days=7, minutes=30)))
+        self.service.oturum_olustur(IndividualTrainingSession(12, 30, 102, 5))
+        rapor = self.service.program_olustur(
+            [IndividualTrainingSession(99, 60, 101, 5, tarih_saat=self.sali)],
+            TekrarKurali(aralik=7, adet=4), 10
+        )
+
+        self.assertEqual([s.durum for s in rapor], ["eklendi", "cakisma", "mukerrer_id", "eklendi"])
+        self.assertEqual(rapor.sonuclar[1].cakisan_idler, [1])
+        self.assertEqual([o.oturum_id for o in self.repo.sporcuya_gore_filtrele(101)], [1, 10, 13])
+        self.assertIsNone(self.repo.id_ile_bul(99))
+
+        with self.assertRaises(GecersizTarihSaatHatasi):
+            self.service.toplu_program_olustur(20, IndividualTrainingSession(98, 60, 101, 5), 2, 7)
+
+
+class TestOlayDinleyicileri(unittest.TestCase):
+    """TrainingManager olaylarını, yazıcı ve metrik dinleyicilerini test eder."""
+
+    def setUp(self):
+        """Her testten önce çalışır, temiz bir ortam kurar."""
+        self.repo = TrainingRepository()
+        self.tarih = datetime(2025, 6, 1, 10, 0)
+
+    def _islemleri_yap(self, manager):
+        manager.oturum_olustur(IndividualTrainingSession(1, 60, 101, 5, tarih_saat=self.tarih))
+        manager.oturum_olustur(IndividualTrainingSession(2, 60, 102, 5, tarih_saat=self.tarih))
+        with self.assertRaises(TakvimCakismasiHatasi):
+            manager.oturum_olustur(IndividualTrainingSession(3, 30, 101, 5, tarih_saat=self.tarih))
+        manager.oturum_tamamla(1)
+        manager.oturum_iptal_et(2)
+        manager.oturum_planla(2, self.tarih + timedelta(days=1))
+
+    def test_varsayilan_sessiz_ve_yazici(self):
+        """Dinleyicisiz manager hiçbir şey yazdırmaz; yazıcı dinleyici eski mesajları üretir."""
+        cikti = StringIO()
+        with redirect_stdout(cikti):
+            self._islemleri_yap(TrainingManager(self.repo))
+        self.assertEqual(cikti.getvalue(), "")
+
+        cikti = StringIO()
+        self._islemleri_yap(TrainingManager(TrainingRepository(), dinleyiciler=[YaziciDinleyici(cikti)]))
+        satirlar = cikti.getvalue().splitlines()
+        self.assertEqual(satirlar[0], "Bilgi: 1 ID'li oturum başarıyla oluşturuldu.")
+        self.assertEqual(satirlar[2], "Uyarı: 3 ID'li oturum çakışma nedeniyle reddedildi.")
+        self.assertEqual(satirlar[3], "Bilgi: 1 ID'li oturum tamamlandı olarak işaretlendi.")
+        self.assertEqual(len(satirlar), 6)
+
+    def test_metrik_toplayici(self):
+        """Sayaçlar olay türüne göre artar; süreler histogram ve yüzdeliklerde görünür."""
+        metrik = MetrikToplayici()
+        manager = TrainingManager(self.repo)
+        manager.dinleyici_ekle(metrik)
+        self._islemleri_yap(manager)
+        rapor = manager.oturum_olustur_toplu([
+            IndividualTrainingSession(4, 60, 103, 5, tarih_saat=self.tarih),
+            IndividualTrainingSession(5, 60, 103, 5, tarih_saat=self.tarih),
+            IndividualTrainingSession(1, 60, 104, 5),
+        ])
+
+        self.assertEqual(len(rapor.eklenenler), 1)
+        self.assertEqual(metrik.sayaclar(), {
+            "olusturuldu": 3, "cakisma_reddedildi": 2, "tamamlandi": 1, "iptal_edildi": 1,
+            "planlandi": 1, "toplu_olusturuldu": 1,
+        })
+        # Toplu işlemin madde olayları süresizdir: sadece tek tek oluşturulan 2 oturum ölçülür
+        self.assertEqual(sum(adet for _, adet in metrik.histogram("olusturuldu")), 2)
+        self.assertGreater(metrik.ortalama_sure("olusturuldu"), 0)
+        self.assertLessEqual(metrik.yuzdelik("olusturuldu", 0.5), metrik.yuzdelik("olusturuldu", 1.0))
+        self.assertIsNone(metrik.yuzdelik("bilinmeyen", 0.5))
+
+        manager.dinleyici_cikar(metrik)
+        manager.oturum_olustur(IndividualTrainingSession(6, 30, 106, 5))
+        self.assertEqual(metrik.sayac("olusturuldu"), 3)
+        metrik.sifirla()
+        self.assertEqual(metrik.sayaclar(), {})
+
+
+class _GecikmeliRepository(TrainingRepository):
+    """Her çağrıda veritabanı gidiş-dönüşünü taklit eden, çağrı bazında thread-safe repository."""
+
+    def __init__(self):
+        super().__init__()
+        self._kilit = threading.Lock()
+
+    def detayli_cakisma_kontrol(self, *parametreler, **adlandirilmis):
+        time.sleep(0.0005)
+        with self._kilit:
+            return super().detayli_cakisma_kontrol(*parametreler, **adlandirilmis)
+
+    def kaydet(self, oturum):
+        time.sleep(0.0005)
+        with self._kilit:
+            super().kaydet(oturum)
+
+
+class TestAsyncTrainingManager(unittest.TestCase):
+    """AsyncTrainingManager kaynak bazlı kilitlerini ve async işlemlerini test eder."""
+
+    def setUp(self):
+        """Her testten önce çalışır, temiz bir ortam kurar."""
+        self.tarih = datetime(2025, 6, 2, 8, 0)
+
+    def test_eszamanli_isteklerde_cift_rezervasyon_olmaz(self):
+        """Aynı sporcu/sahaya eşzamanlı istekler iş parçacıklarında çalışsa da çakışan kayıt oluşmaz."""
+        rng = random.Random(11)
+        istekler = []
+        for oturum_id in range(1, 301):
+            tarih = self.tarih + timedelta(minutes=30 * rng.randrange(8))
+            if rng.random() < 0.5:
+                istekler.append(IndividualTrainingSession(oturum_id, 60, rng.randint(1, 10), 5, tarih_saat=tarih))
+            else:
+                istekler.append(TeamTrainingSession(oturum_id, 60, rng.randint(1, 10), rng.randint(1, 5), 12,
+                                                    tarih_saat=tarih))
+        repo = _GecikmeliRepository()
+
+        async def calistir():
+            with ThreadPoolExecutor(max_workers=32) as yurutucu:
+                manager = AsyncTrainingManager(repo, yurutucu=yurutucu)
+                sonuclar = await asyncio.gather(*(manager.oturum_olustur(o) for o in istekler),
+                                                return_exceptions=True)
+            return manager, sonuclar
+
+        manager, sonuclar = asyncio.run(calistir())
+        hatalar = [sonuc for sonuc in sonuclar if sonuc is not None]
+        self.assertTrue(all(isinstance(hata, TakvimCakismasiHatasi) for hata in hatalar))
+        self.assertEqual(len(repo.tumunu_listele()) + len(hatalar), len(istekler))
+        self.assertEqual(len(manager._kilitler), 0)
+
+        kayitlar = repo.tumunu_listele()
+        for i, birinci in enumerate(kayitlar):
+            for ikinci in kayitlar[i + 1:]:
+                ayni_kaynak = any(
+                    getattr(birinci, alan, None) is not None and getattr(birinci, alan, None) == getattr(ikinci, alan, None)
+                    for alan in ("athlete_id", "saha_id")
+                )
+                if ayni_kaynak:
+                    self.assertFalse(AntrenmanOturumuTemel.tarih_cakismasi_kontrol(
+                        birinci.tarih_saat, birinci.sure, ikinci.tarih_saat, ikinci.sure))
+
+    def test_async_islemler(self):
+        """İptal, tamamlama ve planlama async cephe üzerinden senkron manager ile aynı çalışır."""
+        repo = TrainingRepository()
+        metrik = MetrikToplayici()
+        manager = AsyncTrainingManager(repo, dinleyiciler=[metrik])
+
+        async def calistir():
+            await manager.oturum_olustur(IndividualTrainingSession(1, 60, 101, 5, tarih_saat=self.tarih))
+            await manager.oturum_olustur(IndividualTrainingSession(2, 60, 101, 5, tarih_saat=self.tarih + timedelta(hours=2)))
+            await manager.oturum_tamamla(1)
+            with self.assertRaises(TakvimCakismasiHatasi):
+                await manager.oturum_planla(2, self.tarih + timedelta(minutes=30))
+            await manager.oturum_iptal_et(2)
+            with self.assertRaises(OturumBulunamadiHatasi):
+                await manager.oturum_iptal_et(99)
+
+        asyncio.run(calistir())
+        self.assertEqual(repo.id_ile_bul(1).durum, "tamamlandi")
+        self.assertEqual(repo.id_ile_bul(2).durum, "iptal_edildi")
+        self.assertEqual(metrik.sayac("olusturuldu"), 2)
+        self.assertEqual(metrik.sayac("cakisma_reddedildi"), 1)
+
+
+class TestEszamanliTrainingRepository(unittest.TestCase):
+    """EszamanliTrainingRepository sürüm kontrolünü, anlık görüntüyü ve thread güvenliğini test eder."""
+
+    def setUp(self):
+        """Her testten önce çalışır, temiz bir ortam kurar."""
+        self.repo = EszamanliTrainingRepository(serit_sayisi=8)
+        self.tarih = datetime(2025, 6, 2, 8, 0)
+
+    def test_eski_surumle_guncelleme_reddedilir(self):
+        """Aynı sürümden okunan iki kopyadan ikincisinin güncellemesi SurumCakismasiHatasi fırlatır."""
+        oturum = IndividualTrainingSession(1, 60, 101, 5, tarih_saat=self.tarih)
+        self.repo.kaydet(oturum)
+        self.assertEqual(oturum.surum, 1)
+
+        birinci = self.repo.id_ile_bul(1)
+        ikinci = self.repo.id_ile_bul(1)
+        birinci.oturum_tamamla()
+        self.repo.guncelle(birinci)
+        self.assertEqual(birinci.surum, 2)
+
+        ikinci.oturum_iptal_et()
+        with self.assertRaises(SurumCakismasiHatasi):
+            self.repo.guncelle(ikinci)
+        self.assertEqual(self.repo.id_ile_bul(1).durum, "tamamlandi")
+
+        # Okunan kopya değiştirilse de saklanan oturum değişmez
+        kopya = self.repo.id_ile_bul(1)
+        kopya.sure = 90
+        self.assertEqual(self.repo.id_ile_bul(1).sure, 60)
+
+    def test_anlik_goruntu_kilit_beklemez_ve_yazma_olmadan_paylasilir(self):
+        """Anlık görüntü yazma kilitleri tutulurken de alınır; araya yazma girmedikçe aynı sözlük paylaşılır."""
+        self.repo.kaydet(IndividualTrainingSession(1, 60, 101, 5, tarih_saat=self.tarih))
+        sonuclar = []
+        with self.repo._tum_indeksleri_kilitle():
+            okuyucu = threading.Thread(target=lambda: sonuclar.append(len(self.repo.anlik_goruntu())))
+            okuyucu.start()
+            okuyucu.join(timeout=5)
+        self.assertEqual(sonuclar, [1])
+
+        ilk = self.repo.anlik_goruntu()
+        self.assertIs(self.repo.anlik_goruntu()._oturumlar, ilk._oturumlar)
+        self.repo.kaydet(IndividualTrainingSession(2, 60, 101, 5, tarih_saat=self.tarih))
+        self.assertEqual(len(ilk), 1)
+        self.assertEqual(len(self.repo.anlik_goruntu()), 2)
+
+    def test_anlik_goruntu_sonraki_yazmalardan_etkilenmez(self):
+        """Anlık görüntü alındıktan sonraki ekleme, güncelleme ve silmeler görüntüye yansımaz."""
+        for oturum_id in range(1, 4):
+            self.repo.kaydet(IndividualTrainingSession(oturum_id, 60, 101, 5,
+                                                       tarih_saat=self.tarih + timedelta(days=oturum_id)))
+        goruntu = self.repo.anlik_goruntu()
+
+        oturum = self.repo.id_ile_bul(1)
+        oturum.oturum_planla(self.tarih + timedelta(days=10))
+        self.repo.guncelle(oturum)
+        self.repo.sil(2)
+        self.repo.kaydet(IndividualTrainingSession(4, 60, 101, 5, tarih_saat=self.tarih))
+
+        self.assertEqual(len(goruntu), 3)
+        self.assertEqual(goruntu.id_ile_bul(1).tarih_saat, self.tarih + timedelta(days=1))
+        self.assertEqual([o.oturum_id for o in goruntu.sporcuya_gore_filtrele(101)], [1, 2, 3])
+        self.assertEqual([o.oturum_id for o in self.repo.tarih_araligina_gore_filtrele(
+            self.tarih, self.tarih + timedelta(days=30))], [4, 3, 1])
+
+    def test_manager_ile_calisir(self):
+        """TrainingManager işlemleri kopya okuyup sürümlü güncelleme yaparak çalışır."""
+        manager = TrainingManager(self.repo)
+        manager.oturum_olustur(IndividualTrainingSession(1, 60, 101, 5, tarih_saat=self.tarih))
+        manager.oturum_olustur(IndividualTrainingSession(2, 60, 101, 5, tarih_saat=self.tarih + timedelta(hours=2)))
+        with self.assertRaises(TakvimCakismasiHatasi):
+            manager.oturum_planla(2, self.tarih + timedelta(minutes=30))
+        manager.oturum_planla(2, self.tarih + timedelta(hours=3))
+        manager.oturum_iptal_et(1)
+
+        self.assertEqual(self.repo.id_ile_bul(2).surum, 2)
+        self.assertEqual(self.repo.id_ile_bul(1).durum, "iptal_edildi")
+        self.assertTrue(self.repo.detayli_cakisma_kontrol(self.tarih + timedelta(hours=3), 30, athlete_id=101))
+
+    def test_eszamanli_yazma_ve_okumada_guncelleme_kaybolmaz(self):
+        """Çok thread'li güncelleme, ekleme/silme ve okumalardan sonra sayaçlar ve indeksler tutarlıdır."""
+        eski_aralik = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        self.addCleanup(sys.setswitchinterval, eski_aralik)
+
+        for oturum_id in range(1, 41):
+            self.repo.kaydet(IndividualTrainingSession(oturum_id, 1, oturum_id % 8 + 1, 5,
+                                                       tarih_saat=self.tarih + timedelta(hours=oturum_id)))
+        artislar = [0] * 41
+        hatalar = []
+        sayac_kilidi = threading.Lock()
+
+        def artir(tohum):
+            rng = random.Random(tohum)
+            for _ in range(150):
+                oturum_id = rng.randint(1, 40)
+                while True:
+                    oturum = self.repo.id_ile_bul(oturum_id)
+                    oturum.sure += 1
+                    try:
+                        self.repo.guncelle(oturum)
+                        break
+                    except SurumCakismasiHatasi:
+                        continue
+                with sayac_kilidi:
+                    artislar[oturum_id] += 1
+
+        def ekle_sil(tohum):
+            rng = random.Random(tohum)
+            for oturum_id in range(1000 + tohum * 1000, 1200 + tohum * 1000):
+                self.repo.kaydet(IndividualTrainingSession(oturum_id, 30, rng.randint(1, 8), 5,
+                                                           tarih_saat=self.tarih + timedelta(minutes=rng.randrange(5000))))
+                if rng.random() < 0.5:
+                    self.repo.sil(oturum_id)
+
+        def oku():
+            try:
+                for _ in range(100):
+                    goruntu = self.repo.anlik_goruntu()
+                    self.assertEqual(len(goruntu.tumunu_listele()), len(goruntu))
+                    for athlete_id in range(1, 9):
+                        self.assertTrue(all(o.athlete_id == athlete_id
+                                            for o in self.repo.sporcuya_gore_filtrele(athlete_id)))
+                    tarihler = [o.tarih_saat for o in self.repo.tarih_araligina_gore_filtrele(
+                        self.tarih, self.tarih + timedelta(days=10))]
+                    self.assertEqual(tarihler, sorted(tarihler))
+            except Exception as hata:
+                hatalar.append(hata)
+
+        threadler = [threading.Thread(target=artir, args=(tohum,)) for tohum in range(6)]
+        threadler += [threading.Thread(target=ekle_sil, args=(tohum,)) for tohum in range(2)]
+        threadler += [threading.Thread(target=oku) for _ in range(2)]
+        for thread in threadler:
+            thread.start()
+        for thread in threadler:
+            thread.join()
+
+        self.assertEqual(hatalar, [])
+        for oturum_id in range(1, 41):
+            oturum = self.repo.id_ile_bul(oturum_id)
+            self.assertEqual(oturum.sure, 1 + artislar[oturum_id])
+            self.assertEqual(oturum.surum, 1 + artislar[oturum_id])
+
+        # İndeksler, son durumdan sıfırdan kurulan bir repository ile aynı olmalı
+        referans = TrainingRepository()
+        for oturum in self.repo.tumunu_listele():
+            referans.kaydet(oturum)
+        for athlete_id in range(1, 9):
+            self.assertEqual(sorted(o.oturum_id for o in self.repo.sporcuya_gore_filtrele(athlete_id)),
+                             sorted(o.oturum_id for o in referans.sporcuya_gore_filtrele(athlete_id)))
+        bitis = self.tarih + timedelta(days=30)
+        self.assertEqual([o.oturum_id for o in self.repo.tarih_araligina_gore_filtrele(self.tarih, bitis)],
+                         [o.oturum_id for o in referans.tarih_araligina_gore_filtrele(self.tarih, bitis)])
+
+
+class TestOturumSorgusu(unittest.TestCase):
+    """Birleştirilebilir sorgu API'sinin indeks seçimini ve sonuç doğruluğunu test eder."""
+
+    def setUp(self):
+        """Her testten önce çalışır, rastgele oturumlarla bir ortam kurar."""
+        self.tarih = datetime(2025, 3, 1, 8, 0)
+        rng = random.Random(5)
+        self.oturumlar = []
+        for oturum_id in range(1, 401):
+            tarih = None if rng.random() < 0.1 else self.tarih + timedelta(hours=rng.randrange(24 * 90))
+            tip = rng.choice(["kondisyon", "teknik", "taktik"])
+            durum = rng.choice(["planlandı", "tamamlandi", "iptal_edildi"])
+            if rng.random() < 0.6:
+                oturum = IndividualTrainingSession(oturum_id, rng.randint(30, 120), rng.randint(1, 20), rng.randint(1, 5),
+                                                   oturum_tipi=tip, tarih_saat=tarih, durum=durum)
+            else:
+                oturum = TeamTrainingSession(oturum_id, rng.randint(30, 120), rng.randint(1, 6), rng.randint(1, 5), 12,
+                                             oturum_tipi=tip, tarih_saat=tarih, durum=durum)
+            self.oturumlar.append(oturum)
+
+    def _kaba_kuvvet(self, oturumlar, athlete_id=None, team_id=None, tip=None, durum=None, baslangic=None, bitis=None):
+        """Sorgunun beklenen sonucunu tüm oturumları tarayarak hesaplar."""
+        sonuc = []
+        for oturum in oturumlar:
+            if athlete_id is not None and getattr(oturum, "athlete_id", None) != athlete_id:
+                continue
+            if team_id is not None and oturum.team_id != team_id:
+                continue
+            if tip is not None and oturum.oturum_tipi != tip:
+                continue
+            if durum is not None and oturum.durum != durum:
+                continue
+            if baslangic is not None and (oturum.tarih_saat is None or not baslangic <= oturum.tarih_saat <= bitis):
+                continue
+            sonuc.append(oturum)
+        return sonuc
+
+    def test_sonuclar_tarama_ile_ayni(self):
+        """Rastgele koşul birleşimleri bellek içi, eşzamanlı ve SQLite repository'lerde taramayla aynı sonucu verir."""
+        repolar = [TrainingRepository(), EszamanliTrainingRepository(), SqliteTrainingRepository()]
+        for repo in repolar:
+            repo.kaydet_toplu(self.oturumlar)
+        rng = random.Random(9)
+        for _ in range(60):
+            kosullar = {}
+            if rng.random() < 0.5:
+                kosullar["athlete_id"] = rng.randint(1, 20)
+            if rng.random() < 0.3:
+                kosullar["team_id"] = rng.randint(1, 6)
+            if rng.random() < 0.5:
+                kosullar["tip"] = rng.choice(["kondisyon", "teknik", "taktik"])
+            if rng.random() < 0.5:
+                kosullar["durum"] = rng.choice(["planlandı", "tamamlandi", "iptal_edildi"])
+            if rng.random() < 0.5:
+                kosullar["baslangic"] = self.tarih + timedelta(days=rng.randrange(60))
+                kosullar["bitis"] = kosullar["baslangic"] + timedelta(days=rng.randrange(1, 40))
+            alan = rng.choice(["tarih_saat", "oturum_id", "sure"])
+            azalan = rng.random() < 0.5
+            beklenen = self._kaba_kuvvet(self.oturumlar, **kosullar)
+            if alan == "tarih_saat":
+                tarihli = sorted((o for o in beklenen if o.tarih_saat), key=lambda o: (o.tarih_saat, o.oturum_id),
+                                 reverse=azalan)
+                tarihsiz = sorted((o for o in beklenen if not o.tarih_saat), key=lambda o: o.oturum_id, reverse=azalan)
+                beklenen = tarihli + tarihsiz
+            else:
+                beklenen.sort(key=lambda o: (getattr(o, alan), o.oturum_id), reverse=azalan)
+
+            for repo in repolar:
+                sorgu = repo.sorgu()
+                if "athlete_id" in kosullar:
+                    sorgu.sporcu(kosullar["athlete_id"])
+                if "team_id" in kosullar:
+                    sorgu.takim(kosullar["team_id"])
+                if "tip" in kosullar:
+                    sorgu.tip(kosullar["tip"].upper())
+                if "durum" in kosullar:
+                    sorgu.durum(kosullar["durum"])
+                if "baslangic" in kosullar:
+                    sorgu.tarih_araligi(kosullar["baslangic"], kosullar["bitis"])
+                sorgu.sirala(alan, azalan)
+                self.assertEqual([o.oturum_id for o in sorgu], [o.oturum_id for o in beklenen])
+                self.assertEqual(sorgu.say(), len(beklenen))
+        repolar[2].kapat()
+
+    def test_en_secici_indeks_surucu_olur(self):
+        """Plan en küçük kovayı seçer; tarih sürücüsünde tarih sıralaması limitle tembel akar."""
+        repo = TrainingRepository()
+        repo.kaydet_toplu(self.oturumlar)
+        sporcu_kovasi = len(repo.sporcuya_gore_filtrele(3))
+        self.assertEqual(repo.sorgu().sporcu(3).durum("planlandı").tip("teknik").plan(), ("athlete_id", sporcu_kovasi))
+        gun = self.tarih + timedelta(days=10)
+        surucu, aday_sayisi = repo.sorgu().durum("planlandı").tarih_araligi(gun, gun + timedelta(hours=12)).plan()
+        self.assertEqual(surucu, "tarih_saat")
+        self.assertEqual(aday_sayisi, len(repo.tarih_araligina_gore_filtrele(gun, gun + timedelta(hours=12))))
+        self.assertEqual(repo.sorgu().sporcu(999).tip("teknik").plan(), ("athlete_id", 0))
+        self.assertEqual(repo.sorgu().plan(), ("tumu", 400))
+
+        ilk_uc = repo.sorgu().tarih_araligi(self.tarih).sirala("tarih_saat").limit(3).listele()
+        self.assertEqual(ilk_uc, repo.tarih_sirali_sayfa(limit=3)[0])
+        with self.assertRaises(ValueError):
+            repo.sorgu().sirala("performans_notu")
+
+    def test_durum_degisince_indeks_guncellenir(self):
+        """Manager üzerinden iptal edilen ve silinen oturumlar durum/tip kovalarına doğru yansır."""
+        repo = TrainingRepository()
+        manager = TrainingManager(repo)
+        manager.oturum_olustur(IndividualTrainingSession(1, 60, 7, 2, oturum_tipi="teknik", tarih_saat=self.tarih))
+        manager.oturum_olustur(IndividualTrainingSession(2, 60, 7, 2, oturum_tipi="teknik",
+                                                         tarih_saat=self.tarih + timedelta(days=1)))
+        manager.oturum_iptal_et(1)
+        self.assertEqual([o.oturum_id for o in repo.sorgu().sporcu(7).durum("planlandı")], [2])
+        self.assertEqual(repo.sorgu().sporcu(7).durum("iptal_edildi").ilk().oturum_id, 1)
+        repo.sil(2)
+        self.assertIsNone(repo.sorgu().tip("teknik").durum("planlandı").ilk())
+        manager.oturum_olustur(TeamTrainingSession(3, 90, 4, 2, 12, tarih_saat=self.tarih))
+        self.assertEqual(repo.sorgu().saha(2).takim(4).say(), 1)
+
+
+@unittest.skipUnless(np is not None, "numpy kurulu değil")
+class TestMaliyetMotoru(unittest.TestCase):
+    """Vektörel maliyet motorunun nesne metotlarıyla birebir aynı sonuç verdiğini test eder."""
+
+    def setUp(self):
+        """Her testten önce çalışır, tüm fiyat kurallarını kapsayan rastgele oturumlar üretir."""
+        rng = random.Random(11)
+        self.oturumlar = []
+        for oturum_id in range(1, 3001):
+            sure = rng.randint(1, 480)
+            tarih = None if rng.random() < 0.2 else datetime(2025, 1, 1, 8, 0) + timedelta(hours=rng.randrange(24 * 365))
+            secim = rng.random()
+            if secim < 0.4:
+                oturum = IndividualTrainingSession(oturum_id, sure, rng.randint(1, 30), rng.randint(1, 5),
+                                                   odak_alani=rng.choice(["koordinasyon", "hız", "güç"]),
+                                                   tarih_saat=tarih)
+            elif secim < 0.7:
+                oturum = TeamTrainingSession(oturum_id, sure, rng.randint(1, 6), rng.randint(1, 5), rng.randint(2, 30),
+                                             antrenman_plani=rng.choice(["maç_hazırlığı", "taktik"]),
+                                             tarih_saat=tarih)
+            else:
+                oturum = RehabTrainingSession(oturum_id, sure, rng.randint(1, 30), rng.randint(1, 4),
+                                              sakatlik_tipi=rng.choice(["kırık", "yırtık", "burkulma"]),
+                                              tarih_saat=tarih)
+            self.oturumlar.append(oturum)
+
+    def _beklenen_gruplar(self, anahtar_fonksiyonu):
+        """Nesne metotlarından kuruş toplamlarıyla beklenen grup toplamlarını hesaplar."""
+        kuruslar = {}
+        for oturum in self.oturumlar:
+            anahtar = anahtar_fonksiyonu(oturum)
+            kuruslar[anahtar] = kuruslar.get(anahtar, 0) + round(oturum.oturum_maliyeti_hesapla() * 100)
+        return {anahtar: kurus / 100 for anahtar, kurus in kuruslar.items()}
+
+    def test_oturum_maliyetleri_birebir_ayni(self):
+        """Her oturumun maliyeti oturum_maliyeti_hesapla ile aynıdır."""
+        motor = MaliyetMotoru(self.oturumlar)
+        beklenen = [oturum.oturum_maliyeti_hesapla() for oturum in self.oturumlar]
+        self.assertEqual(motor.maliyetler().tolist(), beklenen)
+        self.assertEqual(len(motor), len(self.oturumlar))
+
+    def test_gruplama(self):
+        """Takım, antrenör, fizyoterapist, ay ve tip toplamları nesne metotlarıyla aynıdır."""
+        motor = MaliyetMotoru(self.oturumlar)
+        self.assertEqual(motor.grupla("takim"), self._beklenen_gruplar(lambda o: o.team_id))
+        self.assertEqual(motor.grupla("antrenor"), self._beklenen_gruplar(lambda o: getattr(o, "antrenor_id", None)))
+        self.assertEqual(motor.grupla("fizyoterapist"),
+                         self._beklenen_gruplar(lambda o: getattr(o, "fizyoterapist_id", None)))
+        self.assertEqual(motor.grupla("ay"), self._beklenen_gruplar(
+            lambda o: None if o.tarih_saat is None else (o.tarih_saat.year, o.tarih_saat.month)))
+        self.assertEqual(motor.grupla("tip"), self._beklenen_gruplar(lambda o: o.oturum_tipi))
+        self.assertEqual(sum(motor.grupla("tur").values()), motor.toplam())
+        with self.assertRaises(ValueError):
+            motor.grupla("saha")
+
+    def test_repository_ve_alt_sinif(self):
+        """Repository'den oluşturma çalışır; bilinmeyen alt sınıflar kendi maliyet metodunu kullanır."""
+        class IndirimliOturum(IndividualTrainingSession):
+            def oturum_maliyeti_hesapla(self) -> float:
+                return round(super().oturum_maliyeti_hesapla() * 0.5, 2)
+
+        repo = TrainingRepository()
+        repo.kaydet_toplu(self.oturumlar[:50])
+        repo.kaydet(IndirimliOturum(9001, 75, 3, 2, odak_alani="koordinasyon"))
+        motor = MaliyetMotoru.repositoryden_olustur(repo)
+        self.assertEqual(motor.maliyetler().tolist(), [o.oturum_maliyeti_hesapla() for o in repo.tumunu_listele()])
+        self.assertEqual(motor.grupla("tur")["IndirimliOturum"], 112.5)
+        self.assertEqual(MaliyetMotoru([]).toplam(), 0.0)
+
+    def test_alan_okuyucu_ezilen_ozelligi_okur(self):
+        """Alan okuyucu property ile aynı değeri verir; alt sınıfta ezilen property'yi kullanır."""
+        class EtiketliTakim(TeamTrainingSession):
+            __slots__ = ()
+
+            @TeamTrainingSession.team_id.getter
+            def team_id(self):
+                return -self._team_id
+
+        takim = EtiketliTakim(1, 60, 4, 2, 10)
+        self.assertEqual(EtiketliTakim.alan_okuyucu("team_id")(takim), -4)
+        self.assertIs(IndividualTrainingSession.alan_okuyucu("sure"), TeamTrainingSession.alan_okuyucu("sure"))
+        self.assertIsNone(TeamTrainingSession.alan_okuyucu("fizyoterapist_id"))
+        for oturum in self.oturumlar[:30]:
+            for alan in ("oturum_id", "sure", "team_id", "tarih_saat", "oturum_tipi"):
+                self.assertEqual(type(oturum).alan_okuyucu(alan)(oturum), getattr(oturum, alan))
+        self.assertEqual(MaliyetMotoru([takim]).grupla("takim"), {-4: takim.oturum_maliyeti_hesapla()})
+
+
+class TestDurumSayaclari(unittest.TestCase):
+    """Repository'nin canlı durum sayaçlarının kayıt, durum geçişi ve silmede güncel kaldığını test eder."""
+
+    def _rastgele_islemler(self, repo):
+        """Repository üzerinde manager ile rastgele kayıt, tamamlama, iptal ve silme işlemleri yapar."""
+        rng = random.Random(3)
+        manager = TrainingManager(repo)
+        repo.kaydet_toplu(IndividualTrainingSession(oturum_id, 60, rng.randint(1, 8), 2) for oturum_id in range(1, 101))
+        for oturum_id in range(101, 161):
+            manager.oturum_olustur(TeamTrainingSession(oturum_id, 60, rng.randint(1, 4), 3, 12))
+        for _ in range(150):
+            oturum_id = rng.randint(1, 160)
+            if repo.id_ile_bul(oturum_id) is None:
+                continue
+            secim = rng.random()
+            if secim < 0.4:
+                manager.oturum_tamamla(oturum_id)
+            elif secim < 0.8:
+                manager.oturum_iptal_et(oturum_id)
+            else:
+                repo.sil(oturum_id)
+        return manager
+
+    def test_sayaclar_yeniden_sayimla_ayni(self):
+        """Bellek, eşzamanlı ve SQLite repository'lerde sayaçlar tam sayımla aynıdır."""
+        for repo in (TrainingRepository(), EszamanliTrainingRepository(), SqliteTrainingRepository()):
+            manager = self._rastgele_islemler(repo)
+            oturumlar = repo.tumunu_listele()
+            self.assertEqual(repo.durum_sayilari(), TrainingStatistics.durum_sayim(oturumlar))
+            for athlete_id in range(1, 9):
+                beklenen = TrainingStatistics.oturumlardan_olustur(
+                    athlete_id, [o for o in oturumlar if getattr(o, "athlete_id", None) is not None])
+                self.assertEqual(manager.sporcu_istatistikleri(athlete_id).istatistik_ozeti(),
+                                 beklenen.istatistik_ozeti())
+            if hasattr(repo, "sayac_tutarliligi_kontrol"):
+                self.assertEqual(repo.sayac_tutarliligi_kontrol(), {})
+
+    def test_tutarlilik_kontrolu_yerinde_degisikligi_bulur(self):
+        """guncelle çağrılmadan yerinde değiştirilen durum tutarsızlık olarak raporlanır."""
+        repo = TrainingRepository()
+        repo.kaydet(IndividualTrainingSession(1, 60, 5, 2))
+        self.assertEqual(repo.durum_sayilari(5), {"planlandı": 1})
+        repo.id_ile_bul(1).durum = "tamamlandi"
+        self.assertEqual(repo.sayac_tutarliligi_kontrol(), {
+            (None, "planlandı"): (1, 0), (None, "tamamlandi"): (0, 1),
+            (5, "planlandı"): (1, 0), (5, "tamamlandi"): (0, 1),
+        })
+        repo.guncelle(repo.id_ile_bul(1))
+        self.assertEqual(repo.sayac_tutarliligi_kontrol(), {})
+        repo.sil(1)
+        self.assertEqual(repo.durum_sayilari(), {})
+        self.assertEqual(repo.durum_sayilari(5), {})
+
+
+class TestHaftalikYuk(unittest.TestCase):
+    """ISO hafta kovalı sporcu/takım yük indeksinin artımlı güncellenmesini test eder."""
+
+    def setUp(self):
+        """Her testten önce çalışır; 2025-03-09 Pazar (10. hafta), 2025-03-10 Pazartesi (11. hafta)."""
+        self.pazar = datetime(2025, 3, 9, 10, 0)
+        self.pazartesi = datetime(2025, 3, 10, 10, 0)
+
+    def test_kayit_planlama_ve_iptal(self):
+        """Kayıt, yeniden planlama, iptal ve silme haftalık toplamlara yansır."""
+        repo = TrainingRepository()
+        manager = TrainingManager(repo)
+        manager.oturum_olustur(IndividualTrainingSession(1, 120, 7, 3, tarih_saat=self.pazar))
+        manager.oturum_olustur(IndividualTrainingSession(2, 90, 7, 3, tarih_saat=self.pazartesi))
+        manager.oturum_olustur(TeamTrainingSession(3, 60, 3, 2, 12, tarih_saat=self.pazartesi + timedelta(hours=4)))
+        repo.kaydet(IndividualTrainingSession(4, 45, 7, 3))
+        self.assertEqual(repo.haftalik_yuk(self.pazar, athlete_id=7), 120)
+        self.assertEqual(repo.haftalik_yuk(self.pazartesi, athlete_id=7), 90)
+        self.assertEqual(repo.haftalik_yuk(self.pazartesi, team_id=3), 60)
+
+        manager.oturum_planla(1, self.pazartesi + timedelta(days=2))
+        self.assertEqual(repo.haftalik_yukler(athlete_id=7), {(2025, 11): 210})
+        manager.oturum_iptal_et(2)
+        self.assertEqual(repo.haftalik_yuk(self.pazartesi, athlete_id=7), 120)
+        repo.sil(3)
+        self.assertEqual(repo.haftalik_yukler(team_id=3), {})
+        with self.assertRaises(ValueError):
+            repo.haftalik_yuk(self.pazar)
+
+    def test_sinir_asanlar(self):
+        """Seviyeye göre sınırı aşan sporcular hafta kovasından okunur."""
+        for repo in (TrainingRepository(), EszamanliTrainingRepository()):
+            manager = TrainingManager(repo)
+            for gun in range(5):
+                for athlete_id, sure in ((1, 80), (2, 60)):
+                    manager.oturum_olustur(IndividualTrainingSession(
+                        athlete_id * 10 + gun, sure, athlete_id, 4, tarih_saat=self.pazartesi + timedelta(days=gun)))
+            # Sporcu 1: 400 dk > 360 (orta); sporcu 2: 300 dk
+            self.assertEqual(repo.haftalik_sinir_asanlar(self.pazartesi), {1: (400, 360)})
+            repo.haftalik_seviye_ata("yüksek", athlete_id=1)
+            repo.haftalik_seviye_ata("düşük", athlete_id=2)
+            self.assertEqual(repo.haftalik_sinir_asanlar(self.pazartesi), {2: (300, 240)})
+            manager.oturum_iptal_et(20)
+            self.assertEqual(repo.haftalik_sinir_asanlar(self.pazartesi), {})
+            self.assertEqual(repo.haftalik_sinir_asanlar(self.pazar), {})
+            with self.assertRaises(ValueError):
+                repo.haftalik_seviye_ata("çok_yüksek", athlete_id=1)
+
+    def test_rastgele_islemler_yeniden_hesapla_ayni(self):
+        """Rastgele işlemlerden sonra haftalık toplamlar tüm oturumlardan yeniden hesaplananla aynıdır."""
+        rng = random.Random(8)
+        repo = TrainingRepository()
+        manager = TrainingManager(repo)
+        for oturum_id in range(1, 301):
+            tarih = None if rng.random() < 0.1 else self.pazartesi + timedelta(hours=rng.randrange(24 * 60))
+            repo.kaydet(IndividualTrainingSession(oturum_id, rng.randint(30, 120), rng.randint(1, 10),
+                                                  rng.randint(1, 3), tarih_saat=tarih))
+        for _ in range(200):
+            oturum_id = rng.randint(1, 300)
+            if repo.id_ile_bul(oturum_id) is None:
+                continue
+            secim = rng.random()
+            if secim < 0.3:
+                manager.oturum_iptal_et(oturum_id)
+            elif secim < 0.8:
+                oturum = repo.id_ile_bul(oturum_id)
+                oturum.tarih_saat = self.pazartesi + timedelta(hours=rng.randrange(24 * 60))
+                repo.guncelle(oturum)
+            else:
+                repo.sil(oturum_id)
+
+        beklenen = {}
+        for oturum in repo.tumunu_listele():
+            if oturum.tarih_saat is None or oturum.durum == "iptal_edildi":
+                continue
+            hafta = tuple(oturum.tarih_saat.isocalendar())[:2]
+            haftalar = beklenen.setdefault(oturum.athlete_id, {})
+            haftalar[hafta] = haftalar.get(hafta, 0) + oturum.sure
+        for athlete_id in range(1, 11):
+            self.assertEqual(repo.haftalik_yukler(athlete_id=athlete_id), dict(sorted(beklenen.get(athlete_id, {}).items())))
+
+
+@unittest.skipUnless(np is not None, "numpy kurulu değil")
+class TestAkutKronikYukAnalizi(unittest.TestCase):
+    """Gün matrisli akut/kronik yük hesabının saf hesapla aynı olduğunu test eder."""
+
+    def setUp(self):
+        """Her testten önce çalışır, rastgele tamamlanmış/planlı oturumlar üretir."""
+        rng = random.Random(4)
+        self.baslangic = datetime(2025, 1, 1, 9, 0)
+        self.oturumlar = [
+            IndividualTrainingSession(oturum_id, rng.randint(30, 120), rng.randint(1, 6), 1,
+                                      oturum_tipi=rng.choice(["kondisyon", "teknik", "taktik"]),
+                                      tarih_saat=self.baslangic + timedelta(hours=rng.randrange(24 * 120)),
+                                      durum=rng.choice(["tamamlandi", "tamamlandi", "planlandı"]))
+            for oturum_id in range(1, 601)
+        ]
+
+    def _saf(self, athlete_id, gun):
+        """Sporcunun o günkü akut ve kronik ortalamalarını tüm oturumları tarayarak hesaplar."""
+        akut = kronik = 0.0
+        agirliklar = {"kondisyon": 1.0, "teknik": 0.8, "taktik": 0.7}
+        for oturum in self.oturumlar:
+            if oturum.athlete_id != athlete_id or oturum.durum != "tamamlandi":
+                continue
+            fark = (gun - oturum.tarih_saat.date()).days
+            if 0 <= fark < 28:
+                kronik += oturum.sure * agirliklar[oturum.oturum_tipi]
+                if fark < 7:
+                    akut += oturum.sure * agirliklar[oturum.oturum_tipi]
+        return akut / 7, kronik / 28
+
+    def test_toplu_ve_artimli_ekleme_saf_hesapla_ayni(self):
+        """Toplu + tek tek eklenen (geçmişe uzanan dahil) oturumlarla değerler saf hesapla aynıdır."""
+        analiz = AkutKronikYukAnalizi()
+        # Son oturumlar önce eklenir; önceki tarihler gün eksenini sola genişletir
+        analiz.oturumlari_ekle(self.oturumlar[300:])
+        for oturum in self.oturumlar[:300]:
+            analiz.oturum_ekle(oturum)
+        gunler = analiz.gunler().astype(object).tolist()
+        for athlete_id in range(1, 7):
+            seri = analiz.sporcu_serisi(athlete_id)
+            for sira in range(0, len(gunler), 9):
+                akut, kronik = self._saf(athlete_id, gunler[sira])
+                self.assertAlmostEqual(seri["akut"][sira], akut, places=9)
+                self.assertAlmostEqual(seri["kronik"][sira], kronik, places=9)
+        akut, kronik, oran = analiz.matrisler()
+        self.assertEqual(akut.shape, (6, len(gunler)))
+        gun = gunler[60]
+        for athlete_id, (gun_akut, gun_kronik, gun_orani) in analiz.gun_degerleri(gun).items():
+            satir = analiz.sporcular().index(athlete_id)
+            self.assertEqual((gun_akut, gun_kronik), (akut[satir, 60], kronik[satir, 60]))
+            if gun_orani is not None:
+                self.assertAlmostEqual(oran[satir, 60], gun_orani)
+        self.assertIsNone(analiz.sporcu_serisi(99))
+
+    def test_dinleyici_ve_agirliklar(self):
+        """Manager'da tamamlanan oturum dinleyiciyle analize eklenir; ağırlıklar değiştirilebilir."""
+        repo = TrainingRepository()
+        analiz = AkutKronikYukAnalizi({"teknik": 2.0})
+        manager = TrainingManager(repo, [AkutKronikYukDinleyici(analiz, repo)])
+        manager.oturum_olustur(IndividualTrainingSession(1, 70, 5, 1, oturum_tipi="teknik", tarih_saat=self.baslangic))
+        self.assertEqual(analiz.sporcular(), [])
+        manager.oturum_tamamla(1)
+        self.assertEqual(analiz.gun_degerleri(self.baslangic.date()), {5: (20.0, 5.0, 4.0)})
+        self.assertTrue(analiz.oturum_cikar(repo.id_ile_bul(1)))
+        self.assertEqual(analiz.gun_degerleri(self.baslangic.date()), {5: (0.0, 0.0, None)})
+
+    def _dinleyicili_manager(self):
+        """Tamamlanmış tek oturumlu, yük dinleyicili bir manager ve analiz döndürür."""
+        repo = TrainingRepository()
+        analiz = AkutKronikYukAnalizi()
+        manager = TrainingManager(repo, [AkutKronikYukDinleyici(analiz, repo)])
+        manager.oturum_olustur(IndividualTrainingSession(1, 70, 5, 1, tarih_saat=self.baslangic))
+        manager.oturum_tamamla(1)
+        return manager, analiz
+
+    def test_dinleyici_tekrar_tamamlamayi_saymaz(self):
+        """Aynı oturum ikinci kez tamamlandı işaretlenince yükü iki kez eklenmez."""
+        manager, analiz = self._dinleyicili_manager()
+        manager.oturum_tamamla(1)
+        self.assertEqual(analiz.gun_degerleri(self.baslangic.date()), {5: (10.0, 2.5, 4.0)})
+
+    def test_dinleyici_iptalde_yuku_geri_alir(self):
+        """Sayılmış oturum iptal edilince yükü analizden çıkarılır; tekrar tamamlanınca yeniden eklenir."""
+        manager, analiz = self._dinleyicili_manager()
+        manager.oturum_iptal_et(1)
+        self.assertEqual(analiz.gun_degerleri(self.baslangic.date()), {5: (0.0, 0.0, None)})
+        manager.oturum_tamamla(1)
+        self.assertEqual(analiz.gun_degerleri(self.baslangic.date()), {5: (10.0, 2.5, 4.0)})
+
+    def test_dinleyici_yeniden_planlamada_yuku_tasir(self):
+        """Sayılmış oturum yeniden planlanınca yükü eski günden çıkıp yeni güne eklenir."""
+        manager, analiz = self._dinleyicili_manager()
+        yeni_tarih = self.baslangic + timedelta(days=10)
+        manager.oturum_planla(1, yeni_tarih)
+        self.assertEqual(analiz.gun_degerleri(self.baslangic.date()), {5: (0.0, 0.0, None)})
+        self.assertEqual(analiz.gun_degerleri(yeni_tarih.date()), {5: (10.0, 2.5, 4.0)})
+
+
+class TestPerformansAnalizi(unittest.TestCase):
+    """Histogram tabanlı not ortalama/yüzdeliklerinin saf hesapla aynı olduğunu test eder."""
+
+    def setUp(self):
+        """Her testten önce çalışır, rastgele notlu bireysel oturumlar üretir."""
+        rng = random.Random(19)
+        self.bugun = datetime(2025, 3, 31).date()
+        self.oturumlar = []
+        for oturum_id in range(1, 401):
+            oturum = IndividualTrainingSession(
+                oturum_id, 60, rng.randint(1, 5), 1,
+                odak_alani=rng.choice(["hız", "güç", "esneklik"]),
+                tarih_saat=datetime(2025, 1, 1, 10, 0) + timedelta(days=rng.randrange(90)))
+            oturum.performans_notu_guncelle(round(rng.uniform(0, 10), 1))
+            self.oturumlar.append(oturum)
+
+    def _saf_notlar(self, odak_alani, son_gun):
+        """Son son_gun gündeki odak alanı notlarını tüm oturumları tarayarak sıralı döndürür."""
+        return sorted(o.performans_notu for o in self.oturumlar
+                      if o.odak_alani == odak_alani and 0 <= (self.bugun - o.tarih_saat.date()).days < son_gun)
+
+    def test_pencereli_ortalama_ve_yuzdelik_saf_hesapla_ayni(self):
+        """Son 30 gün ve tüm zamanlar için ortalama, p50 ve p90 saf hesapla aynıdır."""
+        analiz = PerformansAnalizi(saklama_gun=60)
+        self.assertEqual(analiz.notlari_ekle(self.oturumlar), 400)
+        for odak_alani in ("hız", "güç", "esneklik"):
+            for son_gun in (30, None):
+                notlar = self._saf_notlar(odak_alani, son_gun or 1000)
+                self.assertEqual(analiz.adet(odak_alani=odak_alani, son_gun=son_gun, bugun=self.bugun), len(notlar))
+                self.assertAlmostEqual(
+                    analiz.ortalama(odak_alani=odak_alani, son_gun=son_gun, bugun=self.bugun),
+                    sum(notlar) / len(notlar))
+                for oran in (0.5, 0.9):
+                    sira = max(1, -(-len(notlar) * oran // 1))
+                    self.assertEqual(
+                        analiz.yuzdelik(oran, odak_alani=odak_alani, son_gun=son_gun, bugun=self.bugun),
+                        notlar[int(sira) - 1])
+        self.assertIsNone(analiz.yuzdelik(0.9, athlete_id=99))
+        with self.assertRaises(ValueError):
+            analiz.ortalama(odak_alani="hız", son_gun=90, bugun=self.bugun)
+        with self.assertRaises(ValueError):
+            analiz.ortalama(athlete_id=1, odak_alani="hız")
+        with self.assertRaises(ValueError):
+            analiz.yuzdelik(0, athlete_id=1)
+
+    def test_manager_not_guncellemesi_analize_yansir(self):
+        """Manager ile yeniden yazılan not dinleyiciyle eski notu geri alarak analize yansır."""
+        repo = TrainingRepository()
+        analiz = PerformansAnalizi()
+        manager = TrainingManager(repo, [PerformansAnaliziDinleyici(analiz, repo)])
+        tarih = datetime(2025, 3, 30, 10, 0)
+        manager.oturum_olustur(IndividualTrainingSession(1, 60, 7, 1, odak_alani="hız", tarih_saat=tarih))
+        manager.oturum_olustur(RehabTrainingSession(2, 45, 7, 3, "kas", tarih_saat=tarih + timedelta(hours=2)))
+        manager.performans_notu_guncelle(1, 6.0)
+        manager.performans_notu_guncelle(1, 8.5)
+        manager.ilerleme_notu_guncelle(2, 4.0)
+        self.assertEqual(analiz.adet(odak_alani="hız"), 1)
+        self.assertEqual(analiz.yuzdelik(0.9, odak_alani="hız", son_gun=30, bugun=self.bugun), 8.5)
+        self.assertEqual(analiz.ortalama(athlete_id=7), 8.5)
+        self.assertEqual(analiz.ortalama(athlete_id=7, metrik="ilerleme"), 4.0)
+        self.assertEqual(analiz.ortalama(sakatlik_tipi="kas"), 4.0)
+        self.assertEqual(repo.id_ile_bul(1).performans_notu, 8.5)
+        with self.assertRaises(AntrenmanHatasi):
+            manager.ilerleme_notu_guncelle(1, 5.0)
+        with self.assertRaises(OturumBulunamadiHatasi):
+            manager.performans_notu_guncelle(99, 5.0)
+
+    def test_yeniden_planlanan_oturumun_eski_notu_yazildigi_gunden_geri_alinir(self):
+        """Not verildikten sonra tarihi değişen oturumun eski notu ilk yazıldığı günden geri alınır."""
+        repo = TrainingRepository()
+        analiz = PerformansAnalizi()
+        manager = TrainingManager(repo, [PerformansAnaliziDinleyici(analiz, repo)])
+        tarih = datetime(2025, 3, 20, 10, 0)
+        manager.oturum_olustur(IndividualTrainingSession(1, 60, 7, 1, odak_alani="hız", tarih_saat=tarih))
+        manager.performans_notu_guncelle(1, 5.0)
+        manager.oturum_planla(1, tarih + timedelta(days=9))
+        manager.performans_notu_guncelle(1, 6.0)
+        self.assertEqual(analiz.adet(athlete_id=7), 1)
+        self.assertEqual(analiz.adet(athlete_id=7, son_gun=30, bugun=self.bugun), 1)
+        self.assertEqual(analiz.ortalama(athlete_id=7, son_gun=30, bugun=self.bugun), 6.0)
+        self.assertEqual(analiz.adet(athlete_id=7, son_gun=5, bugun=self.bugun), 1)
+        self.assertEqual(analiz.notlari_ekle([repo.id_ile_bul(1)]), 1)
+        self.assertEqual(analiz.adet(odak_alani="hız"), 1)
+
+    def test_ileri_tarihli_not_pencereli_sorgulari_bozmaz(self):
+        """Saklama süresinden ileri tarihli bir not bugünün pencere histogramlarını silmez."""
+        analiz = PerformansAnalizi(saklama_gun=60)
+        bugun = datetime.now().replace(hour=10, minute=0, second=0, microsecond=0)
+        oturumlar = [IndividualTrainingSession(1, 60, 7, 1, odak_alani="hız", tarih_saat=bugun - timedelta(days=2)),
+                     IndividualTrainingSession(2, 60, 7, 1, odak_alani="hız", tarih_saat=bugun + timedelta(days=800))]
+        for oturum, notu in zip(oturumlar, (4.0, 9.0)):
+            oturum.performans_notu_guncelle(notu)
+        self.assertEqual(analiz.notlari_ekle(oturumlar), 2)
+        self.assertEqual(analiz.adet(odak_alani="hız", son_gun=30), 1)
+        self.assertEqual(analiz.ortalama(odak_alani="hız", son_gun=30), 4.0)
+        self.assertEqual(analiz.adet(odak_alani="hız"), 2)
+
+    def test_pencereden_cikan_notlarin_kayitlari_atilir(self):
+        """Günü saklama penceresinden çıkan notların kayıtları atılır; yeniden yazılan eski not tüm zamanlardan geri alınır."""
+        analiz = PerformansAnalizi(saklama_gun=30)
+        oturumlar = []
+        for oturum_id in range(1, 121):
+            oturum = IndividualTrainingSession(oturum_id, 60, 7, 1, odak_alani="hız",
+                                               tarih_saat=datetime(2025, 3, 31, 10, 0) - timedelta(days=120 - oturum_id))
+            oturum.performans_notu_guncelle(5.0)
+            oturumlar.append(oturum)
+        self.assertEqual(analiz.notlari_ekle(oturumlar, bugun=self.bugun), 120)
+        self.assertEqual(len(analiz._not_kayitlari), 30)
+        self.assertEqual(sum(map(len, analiz._kayit_gunleri.values())), 30)
+
+        oturumlar[0].performans_notu_guncelle(9.0)
+        self.assertTrue(analiz.not_kaydet(oturumlar[0], self.bugun, eski_not=5.0))
+        self.assertEqual(analiz.adet(athlete_id=7), 120)
+        self.assertAlmostEqual(analiz.ortalama(athlete_id=7), (119 * 5.0 + 9.0) / 120)
+        self.assertEqual(analiz.adet(athlete_id=7, son_gun=30, bugun=self.bugun), 30)
+
+    def test_referans_gun_cagirandan_alinir(self):
+        """Verilen bugünden ileri tarihli not pencereyi bugünün ötesine kaydırmaz."""
+        analiz = PerformansAnalizi(saklama_gun=30)
+        oturumlar = [IndividualTrainingSession(1, 60, 7, 1, odak_alani="hız", tarih_saat=datetime(2025, 3, 29, 10, 0)),
+                     IndividualTrainingSession(2, 60, 7, 1, odak_alani="hız", tarih_saat=datetime(2025, 6, 1, 10, 0))]
+        for oturum in oturumlar:
+            oturum.performans_notu_guncelle(6.0)
+        analiz.notlari_ekle(oturumlar, bugun=self.bugun)
+        self.assertEqual(analiz.adet(odak_alani="hız", son_gun=7, bugun=self.bugun), 1)
+        self.assertEqual(sorted(analiz._not_kayitlari), [1, 2])
+
+
+class TestBireyselRaporUretici(unittest.TestCase):
+    """Parçalı/paralel sporcu raporu üretiminin doğrudan üretimle aynı olduğunu test eder."""
+
+    def setUp(self):
+        """Her testten önce çalışır, karışık oturumlu bir repository hazırlar."""
+        rng = random.Random(20)
+        self.repo = TrainingRepository()
+        self.bireyseller = []
+        for oturum_id in range(1, 301):
+            oturum = IndividualTrainingSession(
+                oturum_id, rng.randint(30, 150), rng.randint(1, 25), rng.randint(1, 5),
+                tarih_saat=rng.choice([None, datetime(2025, 1, 1, 9, 0) + timedelta(minutes=rng.randrange(10 ** 5))]))
+            if rng.random() < 0.5:
+                oturum.performans_notu_guncelle(round(rng.uniform(0, 10), 1))
+            self.bireyseller.append(oturum)
+        self.repo.kaydet_toplu(self.bireyseller)
+        self.repo.kaydet(RehabTrainingSession(301, 45, 99, 2, "kas"))
+
+    def _beklenen(self):
+        """Her sporcunun raporunu doğrudan sporcu_raporu_olustur ile üretir."""
+        sporcular = sorted({oturum.athlete_id for oturum in self.bireyseller})
+        return [(athlete_id, sporcu_raporu_olustur(
+            athlete_id, [o for o in self.bireyseller if o.athlete_id == athlete_id])) for athlete_id in sporcular]
+
+    def test_tek_surec_ve_havuz_dogrudan_uretimle_ayni(self):
+        """Tek süreçte ve süreç havuzunda parçalı üretim aynı raporları sporcu sırasıyla verir."""
+        beklenen = self._beklenen()
+        self.assertEqual(list(BireyselRaporUretici(self.repo, isci_sayisi=1, parca_boyutu=4).raporlar()), beklenen)
+        self.assertEqual(list(BireyselRaporUretici(self.repo, isci_sayisi=2, parca_boyutu=3).raporlar()), beklenen)
+        metin = dict(beklenen)[1]
+        self.assertTrue(metin.startswith("##### SPORCU 1 - BİREYSEL ANTRENMAN RAPORLARI"))
+        self.assertIn(self.repo.sporcuya_gore_filtrele(1)[0].bireysel_rapor_olustur(), metin)
+
+    def test_klasor_ve_arsiv_ciktisi(self):
+        """Raporlar sporcu başına dosyaya ve zip arşivine yazılır; yalnız bireysel oturumu olanlar raporlanır."""
+        beklenen = dict(self._beklenen())
+        uretici = BireyselRaporUretici(self.repo, isci_sayisi=1, parca_boyutu=7)
+        with tempfile.TemporaryDirectory() as klasor:
+            self.assertEqual(uretici.klasore_yaz(os.path.join(klasor, "raporlar")), len(beklenen))
+            with open(os.path.join(klasor, "raporlar", "sporcu_3.txt"), encoding="utf-8") as dosya:
+                self.assertEqual(dosya.read(), beklenen[3])
+            arsiv_yolu = os.path.join(klasor, "raporlar.zip")
+            self.assertEqual(uretici.arsive_yaz(arsiv_yolu, [3, 99]), 1)
+            with zipfile.ZipFile(arsiv_yolu) as arsiv:
+                self.assertEqual(arsiv.namelist(), ["sporcu_3.txt"])
+                self.assertEqual(arsiv.read("sporcu_3.txt").decode("utf-8"), beklenen[3])
+        with self.assertRaises(ValueError):
+            BireyselRaporUretici(self.repo, isci_sayisi=0)
+        with self.assertRaises(ValueError):
+            BireyselRaporUretici(self.repo, parca_boyutu=0)
+
+
+class TestDisaAktarim(unittest.TestCase):
+    """Oturumların JSONL/CSV olarak akışla dışa aktarımını test eder."""
+
+    def setUp(self):
+        """Her testten önce çalışır, üç türden oturum içeren bir repository hazırlar."""
+        self.repo = TrainingRepository()
+        self.repo.kaydet_toplu([
+            IndividualTrainingSession(1, 60, 100, 5, odak_alani="güç", tarih_saat=datetime(2025, 6, 1, 9, 0)),
+            TeamTrainingSession(2, 90, 10, 3, 12, tarih_saat=datetime(2025, 6, 1, 10, 0)),
+            RehabTrainingSession(3, 45, 101, 7, "kas", ilerleme_notu=4.5),
+        ])
+        self.klasor = tempfile.TemporaryDirectory()
+        self.addCleanup(self.klasor.cleanup)
+
+    def test_jsonl_satirlari_oturum_detaylari_ile_ayni(self):
+        """Her satır oturum_detaylari_getir sözlüğüdür ve oturumlar geri kurulabilir."""
+        yol = os.path.join(self.klasor.name, "oturumlar.jsonl")
+        self.assertEqual(oturumlari_disa_aktar(self.repo, yol, parca_boyutu=2), 3)
+        with open(yol, encoding="utf-8") as dosya:
+            satirlar = [json.loads(satir) for satir in dosya]
+        self.assertEqual(satirlar, [o.oturum_detaylari_getir() for o in self.repo.tumunu_listele()])
+        geri = sozluklerden_oturumlar_olustur(satirlar)
+        self.assertEqual([o.oturum_detaylari_getir() for o in geri], satirlar)
+
+    def test_gzipli_csv(self):
+        """CSV başlığı tüm türlerin sütunlarıdır; türde olmayan alanlar boş yazılır."""
+        yol = os.path.join(self.klasor.name, "oturumlar.csv.gz")
+        self.assertEqual(oturumlari_disa_aktar(self.repo, yol, bicim="csv", sikistir=True), 3)
+        with gzip.open(yol, "rt", encoding="utf-8", newline="") as dosya:
+            satirlar = list(csv.DictReader(dosya))
+        self.assertEqual(tuple(satirlar[0]), CSV_SUTUNLARI)
+        self.assertEqual(satirlar[0]["tarih_saat"], "2025-06-01T09:00:00")
+        self.assertEqual(satirlar[1]["team_id"], "10")
+        self.assertEqual(satirlar[2]["team_id"], "")
+
+    def test_kayitlari_yaz_ve_gecersiz_parametreler(self):
+        """Tırnak, virgül ve satır sonu içeren metinler korunur; geçersiz parametreler reddedilir."""
+        kayitlar = [{"a": 1, "b": 'x, "y"'}, {"a": 2}, {"a": 3, "b": '},{"z\nw'}]
+        yol = os.path.join(self.klasor.name, "kayitlar.csv")
+        self.assertEqual(kayitlari_yaz(iter(kayitlar), yol, "csv", sutunlar=["a", "b"], parca_boyutu=2), 3)
+        with open(yol, encoding="utf-8", newline="") as dosya:
+            self.assertEqual(list(csv.reader(dosya)), [["a", "b"], ["1", 'x, "y"'], ["2", ""], ["3", '},{"z\nw']])
+        yol = os.path.join(self.klasor.name, "kayitlar.jsonl")
+        self.assertEqual(kayitlari_yaz(kayitlar, yol), 3)
+        with open(yol, encoding="utf-8") as dosya:
+            self.assertEqual([json.loads(satir) for satir in dosya], kayitlar)
+        with self.assertRaises(ValueError):
+            oturumlari_disa_aktar(self.repo, yol, bicim="xml")
+        with self.assertRaises(ValueError):
+            kayitlari_yaz([], yol, "csv")
+        with self.assertRaises(ValueError):
+            oturumlari_disa_aktar(self.repo, yol, parca_boyutu=0)
+
+    def test_jsonl_ic_ice_nesneli_satirlar(self):
+        """İç içe nesne ve liste içeren satırlar JSONL'de birer satır olarak yazılır."""
+        kayitlar = [{"id": 1, "etiketler": [{"a": 1}, {"b": 2}]}, {"id": 2, "ic": {"x": {"y": "},{\""}}}, {"id": 3}]
+        yol = os.path.join(self.klasor.name, "ic_ice.jsonl")
+        self.assertEqual(kayitlari_yaz(kayitlar, yol, parca_boyutu=2), 3)
+        with open(yol, encoding="utf-8") as dosya:
+            self.assertEqual([json.loads(satir) for satir in dosya], kayitlar)
+
+
+class TestTopluIceAktarici(unittest.TestCase):
+    """JSONL/CSV dosyalarının doğrulanarak toplu içe aktarımını test eder."""
+
+    def setUp(self):
+        """Her testten önce çalışır, geçici klasör ve boş bir manager hazırlar."""
+        self.klasor = tempfile.TemporaryDirectory()
+        self.addCleanup(self.klasor.cleanup)
+        self.repo = TrainingRepository()
+        self.manager = TrainingManager(self.repo)
+
+    def _yaz(self, ad, satirlar):
+        yol = os.path.join(self.klasor.name, ad)
+        with open(yol, "w", encoding="utf-8") as dosya:
+            dosya.write("\n".join(satirlar) + "\n")
+        return yol
+
+    def test_disa_aktarilan_dosya_geri_yuklenir(self):
+        """JSONL ve gzip'li CSV dışa aktarımı aynı oturumlarla geri yüklenir."""
+        kaynak = TrainingRepository()
+        kaynak.kaydet_toplu([
+            IndividualTrainingSession(1, 60, 100, 5, odak_alani="güç", tarih_saat=datetime(2025, 6, 1, 9, 0),
+                                      performans_notu=7.5),
+            TeamTrainingSession(2, 90, 10, 3, 12, tarih_saat=datetime(2025, 6, 1, 10, 0)),
+            RehabTrainingSession(3, 45, 101, 7, "kas", ilerleme_notu=4.5),
+        ])
+        beklenen = [o.oturum_detaylari_getir() for o in kaynak.tumunu_listele()]
+        for ad, bicim, sikistir in (("o.jsonl", "jsonl", False), ("o.csv.gz", "csv", True)):
+            yol = os.path.join(self.klasor.name, ad)
+            oturumlari_disa_aktar(kaynak, yol, bicim=bicim, sikistir=sikistir)
+            repo = TrainingRepository()
+            rapor = TopluIceAktarici(TrainingManager(repo), isci_sayisi=1, parca_boyutu=2).ice_aktar(yol)
+            self.assertEqual((rapor.okunan, rapor.eklenen, rapor.reddedilenler), (3, 3, []))
+            self.assertEqual([o.oturum_detaylari_getir() for o in repo.tumunu_listele()], beklenen)
+
+    def test_tum_hatalar_satir_numarasiyla_raporlanir(self):
+        """Hatalı satırın her alan hatası toplanır; çakışan ve mükerrer satırlar reddedilir, kalanlar eklenir."""
+        tarih = "2025-06-01T09:00:00"
+        satir = lambda **alanlar: json.dumps(dict({"oturum_turu": "bireysel", "sure": 60, "athlete_id": 100,
+                                                   "antrenor_id": 5, "tarih_saat": tarih}, **alanlar))
+        yol = self._yaz("o.jsonl", [
+            satir(oturum_id=1),
+            satir(oturum_id=2, sure=0, durum="bilinmiyor", tarih_saat="dün"),
+            "{bozuk",
+            satir(oturum_id=3),
+            satir(oturum_id=1, athlete_id=200),
+            json.dumps({"oturum_turu": "yoga", "oturum_id": 5}),
+            satir(oturum_id=6, athlete_id=101),
+        ])
+        for isci_sayisi in (1, 2):
+            repo = TrainingRepository()
+            rapor = TopluIceAktarici(TrainingManager(repo), isci_sayisi=isci_sayisi, parca_boyutu=3).ice_aktar(yol)
+            self.assertEqual(sorted(o.oturum_id for o in repo.tumunu_listele()), [1, 6])
+            ozet = rapor.ozet()
+            self.assertEqual((ozet["okunan"], ozet["eklenen"], ozet["gecersiz"], ozet["cakisma"], ozet["mukerrer_id"]),
+                             (7, 2, 3, 1, 1))
+            self.assertEqual([(r.satir_no, r.oturum_id, r.durum) for r in rapor.reddedilenler], [
+                (2, 2, "gecersiz"), (3, None, "gecersiz"), (4, 3, "cakisma"), (5, 1, "mukerrer_id"),
+                (6, 5, "gecersiz"),
+            ])
+            self.assertEqual([alan for alan, _ in rapor.reddedilenler[0].hatalar], ["sure", "tarih_saat", "durum"])
+            self.assertGreater(rapor.satir_hizi, 0)
+
+    def test_satiri_dogrula_ve_gecersiz_parametreler(self):
+        """Tek satır setter kurallarıyla normalize edilir; geçersiz parametreler reddedilir."""
+        oturum, hatalar = satiri_dogrula({"oturum_turu": "takım", "oturum_id": 7, "sure": 90, "team_id": 10,
+                                          "saha_id": 3, "katilimci_sayisi": 12, "antrenman_plani": " TEKNIK "})
+        self.assertEqual(hatalar, [])
+        self.assertEqual((oturum.antrenman_plani, oturum.durum), ("teknik", "planlandı"))
+        oturum, hatalar = satiri_dogrula({"oturum_turu": "takım", "oturum_id": -1, "sure": 90})
+        self.assertIsNone(oturum)
+        self.assertEqual([alan for alan, _ in hatalar], ["oturum_id", "team_id", "saha_id", "katilimci_sayisi"])
+        with self.assertRaises(ValueError):
+            TopluIceAktarici(self.manager, isci_sayisi=0)
+        with self.assertRaises(ValueError):
+            TopluIceAktarici(self.manager, parca_boyutu=0)
+        with self.assertRaises(ValueError):
+            TopluIceAktarici(self.manager).ice_aktar(self._yaz("o.xml", ["<a/>"]))
+
+
 class TestTrainingStatistics(unittest.TestCase):
     """TrainingStatistics sınıfını test eder."""
     
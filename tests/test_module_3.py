@@ -3,6 +3,11 @@ Module 3 Test Suite
 Maç, lig ve turnuva organizasyonlarının yönetimi testleri
 """
 
+import copy
+import csv
+import json
+import subprocess
+import tempfile
 import unittest
 from datetime import datetime, timedelta
 import sys
@@ -21,6 +26,12 @@ from app.modules.module_3.repository import (
     LigRepository,
     MacRepository
 )
+from app.modules.module_3.disa_aktarim import (
+    MAC_SUTUNLARI,
+    maclari_disa_aktar,
+    ligleri_disa_aktar,
+    lig_maclarini_disa_aktar
+)
 
 
 # ============================================================================
@@ -111,6 +122,47 @@ class TestMacOlusturma(unittest.TestCase):
                 hafta_no=1
             )
 
+    def test_slots_ve_deepcopy(self):
+        """Maç nesneleri __dict__ taşımaz, deepcopy tüm alanları kopyalar"""
+        tarih = datetime(2024, 9, 15, 15, 0)
+        maclar = [
+            LigMaci(1, "Galatasaray", "Fenerbahçe", tarih, "Süper Lig", 1),
+            HazirlikMaci(2, "Galatasaray", "Fenerbahçe", tarih, "Yaz Kupası"),
+            ElemeMaci(3, "Galatasaray", "Fenerbahçe", tarih, "Çeyrek Final"),
+        ]
+        for mac in maclar:
+            self.assertFalse(hasattr(mac, "__dict__"))
+            mac.skor_belirle(2, 1)
+            kopya = copy.deepcopy(mac)
+            self.assertEqual(kopya.mac_detay_getir(), mac.mac_detay_getir())
+            self.assertEqual(kopya.skor, mac.skor)
+            self.assertEqual(kopya.mac_tipi, mac.mac_tipi)
+
+    def test_lig_maci_satirlardan_olustur(self):
+        """Toplu oluşturulan lig maçları kurucuyla oluşturulanlarla aynıdır"""
+        tarih = datetime(2024, 9, 15, 15, 0)
+        satirlar = [
+            {"mac_id": i, "ev_sahibi": "Galatasaray", "deplasman": "Fenerbahçe", "tarih_saat": tarih,
+             "lig_adi": "Süper Lig", "hafta_no": i, "spor_tipi": SporTipi.VOLEYBOL}
+            for i in range(1, 4)
+        ]
+        for dogrula in (True, False):
+            maclar = LigMaci.satirlardan_olustur(satirlar, dogrula=dogrula)
+            slotlar = [slot for sinif in LigMaci.__mro__ for slot in getattr(sinif, "__slots__", ())]
+            for mac, satir in zip(maclar, satirlar):
+                beklenen = LigMaci(**satir)
+                self.assertEqual(mac.mac_detay_getir(), beklenen.mac_detay_getir())
+                self.assertEqual([getattr(mac, slot) for slot in slotlar], [getattr(beklenen, slot) for slot in slotlar])
+                self.assertEqual((mac.mac_id, mac.spor_tipi, mac.mac_tipi, mac.durum, mac.skor),
+                                 (beklenen.mac_id, beklenen.spor_tipi, beklenen.mac_tipi, beklenen.durum, beklenen.skor))
+            maclar[0].skor_belirle(3, 1)
+            self.assertEqual(maclar[0].skor, "3-1")
+            self.assertIsNot(maclar[0]._gecerli_durumlar, maclar[1]._gecerli_durumlar)
+
+        satirlar[1]["deplasman"] = "Galatasaray"
+        with self.assertRaises(TurnuvaHatasi):
+            LigMaci.satirlardan_olustur(satirlar)
+
 
 # ============================================================================
 # SONUÇ GİRİŞ TESTLERİ
@@ -621,6 +673,19 @@ class TestFiksturOlusturma(unittest.TestCase):
         self.assertIsNotNone(fikstur)
         self.assertGreater(fikstur.toplam_hafta_sayisi(), 0)
     
+    def test_fikstur_var_mi(self):
+        """Fikstür oluşturulunca var, takım çıkarılınca yok görünür"""
+        lig = LigYonetimi("Test Lig", SporTipi.FUTBOL, datetime(2024, 9, 1))
+        for takim in ("Galatasaray", "Fenerbahçe", "Beşiktaş"):
+            lig.takim_ekle(takim)
+        self.assertFalse(lig.fikstur_var_mi())
+        
+        lig.fikstur_olustur()
+        self.assertTrue(lig.fikstur_var_mi())
+        
+        lig.takim_cikar("Beşiktaş")
+        self.assertFalse(lig.fikstur_var_mi())
+    
     def test_haftalik_maclar_getir(self):
         """Haftalık maçlar getirme testi"""
         tarih = datetime(2024, 9, 1)
@@ -634,6 +699,133 @@ class TestFiksturOlusturma(unittest.TestCase):
         self.assertGreater(len(maclar), 0)
         self.assertIsInstance(maclar[0], LigMaci)
 
+    def test_hafta_maclari_saklanir(self):
+        """Aynı haftanın maçları aynı objelerdir; girilen skorlar sonraki çağrılarda görünür"""
+        lig = LigYonetimi("Test Lig", SporTipi.FUTBOL, datetime(2024, 9, 1))
+        for takim in ("Galatasaray", "Fenerbahçe", "Beşiktaş"):
+            lig.takim_ekle(takim)
+        fikstur = lig.fikstur_olustur()
+
+        mac = lig.haftalik_maclar_getir(2)[0]
+        mac.skor_belirle(2, 1)
+        self.assertIs(lig.haftalik_maclar_getir(2)[0], mac)
+        self.assertTrue(lig.haftalik_maclar_getir(2)[0].skor_girildi_mi)
+        self.assertIs(next(m for m in lig.maclari_gez() if m.mac_id == mac.mac_id), mac)
+
+        self.assertIs(lig.mac_getir(mac.mac_id), mac)
+        self.assertEqual(lig.mac_getir(301).hafta_no, 3)
+        self.assertIsNone(lig.mac_getir(399))
+        with self.assertRaises(TurnuvaHatasi):
+            fikstur.hafta_maclarini_getir(1, "Başka Lig")
+
+    def test_takim_mac_gecmisi_indeksten(self):
+        """Takım geçmişi tüm haftaların taranıp tarihe göre sıralanmasıyla aynıdır ve aynı objeleri içerir"""
+        lig = LigYonetimi("Test Lig", SporTipi.FUTBOL, datetime(2024, 9, 1))
+        takimlar = [f"Takım {i}" for i in range(7)]
+        for takim in takimlar:
+            lig.takim_ekle(takim)
+        fikstur = lig.fikstur_olustur()
+
+        for takim in takimlar:
+            beklenen = sorted((mac for hafta in range(1, fikstur.toplam_hafta_sayisi() + 1)
+                               for mac in lig.haftalik_maclar_getir(hafta) if takim in (mac.ev_sahibi, mac.deplasman)),
+                              key=lambda mac: mac.tarih_saat)
+            gecmis = lig.takim_mac_gecmisi_getir(takim)
+            self.assertEqual(len(gecmis), 12)
+            self.assertEqual([id(mac) for mac in gecmis], [id(mac) for mac in beklenen])
+        self.assertIs(lig.takim_mac_gecmisi_getir("Takım 0"), lig.takim_mac_gecmisi_getir("Takım 0"))
+        with self.assertRaises(TurnuvaHatasi):
+            lig.takim_mac_gecmisi_getir("Olmayan Takım")
+
+    def test_kapali_form_haftalar(self):
+        """Kapalı formla hesaplanan haftalar çemberi her hafta döndürmekle aynıdır"""
+        for takim_sayisi in range(2, 10):
+            takimlar = [f"Takım {i}" for i in range(takim_sayisi)]
+            fikstur = FiksturOlusturucu(takimlar, datetime(2024, 9, 1), SporTipi.FUTBOL)
+            cember = takimlar + ["BYE"] if takim_sayisi % 2 else list(takimlar)
+            ilk_yari = len(cember) - 1
+            self.assertEqual(fikstur.toplam_hafta_sayisi(), 2 * ilk_yari)
+
+            for hafta in range(1, ilk_yari + 1):
+                beklenen = [(cember[i], cember[-1 - i]) for i in range(len(cember) // 2)
+                            if "BYE" not in (cember[i], cember[-1 - i])]
+                self.assertEqual([(ev, dep) for ev, dep, _ in fikstur.hafta_eslesmeleri_getir(hafta)], beklenen)
+                self.assertEqual([(ev, dep) for ev, dep, _ in fikstur.hafta_eslesmeleri_getir(hafta + ilk_yari)],
+                                 [(dep, ev) for ev, dep in beklenen])
+                cember = [cember[0], cember[-1]] + cember[1:-1]
+
+        fikstur = FiksturOlusturucu(["Takım A", "Takım B", "Takım C"], datetime(2024, 9, 1), SporTipi.FUTBOL)
+        self.assertEqual(fikstur.hafta_eslesmeleri_getir(2)[0][2], datetime(2024, 9, 6, 13, 0))
+        with self.assertRaises(TurnuvaHatasi):
+            fikstur.hafta_eslesmeleri_getir(7)
+
+
+# ============================================================================
+# DIŞA AKTARIM TESTLERİ
+# ============================================================================
+
+class TestDisaAktarim(unittest.TestCase):
+    """Maç ve lig dışa aktarım testleri"""
+
+    def setUp(self):
+        """Test öncesi hazırlık"""
+        self.klasor = tempfile.TemporaryDirectory()
+        self.addCleanup(self.klasor.cleanup)
+        self.yol = lambda ad: os.path.join(self.klasor.name, ad)
+
+    def test_maclari_jsonl_aktar(self):
+        """Maçlar tür, ISO tarih ve enum değerleriyle satır satır yazılır"""
+        repo = MacRepository()
+        repo.mac_kaydet(LigMaci(1, "Galatasaray", "Fenerbahçe", datetime(2024, 9, 15, 15, 0),
+                                "Süper Lig", 1, SporTipi.FUTBOL))
+        repo.mac_kaydet(ElemeMaci(2, "Real Madrid", "Barcelona", datetime(2024, 10, 5, 20, 0), "Çeyrek Final"))
+
+        self.assertEqual(maclari_disa_aktar(repo, self.yol("maclar.jsonl"), parca_boyutu=1), 2)
+        with open(self.yol("maclar.jsonl"), encoding="utf-8") as dosya:
+            satirlar = [json.loads(satir) for satir in dosya]
+
+        self.assertEqual(satirlar[0]["mac_turu"], "lig")
+        self.assertEqual(satirlar[0]["tarih_saat"], "2024-09-15T15:00:00")
+        self.assertEqual(satirlar[0]["spor_tipi"], SporTipi.FUTBOL.value)
+        self.assertEqual(satirlar[0]["mac_tipi"], MacTipi.LEAGUE.value)
+        self.assertEqual(satirlar[1]["tur_adi"], "Çeyrek Final")
+
+    def test_lig_ve_fikstur_csv_aktar(self):
+        """Ligler ve fikstür maçları CSV olarak yazılır"""
+        lig = LigYonetimi("Test Lig", SporTipi.FUTBOL, datetime(2024, 9, 1))
+        for takim in ("Galatasaray", "Fenerbahçe", "Beşiktaş", "Trabzonspor"):
+            lig.takim_ekle(takim)
+        fikstur = lig.fikstur_olustur()
+        repo = LigRepository()
+        repo.lig_kaydet(lig)
+
+        self.assertEqual(ligleri_disa_aktar(repo, self.yol("ligler.csv"), bicim="csv"), 1)
+        with open(self.yol("ligler.csv"), encoding="utf-8", newline="") as dosya:
+            lig_satiri = next(csv.DictReader(dosya))
+        self.assertEqual(json.loads(lig_satiri["takimlar"]), lig.takim_listesi_getir())
+
+        beklenen = sum(len(lig.haftalik_maclar_getir(hafta))
+                       for hafta in range(1, fikstur.toplam_hafta_sayisi() + 1))
+        self.assertEqual(lig_maclarini_disa_aktar(repo, self.yol("maclar.csv"), bicim="csv"), beklenen)
+        with open(self.yol("maclar.csv"), encoding="utf-8", newline="") as dosya:
+            okuyucu = csv.DictReader(dosya)
+            self.assertEqual(tuple(okuyucu.fieldnames), MAC_SUTUNLARI)
+            self.assertTrue(all(satir["lig_adi"] == "Test Lig" for satir in okuyucu))
+
+    def test_gecersiz_bicim(self):
+        """Geçersiz biçim ve parça boyutu reddedilir"""
+        with self.assertRaises(ValueError):
+            maclari_disa_aktar(MacRepository(), self.yol("x"), bicim="xml")
+        with self.assertRaises(ValueError):
+            ligleri_disa_aktar(LigRepository(), self.yol("x"), parca_boyutu=0)
+
+    def test_module_2_yuklenmez(self):
+        """Dışa aktarım modülü yalnızca ortak yazıcıyı kullanır, module_2'yi yüklemez"""
+        kod = ("import sys, app.modules.module_3.disa_aktarim; "
+               "print(any(ad.startswith('app.modules.module_2') for ad in sys.modules))")
+        sonuc = subprocess.run([sys.executable, "-c", kod], cwd=project_root, capture_output=True, text=True, check=True)
+        self.assertEqual(sonuc.stdout.strip(), "False")
+
 
 if __name__ == '__main__':
     unittest.main()